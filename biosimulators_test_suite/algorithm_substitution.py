@@ -0,0 +1,167 @@
+""" Table of the KiSAO algorithms which can be substituted for each algorithm under each algorithm substitution policy
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-29
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from .config import Config
+from .utils import read_versioned_json, write_json_atomically
+from kisao import Kisao
+from kisao.data_model import ID_ALGORITHM, AlgorithmSubstitutionPolicy
+from kisao.utils import get_substitutable_algorithms_for_policy, get_terms_with_characteristics
+import kisao
+import threading
+
+__all__ = [
+    'AlgorithmSubstitutionTable',
+    'get_algorithm_substitution_table',
+]
+
+
+class AlgorithmSubstitutionTable(object):
+    """ Table of the KiSAO algorithms which can be substituted for each algorithm under each algorithm substitution policy
+
+    Computing the algorithms which can be substituted for an algorithm requires loading the KiSAO ontology and searching it.
+    The table for each policy is built lazily, for all algorithms at once, the first time the policy is used, and then reused for
+    the rest of the process. Optionally, the table is also saved, so that other processes (e.g., the workers which evaluate test
+    cases concurrently and subsequent runs) can read it rather than rebuilding it. The saved table is versioned (:obj:`VERSION` and
+    the version of the installed ``kisao`` package), and is rebuilt when a different version of KiSAO is installed.
+
+    Attributes:
+        filename (:obj:`str`): path to save the table, or :obj:`None` to only build the table in memory
+        _policies (:obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`): map from the names of
+            algorithm substitution policies to maps from the KiSAO ids of algorithms to the sorted KiSAO ids of the algorithms
+            which can be substituted for them
+        _lock (:obj:`threading.Lock`): lock for building the table
+    """
+
+    VERSION = 1
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to save the table, or :obj:`None` to only build the table in memory
+        """
+        self.filename = filename
+        self._policies = None
+        self._lock = threading.Lock()
+
+    def get_substitutable_algorithm_ids(self, kisao_id, substitution_policy=AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES):
+        """ Get the KiSAO ids of the algorithms which can be substituted for an algorithm
+
+        Args:
+            kisao_id (:obj:`str`): KiSAO id of the algorithm (e.g., ``KISAO_0000019``)
+            substitution_policy (:obj:`AlgorithmSubstitutionPolicy`, optional): algorithm substitution policy
+
+        Returns:
+            :obj:`list` of :obj:`str`: sorted KiSAO ids of the algorithms which can be substituted for the algorithm
+
+        Raises:
+            :obj:`ValueError`: if :obj:`kisao_id` isn't the id of a KiSAO term
+            :obj:`NotImplementedError`: if substitution isn't implemented for the algorithm under the policy
+        """
+        sub_alg_ids = self.get_policy_table(substitution_policy).get(kisao_id, None)
+        if sub_alg_ids is None:
+            # the algorithm isn't in the table because substitution isn't implemented for it or it isn't an algorithm; the
+            # ontology is used to raise the same errors as :obj:`get_substitutable_algorithms_for_policy`
+            return self._get_substitutable_algorithm_ids(Kisao().get_term(kisao_id), substitution_policy)
+        return list(sub_alg_ids)
+
+    def get_policy_table(self, substitution_policy):
+        """ Get the table of the algorithms which can be substituted for each algorithm under an algorithm substitution policy,
+        building the table if necessary
+
+        Args:
+            substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): algorithm substitution policy
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`: map from the KiSAO ids of algorithms to the sorted KiSAO ids of
+            the algorithms which can be substituted for them
+        """
+        with self._lock:
+            if self._policies is None:
+                self._policies = self.read()
+
+            table = self._policies.get(substitution_policy.name, None)
+            if table is None:
+                table = self._policies[substitution_policy.name] = self.build_policy_table(substitution_policy)
+                self.write(self._policies)
+
+            return table
+
+    def build_policy_table(self, substitution_policy):
+        """ Build the table of the algorithms which can be substituted for each algorithm under an algorithm substitution policy
+
+        Args:
+            substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): algorithm substitution policy
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`: map from the KiSAO ids of algorithms to the sorted KiSAO ids of
+            the algorithms which can be substituted for them. Algorithms for which substitution isn't implemented are omitted.
+        """
+        table = {}
+        for alg_term in get_terms_with_characteristics([ID_ALGORITHM]):
+            try:
+                sub_alg_ids = self._get_substitutable_algorithm_ids(alg_term, substitution_policy)
+            except NotImplementedError:
+                continue
+            table[Kisao().get_term_id(alg_term)] = sub_alg_ids
+        return table
+
+    @staticmethod
+    def _get_substitutable_algorithm_ids(alg_term, substitution_policy):
+        """ Get the KiSAO ids of the algorithms which can be substituted for an algorithm from the ontology
+
+        Args:
+            alg_term (:obj:`pronto.Term`): algorithm
+            substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): algorithm substitution policy
+
+        Returns:
+            :obj:`list` of :obj:`str`: sorted KiSAO ids of the algorithms which can be substituted for the algorithm
+        """
+        sub_algs = get_substitutable_algorithms_for_policy(alg_term, substitution_policy=substitution_policy)
+        return sorted(Kisao().get_term_ids(sub_algs))
+
+    def read(self):
+        """ Read the saved table
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`: map from the names of algorithm
+            substitution policies to their tables, or an empty dictionary if the table hasn't been saved, can't be read, or is for
+            another version of KiSAO
+        """
+        saved_table = read_versioned_json(self.filename, [self.VERSION, kisao.__version__]) or {}
+        return saved_table.get('policies', {})
+
+    def write(self, policies):
+        """ Save the table with :obj:`write_json_atomically`
+
+        Args:
+            policies (:obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`): map from the names of
+                algorithm substitution policies to their tables
+        """
+        write_json_atomically(self.filename, {
+            'version': [self.VERSION, kisao.__version__],
+            'policies': policies,
+        })
+
+
+_algorithm_substitution_table = None
+_algorithm_substitution_table_lock = threading.Lock()
+
+
+def get_algorithm_substitution_table():
+    """ Get the table of substitutable algorithms which is shared by the test cases of the process
+
+    The table is saved to the path configured by the ``ALGORITHM_SUBSTITUTION_TABLE_FILENAME`` environment variable.
+
+    Returns:
+        :obj:`AlgorithmSubstitutionTable`: table of substitutable algorithms
+    """
+    global _algorithm_substitution_table
+    with _algorithm_substitution_table_lock:
+        if _algorithm_substitution_table is None:
+            _algorithm_substitution_table = AlgorithmSubstitutionTable(Config().algorithm_substitution_table_filename)
+        return _algorithm_substitution_table
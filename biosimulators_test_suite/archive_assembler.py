@@ -0,0 +1,289 @@
+""" Assembly of synthetic COMBINE/OMEX archives from the contents of curated archives
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-26
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from biosimulators_utils.combine.io import get_combine_errors_warnings
+from biosimulators_utils.sedml.io import SedmlSimulationWriter
+from biosimulators_utils.utils.core import flatten_nested_list_of_strings
+from biosimulators_utils.warnings import warn, BioSimulatorsWarning
+import libcombine
+import libsedml
+import os
+import posixpath
+import shutil
+import struct
+import zipfile
+import zlib
+
+__all__ = [
+    'CombineArchiveAssembler',
+    'SedmlSimulationStringWriter',
+]
+
+
+class CombineArchiveAssembler(object):
+    """ Assembles COMBINE/OMEX archives directly from the unpacked contents of a source archive (e.g., a curated archive)
+    and SED documents
+
+    * SED documents are serialized directly into the archive, rather than saved to files and then read back.
+    * Members of the source archive which are unchanged are copied into the archive without decompressing and recompressing
+      them, where the version of :obj:`zipfile` supports this (see :obj:`copy_member`).
+    * Other files are read from the directory which contains the unpacked contents of the archive.
+
+    Attributes:
+        compression (:obj:`int`): method for compressing the members of archives which are not copied from their source archives
+            (:obj:`zipfile.ZIP_DEFLATED` or :obj:`zipfile.ZIP_STORED`). :obj:`zipfile.ZIP_STORED` avoids the cost of compressing
+            archives which are only executed locally.
+    """
+
+    MANIFEST_LOCATION = 'manifest.xml'
+    COPY_CHUNK_SIZE = 2 ** 20  # bytes
+
+    def __init__(self, compression=zipfile.ZIP_DEFLATED):
+        """
+        Args:
+            compression (:obj:`int`, optional): method for compressing the members of archives which are not copied from their
+                source archives (:obj:`zipfile.ZIP_DEFLATED` or :obj:`zipfile.ZIP_STORED`)
+        """
+        self.compression = compression
+
+    def run(self, archive, archive_dirname, filename, sed_docs=None, source_filename=None):
+        """ Assemble an archive
+
+        Args:
+            archive (:obj:`CombineArchive`): description of the archive, without its manifest
+            archive_dirname (:obj:`str`): directory which contains the files of the archive
+            filename (:obj:`str`): path to save the archive
+            sed_docs (:obj:`dict` of :obj:`str` to :obj:`SedDocument`, optional): map from the locations of SED documents in the
+                archive to documents to serialize into the archive rather than read from :obj:`archive_dirname`
+            source_filename (:obj:`str`, optional): path to the archive whose contents were unpacked into
+                :obj:`archive_dirname`. Members of this archive which are unchanged in :obj:`archive_dirname` are copied
+                without recompression.
+
+        Raises:
+            :obj:`ValueError`: if the manifest of the archive or a SED document is invalid
+        """
+        sed_docs = sed_docs or {}
+
+        manifest = self.get_manifest(archive.contents)
+
+        source_zip_file = zipfile.ZipFile(source_filename, 'r') if source_filename else None
+        try:
+            with zipfile.ZipFile(filename, 'w', compression=self.compression) as zip_file:
+                for content in archive.contents:
+                    name = self.get_member_name(content.location)
+                    content_filename = os.path.join(archive_dirname, content.location)
+
+                    if content.location in sed_docs:
+                        sedml = SedmlSimulationStringWriter().run(sed_docs[content.location], content_filename)
+                        zip_file.writestr(name, sedml)
+
+                    elif source_zip_file and is_member_unchanged(source_zip_file, name, content_filename):
+                        copy_member(source_zip_file, name, zip_file)
+
+                    else:
+                        zip_file.write(content_filename, name)
+
+                zip_file.writestr(self.MANIFEST_LOCATION, manifest)
+        finally:
+            if source_zip_file:
+                source_zip_file.close()
+
+    def get_manifest(self, contents):
+        """ Get the OMEX manifest of the contents of an archive
+
+        Args:
+            contents (:obj:`list` of :obj:`CombineArchiveContent`): contents of a COMBINE/OMEX archive
+
+        Returns:
+            :obj:`str`: OMEX manifest
+
+        Raises:
+            :obj:`ValueError`: if the manifest is invalid
+        """
+        manifest = libcombine.CaOmexManifest()
+        for content in contents:
+            content_comb = manifest.createContent()
+
+            if content.location is not None:
+                content_comb.setLocation(content.location)
+
+            if content.format is not None:
+                content_comb.setFormat(content.format)
+
+            if content.master is not None:
+                content_comb.setMaster(content.master)
+
+        errors, warnings = get_combine_errors_warnings(manifest)
+        if warnings:
+            msg = 'COMBINE/OMEX archive has warnings.\n  ' + flatten_nested_list_of_strings(warnings).replace('\n', '\n  ')
+            warn(msg, BioSimulatorsWarning)
+        if errors:
+            msg = 'COMBINE/OMEX archive is invalid.\n  ' + flatten_nested_list_of_strings(errors).replace('\n', '\n  ')
+            raise ValueError(msg)
+
+        return libcombine.writeOMEXToString(manifest)
+
+    @staticmethod
+    def get_member_name(location):
+        """ Get the name of the member of a zip file for a location of a content of an archive (e.g., ``model.xml`` for
+        ``./model.xml``)
+
+        Args:
+            location (:obj:`str`): location of a content of an archive
+
+        Returns:
+            :obj:`str`: name of the member of the zip file
+        """
+        return posixpath.normpath(location).lstrip('/')
+
+
+class SedmlSimulationStringWriter(SedmlSimulationWriter):
+    """ Serializes SED documents to strings rather than files """
+
+    def run(self, doc, filename, **kwargs):
+        """ Serialize a SED document to SED-ML
+
+        Args:
+            doc (:obj:`SedDocument`): SED document
+            filename (:obj:`str`): path where the document would be saved. The models of the document are validated relative to
+                the directory of this path.
+            **kwargs: additional arguments to :obj:`SedmlSimulationWriter.run`
+
+        Returns:
+            :obj:`str`: SED-ML
+        """
+        self._sedml = None
+        super(SedmlSimulationStringWriter, self).run(doc, filename, **kwargs)
+        return self._sedml
+
+    def _export_doc(self, filename):
+        """ Serialize a SED document to SED-ML
+
+        Args:
+            filename (:obj:`str`): path where the document would be saved
+        """
+        self._sedml = libsedml.writeSedMLToString(self._doc_sed)
+
+
+def is_member_unchanged(zip_file, name, filename):
+    """ Determine whether a file is identical to a member of a zip file, based on its size and CRC-32 checksum
+
+    Args:
+        zip_file (:obj:`zipfile.ZipFile`): zip file
+        name (:obj:`str`): name of the member
+        filename (:obj:`str`): path to the file
+
+    Returns:
+        :obj:`bool`: :obj:`True` if the zip file has a member with the name which can be copied with :obj:`copy_member`, and
+        the file is identical to the member
+    """
+    try:
+        info = zip_file.getinfo(name)
+    except KeyError:
+        return False
+
+    # encrypted members and compression methods which :obj:`zipfile` doesn't support can't be copied
+    if info.flag_bits & 0x1 or info.compress_type not in [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED]:
+        return False
+
+    if not os.path.isfile(filename) or os.path.getsize(filename) != info.file_size:
+        return False
+
+    crc = 0
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(CombineArchiveAssembler.COPY_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc == info.CRC
+
+
+def copy_member(source_zip_file, name, zip_file):
+    """ Copy a member of a zip file into another zip file
+
+    :obj:`zipfile` doesn't provide a public method for writing compressed data. Where the internals of :obj:`zipfile` which
+    :obj:`zipfile.ZipFile.write` uses are available (see :obj:`can_copy_compressed_members`), the compressed data of the member is
+    copied without decompressing and recompressing it. Otherwise, the member is decompressed and recompressed with the public
+    API of :obj:`zipfile`.
+
+    Args:
+        source_zip_file (:obj:`zipfile.ZipFile`): zip file to copy the member from
+        name (:obj:`str`): name of the member
+        zip_file (:obj:`zipfile.ZipFile`): zip file open for writing to copy the member into
+    """
+    source_info = source_zip_file.getinfo(name)
+
+    info = zipfile.ZipInfo(name, date_time=source_info.date_time)
+    info.compress_type = source_info.compress_type
+    info.external_attr = source_info.external_attr or (0o644 << 16)
+
+    if can_copy_compressed_members(zip_file):
+        copy_compressed_member(source_zip_file, source_info, info, zip_file)
+    else:
+        info.file_size = source_info.file_size
+        with source_zip_file.open(source_info) as source_file, zip_file.open(info, 'w') as file:
+            shutil.copyfileobj(source_file, file, CombineArchiveAssembler.COPY_CHUNK_SIZE)
+
+
+def can_copy_compressed_members(zip_file):
+    """ Determine whether the internals of :obj:`zipfile` which :obj:`copy_compressed_member` uses are available
+
+    Args:
+        zip_file (:obj:`zipfile.ZipFile`): zip file open for writing
+
+    Returns:
+        :obj:`bool`: whether compressed members can be copied into the zip file
+    """
+    return (
+        all(hasattr(zipfile, attr) for attr in ['structFileHeader', 'sizeFileHeader', '_FH_FILENAME_LENGTH', '_FH_EXTRA_FIELD_LENGTH'])
+        and all(hasattr(zip_file, attr) for attr in ['_lock', '_writing', '_seekable', 'start_dir', '_writecheck', '_didModify',
+                                                     'fp', 'filelist', 'NameToInfo'])
+    )
+
+
+def copy_compressed_member(source_zip_file, source_info, info, zip_file):
+    """ Copy the compressed data of a member of a zip file into another zip file, without decompressing and recompressing it
+
+    This follows :obj:`zipfile.ZipFile.write`, and relies on internals of :obj:`zipfile`. :obj:`can_copy_compressed_members`
+    should be used to check whether they are available.
+
+    Args:
+        source_zip_file (:obj:`zipfile.ZipFile`): zip file to copy the member from
+        source_info (:obj:`zipfile.ZipInfo`): member of the source zip file
+        info (:obj:`zipfile.ZipInfo`): member of the zip file to copy the member into
+        zip_file (:obj:`zipfile.ZipFile`): zip file open for writing to copy the member into
+    """
+    info.CRC = source_info.CRC
+    info.compress_size = source_info.compress_size
+    info.file_size = source_info.file_size
+
+    with open(source_zip_file.filename, 'rb') as source_file:
+        # skip the local header of the member
+        source_file.seek(source_info.header_offset)
+        header = struct.unpack(zipfile.structFileHeader, source_file.read(zipfile.sizeFileHeader))
+        source_file.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+        with zip_file._lock:
+            if zip_file._writing:
+                raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+            if zip_file._seekable:
+                zip_file.fp.seek(zip_file.start_dir)
+            info.header_offset = zip_file.fp.tell()
+            zip_file._writecheck(info)
+            zip_file._didModify = True
+
+            zip_file.fp.write(info.FileHeader())
+            n_remaining_bytes = info.compress_size
+            while n_remaining_bytes:
+                chunk = source_file.read(min(n_remaining_bytes, CombineArchiveAssembler.COPY_CHUNK_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipFile('Member `{}` of `{}` is truncated'.format(info.filename, source_zip_file.filename))
+                zip_file.fp.write(chunk)
+                n_remaining_bytes -= len(chunk)
+
+            zip_file.filelist.append(info)
+            zip_file.NameToInfo[info.filename] = info
+            zip_file.start_dir = zip_file.fp.tell()
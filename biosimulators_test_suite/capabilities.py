@@ -0,0 +1,86 @@
+""" Index of the capabilities of a simulator, for checking whether test cases are compatible with simulators
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-28
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+__all__ = [
+    'SimulatorCapabilities',
+]
+
+
+class SimulatorCapabilities(object):
+    """ Index of the capabilities of a simulator (e.g., its algorithms and the model formats they support)
+
+    The index is built once from the specifications of a simulator so that test cases can check whether they are compatible with
+    the simulator, and whether curated archives are suitable for testing the simulator, with dictionary and set lookups rather than
+    by scanning the algorithms of the simulator and their model formats and parameters.
+
+    Attributes:
+        specifications (:obj:`dict`): specifications of the simulator
+        algorithms (:obj:`dict` of :obj:`str` to :obj:`dict`): map from the KiSAO ids of the algorithms of the simulator to
+            their specifications (the first specifications of each algorithm)
+        task_algorithms (:obj:`dict` of :obj:`tuple` to :obj:`set` of :obj:`str`): map from pairs of the EDAM ids of model formats
+            and sets of the features of the formats (e.g., SBML packages) to the KiSAO ids of the algorithms which support them
+        algorithm_parameters (:obj:`dict` of :obj:`str` to :obj:`list` of :obj:`dict`): map from the KiSAO ids of the algorithms
+            of the simulator to the specifications of their parameters (the first non-empty parameters of each algorithm)
+    """
+
+    def __init__(self, specifications):
+        """
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator
+        """
+        self.specifications = specifications
+        self.algorithms = {}
+        self.task_algorithms = {}
+        self.algorithm_parameters = {}
+
+        for alg_specs in specifications.get('algorithms', []):
+            kisao_id = alg_specs['kisaoId']['id']
+            self.algorithms.setdefault(kisao_id, alg_specs)
+
+            for format in alg_specs.get('modelFormats', []):
+                key = (format['id'], frozenset(format.get('supportedFeatures', []) or []))
+                self.task_algorithms.setdefault(key, set()).add(kisao_id)
+
+            if alg_specs.get('parameters', None) and not self.algorithm_parameters.get(kisao_id, None):
+                self.algorithm_parameters[kisao_id] = alg_specs['parameters']
+
+    def supports_task(self, model_format, model_format_features, simulation_algorithm):
+        """ Determine whether the simulator supports a combination of a model format and a simulation algorithm
+
+        Args:
+            model_format (:obj:`str`): EDAM id of the model format
+            model_format_features (:obj:`set` of :obj:`str`): features of the model format required by the task (e.g., SBML
+                packages). The algorithm must support exactly these features.
+            simulation_algorithm (:obj:`str`): KiSAO id of the simulation algorithm
+
+        Returns:
+            :obj:`bool`: whether an algorithm of the simulator with the KiSAO id supports the model format and its features
+        """
+        return simulation_algorithm in self.task_algorithms.get((model_format, frozenset(model_format_features)), ())
+
+    def get_algorithm(self, kisao_id):
+        """ Get the specifications of an algorithm of the simulator
+
+        Args:
+            kisao_id (:obj:`str`): KiSAO id of the algorithm
+
+        Returns:
+            :obj:`dict`: specifications of the algorithm, or :obj:`None` if the simulator doesn't support the algorithm
+        """
+        return self.algorithms.get(kisao_id, None)
+
+    def get_algorithm_parameters(self, kisao_id):
+        """ Get the specifications of the parameters of an algorithm of the simulator
+
+        Args:
+            kisao_id (:obj:`str`): KiSAO id of the algorithm
+
+        Returns:
+            :obj:`list` of :obj:`dict`: specifications of the parameters of the algorithm
+        """
+        return self.algorithm_parameters.get(kisao_id, [])
@@ -34,7 +34,7 @@ class Config(object):
         runbiosimulations_api_client_id (:obj:`str`): Client id of the runBioSimulations API
         runbiosimulations_api_client_secret (:obj:`str`): Client secret of the runBioSimulations API
         runbiosimulations_api_endpoint (:obj:`str`): Base URL for the runBioSimulations API
-        test_case_timeout (:obj:`int`): time out for test cases in seconds
+        test_case_timeout (:obj:`float`): time out for test cases in seconds
         user_to_exec_in_simulator_containers (:obj:`str` or :obj:`None`): user id or name to execute calls inside simulator containers
 
             * Use ``_CURRENT_USER_`` to indicate that the Docker container should execute commands as the current user (``os.getuid()``)
@@ -42,6 +42,25 @@ class Config(object):
               execute commands
 
         singularity_image_dirname (:obj:`str`): directory to save Singularity images
+        exec_cache_dirname (:obj:`str`): directory to cache the outputs of the execution of COMBINE/OMEX archives by simulators.
+            If :obj:`None`, the outputs are not cached.
+        exec_cache_max_size (:obj:`int`): maximum size in bytes of the cache of the outputs of the execution of COMBINE/OMEX archives
+        model_change_budget (:obj:`int`): maximum number of attributes of a model which a test case changes (``0`` for no limit)
+        compress_synthetic_archives (:obj:`bool`): whether to compress the synthetic COMBINE/OMEX archives generated by the test
+            cases (default: :obj:`True`)
+        examples_index_filename (:obj:`str`): path to save the index of the example COMBINE/OMEX archives of published projects.
+            If :obj:`None` (default), the index is rebuilt each time the test cases are collected.
+        algorithm_substitution_table_filename (:obj:`str`): path to save the table of the KiSAO algorithms which can be
+            substituted for each algorithm. If :obj:`None` (default), the table is rebuilt by each process.
+        synthetic_archive_concurrency (:obj:`int`): maximum number of the synthetic COMBINE/OMEX archives of a test case to
+            execute concurrently (default: ``1``)
+        pipeline_depth (:obj:`int`): maximum number of upcoming test cases whose synthetic COMBINE/OMEX archives are prepared
+            while the current test case is evaluated (default: ``0``)
+        case_durations_filename (:obj:`str`): path to save the durations of the test cases of previous runs, for scheduling the
+            test cases of subsequent runs. If :obj:`None` (default), durations are not saved.
+        previous_test_results_filename (:obj:`str`): path to the report of a previous validation of a simulator
+            (``.json`` or ``.jsonl``). If set, the GitHub action for validating simulators only re-evaluates the test cases
+            which could have different outcomes than in this report.
     """
 
     def __init__(self,
@@ -59,7 +78,17 @@ class Config(object):
                  runbiosimulations_api_endpoint=None,
                  test_case_timeout=None,
                  user_to_exec_in_simulator_containers=None,
-                 singularity_image_dirname=None):
+                 singularity_image_dirname=None,
+                 exec_cache_dirname=None,
+                 exec_cache_max_size=None,
+                 model_change_budget=None,
+                 compress_synthetic_archives=None,
+                 examples_index_filename=None,
+                 algorithm_substitution_table_filename=None,
+                 synthetic_archive_concurrency=None,
+                 pipeline_depth=None,
+                 case_durations_filename=None,
+                 previous_test_results_filename=None):
         """
         Args:
             pull_docker_image (:obj:`bool`, optional): whether to pull the Docker image for the simulator (default: :obj:`True`)
@@ -83,7 +112,7 @@ class Config(object):
             runbiosimulations_api_client_id (:obj:`str`, optional): Client id of the runBioSimulations API
             runbiosimulations_api_client_secret (:obj:`str`, optional): Client secret of the runBioSimulations API
             runbiosimulations_api_endpoint (:obj:`str`, optional): Base URL for the runBioSimulations API
-            test_case_timeout (:obj:`int`, optional): time out for test cases in seconds
+            test_case_timeout (:obj:`float`, optional): time out for test cases in seconds
             user_to_exec_in_simulator_containers (:obj:`str`, optional): user id or name to execute calls inside simulator containers
 
                 * Use ``_CURRENT_USER_`` to indicate that the Docker container should execute commands as the current user (``os.getuid()``)
@@ -91,6 +120,27 @@ class Config(object):
                   execute commands
 
             singularity_image_dirname (:obj:`str`, optional): directory to save Singularity images
+            exec_cache_dirname (:obj:`str`, optional): directory to cache the outputs of the execution of COMBINE/OMEX archives by
+                simulators. If :obj:`None`, the outputs are not cached.
+            exec_cache_max_size (:obj:`int`, optional): maximum size in bytes of the cache of the outputs of the execution of
+                COMBINE/OMEX archives
+            model_change_budget (:obj:`int`, optional): maximum number of attributes of a model which a test case changes (``0``
+                for no limit)
+            compress_synthetic_archives (:obj:`bool`, optional): whether to compress the synthetic COMBINE/OMEX archives
+                generated by the test cases (default: :obj:`True`)
+            examples_index_filename (:obj:`str`, optional): path to save the index of the example COMBINE/OMEX archives of
+                published projects. If :obj:`None` (default), the index is rebuilt each time the test cases are collected.
+            algorithm_substitution_table_filename (:obj:`str`, optional): path to save the table of the KiSAO algorithms which
+                can be substituted for each algorithm. If :obj:`None` (default), the table is rebuilt by each process.
+            synthetic_archive_concurrency (:obj:`int`, optional): maximum number of the synthetic COMBINE/OMEX archives of a test
+                case to execute concurrently (default: ``1``)
+            pipeline_depth (:obj:`int`, optional): maximum number of upcoming test cases whose synthetic COMBINE/OMEX archives
+                are prepared while the current test case is evaluated (default: ``0``)
+            case_durations_filename (:obj:`str`, optional): path to save the durations of the test cases of previous runs, for
+                scheduling the test cases of subsequent runs. If :obj:`None` (default), durations are not saved.
+            previous_test_results_filename (:obj:`str`, optional): path to the report of a previous validation of a simulator
+                (``.json`` or ``.jsonl``). If set, the GitHub action for validating simulators only re-evaluates the test cases
+                which could have different outcomes than in this report.
         """
         # Docker registry
         if pull_docker_image is None:
@@ -211,7 +261,7 @@ class Config(object):
             self.runbiosimulations_api_endpoint = runbiosimulations_api_endpoint
 
         if test_case_timeout is None:
-            self.test_case_timeout = int(os.getenv('TEST_CASE_TIMEOUT', '600'))  # seconds
+            self.test_case_timeout = float(os.getenv('TEST_CASE_TIMEOUT', '600'))  # seconds
         else:
             self.test_case_timeout = test_case_timeout
 
@@ -225,3 +275,53 @@ class Config(object):
                                                        os.path.join(os.path.expanduser('~'), '.biosimulators-test-suite', 'singularity'))
         else:
             self.singularity_image_dirname = singularity_image_dirname
+
+        if exec_cache_dirname is None:
+            self.exec_cache_dirname = os.getenv('EXEC_CACHE_DIRNAME') or None
+        else:
+            self.exec_cache_dirname = exec_cache_dirname
+
+        if exec_cache_max_size is None:
+            self.exec_cache_max_size = int(os.getenv('EXEC_CACHE_MAX_SIZE', str(10 * 2 ** 30)))  # bytes
+        else:
+            self.exec_cache_max_size = exec_cache_max_size
+
+        if model_change_budget is None:
+            self.model_change_budget = int(os.getenv('MODEL_CHANGE_BUDGET', '2000'))
+        else:
+            self.model_change_budget = model_change_budget
+
+        if compress_synthetic_archives is None:
+            self.compress_synthetic_archives = os.getenv('COMPRESS_SYNTHETIC_ARCHIVES', '1').lower() in ['1', 'true']
+        else:
+            self.compress_synthetic_archives = compress_synthetic_archives
+
+        if examples_index_filename is None:
+            self.examples_index_filename = os.getenv('EXAMPLES_INDEX_FILENAME') or None
+        else:
+            self.examples_index_filename = examples_index_filename
+
+        if algorithm_substitution_table_filename is None:
+            self.algorithm_substitution_table_filename = os.getenv('ALGORITHM_SUBSTITUTION_TABLE_FILENAME') or None
+        else:
+            self.algorithm_substitution_table_filename = algorithm_substitution_table_filename
+
+        if synthetic_archive_concurrency is None:
+            self.synthetic_archive_concurrency = int(os.getenv('SYNTHETIC_ARCHIVE_CONCURRENCY', '1'))
+        else:
+            self.synthetic_archive_concurrency = synthetic_archive_concurrency
+
+        if pipeline_depth is None:
+            self.pipeline_depth = int(os.getenv('PIPELINE_DEPTH', '0'))
+        else:
+            self.pipeline_depth = pipeline_depth
+
+        if case_durations_filename is None:
+            self.case_durations_filename = os.getenv('CASE_DURATIONS_FILENAME') or None
+        else:
+            self.case_durations_filename = case_durations_filename
+
+        if previous_test_results_filename is None:
+            self.previous_test_results_filename = os.getenv('PREVIOUS_TEST_RESULTS_FILENAME', None) or None
+        else:
+            self.previous_test_results_filename = previous_test_results_filename
@@ -6,16 +6,21 @@
 :License: MIT
 """
 
+from .capabilities import SimulatorCapabilities
 from .config import Config
 from .exceptions import SkippedTestCaseException  # noqa: F401
 from biosimulators_utils.image import get_docker_image
 import abc
+import contextlib
 import docker
 import enum
+import h5py
+import numpy
 
 __all__ = [
     'OutputMedium',
-    'TestCase', 'SedTaskRequirements', 'ExpectedSedReport', 'ExpectedSedDataSet', 'ExpectedSedPlot',
+    'TestCase', 'SedTaskRequirements', 'ExpectedSedReport', 'ExpectedSedDataSet', 'SparseExpectedSedDataSetValues',
+    'ExternalExpectedSedDataSetValues', 'ExpectedSedPlot',
     'AlertType',
 ]
 
@@ -34,20 +39,39 @@ class TestCase(abc.ABC):
         name (:obj:`str`): name
         description (:obj:`str`): description
         output_medium (:obj:`OutputMedium`): medium the description should be formatted for
+        capabilities (:obj:`SimulatorCapabilities`): index of the capabilities of the simulator to validate, or :obj:`None` if
+            the index should be built from the specifications of the simulator
     """
 
-    def __init__(self, id=None, name=None, description=None, output_medium=OutputMedium.console):
+    def __init__(self, id=None, name=None, description=None, output_medium=OutputMedium.console, capabilities=None):
         """
         Args:
             id (:obj:`str`, optional): id
             name (:obj:`str`, optional): name
             description (:obj:`str`): description
             output_medium (:obj:`OutputMedium`, optional): medium the description should be formatted
+            capabilities (:obj:`SimulatorCapabilities`, optional): index of the capabilities of the simulator to validate (e.g.,
+                shared by the test cases of a validation run)
         """
         self.id = id
         self.name = name
         self.description = description
         self.output_medium = output_medium
+        self.capabilities = capabilities
+
+    def get_simulator_capabilities(self, specifications):
+        """ Get the index of the capabilities of a simulator
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+
+        Returns:
+            :obj:`SimulatorCapabilities`: index of the capabilities of the simulator; :obj:`capabilities` if it was built from
+            :obj:`specifications`
+        """
+        if self.capabilities is None or self.capabilities.specifications is not specifications:
+            self.capabilities = SimulatorCapabilities(specifications)
+        return self.capabilities
 
     @abc.abstractmethod
     def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
@@ -114,7 +138,8 @@ class ExpectedSedReport(object):
         id (:obj:`str`): id
         data_sets (:obj:`list` of :obj:`ExpectedSedDataSet`): labels of expected data sets
         points (:obj:`tuple` of :obj:`int`): number of expected points of
-        values (:obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`list`): expected values of data sets or elements of data sets
+        values (:obj:`dict` of :obj:`str` to :obj:`numpy.ndarray`, :obj:`SparseExpectedSedDataSetValues`, or
+            :obj:`ExternalExpectedSedDataSetValues`): expected values of data sets or elements of data sets
     """
 
     def __init__(self, id=None, data_sets=None, points=None, values=None):
@@ -123,7 +148,8 @@ class ExpectedSedReport(object):
             id (:obj:`str`, optional): id
             data_sets (:obj:`set` of :obj:`ExpectedSedDataSet`, optional): labels of expected data sets
             points (:obj:`tuple` of :obj:`int`, optional): number of expected points of
-            values (:obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`list`, optional): expected values of data sets or elements of data sets
+            values (:obj:`dict` of :obj:`str` to :obj:`numpy.ndarray`, :obj:`SparseExpectedSedDataSetValues`, or
+                :obj:`ExternalExpectedSedDataSetValues`, optional): expected values of data sets or elements of data sets
         """
         self.id = id
         self.data_sets = data_sets or set()
@@ -149,6 +175,80 @@ class ExpectedSedDataSet(object):
         self.label = label
 
 
+class SparseExpectedSedDataSetValues(object):
+    """ Expected values of elements of a data set
+
+    The indices of the elements are stored as arrays so that the elements can be compared with the values of data sets with
+    vectorized operations.
+
+    Attributes
+        indices (:obj:`numpy.ndarray` of :obj:`int`): multi-dimensional index of each element (one row per element)
+        flat_indices (:obj:`numpy.ndarray` of :obj:`int`): index of each element into the flattened (C-ordered) data set
+        values (:obj:`numpy.ndarray`): expected value of each element
+    """
+
+    def __init__(self, indices, values, shape):
+        """
+        Args:
+            indices (:obj:`list` of :obj:`tuple` of :obj:`int`): multi-dimensional index of each element
+            values (:obj:`list` of :obj:`float`): expected value of each element
+            shape (:obj:`tuple` of :obj:`int`): shape of the data set
+
+        Raises:
+            :obj:`ValueError`: if an index has a different number of dimensions than the data set or is out of its bounds
+        """
+        self.indices = numpy.array(indices, dtype=numpy.int64).reshape((len(indices), len(shape)))
+        self.flat_indices = numpy.ravel_multi_index(tuple(self.indices.T), tuple(shape))
+        self.values = numpy.array(values)
+
+    def to_dict(self):
+        """ Get a dictionary which maps the multi-dimensional index of each element to its expected value
+
+        Returns:
+            :obj:`dict` of :obj:`tuple` of :obj:`int` to :obj:`float`: expected value of each element
+        """
+        return {tuple(index.tolist()): value for index, value in zip(self.indices, self.values.tolist())}
+
+
+class ExternalExpectedSedDataSetValues(object):
+    """ Expected values of a data set which are stored in an external file (a NumPy ``.npy`` file or a dataset of an HDF5 file)
+
+    The file is only read when the values are compared with the values of a data set. NumPy files are memory-mapped and HDF5
+    datasets are read lazily, so that the values can be compared in blocks without loading the entire file into memory.
+
+    Attributes
+        filename (:obj:`str`): path to the file
+        dataset (:obj:`str`): path to the dataset within the file for HDF5 files, or :obj:`None` for NumPy files
+    """
+
+    def __init__(self, filename=None, dataset=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the file
+            dataset (:obj:`str`, optional): path to the dataset within the file for HDF5 files, or :obj:`None` for NumPy files
+        """
+        self.filename = filename
+        self.dataset = dataset
+
+    @contextlib.contextmanager
+    def open(self):
+        """ Open the expected values
+
+        Returns:
+            :obj:`contextlib._GeneratorContextManager`: context manager which provides the values as a memory-mapped
+            :obj:`numpy.ndarray` or an :obj:`h5py.Dataset`
+
+        Raises:
+            :obj:`OSError`: if the file can't be read
+            :obj:`KeyError`: if the HDF5 file doesn't contain the dataset
+        """
+        if self.dataset is None:
+            yield numpy.load(self.filename, mmap_mode='r', allow_pickle=False)
+        else:
+            with h5py.File(self.filename, 'r') as file:
+                yield file[self.dataset]
+
+
 class ExpectedSedPlot(object):
     """ An expected SED report
 
@@ -0,0 +1,153 @@
+""" Index of the example COMBINE/OMEX archives of published projects, for discovering their test cases without parsing their
+expected results
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-28
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ._version import __version__
+from .utils import read_versioned_json, write_json_atomically
+import glob
+import hashlib
+import json
+import os
+
+__all__ = [
+    'ExamplesIndex',
+]
+
+
+class ExamplesIndex(object):
+    """ Index of the example COMBINE/OMEX archives of published projects
+
+    The index records a summary of the ``expected-results.json`` file of each example (its name, the path to its archive, the
+    requirements of its tasks, the simulators which should skip it, the tolerances for its results, etc.), without its expected
+    reports and plots. This enables the test cases for the examples to be discovered and filtered by the capabilities of
+    simulators without reading and converting their expected results.
+
+    Each entry is keyed by the path to its ``expected-results.json`` file relative to the directory of the examples, and records
+    the size, modification time, and SHA-256 digest of the file. The index is versioned (:obj:`VERSION` and the version of the test
+    suite). An entry is rebuilt when the size or modification time of its file changes (and its digest also changes), entries are
+    added and removed as examples are added to and removed from the directory, and the entire index is rebuilt when it was
+    generated for another directory or version.
+
+    Attributes:
+        filename (:obj:`str`): path to the index, or :obj:`None` to build the index in memory without saving it
+    """
+
+    VERSION = 1
+    EXPECTED_RESULTS_FILENAME = 'expected-results.json'
+    SUMMARY_EXCLUDED_KEYS = ('expectedReports', 'expectedPlots')
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the index, or :obj:`None` to build the index in memory without saving it
+        """
+        self.filename = filename
+
+    def get_entries(self, dir_name):
+        """ Get the entries of the index for the examples in a directory, updating the index if the examples changed
+
+        Args:
+            dir_name (:obj:`str`): directory of example COMBINE/OMEX archives
+
+        Returns:
+            :obj:`list` of :obj:`dict`: entries for the examples, sorted by the paths to their ``expected-results.json`` files.
+            The ``summary`` of each entry is the content of its ``expected-results.json`` file, without its expected reports and
+            plots.
+        """
+        dir_name = os.path.abspath(dir_name)
+        index = self.read()
+        if index.get('dirname', None) != dir_name:
+            index = {}
+        old_entries = index.get('entries', {})
+
+        rel_filenames = self.get_expected_results_filenames(dir_name)
+
+        entries = {}
+        changed = set(old_entries.keys()) != set(rel_filenames)
+        for rel_filename in rel_filenames:
+            entry = old_entries.get(rel_filename, None)
+            new_entry = self.get_entry(dir_name, rel_filename, entry)
+            if new_entry is not entry:
+                changed = True
+            entries[rel_filename] = new_entry
+
+        if changed:
+            self.write({
+                'dirname': dir_name,
+                'entries': entries,
+            })
+
+        return [entries[rel_filename] for rel_filename in sorted(entries.keys())]
+
+    def get_entry(self, dir_name, rel_filename, entry=None):
+        """ Get the entry for an example
+
+        Args:
+            dir_name (:obj:`str`): directory of example COMBINE/OMEX archives
+            rel_filename (:obj:`str`): path to the ``expected-results.json`` file of the example relative to :obj:`dir_name`
+            entry (:obj:`dict`, optional): previous entry for the example
+
+        Returns:
+            :obj:`dict`: entry for the example; :obj:`entry` if the file of the example hasn't changed
+        """
+        filename = os.path.join(dir_name, rel_filename)
+        stat = os.stat(filename)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry
+
+        with open(filename, 'rb') as file:
+            contents = file.read()
+        digest = hashlib.sha256(contents).hexdigest()
+
+        # the file was touched without changing its contents
+        if entry and entry['sha256'] == digest:
+            entry = dict(entry)
+            entry['size'] = stat.st_size
+            entry['mtime'] = stat.st_mtime_ns
+            return entry
+
+        data = json.loads(contents)
+        return {
+            'filename': rel_filename,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'sha256': digest,
+            'summary': {key: value for key, value in data.items() if key not in self.SUMMARY_EXCLUDED_KEYS},
+        }
+
+    def get_expected_results_filenames(self, dir_name):
+        """ Get the paths to the ``expected-results.json`` files of the examples in a directory
+
+        Args:
+            dir_name (:obj:`str`): directory of example COMBINE/OMEX archives
+
+        Returns:
+            :obj:`list` of :obj:`str`: paths to the ``expected-results.json`` files relative to :obj:`dir_name`
+        """
+        return sorted(
+            os.path.relpath(os.path.join(example_filename[0:-5], self.EXPECTED_RESULTS_FILENAME), dir_name)
+            for example_filename in glob.glob(os.path.join(dir_name, '**/*.omex'), recursive=True)
+        )
+
+    def read(self):
+        """ Read the index
+
+        Returns:
+            :obj:`dict`: index, or an empty dictionary if the index doesn't exist, can't be read, or is for another version
+        """
+        return read_versioned_json(self.filename, [self.VERSION, __version__]) or {}
+
+    def write(self, index):
+        """ Save the index with :obj:`write_json_atomically`
+
+        Args:
+            index (:obj:`dict`): index
+        """
+        index = dict(index)
+        index['version'] = [self.VERSION, __version__]
+        write_json_atomically(self.filename, index)
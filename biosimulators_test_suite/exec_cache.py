@@ -0,0 +1,339 @@
+""" Content-addressed cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-22
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ._version import __version__
+from .config import Config
+from biosimulators_utils.image import get_docker_image
+import contextlib
+import docker
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover # only reachable on Windows
+    fcntl = None
+
+__all__ = [
+    'ExecutionCache',
+    'get_archive_digest',
+    'get_cli_identity',
+    'get_docker_image_identity',
+    'get_dir_size',
+]
+
+
+class ExecutionCache(object):
+    """ Content-addressed cache of the outputs (e.g., reports, plots, logs) of the execution of COMBINE/OMEX archives by simulators
+
+    Each entry is keyed by
+
+    * the identity of the simulator (the id of its Docker image or a digest of its command-line interface),
+    * a digest of the contents of the archive,
+    * the environment variables used to execute the archive, and
+    * the version of the test suite.
+
+    Entries are evicted in least-recently used order when the size of the cache exceeds its maximum size. Test cases which
+    concurrently execute the same archive (e.g., in separate worker processes) can use :obj:`lock` so that the archive is only
+    executed once.
+
+    Attributes:
+        dirname (:obj:`str`): directory where the cache is stored
+        max_size (:obj:`int`): maximum size of the cache in bytes
+        _simulator_identities (:obj:`dict`): map from simulators to their identities
+        _lock (:obj:`threading.Lock`): lock for the identities of simulators
+    """
+
+    LAST_USED_FILENAME = '.last-used'
+
+    def __init__(self, dirname, max_size=None):
+        """
+        Args:
+            dirname (:obj:`str`): directory where the cache is stored
+            max_size (:obj:`int`, optional): maximum size of the cache in bytes
+        """
+        self.dirname = dirname
+        self.max_size = max_size if max_size is not None else Config().exec_cache_max_size
+        self._simulator_identities = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, archive_filename, specifications, cli=None, environment=None, singularity=False):
+        """ Get the key for the outputs of the execution of an archive by a simulator
+
+        Args:
+            archive_filename (:obj:`str`): path to the COMBINE/OMEX archive
+            specifications (:obj:`dict`): specifications of the simulator
+            cli (:obj:`str`, optional): command-line interface which executes the archive rather than the Docker image of the simulator
+            environment (:obj:`dict`, optional): environment variables for executing the archive
+            singularity (:obj:`bool`, optional): whether the archive is executed with a Singularity version of the Docker image
+
+        Returns:
+            :obj:`str`: key, or :obj:`None` if the identity of the simulator could not be determined
+        """
+        simulator_identity = self.get_simulator_identity(specifications, cli=cli)
+        if simulator_identity is None:
+            return None
+
+        return hashlib.sha256(json.dumps({
+            'simulator': simulator_identity,
+            'singularity': singularity,
+            'archive': get_archive_digest(archive_filename),
+            'environment': environment or {},
+            'testSuiteVersion': __version__,
+        }, sort_keys=True).encode()).hexdigest()
+
+    def get_simulator_identity(self, specifications, cli=None):
+        """ Get the identity of a simulator: the digest of its command-line interface or the id of its Docker image. The identity of
+        each simulator is determined once per cache instance. If configured, the Docker image is pulled before its id is determined.
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator
+            cli (:obj:`str`, optional): command-line interface which executes archives rather than the Docker image of the simulator
+
+        Returns:
+            :obj:`str`: identity of the simulator, or :obj:`None` if the identity could not be determined
+        """
+        simulator = ('cli', cli) if cli else ('image', specifications['image']['url'])
+        with self._lock:
+            if simulator not in self._simulator_identities:
+                if cli:
+                    identity = get_cli_identity(cli)
+                else:
+                    identity = get_docker_image_identity(specifications['image']['url'])
+                self._simulator_identities[simulator] = identity
+            return self._simulator_identities[simulator]
+
+    def get_entry_dirname(self, key):
+        """ Get the directory for an entry of the cache
+
+        Args:
+            key (:obj:`str`): key
+
+        Returns:
+            :obj:`str`: directory for the entry
+        """
+        return os.path.join(self.dirname, key[0:2], key)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """ Context manager which holds an exclusive lock on an entry of the cache. The lock is held across threads and processes
+        (via :obj:`fcntl.flock`; on platforms without :obj:`fcntl`, the lock is a no-op).
+
+        Args:
+            key (:obj:`str`): key
+        """
+        lock_filename = self.get_entry_dirname(key) + '.lock'
+        if not os.path.isdir(os.path.dirname(lock_filename)):
+            os.makedirs(os.path.dirname(lock_filename), exist_ok=True)
+
+        with open(lock_filename, 'a') as file:
+            if fcntl:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+    def restore(self, key, outputs_dirname):
+        """ Copy the cached outputs of the execution of an archive to a directory
+
+        Args:
+            key (:obj:`str`): key
+            outputs_dirname (:obj:`str`): directory to copy the outputs to
+
+        Returns:
+            :obj:`bool`: whether the outputs were cached
+        """
+        entry_dirname = self.get_entry_dirname(key)
+        if not os.path.isdir(entry_dirname):
+            return False
+
+        try:
+            self._touch(entry_dirname)
+            shutil.copytree(entry_dirname, outputs_dirname, dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns(self.LAST_USED_FILENAME))
+        except OSError:
+            # the entry was concurrently evicted
+            return False
+
+        return True
+
+    def save(self, key, outputs_dirname):
+        """ Save the outputs of the execution of an archive to the cache, and evict the least-recently used entries if
+        the cache has exceeded its maximum size
+
+        Args:
+            key (:obj:`str`): key
+            outputs_dirname (:obj:`str`): directory which contains the outputs
+        """
+        entry_dirname = self.get_entry_dirname(key)
+        if os.path.isdir(entry_dirname):
+            return
+
+        if not os.path.isdir(os.path.dirname(entry_dirname)):
+            os.makedirs(os.path.dirname(entry_dirname), exist_ok=True)
+
+        # copy the outputs to a temporary directory, then move them into place so that other processes never observe partial entries
+        temp_dirname = tempfile.mkdtemp(dir=os.path.dirname(entry_dirname))
+        try:
+            shutil.copytree(outputs_dirname, temp_dirname, dirs_exist_ok=True)
+            self._touch(temp_dirname)
+            os.rename(temp_dirname, entry_dirname)
+        except OSError:
+            # another process saved the same entry
+            shutil.rmtree(temp_dirname, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        """ Evict the least-recently used entries until the size of the cache does not exceed its maximum size """
+        entries = []
+        total_size = 0
+        for entry_dirname in self._get_entry_dirnames():
+            size = get_dir_size(entry_dirname)
+            try:
+                last_used = os.path.getmtime(os.path.join(entry_dirname, self.LAST_USED_FILENAME))
+            except OSError:
+                last_used = 0.
+            entries.append((last_used, size, entry_dirname))
+            total_size += size
+
+        entries.sort()
+        for _, size, entry_dirname in entries:
+            if total_size <= self.max_size:
+                break
+            self._remove_entry(entry_dirname)
+            total_size -= size
+
+    def clear(self):
+        """ Remove all entries from the cache """
+        for entry_dirname in self._get_entry_dirnames():
+            self._remove_entry(entry_dirname)
+
+    def _get_entry_dirnames(self):
+        """ Get the directories of the entries of the cache
+
+        Returns:
+            :obj:`list` of :obj:`str`: directories of the entries
+        """
+        entry_dirnames = []
+        if os.path.isdir(self.dirname):
+            for prefix in os.listdir(self.dirname):
+                prefix_dirname = os.path.join(self.dirname, prefix)
+                if os.path.isdir(prefix_dirname):
+                    for key in os.listdir(prefix_dirname):
+                        if len(key) == 64 and key.startswith(prefix) and os.path.isdir(os.path.join(prefix_dirname, key)):
+                            entry_dirnames.append(os.path.join(prefix_dirname, key))
+        return entry_dirnames
+
+    def _remove_entry(self, entry_dirname):
+        """ Remove an entry from the cache
+
+        Args:
+            entry_dirname (:obj:`str`): directory of the entry
+        """
+        # rename the entry first so that other processes never observe partially removed entries
+        temp_dirname = entry_dirname + '.removing.' + str(os.getpid()) + '.' + str(threading.get_ident())
+        try:
+            os.rename(entry_dirname, temp_dirname)
+        except OSError:
+            return
+        shutil.rmtree(temp_dirname, ignore_errors=True)
+
+    def _touch(self, entry_dirname):
+        """ Record that an entry was used
+
+        Args:
+            entry_dirname (:obj:`str`): directory of the entry
+        """
+        filename = os.path.join(entry_dirname, self.LAST_USED_FILENAME)
+        with open(filename, 'w'):
+            pass
+        now = time.time()
+        os.utime(filename, (now, now))
+
+
+def get_archive_digest(filename):
+    """ Get a digest of the contents of a COMBINE/OMEX archive. The digest is independent of the timestamps and compression
+    of the files in the archive.
+
+    Args:
+        filename (:obj:`str`): path to the archive
+
+    Returns:
+        :obj:`str`: digest
+    """
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(filename, 'r') as zip_file:
+        for name in sorted(zip_file.namelist()):
+            digest.update(name.encode())
+            digest.update(b'\0')
+            digest.update(hashlib.sha256(zip_file.read(name)).digest())
+    return digest.hexdigest()
+
+
+def get_cli_identity(cli):
+    """ Get the identity of a command-line interface: a digest of its executable
+
+    Args:
+        cli (:obj:`str`): command-line interface
+
+    Returns:
+        :obj:`str`: identity, or :obj:`None` if the executable could not be found
+    """
+    filename = shutil.which(cli)
+    if not filename:
+        return None
+
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(2 ** 20), b''):
+            digest.update(chunk)
+    return 'cli:' + digest.hexdigest()
+
+
+def get_docker_image_identity(url):
+    """ Get the identity of a Docker image: the id of the image. If configured, the image is first pulled.
+
+    Args:
+        url (:obj:`str`): URL of the image
+
+    Returns:
+        :obj:`str`: identity, or :obj:`None` if the image is not available
+    """
+    try:
+        image = get_docker_image(docker.from_env(), url, pull=Config().pull_docker_image)
+    except Exception:
+        return None
+    return 'image:' + image.id
+
+
+def get_dir_size(dirname):
+    """ Get the total size of the files in a directory
+
+    Args:
+        dirname (:obj:`str`): directory
+
+    Returns:
+        :obj:`int`: size in bytes
+    """
+    size = 0
+    for root, _, filenames in os.walk(dirname):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(root, filename))
+            except OSError:
+                pass
+    return size
@@ -8,6 +8,7 @@
 
 from .data_model import OutputMedium
 from .results.data_model import TestCaseResultType
+from .profiling import get_profile_summary
 from .results.io import write_test_results
 from biosimulators_utils.config import Colors
 import biosimulators_test_suite
@@ -56,6 +57,13 @@ class BaseController(cement.Controller):
                 default=None,
                 help="Path to save a report of the results in JSON format",
             )),
+            (['--report-jsonl'], dict(
+                default=None,
+                help=(
+                    "Path to stream the results in JSON Lines format as each test case completes. The first line describes the "
+                    "report; each subsequent line is the result of a test case."
+                ),
+            )),
             (['--verbose'], dict(
                 action='store_true',
                 help="If set, print the stdout and stderr of the execution of the tests in real time.",
@@ -79,6 +87,90 @@ class BaseController(cement.Controller):
                 action='store_true',
                 help="If set, create synthetic archives, but do not use the simulator to execute them.",
             )),
+            (['--exec-cache-dir'], dict(
+                default=None,
+                help=(
+                    "Directory to cache the outputs of the execution of COMBINE/OMEX archives by the simulator. When the same "
+                    "image (or command-line interface) executes an identical archive with the same environment, the cached outputs "
+                    "are used rather than executing the archive again. Default: the value of the `EXEC_CACHE_DIRNAME` "
+                    "environment variable. If neither is set, outputs are not cached."
+                ),
+            )),
+            (['--no-exec-cache'], dict(
+                action='store_true',
+                help="If set, don't use cached outputs of the execution of COMBINE/OMEX archives, and don't cache outputs.",
+            )),
+            (['--persistent-container'], dict(
+                action='store_true',
+                help=(
+                    "If set, execute COMBINE/OMEX archives in a long-lived container for the simulator (with `docker exec`) rather "
+                    "than in a new container for each archive (with `docker run`)."
+                ),
+            )),
+            (['--profile-dir'], dict(
+                default=None,
+                help=(
+                    "Directory to save a profile (`.pstats` file) of the evaluation of each test case. If set, a summary of the "
+                    "functions which consumed the most time across the test cases is printed at the end of the run."
+                ),
+            )),
+            (['--profile-collapsed-stacks'], dict(
+                action='store_true',
+                help="If set, also save the profile of each test case as collapsed stacks for visualization as a flame graph.",
+            )),
+            (['--profile-top'], dict(
+                type=int,
+                default=20,
+                help="Number of functions to include in the summary of the profiles of the test cases. Default: 20",
+            )),
+            (['-j', '--jobs'], dict(
+                type=int,
+                default=1,
+                help=(
+                    "Number of test cases to evaluate concurrently. This multiplies with the number of the synthetic archives of "
+                    "each test case which are executed concurrently (`SYNTHETIC_ARCHIVE_CONCURRENCY` environment variable). "
+                    "Default: 1"
+                ),
+            )),
+            (['--time-budget'], dict(
+                type=float,
+                default=None,
+                metavar='SECONDS',
+                help=(
+                    "Time budget for the run in seconds. If set, only the most valuable subset of the test cases (e.g., test cases "
+                    "which failed in the previous run, and test cases which cover each suite) which is predicted to be evaluated "
+                    "within the budget is evaluated, using the durations of the test cases in previous runs (see `--case-durations` "
+                    "and `--durations-from`). The deferred test cases are listed. Default: evaluate all of the test cases."
+                ),
+            )),
+            (['--case-durations'], dict(
+                default=None,
+                metavar='FILENAME',
+                help=(
+                    "Path to save the durations of the test cases of each run to, for scheduling the test cases of subsequent runs "
+                    "(see `--jobs` and `--time-budget`). Default: the value of the `CASE_DURATIONS_FILENAME` environment variable. "
+                    "If neither is set, durations are not saved."
+                ),
+            )),
+            (['--durations-from'], dict(
+                action='append',
+                default=None,
+                metavar='REPORT',
+                help=(
+                    "Path to a report of a previous run (saved with `--report` or `--report-jsonl`) to read the durations of the "
+                    "test cases from. When test cases are evaluated concurrently, they are started longest-first by their "
+                    "durations in these reports and in previous runs. Can be used multiple times."
+                ),
+            )),
+            (['--pipeline-depth'], dict(
+                type=int,
+                default=None,
+                help=(
+                    "Maximum number of upcoming test cases whose synthetic COMBINE/OMEX archives are prepared while the current test "
+                    "case is evaluated. 0 prepares each test case when it is evaluated. Only applies when test cases are evaluated "
+                    "one at a time. Default: the value of the `PIPELINE_DEPTH` environment variable, or 0."
+                ),
+            )),
             (['-v', '--version'], dict(
                 action='version',
                 version=biosimulators_test_suite.__version__,
@@ -100,7 +192,19 @@ class BaseController(cement.Controller):
                 working_dirname=args.work_dir,
                 dry_run=args.dry_run,
                 cli=args.cli,
-                validate_specs=not args.do_not_validate_specs)
+                validate_specs=not args.do_not_validate_specs,
+                jobs=args.jobs,
+                pipeline_depth=args.pipeline_depth,
+                case_durations_filename=args.case_durations,
+                case_duration_report_filenames=args.durations_from,
+                time_budget=args.time_budget,
+                use_persistent_container=args.persistent_container,
+                report_jsonl_filename=args.report_jsonl,
+                retain_logs=args.report is not None or args.report_jsonl is None,
+                profile_dirname=args.profile_dir,
+                profile_collapsed_stacks=args.profile_collapsed_stacks,
+                exec_cache_dirname=args.exec_cache_dir,
+                use_exec_cache=not args.no_exec_cache)
             results = validator.run()
 
             # print summary
@@ -127,6 +231,14 @@ class BaseController(cement.Controller):
                 print(termcolor.colored('', color))
                 print(termcolor.colored('* ' + '\n\n* '.join(skipped_details), color))
                 print('')
+            if args.profile_dir:
+                profile_summary = get_profile_summary(args.profile_dir, n=args.profile_top,
+                                                      case_ids=[result.case.id for result in results])
+                if profile_summary:
+                    print('=============== PROFILE ================')
+                    print('')
+                    print(profile_summary)
+                    print('')
 
             # optionally, save report of results to a JSON file
             if args.report:
@@ -6,10 +6,18 @@
 :License: MIT
 """
 
+from .capabilities import SimulatorCapabilities
 from .config import Config
 from .data_model import TestCase, OutputMedium
-from .exceptions import SkippedTestCaseException, TimeoutException
+from .exceptions import SkippedTestCaseException
+from .exec_cache import ExecutionCache
+from .incremental import get_cases_to_revalidate
+from .persistent_container import PersistentSimulatorContainer
+from .profiling import CaseProfiler
+from .recording import route_thread_output
 from .results.data_model import TestCaseResult, TestCaseResultType
+from .results.io import TestResultsJsonLinesWriter
+from .scheduling import CaseDurationStore, CaseScheduler, read_case_durations_from_report, read_case_result_types_from_report
 from .test_case import cli
 from .test_case import combine_archive
 from .test_case import docker_image
@@ -17,17 +25,22 @@ from .test_case import log
 from .test_case import published_project
 from .test_case import results_report
 from .test_case import sedml
+from .timing import PhaseTimer, phase, get_phase_group
+from .utils import format_traceback
 from .warnings import TestCaseWarning, IgnoredTestCaseWarning
+from .watchdog import Watchdog
 from biosimulators_utils.config import Colors
 from biosimulators_utils.log.utils import StandardOutputErrorCapturer
 import biosimulators_utils.simulator.io
 import collections
+import concurrent.futures
 import contextlib
 import datetime
 import inspect
+import multiprocessing
 import os
+import pickle
 import shutil
-import signal
 import sys
 import tempfile
 import termcolor
@@ -43,6 +56,8 @@ class SimulatorValidator(object):
 
     Attributes:
         specifications (:obj:`str` or :obj:`dict`): path or URL to the specifications of the simulator, or the specifications of the simulator
+        capabilities (:obj:`SimulatorCapabilities`): index of the capabilities of the simulator which is shared by the test cases
+            of a validation run
         cases (:obj:`collections.OrderedDict` of :obj:`types.ModuleType` to :obj:`TestCase`): groups of test cases
         verbose (:obj:`bool`): if :obj:`True`, display stdout/stderr from executing cases in real time
         synthetic_archives_dir (:obj:`str`): Directory to save the synthetic COMBINE/OMEX archives generated by the test cases
@@ -52,10 +67,40 @@ class SimulatorValidator(object):
         dry_run (:obj:`bool`): if :obj:`True`, do not use the simulator to execute COMBINE/OMEX archives.
         cli (:obj:`str`): command-line interface to use to execute the tests involving the simulation of COMBINE/OMEX
             archives rather than a Docker image
+        jobs (:obj:`int`): number of test cases to evaluate concurrently
+        pipeline_depth (:obj:`int`): maximum number of upcoming test cases whose synthetic COMBINE/OMEX archives are prepared
+            while the current test case is evaluated
+        case_duration_store (:obj:`CaseDurationStore`): store of the durations of the test cases of previous runs
+        case_duration_report_filenames (:obj:`list` of :obj:`str`): paths to reports of previous runs to read the durations of
+            test cases from
+        reused_results (:obj:`list` of :obj:`TestCaseResult`): results of the test cases which were reused from the report of a
+            previous validation of the simulator rather than evaluated
+        time_budget (:obj:`float`): time budget for the run in seconds, or :obj:`None` to evaluate all of the test cases
+        deferred_cases (:obj:`list` of :obj:`TestCase`): test cases which were deferred to fit within :obj:`time_budget`
+        curated_archive_cache (:obj:`published_project.CuratedArchiveCache`): cache of the contents of the curated COMBINE/OMEX
+            archives which is shared by the test cases of a validation run
+        exec_cache (:obj:`ExecutionCache`): cache of the outputs of the execution of COMBINE/OMEX archives by the simulator, or
+            :obj:`None` if outputs should not be cached
+        deduplicate_execs (:obj:`bool`): whether to execute each distinct synthetic COMBINE/OMEX archive only once per run
+        use_persistent_container (:obj:`bool`): whether to execute COMBINE/OMEX archives in a long-lived container for the
+            simulator rather than in a new container for each archive
+        report_jsonl_filename (:obj:`str`): path to stream the results of the test cases to in JSON Lines format
+        retain_logs (:obj:`bool`): whether to retain the logs of the test cases which passed without warnings after they have
+            been streamed to :obj:`report_jsonl_filename`
+        profiler (:obj:`CaseProfiler`): profiler for the evaluation of each test case, or :obj:`None` if test cases should
+            not be profiled
+        image_digest (:obj:`str`): digest of the Docker image of the simulator
+        gh_issue (:obj:`int`): number of the GitHub issue which triggered the validation of the simulator
+        gh_action_run (:obj:`int`): id of the GitHub action run which validated the simulator
     """
 
     def __init__(self, specifications, case_ids=None, verbose=False, synthetic_archives_dir=None, output_medium=OutputMedium.console,
-                 log_std_out_err=True, working_dirname=None, dry_run=False, cli=None, validate_specs=True):
+                 log_std_out_err=True, working_dirname=None, dry_run=False, cli=None, validate_specs=True, jobs=1,
+                 exec_cache_dirname=None, use_exec_cache=True, deduplicate_execs=True,
+                 use_persistent_container=False, report_jsonl_filename=None, retain_logs=True,
+                 profile_dirname=None, profile_collapsed_stacks=False, pipeline_depth=None, case_durations_filename=None,
+                 case_duration_report_filenames=None, time_budget=None, previous_report=None, image_digest=None,
+                 gh_issue=None, gh_action_run=None):
         """
         Args:
             specifications (:obj:`str` or :obj:`dict`): path or URL to the specifications of the simulator, or the specifications of the simulator
@@ -70,12 +115,68 @@ class SimulatorValidator(object):
             cli (:obj:`str`, optional): command-line interface to use to execute the tests involving the simulation of COMBINE/OMEX
                 archives rather than a Docker image
             validate_specs (:obj:`bool`, optional): whether to validate specifications
+            jobs (:obj:`int`, optional): number of test cases to evaluate concurrently. Each test case is evaluated in a
+                separate worker process so that its standard output, standard error, and warnings can be captured independently.
+                Each test case can also execute several of its synthetic COMBINE/OMEX archives concurrently
+                (``SYNTHETIC_ARCHIVE_CONCURRENCY`` environment variable, default ``1``). These limits multiply: up to
+                :obj:`jobs` times ``SYNTHETIC_ARCHIVE_CONCURRENCY`` archives can be executed by the simulator at once.
+            exec_cache_dirname (:obj:`str`, optional): directory to cache the outputs of the execution of COMBINE/OMEX archives by
+                the simulator. Default: the value of the ``EXEC_CACHE_DIRNAME`` environment variable. If neither is set, outputs
+                are not cached.
+            use_exec_cache (:obj:`bool`, optional): if :obj:`False`, do not cache the outputs of the execution of COMBINE/OMEX
+                archives, even if a directory for the cache is configured
+            deduplicate_execs (:obj:`bool`, optional): whether to execute each distinct synthetic COMBINE/OMEX archive only once
+                per run. Many test cases generate identical archives (e.g., from the same curated archive) and only differ in how
+                they check the outputs of the simulator. If :obj:`True`, the outputs of the first execution of each archive (with
+                each set of environment variables) are shared with the other test cases which generate the same archive.
+            use_persistent_container (:obj:`bool`, optional): whether to execute COMBINE/OMEX archives in a long-lived container
+                for the simulator (with ``docker exec``) rather than in a new container for each archive (with ``docker run``).
+                This avoids the cost of starting a container and initializing the simulator for each archive. The container is
+                removed at the end of each run.
+            report_jsonl_filename (:obj:`str`, optional): path to stream the results of the test cases to in JSON Lines format as
+                each test case completes
+            retain_logs (:obj:`bool`, optional): whether to retain the logs of the test cases which passed without warnings after
+                they have been streamed to :obj:`report_jsonl_filename`. Summaries of results do not display these logs.
+                Discarding them keeps the memory used by large runs flat.
+            profile_dirname (:obj:`str`, optional): directory to save a profile of the evaluation of each test case. If
+                :obj:`None`, test cases are not profiled.
+            profile_collapsed_stacks (:obj:`bool`, optional): whether to also save the profile of each test case as collapsed
+                stacks for visualization as a flame graph
+            pipeline_depth (:obj:`int`, optional): maximum number of upcoming test cases whose synthetic COMBINE/OMEX archives
+                are prepared (curated archive extracted, synthetic archives built and written) in a background thread while the
+                current test case is evaluated. This hides the preparation of archives behind the execution of the previous
+                archives by the simulator, and bounds the disk used by prepared archives. ``0`` prepares each test case when it
+                is evaluated. Only applies when test cases are evaluated one at a time (:obj:`jobs` is 1). The standard
+                output/error and warnings of the preparation are attributed to the test case which is prepared, except for output
+                which C libraries write directly to the standard output/error of the process. Default: the value of the
+                ``PIPELINE_DEPTH`` environment variable, or ``0``.
+            case_durations_filename (:obj:`str`, optional): path to save the durations of the test cases of each run to, for
+                scheduling the test cases of subsequent runs. Default: the value of the ``CASE_DURATIONS_FILENAME`` environment
+                variable. If neither is set, durations are not saved.
+            case_duration_report_filenames (:obj:`list` of :obj:`str`, optional): paths to reports of previous runs (JSON or JSON
+                Lines) to read the durations of test cases from. When test cases are evaluated concurrently, they are started
+                longest-first by their durations in these reports and in the store of the durations of previous runs
+                (:obj:`case_durations_filename`).
+            time_budget (:obj:`float`, optional): time budget for the run in seconds. If set, only the most valuable subset of
+                the test cases which is predicted to be evaluated within the budget is evaluated (see :obj:`CaseScheduler.select`),
+                and the other test cases are deferred. If :obj:`None`, all of the test cases are evaluated.
+            previous_report (:obj:`TestResultsReport`, optional): report of a previous validation of the simulator. If set, only
+                the test cases which could have different outcomes than in this report (e.g., because the Docker image of the
+                simulator or the algorithms in its specifications changed) are evaluated, and the results of the other test cases
+                are reused from the report (see :obj:`get_cases_to_revalidate`).
+            image_digest (:obj:`str`, optional): digest of the Docker image of the simulator, for comparison with the digest
+                recorded in :obj:`previous_report` and to record in the report streamed to :obj:`report_jsonl_filename`
+            gh_issue (:obj:`int`, optional): number of the GitHub issue which triggered the validation of the simulator, to
+                record in the report streamed to :obj:`report_jsonl_filename`
+            gh_action_run (:obj:`int`, optional): id of the GitHub action run which validated the simulator, to record in the
+                report streamed to :obj:`report_jsonl_filename`
         """
         # if necessary, get and validate specifications of simulator
         if isinstance(specifications, str):
             specifications = biosimulators_utils.simulator.io.read_simulator_specs(specifications, validate=validate_specs)
 
         self.specifications = specifications
+        self.capabilities = SimulatorCapabilities(specifications)
         self.verbose = verbose
         if synthetic_archives_dir and not os.path.isdir(synthetic_archives_dir):
             os.makedirs(synthetic_archives_dir)
@@ -85,10 +186,57 @@ class SimulatorValidator(object):
         self.working_dirname = working_dirname
         self.dry_run = dry_run
         self.cli = cli
+        if jobs < 1:
+            raise ValueError('The number of jobs must be a positive integer, not `{}`.'.format(jobs))
+        self.jobs = jobs
+        self.curated_archive_cache = published_project.CuratedArchiveCache()
+
+        config = Config()
+        if pipeline_depth is None:
+            pipeline_depth = config.pipeline_depth
+        if pipeline_depth < 0:
+            raise ValueError('The depth of the pipeline must be a non-negative integer, not `{}`.'.format(pipeline_depth))
+        self.pipeline_depth = pipeline_depth
+        self.case_duration_store = CaseDurationStore(case_durations_filename or config.case_durations_filename)
+        self.case_duration_report_filenames = case_duration_report_filenames or []
+        exec_cache_dirname = exec_cache_dirname or config.exec_cache_dirname
+        if use_exec_cache and exec_cache_dirname:
+            self.exec_cache = ExecutionCache(exec_cache_dirname, max_size=config.exec_cache_max_size)
+        else:
+            self.exec_cache = None
+        self.deduplicate_execs = deduplicate_execs
+        self.use_persistent_container = use_persistent_container
+        self.report_jsonl_filename = report_jsonl_filename
+        self.retain_logs = retain_logs
+        if profile_dirname:
+            self.profiler = CaseProfiler(profile_dirname, collapsed_stacks=profile_collapsed_stacks)
+        else:
+            self.profiler = None
+        self.image_digest = image_digest
+        self.gh_issue = gh_issue
+        self.gh_action_run = gh_action_run
 
         self.cases = self.find_cases(ids=case_ids)
-
-        self.test_case_timeout = Config().test_case_timeout
+        self._case_indices = {
+            case: i_case
+            for i_case, case in enumerate(case for suite_cases in self.cases.values() for case in suite_cases)
+        }
+
+        if previous_report is None:
+            self.reused_results = []
+        else:
+            self.cases, self.reused_results = get_cases_to_revalidate(self.cases, self.specifications, image_digest,
+                                                                      previous_report)
+
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError('The time budget must be a positive number of seconds, not `{}`.'.format(time_budget))
+        self.time_budget = time_budget
+        if time_budget is None:
+            self.deferred_cases = []
+        else:
+            self.cases, self.deferred_cases = self.get_case_scheduler().select(self.cases, time_budget, jobs=jobs)
+
+        self.test_case_timeout = config.test_case_timeout
 
     def find_cases(self, ids=None):
         """ Find test cases
@@ -104,7 +252,7 @@ class SimulatorValidator(object):
 
         # get cases involving curated published COMBINE/OMEX archives
         all_published_projects_test_cases, compatible_published_projects_test_cases = published_project.find_cases(
-            self.specifications, output_medium=self.output_medium)
+            self.specifications, output_medium=self.output_medium, exec_cache=self.exec_cache, capabilities=self.capabilities)
 
         # get Docker image cases
         suite_name = docker_image.__name__.replace('biosimulators_test_suite.test_case.', '')
@@ -203,9 +351,13 @@ class SimulatorValidator(object):
                         description = ' '.join(line.strip() for line in description_lines) or None
                     if issubclass(child, published_project.SyntheticCombineArchiveTestCase):
                         case = child(id=case_id, description=description, output_medium=self.output_medium,
-                                     published_projects_test_cases=published_projects_test_cases)
+                                     published_projects_test_cases=published_projects_test_cases,
+                                     curated_archive_cache=self.curated_archive_cache,
+                                     exec_cache=self.exec_cache,
+                                     capabilities=self.capabilities)
                     else:
-                        case = child(id=case_id, description=description, output_medium=self.output_medium)
+                        case = child(id=case_id, description=description, output_medium=self.output_medium,
+                                     capabilities=self.capabilities)
                     cases.append(case)
 
                 else:
@@ -230,6 +382,11 @@ class SimulatorValidator(object):
         for suite_cases in self.cases.values():
             n_cases += len(suite_cases)
         print('Collected {} test cases.'.format(n_cases))
+        if self.reused_results:
+            print('Reused the results of {} test cases from a previous validation.'.format(len(self.reused_results)))
+        if self.deferred_cases:
+            print('Deferred {} test cases to fit within the time budget of {:.1f} s:\n  {}'.format(
+                len(self.deferred_cases), self.time_budget, '\n  '.join(case.id for case in self.deferred_cases)))
 
         # get start time
         start = datetime.datetime.now()
@@ -237,46 +394,236 @@ class SimulatorValidator(object):
         # execute test cases and collect results
         results = []
         working_dirname = self.working_dirname or tempfile.mkdtemp()
-        for suite_name, suite_cases in self.cases.items():
-            print('\nExecuting {} {} tests ... {}'.format(len(suite_cases), suite_name, 'done' if not suite_cases else ''))
-            for i_case, case in enumerate(suite_cases):
-                print('  {}: {} ... '.format(i_case + 1, case.id), end='')
-                sys.stdout.flush()
-
-                result = self.eval_case(case, os.path.join(working_dirname, suite_name, case.id))
-                results.append(result)
 
-                print(termcolor.colored(result.type.value, Colors[result.type.value].value), end='')
-                print(' (', end='')
-                if result.warnings:
-                    print(termcolor.colored(str(len(result.warnings)) + ' warnings, ', Colors.warned.value), end='')
-                print('{:.1f} s'.format(result.duration), end='')
-                print(').')
+        # share the outputs of the execution of each distinct synthetic archive among the test cases of the run
+        if self.deduplicate_execs and self.exec_cache is None and not self.dry_run:
+            run_exec_cache = ExecutionCache(os.path.join(working_dirname, '.execs'), max_size=sys.maxsize)
+            self.set_exec_cache_of_synthetic_cases(run_exec_cache)
+        else:
+            run_exec_cache = None
+
+        # execute the archives of the run in a long-lived container
+        if self.use_persistent_container and not self.cli and not self.dry_run:
+            config = Config()
+            user_to_exec_within_container = config.user_to_exec_in_simulator_containers
+            if os.getenv('CI', 'false').lower() in ['1', 'true']:
+                user_to_exec_within_container = '_SUDO_'
+            persistent_container = PersistentSimulatorContainer(self.specifications['image']['url'],
+                                                                pull_docker_image=config.pull_docker_image,
+                                                                user_to_exec_within_container=user_to_exec_within_container)
+            self.set_persistent_container_of_cases(persistent_container)
+        else:
+            persistent_container = None
+
+        # stream the results to a file as the test cases complete
+        if self.report_jsonl_filename:
+            report_writer = TestResultsJsonLinesWriter(self.report_jsonl_filename,
+                                                       gh_issue=self.gh_issue, gh_action_run=self.gh_action_run,
+                                                       specifications=self.specifications, image_digest=self.image_digest)
+            for result in self.reused_results:
+                report_writer.write(result)
+        else:
+            report_writer = None
+
+        if self.jobs > 1:
+            # start the test cases longest-first so that long test cases don't start last and dominate the duration of the run
+            scheduler = self.get_case_scheduler()
+            case_positions = collections.OrderedDict(
+                (case, (suite_name, i_case))
+                for suite_name, suite_cases in self.cases.items()
+                for i_case, case in enumerate(suite_cases)
+            )
+            estimated_durations = scheduler.estimate_durations(list(case_positions.keys()))
+            predicted_duration = scheduler.predict_makespan(list(case_positions.keys()), self.jobs,
+                                                            estimated_durations=estimated_durations)
+            print('Predicted duration: {:.1f} s.'.format(predicted_duration))
+
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.jobs,
+                                                              mp_context=get_worker_multiprocessing_context(),
+                                                              initializer=_init_worker,
+                                                              initargs=(self,))
+            futures = {}
+            for case in scheduler.order(list(case_positions.keys()), estimated_durations=estimated_durations):
+                suite_name, i_case = case_positions[case]
+                futures[case] = executor.submit(_eval_case_in_worker, suite_name, i_case,
+                                                os.path.join(working_dirname, suite_name, case.id))
+        else:
+            executor = None
+            predicted_duration = None
+
+        # prepare the synthetic archives of upcoming test cases while the simulator executes the archives of the current case
+        if executor is None and self.pipeline_depth > 0:
+            preparer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='prepare-synthetic-archives')
+            cases_to_prepare = collections.deque(
+                (case, os.path.join(working_dirname, suite_name, case.id))
+                for suite_name, suite_cases in self.cases.items()
+                for case in suite_cases
+                if isinstance(case, published_project.SyntheticCombineArchiveTestCase)
+            )
+        else:
+            preparer = None
+            cases_to_prepare = collections.deque()
+        preparations = {}
+
+        # route the output and warnings of the preparation of upcoming test cases to the test cases which they belong to, also
+        # between the evaluations of test cases, and filter the warnings of the preparation as in the evaluation of test cases
+        output_routing = contextlib.ExitStack()
+        if preparer:
+            output_routing.enter_context(warnings.catch_warnings())
+            warnings.simplefilter("ignore")
+            warnings.simplefilter("always", TestCaseWarning)
+            output_routing.enter_context(route_thread_output())
+
+        try:
+            for suite_name, suite_cases in self.cases.items():
+                print('\nExecuting {} {} tests ... {}'.format(len(suite_cases), suite_name, 'done' if not suite_cases else ''))
+                for i_case, case in enumerate(suite_cases):
+                    print('  {}: {} ... '.format(i_case + 1, case.id), end='')
+                    sys.stdout.flush()
+
+                    if executor:
+                        result = self.get_result_from_worker(case, futures[case])
+                    else:
+                        if preparer:
+                            self.prepare_upcoming_cases(preparer, cases_to_prepare, preparations, current_case=case)
+                        result = self.eval_case(case, os.path.join(working_dirname, suite_name, case.id),
+                                                preparation=preparations.pop(case, None))
+                    results.append(result)
+
+                    if report_writer:
+                        report_writer.write(result)
+                        if not self.retain_logs and result.type == TestCaseResultType.passed and not result.warnings:
+                            result.log = None
+
+                    print(termcolor.colored(result.type.value, Colors[result.type.value].value), end='')
+                    print(' (', end='')
+                    if result.warnings:
+                        print(termcolor.colored(str(len(result.warnings)) + ' warnings, ', Colors.warned.value), end='')
+                    print('{:.1f} s'.format(result.duration), end='')
+                    print(').')
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            if preparer:
+                preparer.shutdown(wait=True, cancel_futures=True)
+            output_routing.close()
+
+            if run_exec_cache:
+                self.set_exec_cache_of_synthetic_cases(self.exec_cache)
+                shutil.rmtree(run_exec_cache.dirname, ignore_errors=True)
+
+            if persistent_container:
+                self.set_persistent_container_of_cases(None)
+                persistent_container.stop()
+
+            if report_writer:
+                report_writer.close()
 
         if self.working_dirname is None:
             shutil.rmtree(working_dirname)
 
+        # record the durations of the test cases for scheduling subsequent runs
+        if not self.dry_run and self.specifications.get('id', None):
+            self.case_duration_store.update(self.specifications['id'], results)
+
+        # merge the results which were reused from a previous validation
+        if self.reused_results:
+            results = sorted(results + self.reused_results, key=lambda result: self._case_indices[result.case])
+
         # get total duration
         duration = (datetime.datetime.now() - start).total_seconds()
 
         # print completion message
-        print('\n{} tests completed in {:.1f} s'.format(n_cases, duration))
+        if predicted_duration is None:
+            print('\n{} tests completed in {:.1f} s'.format(n_cases, duration))
+        else:
+            print('\n{} tests completed in {:.1f} s (predicted: {:.1f} s)'.format(n_cases, duration, predicted_duration))
 
         # return results
         return results
 
-    def eval_case(self, case, working_dirname):
+    def get_case_scheduler(self):
+        """ Get a scheduler for the test cases from the durations and results of the test cases of previous runs
+
+        Returns:
+            :obj:`CaseScheduler`: scheduler
+        """
+        if self.specifications.get('id', None):
+            durations = self.case_duration_store.get_durations(self.specifications['id'])
+            result_types = self.case_duration_store.get_result_types(self.specifications['id'])
+        else:
+            durations = {}
+            result_types = {}
+        for report_filename in self.case_duration_report_filenames:
+            durations.update(read_case_durations_from_report(report_filename))
+            result_types.update(read_case_result_types_from_report(report_filename))
+        return CaseScheduler(durations, result_types=result_types)
+
+    def set_exec_cache_of_synthetic_cases(self, exec_cache):
+        """ Set the cache of the outputs of the execution of COMBINE/OMEX archives used by the test cases which generate
+        synthetic archives
+
+        Args:
+            exec_cache (:obj:`ExecutionCache`): cache, or :obj:`None` to not cache outputs
+        """
+        for suite_cases in self.cases.values():
+            for case in suite_cases:
+                if isinstance(case, published_project.SyntheticCombineArchiveTestCase):
+                    case.exec_cache = exec_cache
+
+    def set_persistent_container_of_cases(self, persistent_container):
+        """ Set the long-lived container used by the test cases which execute COMBINE/OMEX archives
+
+        Args:
+            persistent_container (:obj:`PersistentSimulatorContainer`): container, or :obj:`None` to execute each archive in a
+                new container
+        """
+        for suite_cases in self.cases.values():
+            for case in suite_cases:
+                if isinstance(case, (published_project.SimulatorCanExecutePublishedProject,
+                                     published_project.SyntheticCombineArchiveTestCase)):
+                    case.persistent_container = persistent_container
+
+    def prepare_upcoming_cases(self, preparer, cases_to_prepare, preparations, current_case=None):
+        """ Submit the preparation of the synthetic archives of upcoming test cases, keeping at most :obj:`pipeline_depth`
+        test cases after the current test case prepared or in preparation
+
+        Args:
+            preparer (:obj:`concurrent.futures.Executor`): executor for preparing test cases
+            cases_to_prepare (:obj:`collections.deque` of :obj:`tuple`): test cases which have not been submitted for preparation
+                and their working directories, in the order in which they will be evaluated
+            preparations (:obj:`dict` of :obj:`TestCase` to :obj:`concurrent.futures.Future`): map from test cases to the
+                futures for the durations of the phases of their preparation
+            current_case (:obj:`TestCase`, optional): test case which is about to be evaluated
+        """
+        n_upcoming = len(preparations) - (current_case in preparations)
+        while cases_to_prepare and n_upcoming < self.pipeline_depth:
+            case, case_working_dirname = cases_to_prepare.popleft()
+            preparations[case] = preparer.submit(_prepare_case, case, self.specifications, case_working_dirname,
+                                                 synthetic_archives_dir=self.synthetic_archives_dir)
+            if case is not current_case:
+                n_upcoming += 1
+
+    def eval_case(self, case, working_dirname, preparation=None):
         """ Evaluate a test case for a simulator
 
         Args:
             case (:obj:`TestCase`): test case
             working_dirname (:obj:`str`): directory for temporary files for evaluating test case
+            preparation (:obj:`concurrent.futures.Future`, optional): future for the durations of the phases of the preparation
+                of the synthetic archives of the test case (see :obj:`prepare_upcoming_cases`)
 
         Returns:
             :obj:`TestCaseResult`: test case result
         """
         start_time = datetime.datetime.now()
 
+        timer = PhaseTimer()
+        if self.profiler:
+            profiler = self.profiler.profile(case.id)
+        else:
+            profiler = contextlib.nullcontext()
         with StandardOutputErrorCapturer(relay=self.verbose, disabled=not self.log_std_out_err) as captured:
             with warnings.catch_warnings(record=True) as caught_warnings:
                 warnings.simplefilter("ignore")
@@ -284,12 +631,18 @@ class SimulatorValidator(object):
 
                 try:
 
-                    with time_limit(seconds=self.test_case_timeout):
-                        case.eval(self.specifications,
-                                  working_dirname,
-                                  synthetic_archives_dir=self.synthetic_archives_dir,
-                                  dry_run=self.dry_run,
-                                  cli=self.cli)
+                    with route_thread_output(), Watchdog(self.test_case_timeout, working_dirname=working_dirname):
+                        with timer, phase('eval'), profiler:
+                            if preparation:
+                                with phase('awaitPreparation'):
+                                    preparation_timings = preparation.result()
+                                for name, duration in preparation_timings.items():
+                                    timer.add(name, duration)
+                            case.eval(self.specifications,
+                                      working_dirname,
+                                      synthetic_archives_dir=self.synthetic_archives_dir,
+                                      dry_run=self.dry_run,
+                                      cli=self.cli)
                     type = TestCaseResultType.passed
                     exception = None
                     exception_traceback = None
@@ -299,12 +652,14 @@ class SimulatorValidator(object):
                     type = TestCaseResultType.skipped
                     exception = None
                     exception_traceback = None
-                    skip_reason = caught_exception
+                    skip_reason = _release_frames_of_exception(caught_exception)
 
                 except Exception as caught_exception:
+                    # capture a summary of the frames of the traceback rather than the traceback itself so that the frames (and
+                    # their local variables, such as simulation results) can be released
                     type = TestCaseResultType.failed
-                    exception = caught_exception
-                    exception_traceback = sys.exc_info()[2]
+                    exception_traceback = traceback.extract_tb(sys.exc_info()[2])
+                    exception = _release_frames_of_exception(caught_exception)
                     skip_reason = None
 
                 duration = (datetime.datetime.now() - start_time).total_seconds()
@@ -317,7 +672,36 @@ class SimulatorValidator(object):
                     exception_traceback=exception_traceback,
                     warnings=caught_warnings,
                     skip_reason=skip_reason,
-                    log=captured.get_text())
+                    log=captured.get_text(),
+                    timings=timer.timings)
+
+    @staticmethod
+    def get_result_from_worker(case, future):
+        """ Get the result of a test case which was evaluated by a worker process
+
+        Args:
+            case (:obj:`TestCase`): test case
+            future (:obj:`concurrent.futures.Future`): future for the result of the evaluation of the test case
+
+        Returns:
+            :obj:`TestCaseResult`: test case result
+        """
+        try:
+            result = future.result()
+
+        except Exception as caught_exception:
+            # the worker process terminated abnormally (e.g., it was killed by the operating system)
+            exception_traceback = traceback.extract_tb(sys.exc_info()[2])
+            return TestCaseResult(
+                case=case,
+                type=TestCaseResultType.failed,
+                duration=0.,
+                exception=_release_frames_of_exception(caught_exception),
+                exception_traceback=exception_traceback,
+            )
+
+        result.case = case
+        return result
 
     @staticmethod
     def summarize_results(results, debug=False, output_medium=OutputMedium.console):
@@ -368,7 +752,7 @@ class SimulatorValidator(object):
                 detail += '  {}\n'.format(str(result.exception).replace('\n', '\n  '))
                 if debug and result.exception_traceback:
                     detail += '\n'
-                    detail += '  {}\n'.format('\n'.join(traceback.format_tb(result.exception_traceback)).replace('\n', '\n  '))
+                    detail += '  {}\n'.format('\n'.join(format_traceback(result.exception_traceback)).replace('\n', '\n  '))
                 detail += '  ```\n'
                 detail += '\n'
 
@@ -463,34 +847,148 @@ class SimulatorValidator(object):
 
                 warning_details.append(detail)
 
+        # summarize the durations of the phases of the test cases
+        phase_durations = collections.defaultdict(float)
+        phase_cases = collections.defaultdict(set)
+        for i_result, result in enumerate(results):
+            for name, duration in result.timings.items():
+                group = get_phase_group(name)
+                phase_durations[group] += duration
+                phase_cases[group].add(i_result)
+        timings = [
+            '  * `{}`: {:.1f} s ({} test cases)\n'.format(group, duration, len(phase_cases[group]))
+            for group, duration in sorted(phase_durations.items(), key=lambda group_duration: (-group_duration[1], group_duration[0]))
+        ]
+
         return (
             '\n'.join([
                 '* Executed {} test cases\n'.format(len(results)),
                 '* Passed {} test cases{}\n{}'.format(len(passed), ':' if passed else '', ''.join(passed)),
                 '* Failed {} test cases{}\n{}'.format(len(failed), ':' if failed else '', ''.join(failed)),
                 '* Skipped {} test cases{}\n{}'.format(len(skipped), ':' if skipped else '', ''.join(skipped)),
-            ]).strip(),
+            ] + ([
+                '* Duration by phase:\n{}'.format(''.join(timings)),
+            ] if timings else [])).strip(),
             failure_details,
             warning_details,
             skipped_details,
         )
 
 
-@contextlib.contextmanager
-def time_limit(seconds):
-    """ Context manager for timing out long operations
+def get_worker_multiprocessing_context():
+    """ Get the multiprocessing context for the processes which evaluate test cases concurrently. Where possible, worker
+    processes are forked so that they inherit the test cases discovered by the parent process rather than receiving
+    pickled copies of them.
+
+    Returns:
+        :obj:`multiprocessing.context.BaseContext`: multiprocessing context
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+_worker_validator = None
+
+
+def _init_worker(validator):
+    """ Initialize a worker process for evaluating test cases
+
+    Args:
+        validator (:obj:`SimulatorValidator`): validator
+    """
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _eval_case_in_worker(suite_name, i_case, working_dirname):
+    """ Evaluate a test case in a worker process
+
+    Each worker process has its own standard output and error file descriptors and its own warning filters. Consequently,
+    :obj:`SimulatorValidator.eval_case` can capture the output and warnings of each test case independently of the test cases
+    which are concurrently being evaluated by other workers.
+
+    Args:
+        suite_name (:obj:`str`): name of the suite of the test case
+        i_case (:obj:`int`): index of the test case within its suite
+        working_dirname (:obj:`str`): directory for temporary files for evaluating test case
+
+    Returns:
+        :obj:`TestCaseResult`: test case result, without its test case, prepared to be returned to the parent process
+    """
+    case = _worker_validator.cases[suite_name][i_case]
+    result = _worker_validator.eval_case(case, working_dirname)
+
+    # the parent process re-attaches its own instance of the test case
+    result.case = None
+
+    # replace exceptions and warnings which cannot be transferred to the parent process
+    if result.exception is not None and not _is_picklable(result.exception):
+        result.exception = Exception(str(result.exception))
+    if result.skip_reason is not None and not _is_picklable(result.skip_reason):
+        result.skip_reason = SkippedTestCaseException(str(result.skip_reason))
+    for warning in result.warnings:
+        warning.source = None
+        if not _is_picklable(warning.message) or not _is_picklable(warning.category):
+            warning.message = TestCaseWarning(str(warning.message))
+            warning.category = TestCaseWarning
+
+    return result
+
+
+def _prepare_case(case, specifications, working_dirname, synthetic_archives_dir=None):
+    """ Prepare the synthetic archives of a test case ahead of its evaluation
+
+    Args:
+        case (:obj:`published_project.SyntheticCombineArchiveTestCase`): test case
+        specifications (:obj:`dict`): specifications of the simulator to validate
+        working_dirname (:obj:`str`): directory for temporary files for evaluating test case
+        synthetic_archives_dir (:obj:`str`, optional): Directory to save the synthetic COMBINE/OMEX archives generated by the
+            test cases
+
+    Returns:
+        :obj:`collections.OrderedDict` of :obj:`str` to :obj:`float`: durations of the phases of the preparation
+    """
+    with PhaseTimer() as timer, phase('prepare'):
+        case.prepare(specifications, working_dirname, synthetic_archives_dir=synthetic_archives_dir)
+    return timer.timings
+
+
+def _release_frames_of_exception(exception):
+    """ Remove the tracebacks from an exception and from the exceptions which it was raised from or while handling so that the
+    frames of the tracebacks (and their local variables) can be garbage collected
+
+    Args:
+        exception (:obj:`BaseException`): exception
+
+    Returns:
+        :obj:`BaseException`: exception
+    """
+    exceptions_to_visit = [exception]
+    visited_exception_ids = set()
+    while exceptions_to_visit:
+        chained_exception = exceptions_to_visit.pop()
+        if chained_exception is None or id(chained_exception) in visited_exception_ids:
+            continue
+        visited_exception_ids.add(id(chained_exception))
+
+        chained_exception.__traceback__ = None
+        exceptions_to_visit.append(chained_exception.__cause__)
+        exceptions_to_visit.append(chained_exception.__context__)
+    return exception
+
+
+def _is_picklable(obj):
+    """ Determine whether an object can be pickled and unpickled
 
     Args:
-        seconds (:obj:`int`): length in seconds before time out
+        obj (:obj:`object`): object
 
-    Raises:
-        :obj:`TimeoutException`: if the operation timed out
+    Returns:
+        :obj:`bool`: whether the object can be pickled and unpickled
     """
-    def signal_handler(signum, frame):
-        raise TimeoutException("Operation did not complete within {} seconds".format(seconds))
-    signal.signal(signal.SIGALRM, signal_handler)
-    signal.alarm(int(seconds))
     try:
-        yield
-    finally:
-        signal.alarm(0)
+        pickle.loads(pickle.dumps(obj))
+        return True
+    except Exception:
+        return False
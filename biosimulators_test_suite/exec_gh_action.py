@@ -11,7 +11,7 @@ from .config import Config
 from .data_model import OutputMedium
 from .exec_core import SimulatorValidator
 from .results.data_model import TestCaseResult, TestCaseResultType, TestResultsReport  # noqa: F401
-from .results.io import write_test_results
+from .results.io import read_test_results, read_test_results_jsonl, write_test_results
 from .utils import get_singularity_image_filename
 from biosimulators_utils.biosimulations.utils import validate_biosimulations_api_response
 from biosimulators_utils.config import Colors, Config as BioSimulatorsUtilsConfig
@@ -24,6 +24,7 @@ from biosimulators_utils.simulator_registry.query import get_simulator_version_s
 from natsort import natsort_keygen
 import biosimulators_utils.image
 import biosimulators_utils.simulator.io
+import os
 import requests
 import requests.exceptions
 import termcolor
@@ -295,7 +296,8 @@ class ValidateCommitSimulatorGitHubAction(GitHubAction):
 
         # validate that container (Docker image) exists
         image_url = specifications['image']['url']
-        get_docker_image(docker_client, image_url, pull=True)
+        image = get_docker_image(docker_client, image_url, pull=True)
+        image_digest = getattr(image, 'id', None)
 
         # validate that Docker image can be converted to a Singularity image
         biosimulators_utils.image.convert_docker_image_to_singularity(
@@ -303,10 +305,13 @@ class ValidateCommitSimulatorGitHubAction(GitHubAction):
             singularity_filename=get_singularity_image_filename(image_url))
 
         # validate that image is consistent with the BioSimulators standards
-        validator = SimulatorValidator(specifications, output_medium=OutputMedium.gh_issue)
+        previous_report = self.read_previous_test_results()
+        validator = SimulatorValidator(specifications, output_medium=OutputMedium.gh_issue,
+                                       previous_report=previous_report, image_digest=image_digest)
         case_results = validator.run()
         write_test_results(case_results, '.biosimulators-test-suite-results.json',
-                           gh_issue=int(self.issue_number), gh_action_run=int(self.get_gh_action_run_id()))
+                           gh_issue=int(self.issue_number), gh_action_run=int(self.get_gh_action_run_id()),
+                           specifications=specifications, image_digest=image_digest)
         summary, failure_details, warning_details, skipped_details = validator.summarize_results(
             case_results, output_medium=OutputMedium.gh_issue)
 
@@ -381,6 +386,22 @@ class ValidateCommitSimulatorGitHubAction(GitHubAction):
 
         return case_results
 
+    def read_previous_test_results(self):
+        """ Read the report of a previous validation of the simulator (``PREVIOUS_TEST_RESULTS_FILENAME`` environment
+        variable), so that only the test cases which could have different outcomes are re-evaluated
+
+        Returns:
+            :obj:`TestResultsReport`: report of the previous validation, or :obj:`None` if there is no previous report
+        """
+        filename = self.config.previous_test_results_filename
+        if not filename or not os.path.isfile(filename):
+            return None
+
+        if filename.endswith('.jsonl'):
+            return read_test_results_jsonl(filename)
+        else:
+            return read_test_results(filename)
+
     def is_simulator_approved(self, specifications, existing_version_specifications):
         """ Determine whether a simulation tool has already been approved
 
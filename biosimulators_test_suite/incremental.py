@@ -0,0 +1,155 @@
+""" Incremental re-validation of simulators: determine which test cases could have different outcomes than in the report of a
+previous validation of a simulator, and reuse the results of the other test cases
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-07-01
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from ._version import __version__
+from .results.data_model import TestCaseResult
+from .test_case import cli
+from .test_case import docker_image
+from .test_case import published_project
+import collections
+
+__all__ = [
+    'SPECIFICATIONS_KEYS_WITHOUT_EFFECT_ON_RESULTS',
+    'ALGORITHM_INDEPENDENT_SUITES',
+    'get_changed_specifications_keys',
+    'get_cases_to_revalidate',
+    'is_case_affected_by_algorithms',
+]
+
+SPECIFICATIONS_KEYS_WITHOUT_EFFECT_ON_RESULTS = (
+    'name',
+    'description',
+    'urls',
+    'authors',
+    'references',
+    'license',
+    'funding',
+    'biosimulators',
+)
+# :obj:`tuple` of :obj:`str`: keys of the specifications of simulators which are metadata that no test case uses
+
+ALGORITHM_INDEPENDENT_SUITES = (
+    docker_image.__name__.replace('biosimulators_test_suite.test_case.', ''),
+    cli.__name__.replace('biosimulators_test_suite.test_case.', ''),
+)
+# :obj:`tuple` of :obj:`str`: names of the suites of test cases which only use the Docker image of a simulator, and not the
+# algorithms in its specifications
+
+
+def get_changed_specifications_keys(old_specifications, new_specifications):
+    """ Get the top-level keys of the specifications of a simulator which changed
+
+    Args:
+        old_specifications (:obj:`dict`): previous specifications of the simulator
+        new_specifications (:obj:`dict`): new specifications of the simulator
+
+    Returns:
+        :obj:`set` of :obj:`str`: keys which were added, removed, or whose values changed
+    """
+    return set(
+        key
+        for key in set(old_specifications.keys()).union(new_specifications.keys())
+        if old_specifications.get(key, None) != new_specifications.get(key, None)
+    )
+
+
+def get_cases_to_revalidate(cases, specifications, image_digest, previous_report):
+    """ Determine which test cases could have different outcomes than in the report of a previous validation of a simulator,
+    and reuse the results of the other test cases
+
+    All of the test cases are evaluated if the report was generated by another version of the test suite, the report does not
+    record the specifications of the simulator and the digest of its Docker image, the image changed, or the specifications
+    changed other than in their metadata (:obj:`SPECIFICATIONS_KEYS_WITHOUT_EFFECT_ON_RESULTS`) or algorithms. If the algorithms
+    changed, the test cases which do not depend on algorithms (:obj:`ALGORITHM_INDEPENDENT_SUITES` and published projects whose
+    compatibility with the simulator didn't change) keep their results, and the other test cases are evaluated (published
+    projects which became compatible or incompatible with the simulator, and synthetic archives which are generated from the
+    algorithms of the simulator). Test cases without previous results are always evaluated.
+
+    Args:
+        cases (:obj:`collections.OrderedDict` of :obj:`str` to :obj:`list` of :obj:`TestCase`): map from the names of suites
+            to their test cases
+        specifications (:obj:`dict`): specifications of the simulator
+        image_digest (:obj:`str`): digest of the Docker image of the simulator
+        previous_report (:obj:`TestResultsReport`): report of the previous validation of the simulator
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`collections.OrderedDict` of :obj:`str` to :obj:`list` of :obj:`TestCase`: map from the names of suites to
+              the test cases which should be evaluated
+            * :obj:`list` of :obj:`TestCaseResult`: results of the other test cases from the previous report, marked with
+              the provenance of the report
+    """
+    if (
+        previous_report.test_suite_version != __version__
+        or not previous_report.specifications
+        or not image_digest
+        or previous_report.image_digest != image_digest
+    ):
+        return (cases, [])
+
+    changed_keys = get_changed_specifications_keys(previous_report.specifications, specifications).difference(
+        SPECIFICATIONS_KEYS_WITHOUT_EFFECT_ON_RESULTS)
+    if changed_keys.difference(['algorithms']):
+        return (cases, [])
+    algorithms_changed = 'algorithms' in changed_keys
+
+    provenance = {
+        'testSuiteVersion': previous_report.test_suite_version,
+        'ghIssue': previous_report.gh_issue,
+        'ghActionRun': previous_report.gh_action_run,
+    }
+    previous_results = {result.case.id: result for result in previous_report.results}
+
+    cases_to_evaluate = collections.OrderedDict()
+    reused_results = []
+    for suite_name, suite_cases in cases.items():
+        cases_to_evaluate[suite_name] = []
+        for case in suite_cases:
+            previous_result = previous_results.get(case.id, None)
+            if previous_result is None or (algorithms_changed and is_case_affected_by_algorithms(
+                    suite_name, case, previous_report.specifications, specifications)):
+                cases_to_evaluate[suite_name].append(case)
+            else:
+                reused_results.append(TestCaseResult(
+                    case=case,
+                    type=previous_result.type,
+                    duration=previous_result.duration,
+                    exception=previous_result.exception,
+                    exception_traceback=previous_result.exception_traceback,
+                    warnings=previous_result.warnings,
+                    skip_reason=previous_result.skip_reason,
+                    log=previous_result.log,
+                    timings=previous_result.timings,
+                    provenance=previous_result.provenance or provenance,
+                ))
+
+    return (cases_to_evaluate, reused_results)
+
+
+def is_case_affected_by_algorithms(suite_name, case, old_specifications, new_specifications):
+    """ Determine whether a change to the algorithms of a simulator could change the outcome of a test case
+
+    Args:
+        suite_name (:obj:`str`): name of the suite of the test case
+        case (:obj:`TestCase`): test case
+        old_specifications (:obj:`dict`): previous specifications of the simulator
+        new_specifications (:obj:`dict`): new specifications of the simulator
+
+    Returns:
+        :obj:`bool`: :obj:`True` if the test case uses the algorithms of the simulator (e.g., to generate synthetic archives), or
+        the test case is a published project which became compatible or incompatible with the simulator
+    """
+    if suite_name in ALGORITHM_INDEPENDENT_SUITES:
+        return False
+
+    if isinstance(case, published_project.SimulatorCanExecutePublishedProject):
+        return case.compatible_with_specifications(old_specifications) != case.compatible_with_specifications(new_specifications)
+
+    return True
@@ -0,0 +1,159 @@
+""" Index of the attributes of the elements of XML-encoded models for generating model changes
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-25
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from biosimulators_utils.sedml.utils import get_xml_node_namespace_tag_target
+from lxml import etree
+import collections
+import re
+
+__all__ = [
+    'ModelAttribute',
+    'get_model_attributes',
+    'get_model_attribute_type',
+    'sample_model_attributes',
+]
+
+
+class ModelAttribute(object):
+    """ An attribute of an element of an XML-encoded model
+
+    Attributes:
+        target (:obj:`str`): XPath to the attribute for use with SED (e.g., ``/sbml:sbml[1]/sbml:model[1]/@id``)
+        target_namespaces (:obj:`dict` of :obj:`str` to :obj:`str`): map from the prefixes of the namespaces used by
+            :obj:`target` to their URIs. This dictionary is shared by the attributes of each element and must not be modified.
+        name (:obj:`str`): name of the attribute, including the prefix of its namespace (e.g., ``fbc:id``)
+        value (:obj:`str`): value of the attribute
+        numeric_value (:obj:`float`): value of the attribute as a number, or :obj:`None` if the value is not numeric
+    """
+
+    __slots__ = ('target', 'target_namespaces', 'name', 'value', 'numeric_value')
+
+    def __init__(self, target, target_namespaces, name, value, numeric_value=None):
+        """
+        Args:
+            target (:obj:`str`): XPath to the attribute for use with SED
+            target_namespaces (:obj:`dict` of :obj:`str` to :obj:`str`): map from the prefixes of the namespaces used by
+                :obj:`target` to their URIs
+            name (:obj:`str`): name of the attribute, including the prefix of its namespace
+            value (:obj:`str`): value of the attribute
+            numeric_value (:obj:`float`, optional): value of the attribute as a number, or :obj:`None` if the value is not numeric
+        """
+        self.target = target
+        self.target_namespaces = target_namespaces
+        self.name = name
+        self.value = value
+        self.numeric_value = numeric_value
+
+
+def get_model_attributes(filename):
+    """ Get the attributes of the elements of an XML-encoded model
+
+    The elements are visited depth first, with the children of each element visited in reverse order, in a single pass over
+    the model.
+
+    Args:
+        filename (:obj:`str`): path to the model
+
+    Returns:
+        :obj:`list` of :obj:`ModelAttribute`: attributes
+
+    Raises:
+        :obj:`etree.XMLSyntaxError`: if the model is not encoded in XML
+    """
+    root = etree.parse(filename).getroot()
+    _, _, _, root_target, root_namespaces = get_xml_node_namespace_tag_target(root)
+
+    attributes = []
+    nodes = [(root, '/' + root_target + '[1]', root_namespaces)]
+    while nodes:
+        node, node_target, target_namespaces = nodes.pop()
+
+        rev_nsmap = None
+        for key, value in node.attrib.items():
+            if key[0] == '{':
+                if rev_nsmap is None:
+                    rev_nsmap = {uri: prefix for prefix, uri in node.nsmap.items()}
+                ns, _, key = key[1:].rpartition('}')
+                key = rev_nsmap[ns] + ':' + key
+
+            try:
+                numeric_value = float(value)
+            except ValueError:
+                numeric_value = None
+
+            attributes.append(ModelAttribute(node_target + '/@' + key, target_namespaces, key, value, numeric_value))
+
+        n_children = {}
+        for child in node.iterchildren(tag=etree.Element):
+            _, _, _, child_target, child_namespaces = get_xml_node_namespace_tag_target(
+                child, target_namespaces=target_namespaces)
+
+            i_child = n_children.get(child_target, 0) + 1
+            n_children[child_target] = i_child
+
+            nodes.append((child, node_target + '/' + child_target + '[{}]'.format(i_child), child_namespaces))
+
+    return attributes
+
+
+def get_model_attribute_type(attribute):
+    """ Get the type of an attribute: its target without the positions of its elements (e.g.,
+    ``/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter/@value``)
+
+    Args:
+        attribute (:obj:`ModelAttribute`): attribute
+
+    Returns:
+        :obj:`str`: type of the attribute
+    """
+    return re.sub(r'\[\d+\]', '', attribute.target)
+
+
+def sample_model_attributes(attributes, max_attributes):
+    """ Deterministically sample attributes, stratified by their types (see :obj:`get_model_attribute_type`)
+
+    Each type is sampled in proportion to its number of attributes, and at least one attribute of each type is sampled.
+    If there are more types than :obj:`max_attributes`, one attribute of each of the first :obj:`max_attributes` types is
+    sampled. Within each type, the sampled attributes are evenly spaced. The sampled attributes are returned in their
+    original order.
+
+    Args:
+        attributes (:obj:`list` of :obj:`ModelAttribute`): attributes
+        max_attributes (:obj:`int`): maximum number of attributes to sample (``0`` or :obj:`None` for no limit)
+
+    Returns:
+        :obj:`list` of :obj:`ModelAttribute`: sampled attributes
+    """
+    if not max_attributes or len(attributes) <= max_attributes:
+        return list(attributes)
+
+    strata = collections.OrderedDict()
+    for i_attribute, attribute in enumerate(attributes):
+        strata.setdefault(get_model_attribute_type(attribute), []).append(i_attribute)
+
+    # allocate one attribute to each type, and the remainder of the budget in proportion to the remaining attributes of each type
+    if len(strata) >= max_attributes:
+        quotas = [1] * max_attributes + [0] * (len(strata) - max_attributes)
+    else:
+        budget = max_attributes - len(strata)
+        n_remaining_attributes = len(attributes) - len(strata)
+        shares = [budget * (len(i_attributes) - 1) / n_remaining_attributes for i_attributes in strata.values()]
+        quotas = [1 + int(share) for share in shares]
+
+        i_strata_by_remainder = sorted(range(len(strata)), key=lambda i_stratum: (int(shares[i_stratum]) - shares[i_stratum], i_stratum))
+        for i_stratum in i_strata_by_remainder[0:max_attributes - sum(quotas)]:
+            quotas[i_stratum] += 1
+
+    # evenly sample the attributes of each type
+    i_sampled_attributes = []
+    for i_attributes, quota in zip(strata.values(), quotas):
+        n_attributes = len(i_attributes)
+        for i_sample in range(quota):
+            i_sampled_attributes.append(i_attributes[(2 * i_sample + 1) * n_attributes // (2 * quota)])
+
+    return [attributes[i_attribute] for i_attribute in sorted(i_sampled_attributes)]
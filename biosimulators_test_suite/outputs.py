@@ -0,0 +1,375 @@
+""" Reading the outputs (reports and the data for plots) which simulators save to HDF5 files
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-27
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from biosimulators_utils.config import get_config
+from biosimulators_utils.report.data_model import DataSetResults
+from biosimulators_utils.report.io import Hdf5DataSetType, ReportReader
+from biosimulators_utils.report.warnings import MissingDataWarning, ExtraDataWarning
+from biosimulators_utils.sedml.data_model import Output
+from biosimulators_utils.warnings import warn
+import collections
+import h5py
+import numpy
+import os
+
+__all__ = [
+    'OutputMetadata',
+    'OutputDataSet',
+    'OutputsReader',
+]
+
+
+class OutputMetadata(object):
+    """ Metadata about a group or dataset of an HDF5 file of outputs
+
+    Attributes:
+        path (:obj:`str`): path to the group or dataset within the file (e.g., ``simulation.sedml/report``)
+        is_dataset (:obj:`bool`): whether the object is a dataset (rather than a group)
+        type (:obj:`str`): type of the output encoded by the dataset (name of a :obj:`Hdf5DataSetType`), or :obj:`None`
+        uri (:obj:`object`): value of the ``uri`` attribute of the object, or :obj:`None`
+        combine_archive_location (:obj:`object`): value of the ``combineArchiveLocation`` attribute of the object, or :obj:`None`
+        shape (:obj:`tuple` of :obj:`int`): shape of the dataset, or :obj:`None` for groups
+        dtype (:obj:`numpy.dtype`): data type of the dataset, or :obj:`None` for groups
+        data_set_ids (:obj:`list` of :obj:`str`): ids of the SED data sets of the output encoded by the dataset, or :obj:`None`
+        data_set_data_types (:obj:`list` of :obj:`str`): data types of the SED data sets, or :obj:`None`
+        data_set_shapes (:obj:`list` of :obj:`list` of :obj:`int`): shapes of the SED data sets, or :obj:`None`
+    """
+
+    __slots__ = ('path', 'is_dataset', 'type', 'uri', 'combine_archive_location', 'shape', 'dtype',
+                 'data_set_ids', 'data_set_data_types', 'data_set_shapes')
+
+    def __init__(self, path, is_dataset, type=None, uri=None, combine_archive_location=None, shape=None, dtype=None,
+                 data_set_ids=None, data_set_data_types=None, data_set_shapes=None):
+        """
+        Args:
+            path (:obj:`str`): path to the group or dataset within the file
+            is_dataset (:obj:`bool`): whether the object is a dataset (rather than a group)
+            type (:obj:`str`, optional): type of the output encoded by the dataset
+            uri (:obj:`object`, optional): value of the ``uri`` attribute of the object
+            combine_archive_location (:obj:`object`, optional): value of the ``combineArchiveLocation`` attribute of the object
+            shape (:obj:`tuple` of :obj:`int`, optional): shape of the dataset
+            dtype (:obj:`numpy.dtype`, optional): data type of the dataset
+            data_set_ids (:obj:`list` of :obj:`str`, optional): ids of the SED data sets of the output encoded by the dataset
+            data_set_data_types (:obj:`list` of :obj:`str`, optional): data types of the SED data sets
+            data_set_shapes (:obj:`list` of :obj:`list` of :obj:`int`, optional): shapes of the SED data sets
+        """
+        self.path = path
+        self.is_dataset = is_dataset
+        self.type = type
+        self.uri = uri
+        self.combine_archive_location = combine_archive_location
+        self.shape = shape
+        self.dtype = dtype
+        self.data_set_ids = data_set_ids
+        self.data_set_data_types = data_set_data_types
+        self.data_set_shapes = data_set_shapes
+
+
+class OutputDataSet(object):
+    """ Lazy handle to the values of a SED data set of a report of an HDF5 file of outputs
+
+    Each data set of a report is stored as a slice of the (padded) HDF5 dataset of the report. Indexing the handle (e.g.,
+    ``data_set[0:10]``) reads the corresponding hyperslab of the data set from the file, without the padding, rather than
+    reading the entire data set into memory. Handles can be read while the :obj:`OutputsReader` which created them is open.
+
+    Attributes:
+        shape (:obj:`tuple` of :obj:`int`): shape of the data set
+        dtype (:obj:`numpy.dtype`): data type of the data set
+        _dataset (:obj:`h5py.Dataset`): HDF5 dataset of the report
+        _index (:obj:`int`): index of the data set within the HDF5 dataset of the report
+    """
+
+    def __init__(self, dataset, index, shape, dtype):
+        """
+        Args:
+            dataset (:obj:`h5py.Dataset`): HDF5 dataset of the report
+            index (:obj:`int`): index of the data set within the HDF5 dataset of the report
+            shape (:obj:`list` of :obj:`int`): shape of the data set
+            dtype (:obj:`str`): data type of the data set
+        """
+        self._dataset = dataset
+        self._index = index
+        self.shape = tuple(shape)
+        self.dtype = numpy.dtype(dtype)
+
+    @property
+    def ndim(self):
+        """ Get the number of dimensions of the data set
+
+        Returns:
+            :obj:`int`: number of dimensions
+        """
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """ Get the number of elements of the data set
+
+        Returns:
+            :obj:`int`: number of elements
+        """
+        return int(numpy.prod(self.shape, dtype=numpy.int64))
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError('len() of unsized object')
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        """ Read a hyperslab of the data set from the file
+
+        Args:
+            key (:obj:`int`, :obj:`slice`, :obj:`Ellipsis`, or :obj:`tuple` of :obj:`int`, :obj:`slice`, and :obj:`Ellipsis`):
+                slice of the data set
+
+        Returns:
+            :obj:`numpy.ndarray`: values of the slice of the data set
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if Ellipsis in key:
+            i_ellipsis = key.index(Ellipsis)
+            key = key[0:i_ellipsis] + (slice(None),) * (self.ndim - len(key) + 1) + key[i_ellipsis + 1:]
+        if len(key) > self.ndim:
+            raise IndexError('Too many indices for a data set with {} dimensions'.format(self.ndim))
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        # slices are limited to the shape of the data set, which excludes the padding of the HDF5 dataset; the HDF5 dataset is
+        # read with positive steps and slices with negative steps are reversed after they are read
+        file_key = [self._index]
+        reversed_axes = []
+        n_axes = 0
+        for dim_len, dim_key in zip(self.shape, key):
+            if isinstance(dim_key, slice):
+                dim_range = range(*dim_key.indices(dim_len))
+                if dim_range.step < 0:
+                    dim_range = dim_range[::-1]
+                    reversed_axes.append(n_axes)
+                n_axes += 1
+                if dim_range:
+                    file_key.append(slice(dim_range.start, dim_range.stop, dim_range.step))
+                else:
+                    file_key.append(slice(0, 0))
+            else:
+                dim_index = int(dim_key)
+                if dim_index < -dim_len or dim_index >= dim_len:
+                    raise IndexError('Index {} is out of bounds for a dimension of length {}'.format(dim_index, dim_len))
+                file_key.append(dim_index % dim_len)
+
+        file_key.extend([0] * (self._dataset.ndim - 1 - self.ndim))
+
+        value = numpy.asarray(self._dataset[tuple(file_key)]).astype(self.dtype, copy=False)
+        if reversed_axes:
+            value = numpy.flip(value, axis=tuple(reversed_axes))
+        return value
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.read()
+        if dtype is not None:
+            value = value.astype(dtype, copy=False)
+        return value
+
+    def read(self):
+        """ Read all of the values of the data set from the file
+
+        Returns:
+            :obj:`numpy.ndarray`: values of the data set
+        """
+        return self[()]
+
+
+class OutputsReader(object):
+    """ Reads the outputs (reports and the data for plots) which a simulator saved to the HDF5 file of an outputs directory
+
+    The file is opened when it is first needed, and the metadata of its groups and datasets (e.g., their ``uri`` and
+    ``combineArchiveLocation`` attributes, the shapes and data types of their data sets) are indexed in a single scan of the file.
+    Reports are then read lazily from the open file. This replaces repeatedly reopening and scanning the file with
+    :obj:`ReportReader`, whose methods this class mirrors for HDF5 files.
+
+    Attributes:
+        filename (:obj:`str`): path to the HDF5 file
+        _file (:obj:`h5py.File`): open file, or :obj:`None` if the file hasn't been opened
+        _index (:obj:`collections.OrderedDict` of :obj:`str` to :obj:`OutputMetadata`): map from the paths of the groups and
+            datasets of the file to their metadata, in the order in which they were visited
+    """
+
+    def __init__(self, outputs_dir):
+        """
+        Args:
+            outputs_dir (:obj:`str`): directory which contains the outputs of the execution of a COMBINE/OMEX archive
+        """
+        self.filename = os.path.join(outputs_dir, get_config().H5_REPORTS_PATH)
+        self._file = None
+        self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """ Open the file and index its groups and datasets, if the file hasn't already been opened
+
+        Raises:
+            :obj:`OSError`: if the outputs directory doesn't contain an HDF5 file of outputs, or the file can't be read
+        """
+        if self._file is not None:
+            return
+
+        file = h5py.File(self.filename, 'r')
+        try:
+            self._index = collections.OrderedDict()
+            file.visititems(self._index_object)
+        except Exception:
+            file.close()
+            raise
+        self._file = file
+
+    def close(self):
+        """ Close the file """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _index_object(self, path, obj):
+        """ Add a group or dataset of the file to the index
+
+        Args:
+            path (:obj:`str`): path to the object
+            obj (:obj:`h5py.Group` or :obj:`h5py.Dataset`): object
+        """
+        attrs = obj.attrs
+        metadata = OutputMetadata(
+            path,
+            isinstance(obj, h5py.Dataset),
+            uri=attrs.get('uri', None),
+            combine_archive_location=attrs.get('combineArchiveLocation', None),
+        )
+
+        if metadata.is_dataset:
+            metadata.shape = obj.shape
+            metadata.dtype = obj.dtype
+
+            type = attrs.get('_type', None)
+            if type:
+                metadata.type = ReportReader.parse_dataset_str_value(type)
+
+            if 'sedmlDataSetIds' in attrs:
+                metadata.data_set_ids = ReportReader.parse_dataset_str_list_values(attrs['sedmlDataSetIds'])
+                metadata.data_set_data_types = ReportReader.parse_dataset_str_list_values(attrs['sedmlDataSetDataTypes'])
+                metadata.data_set_shapes = []
+                for data_set_shape in ReportReader.parse_dataset_str_list_values(attrs['sedmlDataSetShapes']):
+                    if data_set_shape:
+                        metadata.data_set_shapes.append([int(dim_len) for dim_len in data_set_shape.split(',')])
+                    else:
+                        metadata.data_set_shapes.append([])
+
+        self._index[path] = metadata
+
+    def get_ids(self, type=Output):
+        """ Get the ids of the outputs in the file
+
+        Args:
+            type (:obj:`type`, optional): type of output to get
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of outputs
+
+        Raises:
+            :obj:`OSError`: if the outputs directory doesn't contain an HDF5 file of outputs, or the file can't be read
+        """
+        self.open()
+        ids = []
+        for metadata in self._index.values():
+            if metadata.type:
+                output_type = Hdf5DataSetType[metadata.type].value
+                if output_type == type or issubclass(output_type, type):
+                    ids.append(metadata.path)
+        return ids
+
+    def get_metadata(self, path):
+        """ Get the metadata of a group or dataset of the file
+
+        Args:
+            path (:obj:`str`): path to the group or dataset (e.g., ``simulation.sedml/report``)
+
+        Returns:
+            :obj:`OutputMetadata`: metadata
+
+        Raises:
+            :obj:`OSError`: if the outputs directory doesn't contain an HDF5 file of outputs, or the file can't be read
+            :obj:`KeyError`: if the file doesn't contain the group or dataset
+        """
+        self.open()
+        return self._index[self._get_path(path)]
+
+    def run(self, report, rel_path, lazy=False):
+        """ Read a report
+
+        Args:
+            report (:obj:`Report`): report
+            rel_path (:obj:`str`): id of the report (e.g., ``simulation.sedml/report``)
+            lazy (:obj:`bool`, optional): if :obj:`True`, return an :obj:`OutputDataSet` handle for each data set, which reads
+                the values of the data set from the file when it is indexed, rather than reading each data set into memory
+
+        Returns:
+            :obj:`DataSetResults`: report results
+
+        Raises:
+            :obj:`OSError`: if the outputs directory doesn't contain an HDF5 file of outputs, or the file can't be read
+            :obj:`KeyError`: if the file doesn't contain the report
+        """
+        self.open()
+        path = self._get_path(rel_path)
+        metadata = self._index[path]
+        if metadata.data_set_ids is None:
+            raise KeyError('`{}` is not a report'.format(path))
+
+        # each data set is read with a hyperslab of its own shape rather than reading the entire (padded) dataset into memory
+        dataset = self._file[path]
+
+        results = DataSetResults()
+        data_set_id_to_index = {data_set_id: i_data_set for i_data_set, data_set_id in enumerate(metadata.data_set_ids)}
+
+        for data_set in report.data_sets:
+            i_data_set = data_set_id_to_index.get(data_set.id, None)
+            if i_data_set is not None:
+                data_set_data_type = metadata.data_set_data_types[i_data_set]
+                if data_set_data_type == '__None__':
+                    results[data_set.id] = None
+                else:
+                    value = OutputDataSet(dataset, i_data_set, metadata.data_set_shapes[i_data_set], data_set_data_type)
+                    results[data_set.id] = value if lazy else value.read()
+
+        file_data_set_ids = set(metadata.data_set_ids)
+        report_data_set_ids = set(data_set.id for data_set in report.data_sets)
+        missing_data_set_ids = report_data_set_ids.difference(file_data_set_ids)
+        extra_data_set_ids = file_data_set_ids.difference(report_data_set_ids)
+
+        if missing_data_set_ids:
+            warn('File does not contain data for the following data sets of the report:\n  - {}'.format(
+                '\n'.join('`' + id + '`' for id in sorted(missing_data_set_ids))), MissingDataWarning)
+
+        if extra_data_set_ids:
+            warn('File contains additional data that could not be mapped to data sets of the report:\n  - {}'.format(
+                '\n'.join('`' + id + '`' for id in sorted(extra_data_set_ids))), ExtraDataWarning)
+
+        return results
+
+    @staticmethod
+    def _get_path(rel_path):
+        """ Get the path to a group or dataset of the file from an id of an output
+
+        Args:
+            rel_path (:obj:`str`): id of an output (e.g., ``./simulation.sedml/report``)
+
+        Returns:
+            :obj:`str`: path within the file (e.g., ``simulation.sedml/report``)
+        """
+        return '/'.join(os.path.relpath(rel_path, '.').split(os.path.sep))
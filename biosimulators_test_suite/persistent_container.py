@@ -0,0 +1,265 @@
+""" Long-lived Docker containers for executing COMBINE/OMEX archives with ``docker exec``
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-23
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from biosimulators_utils.image import get_docker_image
+from biosimulators_utils.simulator.exec import build_cli_args
+import docker
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+
+__all__ = ['PersistentSimulatorContainer']
+
+
+class PersistentSimulatorContainer(object):
+    """ Long-lived Docker container for a simulator which executes COMBINE/OMEX archives with ``docker exec``
+
+    Executing each archive with ``docker run`` pays for the creation and start of a container and the initialization of the
+    simulator (e.g., the Python interpreter and the import of its dependencies). Instead, this class starts a container for
+    the image of the simulator whose entrypoint is replaced with an idle process, and executes the entrypoint of the image for
+    each archive with ``docker exec``. Archives and their outputs are exchanged through a directory which is bind mounted into
+    the container.
+
+    One container is started lazily for each process (e.g., for each worker process which evaluates test cases) so that the
+    processes never interfere with each other. A container is recreated when it is next used if it stopped (e.g., because a
+    simulator crashed it). When an execution is interrupted (e.g., because it exceeded the time limit for a test case), only
+    the process of that execution is killed, so that the other executions in the container (e.g., of the other synthetic
+    archives of a test case) continue. :obj:`stop` removes the containers started by all processes.
+
+    The image must provide ``sh`` and ``tail`` (e.g., from GNU coreutils or BusyBox).
+
+    Attributes:
+        image_url (:obj:`str`): URL of the Docker image of the simulator
+        pull_docker_image (:obj:`bool`): whether to pull the image before starting containers
+        user_to_exec_within_container (:obj:`str`): user to execute the container as (``_CURRENT_USER_`` for the current user,
+            ``_SUDO_`` to use ``sudo`` to execute Docker)
+        run_id (:obj:`str`): id used to label the containers
+        exchange_dirname (:obj:`str`): directory which is bind mounted into the containers to exchange archives and outputs
+        _entrypoint (:obj:`list` of :obj:`str`): entrypoint of the image
+        _container_names (:obj:`dict` of :obj:`int` to :obj:`str`): map from the ids of processes to the names of their containers
+        _lock (:obj:`threading.Lock`): lock which ensures that the threads of a process (e.g., which execute the synthetic
+            archives of a test case concurrently) start a single container
+    """
+
+    LABEL = 'biosimulators-test-suite.run'
+    CONTAINER_EXCHANGE_DIRNAME = '/tmp/biosimulators-test-suite'
+    PID_FILENAME = 'pid'
+
+    def __init__(self, image_url, pull_docker_image=True, user_to_exec_within_container='_CURRENT_USER_'):
+        """
+        Args:
+            image_url (:obj:`str`): URL of the Docker image of the simulator
+            pull_docker_image (:obj:`bool`, optional): whether to pull the image before starting containers
+            user_to_exec_within_container (:obj:`str`, optional): user to execute the container as (``_CURRENT_USER_`` for the
+                current user, ``_SUDO_`` to use ``sudo`` to execute Docker)
+        """
+        self.image_url = image_url
+        self.pull_docker_image = pull_docker_image
+        self.user_to_exec_within_container = user_to_exec_within_container
+        self.run_id = uuid.uuid4().hex
+        self.exchange_dirname = tempfile.mkdtemp()
+        self._entrypoint = None
+        self._container_names = {}
+        self._lock = threading.Lock()
+
+    def exec_sedml_docs_in_archive(self, archive_filename, out_dir, environment=None):
+        """ Use the simulator to execute the tasks specified in a COMBINE/OMEX archive and generate the reports specified
+        in the archive
+
+        Args:
+            archive_filename (:obj:`str`): path to the archive
+            out_dir (:obj:`str`): directory where outputs should be saved
+            environment (:obj:`dict`, optional): environment variables for executing the archive
+
+        Raises:
+            :obj:`RuntimeError`: if the execution failed
+        """
+        container_name = self.get_container()
+
+        exec_dirname = tempfile.mkdtemp(dir=self.exchange_dirname)
+        container_exec_dirname = '/'.join((self.CONTAINER_EXCHANGE_DIRNAME, os.path.basename(exec_dirname)))
+        shutil.copyfile(archive_filename, os.path.join(exec_dirname, os.path.basename(archive_filename)))
+        os.makedirs(os.path.join(exec_dirname, 'out'))
+
+        # the entrypoint is executed through a shell which records its process id, so that the execution can be killed if it is
+        # interrupted
+        args = self._get_docker_args() + ['exec']
+        for key, val in (environment or {}).items():
+            args.extend(['--env', '{}={}'.format(key, val)])
+        args.append(container_name)
+        args.extend(['sh', '-c', 'echo $$ > "$0" && exec "$@"', '/'.join((container_exec_dirname, self.PID_FILENAME))])
+        args.extend(self._entrypoint)
+        args.extend(build_cli_args('/'.join((container_exec_dirname, os.path.basename(archive_filename))),
+                                   '/'.join((container_exec_dirname, 'out'))))
+
+        try:
+            result = subprocess.run(args, stderr=subprocess.PIPE, check=False)
+
+        except FileNotFoundError:
+            shutil.rmtree(exec_dirname, ignore_errors=True)
+            raise RuntimeError("Docker could not be found")
+
+        except BaseException:
+            # the execution was interrupted; kill it so that it does not continue in the background
+            self.kill_exec(container_name, exec_dirname)
+            shutil.rmtree(exec_dirname, ignore_errors=True)
+            raise
+
+        try:
+            stderr = result.stderr.decode(errors='replace')
+            if stderr:
+                sys.stderr.write(stderr)
+                sys.stderr.flush()
+
+            if result.returncode != 0:
+                if result.returncode < 0:
+                    # the Docker client was killed (e.g., because the execution exceeded the time limit for a test case); kill the
+                    # execution so that it does not continue in the background
+                    self.kill_exec(container_name, exec_dirname)
+                raise RuntimeError("The image '{}' could not execute the archive:\n\n  {}".format(
+                    self.image_url, (stderr.strip() or 'Unknown error').replace('\n', '\n  ')))
+
+            shutil.copytree(os.path.join(exec_dirname, 'out'), out_dir, dirs_exist_ok=True)
+
+        finally:
+            shutil.rmtree(exec_dirname, ignore_errors=True)
+
+    def kill_exec(self, container_name, exec_dirname):
+        """ Kill the process of an execution of an archive, without affecting the other executions in the container
+
+        Args:
+            container_name (:obj:`str`): name of the container
+            exec_dirname (:obj:`str`): exchange directory of the execution
+        """
+        pid_filename = os.path.join(exec_dirname, self.PID_FILENAME)
+        try:
+            with open(pid_filename, 'r') as file:
+                pid = file.read().strip()
+        except OSError:
+            # the execution did not start
+            return
+        if pid.isdigit():
+            self._run_docker(['exec', container_name, 'sh', '-c', 'kill -KILL "$0"', pid])
+
+    def get_container(self):
+        """ Get the container for the current process, starting it if it is not running
+
+        Returns:
+            :obj:`str`: name of the container
+        """
+        with self._lock:
+            return self._get_container()
+
+    def _get_container(self):
+        """ Get the container for the current process, starting it if it is not running
+
+        Returns:
+            :obj:`str`: name of the container
+        """
+        container_name = self._container_names.get(os.getpid(), None)
+        if container_name and self.is_container_running(container_name):
+            return container_name
+
+        if container_name:
+            self.remove_container()
+
+        if self._entrypoint is None:
+            image = get_docker_image(docker.from_env(), self.image_url, pull=self.pull_docker_image)
+            self._entrypoint = image.attrs['Config'].get('Entrypoint', None) or []
+            if not self._entrypoint:
+                raise ValueError("The image '{}' does not have an entrypoint.".format(self.image_url))
+
+        temp_dir_host_path = os.getenv('TEMP_DIR_HOST_PATH', None)
+        if temp_dir_host_path:
+            mount_exchange_dirname = os.path.join(temp_dir_host_path, os.path.basename(self.exchange_dirname))
+        else:
+            mount_exchange_dirname = self.exchange_dirname
+
+        container_name = 'biosimulators-test-suite-{}-{}'.format(self.run_id[0:12], os.getpid())
+        args = self._get_docker_args() + [
+            'run', '--detach', '--rm',
+            '--name', container_name,
+            '--label', '{}={}'.format(self.LABEL, self.run_id),
+            '--mount', 'type=bind,source={},target={}'.format(mount_exchange_dirname, self.CONTAINER_EXCHANGE_DIRNAME),
+            '--entrypoint', 'tail',
+        ]
+        if self.user_to_exec_within_container and self.user_to_exec_within_container != '_SUDO_':
+            if self.user_to_exec_within_container == '_CURRENT_USER_':
+                if os.name != 'posix':
+                    raise NotImplementedError('The current user id can only be retrieved for POSIX OSes')
+                args.extend(['--user', str(os.getuid())])
+            else:
+                args.extend(['--user', self.user_to_exec_within_container])
+        args.extend([self.image_url, '-f', '/dev/null'])
+
+        try:
+            subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        except FileNotFoundError:
+            raise RuntimeError("Docker could not be found")
+        except subprocess.CalledProcessError as exception:
+            raise RuntimeError("A container for the image '{}' could not be started:\n\n  {}".format(
+                self.image_url, exception.stderr.decode().replace('\n', '\n  ')))
+
+        self._container_names[os.getpid()] = container_name
+        return container_name
+
+    def is_container_running(self, container_name):
+        """ Determine whether a container is running
+
+        Args:
+            container_name (:obj:`str`): name of the container
+
+        Returns:
+            :obj:`bool`: whether the container is running
+        """
+        result = self._run_docker(['inspect', '--format', '{{.State.Running}}', container_name])
+        return result is not None and result.returncode == 0 and result.stdout.decode().strip() == 'true'
+
+    def remove_container(self):
+        """ Remove the container for the current process """
+        container_name = self._container_names.pop(os.getpid(), None)
+        if container_name:
+            self._run_docker(['rm', '--force', container_name])
+
+    def stop(self):
+        """ Remove the containers started by all processes and the exchange directory """
+        result = self._run_docker(['ps', '--all', '--quiet', '--filter', 'label={}={}'.format(self.LABEL, self.run_id)])
+        container_ids = result.stdout.decode().split() if result is not None and result.returncode == 0 else []
+        if container_ids:
+            self._run_docker(['rm', '--force'] + container_ids)
+        self._container_names = {}
+
+        shutil.rmtree(self.exchange_dirname, ignore_errors=True)
+
+    def _run_docker(self, args):
+        """ Execute a Docker command and capture its output
+
+        Args:
+            args (:obj:`list` of :obj:`str`): arguments for Docker
+
+        Returns:
+            :obj:`subprocess.CompletedProcess`: result, or :obj:`None` if Docker could not be found
+        """
+        try:
+            return subprocess.run(self._get_docker_args() + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        except FileNotFoundError:
+            return None
+
+    def _get_docker_args(self):
+        """ Get the arguments for executing Docker
+
+        Returns:
+            :obj:`list` of :obj:`str`: arguments
+        """
+        if self.user_to_exec_within_container == '_SUDO_':
+            return ['sudo', 'docker']
+        return ['docker']
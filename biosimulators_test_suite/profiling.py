@@ -0,0 +1,178 @@
+""" Profiling of the evaluation of test cases
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-24
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+import cProfile
+import contextlib
+import glob
+import io
+import os
+import pstats
+import re
+
+__all__ = [
+    'CaseProfiler',
+    'write_collapsed_stacks',
+    'get_profile_summary',
+]
+
+
+class CaseProfiler(object):
+    """ Profiles the evaluation of test cases with :obj:`cProfile`, and saves one profile per test case
+
+    For each test case, the profiler saves
+
+    * ``<id>.pstats``: statistics which can be analyzed with :obj:`pstats` or visualized with tools such as SnakeViz, and
+    * optionally, ``<id>.collapsed.txt``: collapsed stacks which can be visualized as a flame graph with tools such as
+      ``flamegraph.pl`` or speedscope.
+
+    Attributes:
+        dirname (:obj:`str`): directory to save the profiles
+        collapsed_stacks (:obj:`bool`): whether to also save collapsed stacks for each test case
+    """
+
+    PSTATS_EXTENSION = '.pstats'
+    COLLAPSED_STACKS_EXTENSION = '.collapsed.txt'
+
+    def __init__(self, dirname, collapsed_stacks=False):
+        """
+        Args:
+            dirname (:obj:`str`): directory to save the profiles
+            collapsed_stacks (:obj:`bool`, optional): whether to also save collapsed stacks for each test case
+        """
+        self.dirname = dirname
+        self.collapsed_stacks = collapsed_stacks
+
+    @contextlib.contextmanager
+    def profile(self, case_id):
+        """ Context manager which profiles the evaluation of a test case
+
+        Args:
+            case_id (:obj:`str`): id of the test case
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+            if not os.path.isdir(self.dirname):
+                os.makedirs(self.dirname, exist_ok=True)
+
+            basename = self.get_basename(case_id)
+            stats = pstats.Stats(profiler)
+            stats.dump_stats(os.path.join(self.dirname, basename + self.PSTATS_EXTENSION))
+            if self.collapsed_stacks:
+                write_collapsed_stacks(stats, os.path.join(self.dirname, basename + self.COLLAPSED_STACKS_EXTENSION))
+
+    @staticmethod
+    def get_basename(case_id):
+        """ Get the base name of the files for the profile of a test case
+
+        Args:
+            case_id (:obj:`str`): id of the test case
+
+        Returns:
+            :obj:`str`: base name
+        """
+        return re.sub(r'[^a-zA-Z0-9_\-\.]', '_', case_id)
+
+
+def write_collapsed_stacks(stats, filename, max_depth=64):
+    """ Write the statistics of a profile as collapsed stacks (one line per stack with its frames separated by semicolons,
+    followed by the time spent in the last frame of the stack in microseconds)
+
+    :obj:`cProfile` records the time spent in each function for each of its callers, rather than for each of its complete
+    stacks. Consequently, the time of a function which is called from multiple stacks is attributed to each stack of its
+    caller in proportion to the time of the caller in that stack.
+
+    Args:
+        stats (:obj:`pstats.Stats`): statistics
+        filename (:obj:`str`): path to save the collapsed stacks
+        max_depth (:obj:`int`, optional): maximum depth of the stacks
+    """
+    # map from each function to its callees and the time spent in each callee for the function
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, caller_stats in callers.items():
+            callees.setdefault(caller, []).append((func, caller_stats[2], caller_stats[3]))
+
+    lines = {}
+
+    def visit(func, stack, own_time, cum_time, fraction):
+        name = _get_func_name(func)
+        stack = stack + [name]
+        lines[';'.join(stack)] = lines.get(';'.join(stack), 0.) + own_time * fraction
+
+        if len(stack) >= max_depth:
+            return
+
+        func_cum_time = stats.stats[func][3]
+        for callee, callee_own_time, callee_cum_time in callees.get(func, []):
+            if _get_func_name(callee) in stack or not func_cum_time:
+                continue
+            visit(callee, stack, callee_own_time, callee_cum_time, fraction * min(1., cum_time / func_cum_time))
+
+    for func, (_, _, own_time, cum_time, callers) in stats.stats.items():
+        if not callers:
+            visit(func, [], own_time, cum_time, 1.)
+
+    with open(filename, 'w') as file:
+        for stack, time in sorted(lines.items()):
+            microseconds = int(round(time * 1e6))
+            if microseconds > 0:
+                file.write('{} {}\n'.format(stack, microseconds))
+
+
+def get_profile_summary(dirname, n=20, case_ids=None):
+    """ Get a summary of the functions which consumed the most time across the profiles of the test cases
+
+    Args:
+        dirname (:obj:`str`): directory which contains the profiles of the test cases
+        n (:obj:`int`, optional): number of functions to summarize
+        case_ids (:obj:`list` of :obj:`str`, optional): ids of the test cases to summarize. Default: all test cases with
+            profiles in :obj:`dirname`
+
+    Returns:
+        :obj:`str`: summary, or :obj:`None` if the directory does not contain any of the profiles
+    """
+    if case_ids is None:
+        filenames = sorted(glob.glob(os.path.join(dirname, '*' + CaseProfiler.PSTATS_EXTENSION)))
+    else:
+        filenames = []
+        for case_id in case_ids:
+            filename = os.path.join(dirname, CaseProfiler.get_basename(case_id) + CaseProfiler.PSTATS_EXTENSION)
+            if os.path.isfile(filename):
+                filenames.append(filename)
+    if not filenames:
+        return None
+
+    stream = io.StringIO()
+    stats = pstats.Stats(*filenames, stream=stream)
+
+    # don't list the file of each profile
+    stats.files = []
+
+    stream.write('Profiles of {} test cases\n'.format(len(filenames)))
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(n)
+    return stream.getvalue().strip()
+
+
+def _get_func_name(func):
+    """ Get a name for a function of a profile
+
+    Args:
+        func (:obj:`tuple`): path to the file of the function, line number, and name of the function
+
+    Returns:
+        :obj:`str`: name
+    """
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return '{}:{}({})'.format(os.path.basename(filename), line, name)
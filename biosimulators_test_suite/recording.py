@@ -0,0 +1,134 @@
+""" Recording of the standard output/error and warnings of threads which run concurrently with the evaluation of test cases
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-07-02
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+import contextlib
+import contextvars
+import sys
+import threading
+import warnings
+
+__all__ = [
+    'ThreadOutputRecorder',
+    'route_thread_output',
+]
+
+_current_recorder = contextvars.ContextVar('current_recorder', default=None)
+
+
+class ThreadOutputRecorder(object):
+    """ Records the standard output/error and warnings of a thread which runs concurrently with the evaluation of test cases
+    (e.g., the preparation of the synthetic archives of an upcoming test case)
+
+    The standard output/error of the process and the warnings of Python are shared by all of its threads. While the recorder
+    is active in a thread (inside a ``with`` statement), the output which the thread writes to :obj:`sys.stdout` and
+    :obj:`sys.stderr` and the warnings which it issues are recorded by the recorder rather than by the test case which is
+    evaluated at the same time, provided that they are routed by :obj:`route_thread_output`. Output which is written directly
+    to the file descriptors of the process (e.g., by C libraries) cannot be attributed to threads, and is not recorded.
+
+    Attributes:
+        warnings (:obj:`list` of :obj:`warnings.WarningMessage`): recorded warnings
+        _log (:obj:`list` of :obj:`str`): recorded standard output/error
+        _lock (:obj:`threading.Lock`): lock for the recorded output and warnings
+        _tokens (:obj:`list` of :obj:`contextvars.Token`): tokens for restoring the previously active recorders
+    """
+
+    def __init__(self):
+        self.warnings = []
+        self._log = []
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def __enter__(self):
+        """ Activate the recorder """
+        self._tokens.append(_current_recorder.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Deactivate the recorder """
+        _current_recorder.reset(self._tokens.pop())
+
+    def write(self, message):
+        """ Record standard output/error
+
+        Args:
+            message (:obj:`str`): output
+        """
+        with self._lock:
+            self._log.append(message)
+
+    def add_warning(self, warning):
+        """ Record a warning
+
+        Args:
+            warning (:obj:`warnings.WarningMessage`): warning
+        """
+        with self._lock:
+            self.warnings.append(warning)
+
+    def get_text(self):
+        """ Get the recorded standard output/error
+
+        Returns:
+            :obj:`str`: recorded standard output/error
+        """
+        with self._lock:
+            return ''.join(self._log)
+
+
+class _RoutedStream(object):
+    """ Stream which passes output through to a stream, except for the output of threads with active
+    :obj:`ThreadOutputRecorder`\\ s, which is recorded by their recorders
+
+    Attributes:
+        stream (:obj:`io.IOBase`): stream to pass output through to
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, message):
+        recorder = _current_recorder.get()
+        if recorder is None:
+            return self.stream.write(message)
+        recorder.write(message)
+        return len(message)
+
+    def flush(self):
+        if _current_recorder.get() is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextlib.contextmanager
+def route_thread_output():
+    """ Context manager which routes the standard output/error and warnings of threads with active
+    :obj:`ThreadOutputRecorder`\\ s to their recorders, and passes the output and warnings of the other threads through
+    (e.g., to the capture of the output and warnings of the test case which is evaluated)
+    """
+    stdout = sys.stdout
+    stderr = sys.stderr
+    showwarning = warnings.showwarning
+
+    def route_warning(message, category, filename, lineno, file=None, line=None):
+        recorder = _current_recorder.get()
+        if recorder is None:
+            showwarning(message, category, filename, lineno, file=file, line=line)
+        else:
+            recorder.add_warning(warnings.WarningMessage(message, category, filename, lineno, file=file, line=line))
+
+    sys.stdout = _RoutedStream(stdout)
+    sys.stderr = _RoutedStream(stderr)
+    warnings.showwarning = route_warning
+    try:
+        yield
+    finally:
+        warnings.showwarning = showwarning
+        sys.stderr = stderr
+        sys.stdout = stdout
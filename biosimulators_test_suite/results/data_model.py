@@ -7,14 +7,19 @@
 """
 
 from .._version import __version__
+from ..utils import format_traceback
+from .. import exceptions
+from .. import warnings as test_case_warnings
 from ..warnings import TestCaseWarning  # noqa: F401
+import builtins
 import enum
-import traceback
+import warnings
 
 __all__ = [
     'TestCaseResultType',
     'TestCaseResult',
     'TestResultsReport',
+    'ReportedTestCase',
 ]
 
 
@@ -33,23 +38,34 @@ class TestCaseResult(object):
         type (:obj:`obj:`TestCaseResultType`): type
         duration (:obj:`float`): execution duration in seconds
         exception (:obj:`Exception`): exception
-        exception_traceback (:obj:`str`): traceback
+        exception_traceback (:obj:`types.TracebackType`, :obj:`traceback.StackSummary`, or :obj:`list` of :obj:`str`): traceback
         warnings (:obj:`list` of :obj:`TestCaseWarning`): warnings
         skip_reason (:obj:`Exception`): Exception which explains reason for skip
         log (:obj:`str`): log of execution
+        timings (:obj:`dict` of :obj:`str` to :obj:`float`): map from the names of the phases of the execution (e.g.,
+            ``syntheticArchive:1.execArchive``) to their durations in seconds
+        provenance (:obj:`dict`): if the result was reused from the report of a previous run rather than evaluated, the version
+            of the test suite, GitHub issue, and GitHub action run of that report (``testSuiteVersion``, ``ghIssue``,
+            ``ghActionRun``); otherwise :obj:`None`
     """
 
-    def __init__(self, case=None, type=None, duration=None, exception=None, exception_traceback=None, warnings=None, skip_reason=None, log=None):
+    def __init__(self, case=None, type=None, duration=None, exception=None, exception_traceback=None, warnings=None, skip_reason=None, log=None,
+                 timings=None, provenance=None):
         """
         Args:
             case (:obj:`TestCase`, optional): test case
             type (:obj:`obj:`TestCaseResultType`, optional): type
             duration (:obj:`float`, optional): execution duration in seconds
             exception (:obj:`Exception`, optional): exception
-            exception_traceback (:obj:`str`, optional): traceback
+            exception_traceback (:obj:`types.TracebackType`, :obj:`traceback.StackSummary`, or :obj:`list` of :obj:`str`, optional):
+                traceback
             warnings (:obj:`list` of :obj:`TestCaseWarning`, optional): warnings
             skip_reason (:obj:`Exception`, optional): Exception which explains reason for skip
             log (:obj:`str`, optional): log of execution
+            timings (:obj:`dict` of :obj:`str` to :obj:`float`, optional): map from the names of the phases of the execution
+                (e.g., ``syntheticArchive:1.execArchive``) to their durations in seconds
+            provenance (:obj:`dict`, optional): if the result was reused from the report of a previous run rather than
+                evaluated, the version of the test suite, GitHub issue, and GitHub action run of that report
         """
         self.case = case
         self.type = type
@@ -59,6 +75,8 @@ class TestCaseResult(object):
         self.warnings = warnings or []
         self.skip_reason = skip_reason
         self.log = log
+        self.timings = timings or {}
+        self.provenance = provenance
 
     def to_dict(self, max_log_len=None, debug=True):
         """ Generate a dictionary representation e.g., for export to JSON
@@ -85,7 +103,7 @@ class TestCaseResult(object):
             'exception': {
                 'category': self.exception.__class__.__name__,
                 'message': str(self.exception),
-                'traceback': traceback.format_tb(self.exception_traceback) if self.exception_traceback else None,
+                'traceback': format_traceback(self.exception_traceback) if self.exception_traceback else None,
             } if self.exception else None,
             'warnings': [{'category': warning.category.__name__, 'message': str(warning.message)}
                          for warning in self.warnings],
@@ -94,8 +112,47 @@ class TestCaseResult(object):
                 'message': str(self.skip_reason),
             } if self.skip_reason else None,
             'log': log,
+            'timings': dict(self.timings),
+            'provenance': self.provenance,
         }
 
+    def from_dict(self, val):
+        """ Load the result from its dictionary representation (e.g., read from a report). The test case, exception, skip
+        reason, and warnings are reconstituted with classes which have the same names as the original classes.
+
+        Args:
+            val (:obj:`dict`): dictionary representation
+
+        Returns:
+            :obj:`TestCaseResult`: result
+        """
+        self.case = ReportedTestCase(id=val['case']['id'], description=val['case']['description'])
+        self.type = TestCaseResultType(val['resultType'])
+        self.duration = val['duration']
+
+        if val['exception']:
+            self.exception = make_exception(val['exception']['category'], val['exception']['message'])
+            self.exception_traceback = val['exception']['traceback']
+        else:
+            self.exception = None
+            self.exception_traceback = None
+
+        self.warnings = []
+        for warning in val['warnings']:
+            category = get_warning_class(warning['category'])
+            self.warnings.append(warnings.WarningMessage(category(warning['message']), category, None, None))
+
+        if val['skipReason']:
+            self.skip_reason = make_exception(val['skipReason']['category'], val['skipReason']['message'])
+        else:
+            self.skip_reason = None
+
+        self.log = val['log']
+        self.timings = val.get('timings', None) or {}
+        self.provenance = val.get('provenance', None)
+
+        return self
+
 
 class TestResultsReport(object):
     """ A report of the results of executing the test suite with a simulation tool
@@ -105,20 +162,27 @@ class TestResultsReport(object):
         results (:obj:`list` of :obj:`TestCaseResult`): results of the test cases of the test suite
         gh_issue (:obj:`int`): GitHub issue for which the test suite was executed
         gh_action_run (:obj:`int`): GitHub action run in which the test suite was executed
+        specifications (:obj:`dict`): specifications of the simulation tool which was validated
+        image_digest (:obj:`str`): digest of the Docker image of the simulation tool which was validated
     """
 
-    def __init__(self, test_suite_version=__version__, results=None, gh_issue=None, gh_action_run=None):
+    def __init__(self, test_suite_version=__version__, results=None, gh_issue=None, gh_action_run=None,
+                 specifications=None, image_digest=None):
         """
         Args:
             test_suite_version (:obj:`str`, optional): version of the test suite which was executed
             results (:obj:`list` of :obj:`TestCaseResult`, optional): results of the test cases of the test suite
             gh_issue (:obj:`int`, optional): GitHub issue for which the test suite was executed
             gh_action_run (:obj:`int`, optional): GitHub action run in which the test suite was executed
+            specifications (:obj:`dict`, optional): specifications of the simulation tool which was validated
+            image_digest (:obj:`str`, optional): digest of the Docker image of the simulation tool which was validated
         """
         self.test_suite_version = test_suite_version
         self.results = results or []
         self.gh_issue = gh_issue
         self.gh_action_run = gh_action_run
+        self.specifications = specifications
+        self.image_digest = image_digest
 
     def to_dict(self, max_log_len=None):
         """ Generate a dictionary representation e.g., for export to JSON
@@ -134,4 +198,82 @@ class TestResultsReport(object):
             'results': [result.to_dict(max_log_len=max_log_len) for result in self.results],
             'ghIssue': self.gh_issue,
             'ghActionRun': self.gh_action_run,
+            'specifications': self.specifications,
+            'imageDigest': self.image_digest,
         }
+
+    def from_dict(self, val):
+        """ Load the report from its dictionary representation (e.g., read from a JSON file)
+
+        Args:
+            val (:obj:`dict`): dictionary representation
+
+        Returns:
+            :obj:`TestResultsReport`: report
+        """
+        self.test_suite_version = val['testSuiteVersion']
+        self.results = [TestCaseResult().from_dict(result) for result in val['results']]
+        self.gh_issue = val['ghIssue']
+        self.gh_action_run = val['ghActionRun']
+        self.specifications = val.get('specifications', None)
+        self.image_digest = val.get('imageDigest', None)
+        return self
+
+
+class ReportedTestCase(object):
+    """ A test case reconstituted from a report of its result
+
+    Attributes:
+        id (:obj:`str`): id
+        description (:obj:`str`): description
+    """
+
+    def __init__(self, id=None, description=None):
+        """
+        Args:
+            id (:obj:`str`, optional): id
+            description (:obj:`str`, optional): description
+        """
+        self.id = id
+        self.description = description
+
+
+def make_exception(category, message):
+    """ Make an exception from the name of its class and its message
+
+    Args:
+        category (:obj:`str`): name of the class of the exception
+        message (:obj:`str`): message
+
+    Returns:
+        :obj:`Exception`: instance of the exception of the test suite or built-in exception with the name, or of a new subclass
+            of :obj:`Exception` with the name
+    """
+    for module in [exceptions, builtins]:
+        cls = getattr(module, category, None)
+        if isinstance(cls, type) and issubclass(cls, Exception):
+            try:
+                exception = cls(message)
+            except TypeError:
+                break
+            if str(exception) == message:
+                return exception
+            break
+    return type(category, (Exception,), {})(message)
+
+
+def get_warning_class(name):
+    """ Get the class of a warning from its name
+
+    Args:
+        name (:obj:`str`): name of the class
+
+    Returns:
+        :obj:`type`: class of the warning of the test suite or built-in warning with the name, or a new subclass of
+            :obj:`TestCaseWarning` with the name
+    """
+    for module in [test_case_warnings, builtins]:
+        cls = getattr(module, name, None)
+        if isinstance(cls, type) and issubclass(cls, Warning):
+            return cls
+    return type(name, (TestCaseWarning,), {})
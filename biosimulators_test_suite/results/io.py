@@ -6,13 +6,20 @@
 :License: MIT
 """
 
+from .._version import __version__
 from .data_model import TestCaseResult, TestResultsReport  # noqa: F401
 import json
+import os
 
-__all__ = ['write_test_results']
+__all__ = [
+    'write_test_results',
+    'read_test_results',
+    'TestResultsJsonLinesWriter',
+    'read_test_results_jsonl',
+]
 
 
-def write_test_results(results, filename, gh_issue=None, gh_action_run=None):
+def write_test_results(results, filename, gh_issue=None, gh_action_run=None, specifications=None, image_digest=None):
     """ Write the results of test cases to a JSON file
 
     Args:
@@ -20,7 +27,123 @@ def write_test_results(results, filename, gh_issue=None, gh_action_run=None):
         filename (:obj:`str`): path to save results
         gh_issue (:obj:`int`, optional): GitHub issue for which the test suite was executed
         gh_action_run (:obj:`int`, optional): GitHub action run in which the test suite was executed
+        specifications (:obj:`dict`, optional): specifications of the simulation tool which was validated
+        image_digest (:obj:`str`, optional): digest of the Docker image of the simulation tool which was validated
     """
-    report = TestResultsReport(results=results, gh_issue=gh_issue, gh_action_run=gh_action_run)
+    report = TestResultsReport(results=results, gh_issue=gh_issue, gh_action_run=gh_action_run,
+                               specifications=specifications, image_digest=image_digest)
     with open(filename, 'w') as file:
         json.dump(report.to_dict(), file)
+
+
+def read_test_results(filename):
+    """ Read a report of the results of test cases from a JSON file written by :obj:`write_test_results`
+
+    Args:
+        filename (:obj:`str`): path to the results
+
+    Returns:
+        :obj:`TestResultsReport`: report
+    """
+    with open(filename, 'r') as file:
+        return TestResultsReport().from_dict(json.load(file))
+
+
+class TestResultsJsonLinesWriter(object):
+    """ Stream the results of test cases to a JSON Lines file as they complete
+
+    The first line of the file describes the report (the version of the test suite, GitHub issue, GitHub action run,
+    specifications and digest of the Docker image of the simulation tool). Each
+    subsequent line is the dictionary representation of the result of a test case. Each line is flushed to disk before
+    :obj:`write` returns, so that the results of the completed test cases are preserved if the test suite is interrupted.
+
+    Attributes:
+        filename (:obj:`str`): path to save results
+        _file (:obj:`io.TextIOWrapper`): file
+    """
+
+    def __init__(self, filename, gh_issue=None, gh_action_run=None, specifications=None, image_digest=None):
+        """
+        Args:
+            filename (:obj:`str`): path to save results
+            gh_issue (:obj:`int`, optional): GitHub issue for which the test suite was executed
+            gh_action_run (:obj:`int`, optional): GitHub action run in which the test suite was executed
+            specifications (:obj:`dict`, optional): specifications of the simulation tool which is validated
+            image_digest (:obj:`str`, optional): digest of the Docker image of the simulation tool which is validated
+        """
+        self.filename = filename
+        self._file = open(filename, 'w')
+        self._write_record({
+            'testSuiteVersion': __version__,
+            'ghIssue': gh_issue,
+            'ghActionRun': gh_action_run,
+            'specifications': specifications,
+            'imageDigest': image_digest,
+        })
+
+    def write(self, result):
+        """ Append the result of a test case to the file
+
+        Args:
+            result (:obj:`TestCaseResult`): result of a test case
+        """
+        self._write_record(result.to_dict())
+
+    def close(self):
+        """ Close the file """
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_record(self, record):
+        """ Append a record to the file and flush it to disk
+
+        Args:
+            record (:obj:`dict`): record
+        """
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def read_test_results_jsonl(filename):
+    """ Read a report of the results of test cases from a JSON Lines file written by :obj:`TestResultsJsonLinesWriter`. An
+    incomplete final line (e.g., because the test suite was killed while writing it) is ignored.
+
+    Args:
+        filename (:obj:`str`): path to the results
+
+    Returns:
+        :obj:`TestResultsReport`: report
+    """
+    report = {
+        'testSuiteVersion': None,
+        'results': [],
+        'ghIssue': None,
+        'ghActionRun': None,
+        'specifications': None,
+        'imageDigest': None,
+    }
+    with open(filename, 'r') as file:
+        for i_line, line in enumerate(file):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if not line.endswith('\n'):
+                    # the final line is incomplete
+                    break
+                raise ValueError('Line {} of `{}` is not valid JSON.'.format(i_line + 1, filename))
+
+            if 'case' in record:
+                report['results'].append(record)
+            else:
+                report.update(record)
+
+    return TestResultsReport().from_dict(report)
@@ -0,0 +1,388 @@
+""" Scheduling of the evaluation of test cases by their durations in previous runs
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-30
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from .results.data_model import TestCaseResultType
+from .results.io import read_test_results, read_test_results_jsonl
+from .test_case.published_project import SimulatorCanExecutePublishedProject
+from .utils import read_versioned_json, write_json_atomically
+import collections
+import heapq
+import os
+import statistics
+
+__all__ = [
+    'CaseDurationStore',
+    'read_case_durations_from_report',
+    'read_case_result_types_from_report',
+    'CaseScheduler',
+]
+
+
+class CaseDurationStore(object):
+    """ Store of the durations and results of the test cases of previous runs with each simulator
+
+    The store maps the id of each simulator to a map from the ids of its test cases to their durations and the types of their
+    most recent results (e.g., ``failed``). After each run, the durations of its test cases are blended with their previous
+    durations (see :obj:`SMOOTHING`) so that a single slow or fast run does not dominate the schedule of subsequent runs. The store
+    is versioned (:obj:`VERSION`); stores with other versions are ignored.
+
+    Attributes:
+        filename (:obj:`str`): path to the store, or :obj:`None` to not save durations
+    """
+
+    VERSION = 2
+    SMOOTHING = 0.5
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the store, or :obj:`None` to not save durations
+        """
+        self.filename = filename
+
+    def get_durations(self, simulator_id):
+        """ Get the durations of the test cases of previous runs with a simulator
+
+        Args:
+            simulator_id (:obj:`str`): id of the simulator
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`float`: map from the ids of test cases to their durations in seconds
+        """
+        return {
+            case_id: case['duration']
+            for case_id, case in self.read().get(simulator_id, {}).items()
+            if case.get('duration', None) is not None
+        }
+
+    def get_result_types(self, simulator_id):
+        """ Get the types of the most recent results of the test cases of previous runs with a simulator
+
+        Args:
+            simulator_id (:obj:`str`): id of the simulator
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`TestCaseResultType`: map from the ids of test cases to the types of their most
+            recent results
+        """
+        return {
+            case_id: TestCaseResultType(case['resultType'])
+            for case_id, case in self.read().get(simulator_id, {}).items()
+            if case.get('resultType', None) in TestCaseResultType.__members__
+        }
+
+    def update(self, simulator_id, results):
+        """ Record the durations and the types of the results of the test cases of a run with a simulator
+
+        Args:
+            simulator_id (:obj:`str`): id of the simulator
+            results (:obj:`list` of :obj:`TestCaseResult`): results of the test cases of the run
+        """
+        if not self.filename:
+            return
+
+        simulators = self.read()
+        cases = simulators.setdefault(simulator_id, {})
+        for result in results:
+            case = cases.setdefault(result.case.id, {})
+            case['resultType'] = result.type.value
+
+            # the results of test cases whose worker terminated abnormally don't have durations
+            if not result.duration:
+                continue
+
+            prev_duration = case.get('duration', None)
+            if prev_duration is None:
+                case['duration'] = result.duration
+            else:
+                case['duration'] = self.SMOOTHING * prev_duration + (1 - self.SMOOTHING) * result.duration
+
+        self.write(simulators)
+
+    def read(self):
+        """ Read the store
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`str` to :obj:`dict`: map from the ids of simulators to maps from
+            the ids of their test cases to their durations (``duration``) and the types of their most recent results
+            (``resultType``), or an empty dictionary if the store hasn't been saved, can't be read, or has another version
+        """
+        store = read_versioned_json(self.filename, self.VERSION) or {}
+        return store.get('simulators', {})
+
+    def write(self, simulators):
+        """ Save the store with :obj:`write_json_atomically`
+
+        Args:
+            simulators (:obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`str` to :obj:`dict`): map from the ids of simulators
+                to maps from the ids of their test cases to their durations and the types of their most recent results
+        """
+        write_json_atomically(self.filename, {
+            'version': self.VERSION,
+            'simulators': simulators,
+        })
+
+
+def read_case_durations_from_report(filename):
+    """ Read the durations of test cases from a report of a previous run (a JSON report saved with ``--report`` or a JSON Lines
+    report saved with ``--report-jsonl``)
+
+    Args:
+        filename (:obj:`str`): path to the report
+
+    Returns:
+        :obj:`dict` of :obj:`str` to :obj:`float`: map from the ids of test cases to their durations in seconds
+    """
+    return {result.case.id: result.duration for result in _read_report(filename).results if result.duration}
+
+
+def read_case_result_types_from_report(filename):
+    """ Read the types of the results of test cases from a report of a previous run (a JSON report saved with ``--report`` or a
+    JSON Lines report saved with ``--report-jsonl``)
+
+    Args:
+        filename (:obj:`str`): path to the report
+
+    Returns:
+        :obj:`dict` of :obj:`str` to :obj:`TestCaseResultType`: map from the ids of test cases to the types of their results
+    """
+    return {result.case.id: result.type for result in _read_report(filename).results}
+
+
+def _read_report(filename):
+    """ Read a report of a previous run
+
+    Args:
+        filename (:obj:`str`): path to the report (JSON or JSON Lines)
+
+    Returns:
+        :obj:`TestResultsReport`: report
+    """
+    if filename.endswith('.jsonl'):
+        return read_test_results_jsonl(filename)
+    return read_test_results(filename)
+
+
+class CaseScheduler(object):
+    """ Schedule the concurrent evaluation of test cases longest-processing-time-first, and select subsets of test cases which
+    can be evaluated within time budgets
+
+    The duration of each test case is estimated from its duration in previous runs. Test cases without previous durations are
+    estimated with heuristics: the duration of a published project is proportional to the size of its COMBINE/OMEX archive (at
+    the rate of the published projects with previous durations, or :obj:`DEFAULT_PUBLISHED_PROJECT_SECONDS_PER_BYTE`), and the
+    duration of another test case is the median duration of the test cases with previous durations (or
+    :obj:`DEFAULT_DURATION`). Starting the longest test cases first keeps long test cases from starting last and dominating the
+    duration of the run.
+
+    Subsets of test cases are selected greedily by the ratio of the value of each test case to its estimated duration. Test cases
+    whose most recent results were failures are the most valuable (:obj:`FAILED_CASE_VALUE`), followed by the first test case of
+    each suite (:obj:`NEW_SUITE_VALUE`), and published projects which cover model formats and simulation algorithms which no
+    selected published project covers (:obj:`NEW_TASK_REQUIREMENT_VALUE` for each).
+
+    Attributes:
+        durations (:obj:`dict` of :obj:`str` to :obj:`float`): map from the ids of test cases to their durations in previous runs
+        result_types (:obj:`dict` of :obj:`str` to :obj:`TestCaseResultType`): map from the ids of test cases to the types of
+            their most recent results
+    """
+
+    DEFAULT_DURATION = 10.
+    DEFAULT_PUBLISHED_PROJECT_SECONDS_PER_BYTE = 1e-4
+
+    CASE_VALUE = 1.
+    FAILED_CASE_VALUE = 10.
+    NEW_SUITE_VALUE = 2.
+    NEW_TASK_REQUIREMENT_VALUE = 1.
+    MIN_DURATION = 0.1
+
+    def __init__(self, durations=None, result_types=None):
+        """
+        Args:
+            durations (:obj:`dict` of :obj:`str` to :obj:`float`, optional): map from the ids of test cases to their durations in
+                previous runs
+            result_types (:obj:`dict` of :obj:`str` to :obj:`TestCaseResultType`, optional): map from the ids of test cases to
+                the types of their most recent results
+        """
+        self.durations = durations or {}
+        self.result_types = result_types or {}
+
+    def estimate_durations(self, cases):
+        """ Estimate the durations of test cases
+
+        Args:
+            cases (:obj:`list` of :obj:`TestCase`): test cases
+
+        Returns:
+            :obj:`dict` of :obj:`TestCase` to :obj:`float`: map from test cases to their estimated durations in seconds
+        """
+        known_durations = [self.durations[case.id] for case in cases if case.id in self.durations]
+        if known_durations:
+            default_duration = statistics.median(known_durations)
+        else:
+            default_duration = self.DEFAULT_DURATION
+
+        archive_sizes = {
+            case: self._get_archive_size(case)
+            for case in cases
+            if isinstance(case, SimulatorCanExecutePublishedProject)
+        }
+        known_archive_sizes = [(self.durations[case.id], size) for case, size in archive_sizes.items()
+                               if case.id in self.durations and size]
+        if known_archive_sizes:
+            seconds_per_byte = sum(duration for duration, _ in known_archive_sizes) / sum(size for _, size in known_archive_sizes)
+        else:
+            seconds_per_byte = self.DEFAULT_PUBLISHED_PROJECT_SECONDS_PER_BYTE
+
+        estimated_durations = {}
+        for case in cases:
+            if case.id in self.durations:
+                estimated_durations[case] = self.durations[case.id]
+            elif archive_sizes.get(case, None):
+                estimated_durations[case] = seconds_per_byte * archive_sizes[case]
+            else:
+                estimated_durations[case] = default_duration
+        return estimated_durations
+
+    def order(self, cases, estimated_durations=None):
+        """ Order test cases longest-processing-time-first. Test cases with the same estimated durations keep their order.
+
+        Args:
+            cases (:obj:`list` of :obj:`TestCase`): test cases
+            estimated_durations (:obj:`dict` of :obj:`TestCase` to :obj:`float`, optional): estimated durations of the test
+                cases. If :obj:`None`, the durations are estimated with :obj:`estimate_durations`.
+
+        Returns:
+            :obj:`list` of :obj:`TestCase`: test cases in the order in which they should be started
+        """
+        if estimated_durations is None:
+            estimated_durations = self.estimate_durations(cases)
+        return sorted(cases, key=lambda case: -estimated_durations[case])
+
+    def predict_makespan(self, cases, jobs, estimated_durations=None):
+        """ Predict the duration of the evaluation of test cases by a pool of workers which start the test cases in the order
+        of :obj:`order` as workers become available
+
+        Args:
+            cases (:obj:`list` of :obj:`TestCase`): test cases
+            jobs (:obj:`int`): number of workers
+            estimated_durations (:obj:`dict` of :obj:`TestCase` to :obj:`float`, optional): estimated durations of the test
+                cases. If :obj:`None`, the durations are estimated with :obj:`estimate_durations`.
+
+        Returns:
+            :obj:`float`: predicted duration in seconds
+        """
+        if estimated_durations is None:
+            estimated_durations = self.estimate_durations(cases)
+
+        worker_end_times = [0.] * jobs
+        for case in self.order(cases, estimated_durations=estimated_durations):
+            heapq.heappush(worker_end_times, heapq.heappop(worker_end_times) + estimated_durations[case])
+        return max(worker_end_times)
+
+    def select(self, cases, time_budget, jobs=1, estimated_durations=None):
+        """ Select the most valuable subset of test cases which is predicted to be evaluated within a time budget
+
+        Args:
+            cases (:obj:`collections.OrderedDict` of :obj:`str` to :obj:`list` of :obj:`TestCase`): map from the names of suites
+                to their test cases
+            time_budget (:obj:`float`): time budget in seconds
+            jobs (:obj:`int`, optional): number of test cases which will be evaluated concurrently
+            estimated_durations (:obj:`dict` of :obj:`TestCase` to :obj:`float`, optional): estimated durations of the test
+                cases. If :obj:`None`, the durations are estimated with :obj:`estimate_durations`.
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`collections.OrderedDict` of :obj:`str` to :obj:`list` of :obj:`TestCase`: map from the names of suites to
+                  their selected test cases, in their original order
+                * :obj:`list` of :obj:`TestCase`: deferred test cases, in their original order
+        """
+        suite_names = {case: suite_name for suite_name, suite_cases in cases.items() for case in suite_cases}
+        all_cases = list(suite_names.keys())
+        if estimated_durations is None:
+            estimated_durations = self.estimate_durations(all_cases)
+
+        selected_cases = set()
+        covered_suite_names = set()
+        covered_task_requirements = set()
+        candidate_cases = list(all_cases)
+        while candidate_cases:
+            candidate_cases.sort(key=lambda case: -self._get_value(case, suite_names[case], covered_suite_names,
+                                                                   covered_task_requirements)
+                                 / max(estimated_durations[case], self.MIN_DURATION))
+
+            for i_case, case in enumerate(candidate_cases):
+                if self.predict_makespan(list(selected_cases) + [case], jobs,
+                                         estimated_durations=estimated_durations) <= time_budget:
+                    selected_cases.add(case)
+                    covered_suite_names.add(suite_names[case])
+                    covered_task_requirements.update(self._get_task_requirements(case))
+                    # test cases which don't fit in the remaining budget are deferred
+                    candidate_cases = candidate_cases[i_case + 1:]
+                    break
+            else:
+                break
+
+        selected_suite_cases = collections.OrderedDict(
+            (suite_name, [case for case in suite_cases if case in selected_cases])
+            for suite_name, suite_cases in cases.items()
+        )
+        deferred_cases = [case for case in all_cases if case not in selected_cases]
+        return (selected_suite_cases, deferred_cases)
+
+    def _get_value(self, case, suite_name, covered_suite_names, covered_task_requirements):
+        """ Get the value of evaluating a test case, given the suites and task requirements covered by the selected test cases
+
+        Args:
+            case (:obj:`TestCase`): test case
+            suite_name (:obj:`str`): name of the suite of the test case
+            covered_suite_names (:obj:`set` of :obj:`str`): names of the suites of the selected test cases
+            covered_task_requirements (:obj:`set` of :obj:`tuple`): model formats and simulation algorithms covered by the
+                selected published projects
+
+        Returns:
+            :obj:`float`: value
+        """
+        value = self.CASE_VALUE
+        if self.result_types.get(case.id, None) == TestCaseResultType.failed:
+            value += self.FAILED_CASE_VALUE
+        if suite_name not in covered_suite_names:
+            value += self.NEW_SUITE_VALUE
+        value += self.NEW_TASK_REQUIREMENT_VALUE * len(self._get_task_requirements(case).difference(covered_task_requirements))
+        return value
+
+    @staticmethod
+    def _get_task_requirements(case):
+        """ Get the model formats and simulation algorithms covered by a test case
+
+        Args:
+            case (:obj:`TestCase`): test case
+
+        Returns:
+            :obj:`set` of :obj:`tuple`: model formats (e.g., ``('modelFormat', 'format_2585')``) and simulation algorithms (e.g.,
+            ``('simulationAlgorithm', 'KISAO_0000019')``) covered by the test case
+        """
+        task_requirements = set()
+        if isinstance(case, SimulatorCanExecutePublishedProject):
+            for task_reqs in case.task_requirements:
+                task_requirements.add(('modelFormat', task_reqs.model_format))
+                task_requirements.add(('simulationAlgorithm', task_reqs.simulation_algorithm))
+        return task_requirements
+
+    @staticmethod
+    def _get_archive_size(case):
+        """ Get the size of the COMBINE/OMEX archive of a published project
+
+        Args:
+            case (:obj:`SimulatorCanExecutePublishedProject`): test case
+
+        Returns:
+            :obj:`int`: size of the archive in bytes, or :obj:`None` if the archive is not available
+        """
+        if case.filename and os.path.isfile(case.filename):
+            return os.path.getsize(case.filename)
+        return None
@@ -6,10 +6,10 @@
 :License: MIT
 """
 
+from ..outputs import OutputsReader
 from ..warnings import InvalidOutputsWarning
 from .published_project import SingleMasterSedDocumentCombineArchiveTestCase
 from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContent, CombineArchiveContentFormat  # noqa: F401
-from biosimulators_utils.report.io import ReportReader
 from biosimulators_utils.sedml.data_model import SedDocument, Report  # noqa: F401
 import abc
 import copy
@@ -114,7 +114,8 @@ class CombineArchiveTestCase(SingleMasterSedDocumentCombineArchiveTestCase):
             :obj:`bool`: whether there were no warnings about the outputs
         """
         try:
-            report_ids = ReportReader().get_ids(outputs_dir)
+            with OutputsReader(outputs_dir) as outputs_reader:
+                report_ids = outputs_reader.get_ids()
         except Exception:
             report_ids = []
 
@@ -173,3 +173,6 @@ class SingularityImageExecutesSimulationsSuccessfully(SimulatorSupportsModelsSim
     """ Test that the Singularity version of a Docker image can sucessfully execute COMBINE archives """
 
     EXEC_WITH_SINGULARITY = True
+
+    # the Docker image is converted to a Singularity image by the execution of each archive
+    MAX_CONCURRENT_SYNTHETIC_ARCHIVES = 1
@@ -37,6 +37,9 @@ class LoggingTestCase(SingleMasterSedDocumentCombineArchiveTestCase):
     VALIDATE_TASK_LOGS = False
     VALIDATE_OUTPUT_LOGS = False
 
+    # the evaluation of the outputs of each archive records the validity of their statuses with the test case
+    MAX_CONCURRENT_SYNTHETIC_ARCHIVES = 1
+
     @abc.abstractmethod
     def is_concrete(self):
         """ Whether the class is abstract
@@ -6,32 +6,42 @@
 :License: MIT
 """
 
+from ..archive_assembler import CombineArchiveAssembler
+from ..capabilities import SimulatorCapabilities
 from ..config import Config
-from ..data_model import (TestCase, SedTaskRequirements, ExpectedSedReport, ExpectedSedDataSet, ExpectedSedPlot,
-                          AlertType, OutputMedium)
+from ..data_model import (TestCase, SedTaskRequirements, ExpectedSedReport, ExpectedSedDataSet, SparseExpectedSedDataSetValues,
+                          ExternalExpectedSedDataSetValues, ExpectedSedPlot, AlertType, OutputMedium)
+from ..examples_index import ExamplesIndex
 from ..exceptions import InvalidOutputsException, SkippedTestCaseException, TimeoutException, TestCaseException
-from ..utils import get_singularity_image_filename, simulation_results_isnan
+from ..exec_cache import ExecutionCache  # noqa: F401
+from ..model_index import ModelAttribute, get_model_attributes  # noqa: F401
+from ..outputs import OutputsReader
+from ..persistent_container import PersistentSimulatorContainer  # noqa: F401
+from ..recording import ThreadOutputRecorder
+from ..timing import phase
+from ..utils import get_singularity_image_filename, iter_simulation_results_blocks, simulation_results_any_isnan
 from ..warnings import IgnoredTestCaseWarning, SimulatorRuntimeErrorWarning, InvalidOutputsWarning
 from .utils import are_array_shapes_equivalent
 from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContentFormatPattern  # noqa: F401
-from biosimulators_utils.combine.io import CombineArchiveReader, CombineArchiveWriter
+from biosimulators_utils.combine.io import CombineArchiveReader
 from biosimulators_utils.config import get_config
 from biosimulators_utils.image import convert_docker_image_to_singularity
-from biosimulators_utils.report.data_model import ReportFormat
-from biosimulators_utils.report.io import ReportReader
 from biosimulators_utils.sedml.data_model import (  # noqa: F401
     Output, Report, Task, UniformTimeCourseSimulation,
     DataGenerator, Variable, Symbol, DataSet,
     Model, ModelLanguagePattern, Simulation, Algorithm)
-from biosimulators_utils.sedml.io import SedmlSimulationReader, SedmlSimulationWriter
+from biosimulators_utils.sedml.io import SedmlSimulationReader
 from biosimulators_utils.sedml.utils import (remove_algorithm_parameter_changes,
                                              replace_complex_data_generators_with_generators_for_individual_variables,
                                              remove_plots)
+from lxml import etree
 import biosimulators_utils.archive.io
 import biosimulators_utils.simulator.exec
-import biosimulators_utils.report.io
 import abc
-import glob
+import concurrent.futures
+import contextvars
+import copy
+import hashlib
 import json
 import numpy
 import numpy.testing
@@ -39,11 +49,16 @@ import os
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 import types  # noqa: F401
 import warnings
+import zipfile
 
 __all__ = [
     'SimulatorCanExecutePublishedProject',
+    'CuratedArchiveCache',
     'SyntheticCombineArchiveTestCase',
     'ExpectedResultOfSyntheticArchive',
     'find_cases',
@@ -75,8 +90,15 @@ class SimulatorCanExecutePublishedProject(TestCase):
         r_tol (:obj:`float`): relative tolerence
         a_tol (:obj:`float`): absolute tolerence
         minimum_number_of_synthetic_uniform_time_steps (:obj:`int`): minimum number of steps to use for derived simulation experiments
+        exec_cache (:obj:`ExecutionCache`): cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+        persistent_container (:obj:`PersistentSimulatorContainer`): long-lived container to execute COMBINE/OMEX archives with
+            rather than a new container for each archive
+        _expected_results_filename (:obj:`str`): path to the ``expected-results.json`` file to read the expected reports and plots
+            from when they are first used, or :obj:`None` if they have already been read
     """
 
+    MAX_REPORTED_EXPECTED_VALUE_MISMATCHES = 10
+
     def __init__(self, id=None, name=None, filename=None,
                  task_requirements=None, skipped_simulators=None,
                  expected_reports=None, expected_plots=None,
@@ -84,7 +106,7 @@ class SimulatorCanExecutePublishedProject(TestCase):
                  assert_no_extra_reports=False, assert_no_extra_datasets=False,
                  assert_no_missing_plots=False, assert_no_extra_plots=False,
                  r_tol=1e-4, a_tol=0., minimum_number_of_synthetic_uniform_time_steps=10,
-                 output_medium=OutputMedium.console):
+                 output_medium=OutputMedium.console, exec_cache=None, persistent_container=None, capabilities=None):
         """
         Args:
             id (:obj:`str`, optional): id
@@ -104,11 +126,16 @@ class SimulatorCanExecutePublishedProject(TestCase):
             a_tol (:obj:`float`, optional): absolute tolerence
             minimum_number_of_synthetic_uniform_time_steps (:obj:`int`, optional): minimum number of steps to use for derived simulation experiments
             output_medium (:obj:`OutputMedium`, optional): medium the description should be formatted for
+            exec_cache (:obj:`ExecutionCache`, optional): cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+            persistent_container (:obj:`PersistentSimulatorContainer`, optional): long-lived container to execute COMBINE/OMEX
+                archives with rather than a new container for each archive
+            capabilities (:obj:`SimulatorCapabilities`, optional): index of the capabilities of the simulator to validate
         """
-        super(SimulatorCanExecutePublishedProject, self).__init__(id, name, output_medium=output_medium)
+        super(SimulatorCanExecutePublishedProject, self).__init__(id, name, output_medium=output_medium, capabilities=capabilities)
         self.filename = filename
         self.task_requirements = task_requirements or []
         self.skipped_simulators = skipped_simulators or []
+        self._expected_results_filename = None
         self.expected_reports = expected_reports or []
         self.expected_plots = expected_plots or []
 
@@ -122,6 +149,135 @@ class SimulatorCanExecutePublishedProject(TestCase):
         self.r_tol = r_tol
         self.a_tol = a_tol
         self.minimum_number_of_synthetic_uniform_time_steps = minimum_number_of_synthetic_uniform_time_steps
+        self.exec_cache = exec_cache
+        self.persistent_container = persistent_container
+
+    @property
+    def expected_reports(self):
+        """ Get the reports expected to be produced by the simulator
+
+        Returns:
+            :obj:`list` of :obj:`ExpectedSedReport`: reports expected to be produced by the simulator
+        """
+        self._read_deferred_expected_results()
+        return self._expected_reports
+
+    @expected_reports.setter
+    def expected_reports(self, value):
+        """ Set the reports expected to be produced by the simulator
+
+        Args:
+            value (:obj:`list` of :obj:`ExpectedSedReport`): reports expected to be produced by the simulator
+        """
+        self._read_deferred_expected_results()
+        self._expected_reports = value
+
+    @property
+    def expected_plots(self):
+        """ Get the plots expected to be produced by the simulator
+
+        Returns:
+            :obj:`list` of :obj:`ExpectedSedPlot`: plots expected to be produced by the simulator
+        """
+        self._read_deferred_expected_results()
+        return self._expected_plots
+
+    @expected_plots.setter
+    def expected_plots(self, value):
+        """ Set the plots expected to be produced by the simulator
+
+        Args:
+            value (:obj:`list` of :obj:`ExpectedSedPlot`): plots expected to be produced by the simulator
+        """
+        self._read_deferred_expected_results()
+        self._expected_plots = value
+
+    def _read_deferred_expected_results(self):
+        """ Read the expected reports and plots of the case, if their reading was deferred until they are first used """
+        filename = self._expected_results_filename
+        if filename:
+            self._expected_results_filename = None
+            with open(filename, 'r') as file:
+                data = json.load(file)
+            self.read_expected_results(data, dirname=os.path.dirname(filename))
+
+    def get_expected_value_mismatches_message(self, report_id, data_set_id, mismatches, n_mismatches, n_elements):
+        """ Get a message which describes the elements of a data set which do not have their expected values
+
+        Args:
+            report_id (:obj:`str`): id of the report
+            data_set_id (:obj:`str`): id of the data set
+            mismatches (:obj:`list` of :obj:`tuple`): index, actual value, and expected value of each of the first
+                :obj:`MAX_REPORTED_EXPECTED_VALUE_MISMATCHES` elements which do not have their expected values
+            n_mismatches (:obj:`int`): number of elements which do not have their expected values
+            n_elements (:obj:`int`): number of elements which were compared with their expected values
+
+        Returns:
+            :obj:`str`: message
+        """
+        msgs = []
+        for index, actual_el_value, expected_el_value in mismatches[0:self.MAX_REPORTED_EXPECTED_VALUE_MISMATCHES]:
+            msgs.append('{}: {} != {}'.format(index, actual_el_value, expected_el_value))
+        if n_mismatches > len(msgs):
+            msgs.append('... and {} more'.format(n_mismatches - len(msgs)))
+
+        return 'Data set {} of report {} does not have expected values at {} of {} elements:\n  {}'.format(
+            data_set_id, report_id, n_mismatches, n_elements, '\n  '.join(msgs))
+
+    def compare_external_expected_values(self, report_id, data_set_id, value, expected_value):
+        """ Compare the values of a data set with expected values stored in an external file
+
+        The expected values are read from the file and compared in blocks along their first dimension, so that the memory
+        used to compare large data sets is bounded.
+
+        Args:
+            report_id (:obj:`str`): id of the report
+            data_set_id (:obj:`str`): id of the data set
+            value (:obj:`numpy.ndarray`): values of the data set
+            expected_value (:obj:`ExternalExpectedSedDataSetValues`): expected values of the data set
+
+        Returns:
+            :obj:`str`: description of the differences between the values and their expected values, or :obj:`None` if the
+            values are equal to their expected values
+        """
+        value = numpy.asarray(value)
+        flat_value = value.reshape(-1)
+
+        mismatches = []
+        n_mismatches = 0
+        try:
+            with expected_value.open() as expected_values:
+                if not are_array_shapes_equivalent(value.shape, expected_values.shape):
+                    return 'Data set {} of report {} does not have the expected shape: {} != {}'.format(
+                        data_set_id, report_id, value.shape, expected_values.shape)
+
+                # the shapes are equivalent up to trailing singleton dimensions, and therefore the flat indices of the
+                # elements are the same for both shapes
+                row_size = int(numpy.prod(expected_values.shape[1:], dtype=numpy.int64))
+                for block_slice, expected_block in iter_simulation_results_blocks(expected_values):
+                    i_start = block_slice.start * row_size if expected_values.shape else 0
+                    expected_block = numpy.asarray(expected_block).reshape(-1)
+                    block = flat_value[i_start:i_start + expected_block.size]
+
+                    block_mismatches = numpy.flatnonzero(~numpy.isclose(
+                        block,
+                        expected_block,
+                        rtol=self.r_tol,
+                        atol=self.a_tol,
+                        equal_nan=True,
+                    ))
+                    n_mismatches += block_mismatches.size
+                    for i_el in block_mismatches[0:max(0, self.MAX_REPORTED_EXPECTED_VALUE_MISMATCHES - len(mismatches))]:
+                        index = tuple(int(i) for i in numpy.unravel_index(i_start + i_el, value.shape))
+                        mismatches.append((index, block[i_el], expected_block[i_el]))
+
+        except (OSError, KeyError, ValueError) as exception:
+            return 'The expected values of data set {} of report {} could not be read from `{}`: {}'.format(
+                data_set_id, report_id, expected_value.filename, str(exception))
+
+        if n_mismatches:
+            return self.get_expected_value_mismatches_message(report_id, data_set_id, mismatches, n_mismatches, flat_value.size)
+        return None
 
     def get_description(self):
         """ Get a description of the case
@@ -155,18 +311,24 @@ class SimulatorCanExecutePublishedProject(TestCase):
         task_descriptions.sort()
         return 'Required model formats and simulation algorithms for SED tasks:\n' + ''.join(task_descriptions)
 
-    def from_json(self, base_path, filename):
+    def from_json(self, base_path, filename, summary=None):
         """ Read test case from JSON file
 
         Args:
             base_path (:obj:`str`): bath directory for test cases
             filename (:obj:`str`): JSON file relative to :obj:`base_path`
+            summary (:obj:`dict`, optional): content of the JSON file without its expected reports and plots (e.g., from an
+                :obj:`ExamplesIndex`). If provided, the expected reports and plots are only read from the file when they are
+                first used (e.g., when the case is evaluated).
 
         Returns:
             :obj:`SimulatorCanExecutePublishedProject`: this object
         """
-        with open(os.path.join(base_path, filename), 'r') as file:
-            data = json.load(file)
+        if summary is None:
+            with open(os.path.join(base_path, filename), 'r') as file:
+                data = json.load(file)
+        else:
+            data = summary
 
         id = filename.replace(os.sep + 'expected-results.json', '')
         self.id = 'published_project.SimulatorCanExecutePublishedProject' + ':' + id
@@ -175,13 +337,20 @@ class SimulatorCanExecutePublishedProject(TestCase):
             base_path,
             os.path.relpath(os.path.join(os.path.dirname(filename), '..', data['filename']), '.'))
 
-        return self.from_dict(data)
+        self.from_dict(data, dirname=os.path.dirname(os.path.join(base_path, filename)))
+
+        if summary is not None:
+            self._expected_results_filename = os.path.join(base_path, filename)
+
+        return self
 
-    def from_dict(self, data):
+    def from_dict(self, data, dirname='.'):
         """ Read test case from dictionary
 
         Args:
             data (:obj:`dict`): dictionary with test case data
+            dirname (:obj:`str`, optional): directory relative to which the paths to external files of expected values
+                are resolved
 
         Returns:
             :obj:`SimulatorCanExecutePublishedProject`: this object
@@ -196,6 +365,29 @@ class SimulatorCanExecutePublishedProject(TestCase):
 
         self.skipped_simulators = [simulator['id'] for simulator in data['skippedSimulators']]
 
+        self.read_expected_results(data, dirname=dirname)
+
+        self.runtime_failure_alert_type = AlertType(data.get('runtimeFailureAlertType', 'exception'))
+        self.assert_no_extra_reports = data.get('assertNoExtraReports', False)
+        self.assert_no_extra_datasets = data.get('assertNoExtraDatasets', False)
+        self.assert_no_missing_plots = data.get('assertNoMissingPlots', False)
+        self.assert_no_extra_plots = data.get('assertNoExtraPlots', False)
+        self.r_tol = data.get('r_tol', 1e-4)
+        self.a_tol = data.get('a_tol', 0.)
+        self.minimum_number_of_synthetic_uniform_time_steps = data.get('minimumNumberOfSyntheticUniformTimeSteps', 10)
+
+        self.description = self.get_description()
+
+        return self
+
+    def read_expected_results(self, data, dirname='.'):
+        """ Read the expected reports and plots of the test case from a dictionary
+
+        Args:
+            data (:obj:`dict`): dictionary with test case data
+            dirname (:obj:`str`, optional): directory relative to which the paths to external files of expected values
+                are resolved
+        """
         self.expected_reports = []
         for exp_report_def in data.get('expectedReports', []):
             id = exp_report_def['id']
@@ -208,24 +400,45 @@ class SimulatorCanExecutePublishedProject(TestCase):
             values = {}
             for labelVal in exp_report_def.get('values', []):
                 data_set_id = labelVal['id']
+
+                # expected values stored in an external file are read lazily when the case is evaluated
+                if 'valueFile' in labelVal:
+                    value_filename = os.path.join(dirname, labelVal['valueFile']['filename'])
+                    if not os.path.isfile(value_filename):
+                        raise ValueError((
+                            "File `{}` of the expected values of data set `{}` of report `{}` of published project test case `{}` "
+                            "does not exist."
+                        ).format(
+                            labelVal['valueFile']['filename'],
+                            data_set_id,
+                            id,
+                            self.id.replace('published_project.SimulatorCanExecutePublishedProject:', ''),
+                        ))
+                    values[data_set_id] = ExternalExpectedSedDataSetValues(
+                        filename=value_filename,
+                        dataset=labelVal['valueFile'].get('dataset', None),
+                    )
+                    continue
+
                 val = labelVal['value']
                 if isinstance(val, dict):
-                    values[data_set_id] = {}
-                    for k, v in val.items():
-                        multi_index = tuple(int(index) for index in k.split(","))
-                        try:
-                            numpy.ravel_multi_index([multi_index], points)[0]
-                        except ValueError:
-                            raise ValueError((
-                                "Key `{}` of the expected values of report `{}` of published project test case `{}` is invalid. "
-                                "Key must be less than or equal to `{}`."
-                            ).format(
-                                multi_index,
-                                self.id,
-                                self.id.replace('published_project.SimulatorCanExecutePublishedProject:', ''),
-                                tuple(p - 1 for p in points),
-                            ))
-                        values[data_set_id][multi_index] = v
+                    multi_indices = [tuple(int(index) for index in k.split(",")) for k in val.keys()]
+                    try:
+                        values[data_set_id] = SparseExpectedSedDataSetValues(multi_indices, list(val.values()), points)
+                    except ValueError:
+                        multi_index = next(
+                            multi_index for multi_index in multi_indices
+                            if len(multi_index) != len(points) or not all(0 <= i < p for i, p in zip(multi_index, points))
+                        )
+                        raise ValueError((
+                            "Key `{}` of the expected values of report `{}` of published project test case `{}` is invalid. "
+                            "Key must be less than or equal to `{}`."
+                        ).format(
+                            multi_index,
+                            self.id,
+                            self.id.replace('published_project.SimulatorCanExecutePublishedProject:', ''),
+                            tuple(p - 1 for p in points),
+                        ))
                 else:
                     values[data_set_id] = numpy.array(val)
 
@@ -251,46 +464,24 @@ class SimulatorCanExecutePublishedProject(TestCase):
                 id=exp_plot_def['id'],
             ))
 
-        self.runtime_failure_alert_type = AlertType(data.get('runtimeFailureAlertType', 'exception'))
-        self.assert_no_extra_reports = data.get('assertNoExtraReports', False)
-        self.assert_no_extra_datasets = data.get('assertNoExtraDatasets', False)
-        self.assert_no_missing_plots = data.get('assertNoMissingPlots', False)
-        self.assert_no_extra_plots = data.get('assertNoExtraPlots', False)
-        self.r_tol = data.get('r_tol', 1e-4)
-        self.a_tol = data.get('a_tol', 0.)
-        self.minimum_number_of_synthetic_uniform_time_steps = data.get('minimumNumberOfSyntheticUniformTimeSteps', 10)
-
-        self.description = self.get_description()
+    def compatible_with_specifications(self, specifications):
+        """ Determine whether the test case is applicable to a simulator
 
-        return self
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
 
-    def compatible_with_specifications(self, specifications):
-        # determine if case is applicable to simulator
+        Returns:
+            :obj:`bool`: whether the simulator isn't skipped and, for each task, one of the algorithms of the simulator supports
+            the model format of the task (with its features) and the simulation algorithm of the task
+        """
         if specifications.get('id', None) in self.skipped_simulators:
             return False
 
-        for task_reqs in self.task_requirements:
-            reqs_satisfied = False
-            for alg_specs in specifications['algorithms']:
-                format_reqs_satisfied = False
-                for format in alg_specs['modelFormats']:
-                    if (
-                        task_reqs.model_format == format['id']
-                        and task_reqs.model_format_features == set(format.get('supportedFeatures', []) or [])
-                    ):
-                        format_reqs_satisfied = True
-                        break
-                if not format_reqs_satisfied:
-                    break
-
-                if task_reqs.simulation_algorithm == alg_specs['kisaoId']['id']:
-                    reqs_satisfied = True
-                    break
-
-            if not reqs_satisfied:
-                return False
-
-        return True
+        capabilities = self.get_simulator_capabilities(specifications)
+        return all(
+            capabilities.supports_task(task_reqs.model_format, task_reqs.model_format_features, task_reqs.simulation_algorithm)
+            for task_reqs in self.task_requirements
+        )
 
     def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
         """ Evaluate a simulator's performance on a test case
@@ -322,7 +513,8 @@ class SimulatorCanExecutePublishedProject(TestCase):
 
         # pull image and execute COMBINE/OMEX archive for case
         try:
-            self.exec_sedml_docs_in_archive(specifications, working_dirname, cli=cli)
+            with phase('execArchive'):
+                self.exec_sedml_docs_in_archive(specifications, working_dirname, cli=cli)
 
         except Exception as exception:
             if os.path.isdir(working_dirname) and os.getenv('CI', 'false').lower() in ['1', 'true']:
@@ -342,86 +534,104 @@ class SimulatorCanExecutePublishedProject(TestCase):
             errors.append('No reports were generated')
 
         else:
-            report_reader = biosimulators_utils.report.io.ReportReader()
-            for expected_report in self.expected_reports:
-                report = Report()
-                for data_set in expected_report.data_sets:
-                    report.data_sets.append(DataSet(id=data_set.id, label=data_set.label))
-                try:
-                    report_results = report_reader.run(report, working_dirname, expected_report.id, format=ReportFormat.h5)
-                except Exception:
-                    errors.append('Report {} could not be read'.format(expected_report.id))
-                    continue
-
-                missing_data_sets = set([data_set.id for data_set in expected_report.data_sets]).difference(set(report_results.keys()))
-                if missing_data_sets:
-                    errors.append(('Report {} does not contain expected data sets:\n  {}\n\n'
-                                   'Report contained these data sets:\n  {}').format(
-                        expected_report.id,
-                        '\n  '.join(sorted(missing_data_sets)),
-                        '\n  '.join(sorted(report_results.keys())),
-                    ))
-                    continue
-
-                points = report_results[report.data_sets[0].id].shape
-                if not are_array_shapes_equivalent(points, expected_report.points):
-                    errors.append('Report {} contains incorrect number of points: {} != {}'.format(
-                                  expected_report.id, points, expected_report.points))
-                    continue
-
-                for data_set_id, expected_value in expected_report.values.items():
-                    if isinstance(expected_value, dict):
-                        value = report_results[data_set_id]
-                        for el_id, expected_el_value in expected_value.items():
-                            el_index = numpy.ravel_multi_index([el_id], value.shape)[0]
-                            actual_el_value = value[el_index]
+            with OutputsReader(working_dirname) as outputs_reader:
+                for expected_report in self.expected_reports:
+                    report = Report()
+                    for data_set in expected_report.data_sets:
+                        report.data_sets.append(DataSet(id=data_set.id, label=data_set.label))
+                    try:
+                        with phase('readReports'):
+                            report_results = outputs_reader.run(report, expected_report.id)
+                    except Exception:
+                        errors.append('Report {} could not be read'.format(expected_report.id))
+                        continue
+
+                    missing_data_sets = set([data_set.id for data_set in expected_report.data_sets]).difference(set(report_results.keys()))
+                    if missing_data_sets:
+                        errors.append(('Report {} does not contain expected data sets:\n  {}\n\n'
+                                       'Report contained these data sets:\n  {}').format(
+                            expected_report.id,
+                            '\n  '.join(sorted(missing_data_sets)),
+                            '\n  '.join(sorted(report_results.keys())),
+                        ))
+                        continue
+
+                    points = report_results[report.data_sets[0].id].shape
+                    if not are_array_shapes_equivalent(points, expected_report.points):
+                        errors.append('Report {} contains incorrect number of points: {} != {}'.format(
+                                      expected_report.id, points, expected_report.points))
+                        continue
+
+                    for data_set_id, expected_value in expected_report.values.items():
+                        if isinstance(expected_value, dict):
+                            expected_value = SparseExpectedSedDataSetValues(
+                                list(expected_value.keys()), list(expected_value.values()), expected_report.points)
+
+                        if isinstance(expected_value, SparseExpectedSedDataSetValues):
+                            # the shape of the data set is equivalent to the expected shape (up to trailing singleton
+                            # dimensions), and therefore the flat indices of the elements are the same for both shapes
+                            actual_value = numpy.asarray(report_results[data_set_id]).reshape(-1)[expected_value.flat_indices]
+                            mismatches = numpy.flatnonzero(~numpy.isclose(
+                                actual_value,
+                                expected_value.values,
+                                rtol=self.r_tol,
+                                atol=self.a_tol,
+                                equal_nan=True,
+                            ))
+                            if mismatches.size:
+                                errors.append(self.get_expected_value_mismatches_message(
+                                    expected_report.id, data_set_id,
+                                    [
+                                        (tuple(expected_value.indices[i_el].tolist()), actual_value[i_el], expected_value.values[i_el])
+                                        for i_el in mismatches[0:self.MAX_REPORTED_EXPECTED_VALUE_MISMATCHES]
+                                    ],
+                                    mismatches.size, expected_value.values.size))
+
+                        elif isinstance(expected_value, ExternalExpectedSedDataSetValues):
+                            with phase('compareExpectedValues'):
+                                error = self.compare_external_expected_values(
+                                    expected_report.id, data_set_id, report_results[data_set_id], expected_value)
+                            if error:
+                                errors.append(error)
+
+                        else:
                             try:
                                 numpy.testing.assert_allclose(
-                                    actual_el_value,
-                                    expected_el_value,
+                                    report_results[data_set_id],
+                                    expected_value,
                                     rtol=self.r_tol,
                                     atol=self.a_tol,
                                 )
                             except AssertionError:
-                                errors.append('Data set {} of report {} does not have expected value at {}: {} != {}'.format(
-                                    data_set_id, expected_report.id, el_id, actual_el_value, expected_el_value))
+                                errors.append('Data set {} of report {} does not have expected values'.format(
+                                    data_set_id, expected_report.id))
+
+                report_ids = set(outputs_reader.get_ids(type=Report))
+                expected_report_ids = set(report.id for report in self.expected_reports)
+                extra_report_ids = report_ids.difference(expected_report_ids)
+                if extra_report_ids:
+                    if self.assert_no_extra_reports:
+                        errors.append('Unexpected reports were produced:\n  {}'.format(
+                            '\n  '.join(sorted(extra_report_ids))))
                     else:
-                        try:
-                            numpy.testing.assert_allclose(
-                                report_results[data_set_id],
-                                expected_value,
-                                rtol=self.r_tol,
-                                atol=self.a_tol,
-                            )
-                        except AssertionError:
-                            errors.append('Data set {} of report {} does not have expected values'.format(
-                                data_set_id, expected_report.id))
-
-            report_ids = set(report_reader.get_ids(working_dirname, type=Report))
-            expected_report_ids = set(report.id for report in self.expected_reports)
-            extra_report_ids = report_ids.difference(expected_report_ids)
-            if extra_report_ids:
-                if self.assert_no_extra_reports:
-                    errors.append('Unexpected reports were produced:\n  {}'.format(
-                        '\n  '.join(sorted(extra_report_ids))))
-                else:
-                    warnings.warn('Unexpected reports were produced:\n  {}'.format(
-                        '\n  '.join(sorted(extra_report_ids))), InvalidOutputsWarning)
-
-            plot_ids = set(report_reader.get_ids(working_dirname, type=Output)).difference(report_ids)
-            expected_plot_ids = set(plot.id for plot in self.expected_plots)
-            extra_plot_ids = plot_ids.difference(expected_plot_ids)
-            if extra_plot_ids:
-                if self.assert_no_extra_plots:
-                    errors.append('Unexpected reports for data for plots were produced:\n  {}'.format(
-                        '\n  '.join(sorted(extra_plot_ids))))
-                else:
-                    warnings.warn('Unexpected reports for data for plots were produced:\n  {}'.format(
-                        '\n  '.join(sorted(extra_plot_ids))), InvalidOutputsWarning)
+                        warnings.warn('Unexpected reports were produced:\n  {}'.format(
+                            '\n  '.join(sorted(extra_report_ids))), InvalidOutputsWarning)
+
+                plot_ids = set(outputs_reader.get_ids(type=Output)).difference(report_ids)
+                expected_plot_ids = set(plot.id for plot in self.expected_plots)
+                extra_plot_ids = plot_ids.difference(expected_plot_ids)
+                if extra_plot_ids:
+                    if self.assert_no_extra_plots:
+                        errors.append('Unexpected reports for data for plots were produced:\n  {}'.format(
+                            '\n  '.join(sorted(extra_plot_ids))))
+                    else:
+                        warnings.warn('Unexpected reports for data for plots were produced:\n  {}'.format(
+                            '\n  '.join(sorted(extra_plot_ids))), InvalidOutputsWarning)
 
         # check expected outputs created: plots
         if os.path.isfile(os.path.join(working_dirname, get_config().PLOTS_PATH)):
-            archive = biosimulators_utils.archive.io.ArchiveReader().run(os.path.join(working_dirname, 'plots.zip'))
+            with phase('readPlots'):
+                archive = biosimulators_utils.archive.io.ArchiveReader().run(os.path.join(working_dirname, 'plots.zip'))
             plot_ids = set(os.path.splitext(file.archive_path)[0] for file in archive.files)
         else:
             plot_ids = set()
@@ -465,10 +675,22 @@ class SimulatorCanExecutePublishedProject(TestCase):
         if os.getenv('CI', 'false').lower() in ['1', 'true']:
             user_to_exec_within_container = '_SUDO_'
 
+        with phase('hashArchive'):
+            exec_cache_key = self.exec_cache.get_key(self.filename, specifications, cli=cli) if self.exec_cache else None
+        with phase('restoreOutputs'):
+            if exec_cache_key and self.exec_cache.restore(exec_cache_key, out_dir):
+                return
+
         if cli:
             biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli(
                 self.filename, out_dir, cli)
 
+        elif self.persistent_container:
+            self.persistent_container.exec_sedml_docs_in_archive(self.filename, out_dir)
+
+            if os.path.isdir(out_dir) and os.getenv('CI', 'false').lower() in ['1', 'true']:
+                subprocess.run(['sudo', 'chown', '{}:{}'.format(os.getuid(), os.getgid()), '-R', out_dir], check=True)
+
         else:
             biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator(
                 self.filename, out_dir, specifications['image']['url'], pull_docker_image=pull_docker_image,
@@ -477,6 +699,148 @@ class SimulatorCanExecutePublishedProject(TestCase):
             if os.path.isdir(out_dir) and os.getenv('CI', 'false').lower() in ['1', 'true']:
                 subprocess.run(['sudo', 'chown', '{}:{}'.format(os.getuid(), os.getgid()), '-R', out_dir], check=True)
 
+        if exec_cache_key:
+            self.exec_cache.save(exec_cache_key, out_dir)
+
+
+class CuratedArchiveCache(object):
+    """ Cache of the contents of curated COMBINE/OMEX archives and the SED documents inside them
+
+    Each archive is read and its SED documents are parsed once. Callers receive copies of the cached archives and SED
+    documents so that they can freely modify them (e.g., to build synthetic archives).
+
+    The cache also indexes the attributes of the elements of the models of the archives once, for the test cases which
+    generate changes to models.
+
+    Attributes:
+        _archives (:obj:`dict` of :obj:`str` to :obj:`tuple` of :obj:`CombineArchive` and :obj:`dict`): map from the path to each
+            curated archive to its contents (without its manifest) and a map from the locations of its SED documents to the documents
+        _model_attributes (:obj:`dict` of :obj:`str` to :obj:`list` of :obj:`ModelAttribute`): map from the digest of the
+            contents of each model to the attributes of its elements, or :obj:`None` if the model is not encoded in XML
+        _lock (:obj:`threading.Lock`): lock for reading archives into the cache
+    """
+
+    MANIFEST_LOCATIONS = ['manifest.xml', './manifest.xml']
+
+    def __init__(self):
+        self._archives = {}
+        self._model_attributes = {}
+        self._lock = threading.Lock()
+
+    def get(self, filename, read_only=False):
+        """ Get the contents of a curated archive and its SED documents
+
+        Args:
+            filename (:obj:`str`): path to the archive
+            read_only (:obj:`bool`, optional): if :obj:`True`, return the cached archive and SED documents rather than copies
+                of them. The caller must not modify these objects.
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: archive, without its manifest
+                * :obj:`dict` of :obj:`str` to :obj:`SedDocument`: map from the locations of the SED documents in the archive to
+                  the documents
+        """
+        with self._lock:
+            if filename not in self._archives:
+                self._archives[filename] = self._read(filename)
+            archive, sed_docs = self._archives[filename]
+
+        if not read_only:
+            archive, sed_docs = copy.deepcopy((archive, sed_docs))
+        return archive, sed_docs
+
+    def extract(self, filename, dirname):
+        """ Unpack a curated archive, without its manifest, and get copies of its contents and SED documents
+
+        Args:
+            filename (:obj:`str`): path to the archive
+            dirname (:obj:`str`): directory to unpack the archive
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: archive, without its manifest
+                * :obj:`dict` of :obj:`str` to :obj:`SedDocument`: map from the locations of the SED documents in the archive to
+                  the documents
+        """
+        archive, sed_docs = self.get(filename)
+
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        biosimulators_utils.archive.io.ArchiveReader().run(filename, dirname)
+        for location in self.MANIFEST_LOCATIONS:
+            if os.path.isfile(os.path.join(dirname, location)):
+                os.remove(os.path.join(dirname, location))
+
+        return archive, sed_docs
+
+    def get_model_attributes(self, filename):
+        """ Get the attributes of the elements of a model (e.g., of a model of a curated archive unpacked by :obj:`extract`)
+
+        Models are identified by digests of their contents, so that the attributes of each model are indexed once, regardless
+        of how many times its archive is unpacked.
+
+        Args:
+            filename (:obj:`str`): path to the model
+
+        Returns:
+            :obj:`list` of :obj:`ModelAttribute`: attributes, or :obj:`None` if the model is not encoded in XML. The caller must
+            not modify the attributes.
+        """
+        with open(filename, 'rb') as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+
+        with self._lock:
+            if digest not in self._model_attributes:
+                try:
+                    self._model_attributes[digest] = get_model_attributes(filename)
+                except etree.XMLSyntaxError:
+                    self._model_attributes[digest] = None
+            return self._model_attributes[digest]
+
+    def clear(self):
+        """ Clear the cache """
+        with self._lock:
+            self._archives = {}
+            self._model_attributes = {}
+
+    def _read(self, filename):
+        """ Read a curated archive and parse its SED documents
+
+        Args:
+            filename (:obj:`str`): path to the archive
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`CombineArchive`: archive, without its manifest
+                * :obj:`dict` of :obj:`str` to :obj:`SedDocument`: map from the locations of the SED documents in the archive to
+                  the documents
+        """
+        archive_dirname = tempfile.mkdtemp()
+        try:
+            archive = CombineArchiveReader().run(filename, archive_dirname)
+            sed_docs = {}
+            sedml_reader = SedmlSimulationReader()
+            for content in list(archive.contents):
+                if content.format and re.match(CombineArchiveContentFormatPattern.SED_ML, content.format):
+                    sed_doc = sedml_reader.run(os.path.join(archive_dirname, content.location))
+                    sed_docs[content.location] = sed_doc
+
+                # remove manifest from contents because libSED-ML occassionally has trouble with this
+                elif (
+                    content.location in self.MANIFEST_LOCATIONS
+                    and content.format == 'http://identifiers.org/combine.specifications/omex-manifest'
+                ):
+                    archive.contents.remove(content)
+
+        finally:
+            shutil.rmtree(archive_dirname)
+
+        return archive, sed_docs
+
 
 class SyntheticCombineArchiveTestCase(TestCase):
     """ Test that involves a computationally-generated COMBINE/OMEX archive
@@ -488,14 +852,28 @@ class SyntheticCombineArchiveTestCase(TestCase):
         output_medium (:obj:`OutputMedium`): medium the description should be formatted for
         published_projects_test_cases (:obj:`list` of :obj:`SimulatorCanExecutePublishedProject`):
             curated COMBINE/OMEX archives that can be used to generate example archives for testing
+        curated_archive_cache (:obj:`CuratedArchiveCache`): cache of the contents of the curated COMBINE/OMEX archives
+        exec_cache (:obj:`ExecutionCache`): cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+        persistent_container (:obj:`PersistentSimulatorContainer`): long-lived container to execute COMBINE/OMEX archives with
+            rather than a new container for each archive
+        MAX_CONCURRENT_SYNTHETIC_ARCHIVES (:obj:`int`): maximum number of the synthetic archives of the test case to execute
+            concurrently, or :obj:`None` to use the configured limit (``SYNTHETIC_ARCHIVE_CONCURRENCY``). Test cases whose
+            evaluation of the outputs of their archives isn't thread-safe should set this to ``1``.
         _published_projects_test_case (:obj:`SimulatorCanExecutePublishedProject`): COMBINE/OMEX archive
             that is used to generate example archives for testing
+        _suitable_published_projects_test_cases (:obj:`dict` of :obj:`str` to :obj:`SimulatorCanExecutePublishedProject`): map
+            from digests of specifications of simulators to the first curated COMBINE/OMEX archive which is suitable for generating
+            example archives for the simulator
+        _prepared_synthetic_archives (:obj:`PreparedSyntheticArchives`): synthetic archives prepared for the next evaluation of
+            the test case, or :obj:`None`
     """
 
     EXEC_WITH_SINGULARITY = False
     REPORT_ERROR_AS_SKIP = False
+    MAX_CONCURRENT_SYNTHETIC_ARCHIVES = None
 
-    def __init__(self, id=None, name=None, description=None, output_medium=OutputMedium.console, published_projects_test_cases=None):
+    def __init__(self, id=None, name=None, description=None, output_medium=OutputMedium.console, published_projects_test_cases=None,
+                 curated_archive_cache=None, exec_cache=None, persistent_container=None, capabilities=None):
         """
         Args:
             id (:obj:`str`, optional): id
@@ -504,10 +882,22 @@ class SyntheticCombineArchiveTestCase(TestCase):
             output_medium (:obj:`OutputMedium`, optional): medium the description should be formatted for
             published_projects_test_cases (:obj:`list` of :obj:`SimulatorCanExecutePublishedProject`, optional):
                 curated COMBINE/OMEX archives that can be used to generate example archives for testing
+            curated_archive_cache (:obj:`CuratedArchiveCache`, optional): cache of the contents of the curated COMBINE/OMEX
+                archives. Test cases which share a cache only read and parse each curated archive once.
+            exec_cache (:obj:`ExecutionCache`, optional): cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+            persistent_container (:obj:`PersistentSimulatorContainer`, optional): long-lived container to execute COMBINE/OMEX
+                archives with rather than a new container for each archive
+            capabilities (:obj:`SimulatorCapabilities`, optional): index of the capabilities of the simulator to validate
         """
-        super(SyntheticCombineArchiveTestCase, self).__init__(id=id, name=name, description=description, output_medium=output_medium)
+        super(SyntheticCombineArchiveTestCase, self).__init__(id=id, name=name, description=description, output_medium=output_medium,
+                                                              capabilities=capabilities)
         self.published_projects_test_cases = published_projects_test_cases or []
+        self.curated_archive_cache = curated_archive_cache or CuratedArchiveCache()
+        self.exec_cache = exec_cache
+        self.persistent_container = persistent_container
         self._published_projects_test_case = None
+        self._suitable_published_projects_test_cases = {}
+        self._prepared_synthetic_archives = None
 
     def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
         """ Evaluate a simulator's performance on a test case
@@ -556,60 +946,206 @@ class SyntheticCombineArchiveTestCase(TestCase):
         Raises:
             :obj:`Exception`: if the simulator did not pass the test case
         """
-        if not os.path.isdir(working_dirname):
-            os.makedirs(working_dirname)
+        # use the synthetic archives which were prepared for this evaluation, or prepare them
+        prepared = self._prepared_synthetic_archives
+        self._prepared_synthetic_archives = None
+        if (
+            prepared is None
+            or prepared.specifications is not specifications
+            or prepared.working_dirname != working_dirname
+            or prepared.synthetic_archives_dir != synthetic_archives_dir
+        ):
+            prepared = self._prepare_synthetic_archives(specifications, working_dirname,
+                                                        synthetic_archives_dir=synthetic_archives_dir)
+        else:
+            # replay the output and warnings of the preparation so that they are captured with the results of this test case
+            if prepared.log:
+                sys.stdout.write(prepared.log)
+                sys.stdout.flush()
+            for warning in prepared.warnings:
+                warnings.warn_explicit(warning.message, warning.category, warning.filename, warning.lineno)
+
+            if prepared.exception:
+                raise prepared.exception
+        expected_results_of_synthetic_archives = prepared.expected_results_of_synthetic_archives
+
+        def eval_synthetic_archive(i_archive, expected_results_of_synthetic_archive):
+            with phase('syntheticArchive:{}'.format(i_archive + 1)):
+                return self._eval_synthetic_archive(specifications, expected_results_of_synthetic_archive,
+                                                    prepared.shared_archive_dir,
+                                                    i_archive, os.path.join(working_dirname, str(i_archive + 1)),
+                                                    synthetic_archives_dir=synthetic_archives_dir, dry_run=dry_run,
+                                                    cli=cli, synthetic_archive_filename=prepared.synthetic_archive_filenames[i_archive])
 
-        # read curated archives and find one that is suitable for testing
-        suitable_curated_archive = False
-        for published_projects_test_case in self.published_projects_test_cases:
-            self._published_projects_test_case = published_projects_test_case
+        has_warnings = False
+        max_workers = min(self.get_synthetic_archive_concurrency(), len(expected_results_of_synthetic_archives))
+        if max_workers <= 1:
+            for i_archive, expected_results_of_synthetic_archive in enumerate(expected_results_of_synthetic_archives):
+                if eval_synthetic_archive(i_archive, expected_results_of_synthetic_archive):
+                    has_warnings = True
 
-            # read archive
-            curated_archive_filename = published_projects_test_case.filename
-            shared_archive_dir = os.path.join(working_dirname, 'archive')
-            if not os.path.isdir(shared_archive_dir):
-                os.makedirs(shared_archive_dir)
+        else:
+            # each archive is executed in its own working directory. The results are collected in the order of the archives so
+            # that the failure of the first archive which fails is reported, and the archives which haven't started are
+            # cancelled after a failure, as when the archives are executed one after another. Each archive is evaluated in a
+            # copy of the context of the test case so that the durations of its phases are recorded with the timer of the case.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, eval_synthetic_archive,
+                                    i_archive, expected_results_of_synthetic_archive)
+                    for i_archive, expected_results_of_synthetic_archive in enumerate(expected_results_of_synthetic_archives)
+                ]
+                try:
+                    for future in futures:
+                        if future.result():
+                            has_warnings = True
+                finally:
+                    for future in futures:
+                        future.cancel()
 
-            curated_archive = CombineArchiveReader().run(curated_archive_filename, shared_archive_dir)
-            curated_sed_docs = {}
-            sedml_reader = SedmlSimulationReader()
-            for content in list(curated_archive.contents):
-                if content.format and re.match(CombineArchiveContentFormatPattern.SED_ML, content.format):
-                    sed_doc = sedml_reader.run(os.path.join(shared_archive_dir, content.location))
-                    curated_sed_docs[content.location] = sed_doc
+        return not has_warnings
 
-                # remove manifest from contents because libSED-ML occassionally has trouble with this
-                elif (
-                    content.location in ['manifest.xml', './manifest.xml']
-                    and content.format == 'http://identifiers.org/combine.specifications/omex-manifest'
-                ):
-                    curated_archive.contents.remove(content)
-                    os.remove(os.path.join(shared_archive_dir, content.location))
+    def prepare(self, specifications, working_dirname, synthetic_archives_dir=None):
+        """ Prepare the synthetic archives of the test case for its next evaluation (e.g., while the simulator executes the
+        archives of another test case)
 
-            # see if archive is suitable for testing
-            if self.is_curated_archive_suitable_for_building_synthetic_archive(specifications, curated_archive, curated_sed_docs):
-                suitable_curated_archive = True
-                break
+        A suitable curated archive is found and extracted, and the synthetic archives are built and written to the working
+        directory. The next evaluation of the test case with the same specifications and directories executes these archives.
+        Errors which occur while the archives are prepared are raised by that evaluation, and the standard output/error and
+        warnings of the preparation are recorded (see :obj:`ThreadOutputRecorder`) and replayed by that evaluation, so that
+        they are captured with the results of this test case rather than with those of the test case which is evaluated while
+        this test case is prepared.
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+            working_dirname (:obj:`str`): directory for temporary files for evaluating test case
+            synthetic_archives_dir (:obj:`str`, optional): Directory to save the synthetic COMBINE/OMEX archives
+                generated by the test cases
+        """
+        with ThreadOutputRecorder() as recorder:
+            try:
+                prepared = self._prepare_synthetic_archives(specifications, working_dirname,
+                                                            synthetic_archives_dir=synthetic_archives_dir)
+            except Exception as exception:
+                prepared = PreparedSyntheticArchives(specifications, working_dirname, synthetic_archives_dir,
+                                                     exception=exception)
+        prepared.log = recorder.get_text()
+        prepared.warnings = recorder.warnings
+        self._prepared_synthetic_archives = prepared
 
-            # cleanup
-            shutil.rmtree(shared_archive_dir)
+    def _prepare_synthetic_archives(self, specifications, working_dirname, synthetic_archives_dir=None):
+        """ Find and extract a suitable curated archive, and build and write the synthetic archives of the test case
 
-        if not suitable_curated_archive:
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+            working_dirname (:obj:`str`): directory for temporary files for evaluating test case
+            synthetic_archives_dir (:obj:`str`, optional): Directory to save the synthetic COMBINE/OMEX archives
+                generated by the test cases
+
+        Returns:
+            :obj:`PreparedSyntheticArchives`: synthetic archives
+
+        Raises:
+            :obj:`SkippedTestCaseException`: if no curated archive is suitable for generating the synthetic archives
+        """
+        if not os.path.isdir(working_dirname):
+            os.makedirs(working_dirname)
+
+        # find a curated archive that is suitable for testing
+        with phase('findCuratedArchive'):
+            published_projects_test_case = self.get_suitable_curated_archive(specifications)
+        if published_projects_test_case is None:
             raise SkippedTestCaseException('No curated COMBINE/OMEX archives are available to generate archives for testing')
+        self._published_projects_test_case = published_projects_test_case
 
-        expected_results_of_synthetic_archives = self.build_synthetic_archives(
-            specifications, curated_archive, shared_archive_dir, curated_sed_docs)
-        has_warnings = False
+        # unpack a copy of the archive
+        shared_archive_dir = os.path.join(working_dirname, 'archive')
+        with phase('extractCuratedArchive'):
+            curated_archive, curated_sed_docs = self.curated_archive_cache.extract(published_projects_test_case.filename,
+                                                                                   shared_archive_dir)
+
+        with phase('buildSyntheticArchives'):
+            expected_results_of_synthetic_archives = self.build_synthetic_archives(
+                specifications, curated_archive, shared_archive_dir, curated_sed_docs)
+
+        synthetic_archive_filenames = []
         for i_archive, expected_results_of_synthetic_archive in enumerate(expected_results_of_synthetic_archives):
-            if self._eval_synthetic_archive(specifications, expected_results_of_synthetic_archive, shared_archive_dir,
-                                            i_archive, os.path.join(working_dirname, str(i_archive + 1)),
-                                            synthetic_archives_dir=synthetic_archives_dir, dry_run=dry_run,
-                                            cli=cli):
-                has_warnings = True
-        return not has_warnings
+            with phase('syntheticArchive:{}'.format(i_archive + 1)):
+                synthetic_archive_filenames.append(self._write_synthetic_archive(
+                    expected_results_of_synthetic_archive, shared_archive_dir,
+                    i_archive, os.path.join(working_dirname, str(i_archive + 1)),
+                    synthetic_archives_dir=synthetic_archives_dir))
+
+        return PreparedSyntheticArchives(specifications, working_dirname, synthetic_archives_dir,
+                                         shared_archive_dir=shared_archive_dir,
+                                         expected_results_of_synthetic_archives=expected_results_of_synthetic_archives,
+                                         synthetic_archive_filenames=synthetic_archive_filenames)
+
+    def get_synthetic_archive_concurrency(self):
+        """ Get the maximum number of the synthetic archives of the test case to execute concurrently
+
+        Returns:
+            :obj:`int`: maximum number of the synthetic archives of the test case to execute concurrently
+        """
+        if self.MAX_CONCURRENT_SYNTHETIC_ARCHIVES is not None:
+            return self.MAX_CONCURRENT_SYNTHETIC_ARCHIVES
+        return Config().synthetic_archive_concurrency
+
+    def _write_synthetic_archive(self, expected_results_of_synthetic_archive, shared_archive_dir,
+                                 i_synthetic_archive, working_dirname, synthetic_archives_dir=None):
+        """ Write a synthetic COMBINE/OMEX archive
+
+        Args:
+            expected_results_of_synthetic_archive (:obj:`ExpectedResultOfSyntheticArchive`): synthetic archive and its expected
+                result
+            shared_archive_dir (:obj:`str`): directory with the contents of the curated archive
+            i_synthetic_archive (:obj:`int`): index of the synthetic archive
+            working_dirname (:obj:`str`): directory for temporary files for the synthetic archive
+            synthetic_archives_dir (:obj:`str`, optional): Directory to save the synthetic COMBINE/OMEX archives
+                generated by the test cases
+
+        Returns:
+            :obj:`str`: path to the synthetic archive
+        """
+        synthetic_archive = expected_results_of_synthetic_archive.archive
+        synthetic_sed_docs = expected_results_of_synthetic_archive.sed_documents
+        is_success_expected = expected_results_of_synthetic_archive.is_success_expected
+
+        if not os.path.isdir(working_dirname):
+            os.makedirs(working_dirname)
+
+        with phase('writeArchive'):
+            # serialize the SED documents directly into the archive, and copy the unchanged files of the curated archive
+            # without recompressing them
+            synthetic_archive_filename = os.path.join(working_dirname, 'archive.omex')
+            if self._published_projects_test_case:
+                curated_archive_filename = self._published_projects_test_case.filename
+            else:
+                curated_archive_filename = None
+            compression = zipfile.ZIP_DEFLATED if Config().compress_synthetic_archives else zipfile.ZIP_STORED
+            CombineArchiveAssembler(compression=compression).run(synthetic_archive, shared_archive_dir, synthetic_archive_filename,
+                                                                 sed_docs=synthetic_sed_docs,
+                                                                 source_filename=curated_archive_filename)
+
+            if synthetic_archives_dir:
+                cls = self.__class__
+                module = cls.__module__.partition('biosimulators_test_suite.test_case.')[2]
+                export_synthetic_archive_dirname = os.path.join(synthetic_archives_dir, module, cls.__name__)
+                if not os.path.isdir(export_synthetic_archive_dirname):
+                    os.makedirs(export_synthetic_archive_dirname)
+                export_synthetic_archive_filename = os.path.join(export_synthetic_archive_dirname,
+                                                                 '{}.{}.omex'.format(
+                                                                     str(i_synthetic_archive + 1),
+                                                                     'execution-should-succeed'
+                                                                     if is_success_expected else
+                                                                     'execute-should-fail'))
+                shutil.copy(synthetic_archive_filename, export_synthetic_archive_filename)
+
+        return synthetic_archive_filename
 
     def _eval_synthetic_archive(self, specifications, expected_results_of_synthetic_archive, shared_archive_dir,
-                                i_synthetic_archive, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+                                i_synthetic_archive, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None,
+                                synthetic_archive_filename=None):
         synthetic_archive = expected_results_of_synthetic_archive.archive
         synthetic_sed_docs = expected_results_of_synthetic_archive.sed_documents
         is_success_expected = expected_results_of_synthetic_archive.is_success_expected
@@ -618,25 +1154,10 @@ class SyntheticCombineArchiveTestCase(TestCase):
         if not os.path.isdir(working_dirname):
             os.makedirs(working_dirname)
 
-        sedml_writer = SedmlSimulationWriter()
-        synthetic_archive_filename = os.path.join(working_dirname, 'archive.omex')
-        for location, sed_doc in synthetic_sed_docs.items():
-            sedml_writer.run(sed_doc, os.path.join(shared_archive_dir, location))
-        CombineArchiveWriter().run(synthetic_archive, shared_archive_dir, synthetic_archive_filename)
-
-        if synthetic_archives_dir:
-            cls = self.__class__
-            module = cls.__module__.partition('biosimulators_test_suite.test_case.')[2]
-            export_synthetic_archive_dirname = os.path.join(synthetic_archives_dir, module, cls.__name__)
-            if not os.path.isdir(export_synthetic_archive_dirname):
-                os.makedirs(export_synthetic_archive_dirname)
-            export_synthetic_archive_filename = os.path.join(export_synthetic_archive_dirname,
-                                                             '{}.{}.omex'.format(
-                                                                 str(i_synthetic_archive + 1),
-                                                                 'execution-should-succeed'
-                                                                 if is_success_expected else
-                                                                 'execute-should-fail'))
-            shutil.copy(synthetic_archive_filename, export_synthetic_archive_filename)
+        if synthetic_archive_filename is None:
+            synthetic_archive_filename = self._write_synthetic_archive(expected_results_of_synthetic_archive, shared_archive_dir,
+                                                                       i_synthetic_archive, working_dirname,
+                                                                       synthetic_archives_dir=synthetic_archives_dir)
 
         if dry_run:
             return False
@@ -651,50 +1172,35 @@ class SyntheticCombineArchiveTestCase(TestCase):
             if os.getenv('CI', 'false').lower() in ['1', 'true']:
                 user_to_exec_within_container = '_SUDO_'
 
-            if cli:
-                biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli(
-                    synthetic_archive_filename, outputs_dir, cli, environment=environment)
-
-            elif self.EXEC_WITH_SINGULARITY:
-                docker_image_url = specifications['image']['url']
-
-                # get path for Singularity image
-                singularity_filename = get_singularity_image_filename(docker_image_url)
-
-                # convert image to Singularity format
-                convert_docker_image_to_singularity(docker_image_url, singularity_filename=singularity_filename)
-
-                # run a simulation with the Singularity image
-                if not os.path.isdir(outputs_dir):
-                    os.makedirs(outputs_dir)
-                temp_filename = os.path.join(outputs_dir, os.path.basename(synthetic_archive_filename))
-                shutil.copyfile(synthetic_archive_filename, temp_filename)
-
-                cmd = [
-                    'singularity', 'run',
-                    '-B', outputs_dir + ':/root',
-                    singularity_filename,
-                    '-i', '/root/' + os.path.basename(synthetic_archive_filename),
-                    '-o', '/root',
-                ]
-                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-                os.remove(temp_filename)
-                if result.returncode != 0:
-                    msg = 'The Docker image could not be successfully executed as a Singularity image:\n  {}'.format(
-                        result.stderr.decode().replace('\n', '\n  '))
-                    raise TestCaseException(msg)
-
+            if self.exec_cache:
+                with phase('hashArchive'):
+                    exec_cache_key = self.exec_cache.get_key(synthetic_archive_filename, specifications, cli=cli,
+                                                             environment=environment,
+                                                             singularity=self.EXEC_WITH_SINGULARITY and not cli)
             else:
-                biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator(
-                    synthetic_archive_filename, outputs_dir, specifications['image']['url'], pull_docker_image=pull_docker_image,
-                    environment=environment,
-                    user_to_exec_within_container=user_to_exec_within_container)
-
-            if os.path.isdir(outputs_dir) and os.getenv('CI', 'false').lower() in ['1', 'true']:
-                subprocess.run(['sudo', 'chown', '{}:{}'.format(os.getuid(), os.getgid()), '-R', outputs_dir], check=True)
+                exec_cache_key = None
+
+            if exec_cache_key:
+                # execute each distinct archive once; concurrent test cases which generate the same archive wait for its execution
+                with self.exec_cache.lock(exec_cache_key):
+                    with phase('restoreOutputs'):
+                        restored = self.exec_cache.restore(exec_cache_key, outputs_dir)
+                    if not restored:
+                        with phase('execArchive'):
+                            self._exec_synthetic_archive(specifications, synthetic_archive_filename, outputs_dir,
+                                                         environment=environment, cli=cli, pull_docker_image=pull_docker_image,
+                                                         user_to_exec_within_container=user_to_exec_within_container)
+                        with phase('saveOutputs'):
+                            self.exec_cache.save(exec_cache_key, outputs_dir)
+            else:
+                with phase('execArchive'):
+                    self._exec_synthetic_archive(specifications, synthetic_archive_filename, outputs_dir, environment=environment,
+                                                 cli=cli, pull_docker_image=pull_docker_image,
+                                                 user_to_exec_within_container=user_to_exec_within_container)
 
-            if not self.eval_outputs(specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
-                has_warnings = True
+            with phase('evalOutputs'):
+                if not self.eval_outputs(specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
+                    has_warnings = True
 
             succeeded = True
 
@@ -712,6 +1218,90 @@ class SyntheticCombineArchiveTestCase(TestCase):
 
         return has_warnings
 
+    def _exec_synthetic_archive(self, specifications, synthetic_archive_filename, outputs_dir, environment=None, cli=None,
+                                pull_docker_image=True, user_to_exec_within_container=None):
+        """ Use the simulator to execute a synthetic COMBINE/OMEX archive
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+            synthetic_archive_filename (:obj:`str`): path to the archive
+            outputs_dir (:obj:`str`): directory to save the outputs of the archive
+            environment (:obj:`dict`, optional): environment variables for executing the archive
+            cli (:obj:`str`, optional): command-line interface to use to execute the archive rather than a Docker image
+            pull_docker_image (:obj:`bool`, optional): whether to pull the Docker image for the simulator
+            user_to_exec_within_container (:obj:`str`, optional): user to execute the Docker image as
+        """
+        if cli:
+            biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli(
+                synthetic_archive_filename, outputs_dir, cli, environment=environment)
+
+        elif self.EXEC_WITH_SINGULARITY:
+            docker_image_url = specifications['image']['url']
+
+            # get path for Singularity image
+            singularity_filename = get_singularity_image_filename(docker_image_url)
+
+            # convert image to Singularity format
+            convert_docker_image_to_singularity(docker_image_url, singularity_filename=singularity_filename)
+
+            # run a simulation with the Singularity image
+            if not os.path.isdir(outputs_dir):
+                os.makedirs(outputs_dir)
+            temp_filename = os.path.join(outputs_dir, os.path.basename(synthetic_archive_filename))
+            shutil.copyfile(synthetic_archive_filename, temp_filename)
+
+            cmd = [
+                'singularity', 'run',
+                '-B', outputs_dir + ':/root',
+                singularity_filename,
+                '-i', '/root/' + os.path.basename(synthetic_archive_filename),
+                '-o', '/root',
+            ]
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            os.remove(temp_filename)
+            if result.returncode != 0:
+                msg = 'The Docker image could not be successfully executed as a Singularity image:\n  {}'.format(
+                    result.stderr.decode().replace('\n', '\n  '))
+                raise TestCaseException(msg)
+
+        elif self.persistent_container:
+            self.persistent_container.exec_sedml_docs_in_archive(synthetic_archive_filename, outputs_dir, environment=environment)
+
+        else:
+            biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator(
+                synthetic_archive_filename, outputs_dir, specifications['image']['url'], pull_docker_image=pull_docker_image,
+                environment=environment,
+                user_to_exec_within_container=user_to_exec_within_container)
+
+        if os.path.isdir(outputs_dir) and os.getenv('CI', 'false').lower() in ['1', 'true']:
+            subprocess.run(['sudo', 'chown', '{}:{}'.format(os.getuid(), os.getgid()), '-R', outputs_dir], check=True)
+
+    def get_suitable_curated_archive(self, specifications):
+        """ Get the first curated COMBINE/OMEX archive which is suitable for generating archives for testing a simulator. The
+        result of the search is cached for each version of the specifications of the simulator.
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+
+        Returns:
+            :obj:`SimulatorCanExecutePublishedProject`: test case for the first suitable curated archive, or :obj:`None` if no
+                curated archive is suitable
+        """
+        specifications_digest = hashlib.sha256(json.dumps(specifications, sort_keys=True).encode()).hexdigest()
+        if specifications_digest not in self._suitable_published_projects_test_cases:
+            suitable_published_projects_test_case = None
+            for published_projects_test_case in self.published_projects_test_cases:
+                self._published_projects_test_case = published_projects_test_case
+
+                curated_archive, curated_sed_docs = self.curated_archive_cache.get(published_projects_test_case.filename, read_only=True)
+                if self.is_curated_archive_suitable_for_building_synthetic_archive(specifications, curated_archive, curated_sed_docs):
+                    suitable_published_projects_test_case = published_projects_test_case
+                    break
+
+            self._suitable_published_projects_test_cases[specifications_digest] = suitable_published_projects_test_case
+
+        return self._suitable_published_projects_test_cases[specifications_digest]
+
     def is_curated_archive_suitable_for_building_synthetic_archive(self, specifications, archive, sed_docs):
         """ Find an archive with at least one report
 
@@ -899,13 +1489,46 @@ class ExpectedResultOfSyntheticArchive(object):
         self.environment = environment or {}
 
 
-def find_cases(specifications, dir_name=None, output_medium=OutputMedium.console):
+class PreparedSyntheticArchives(object):
+    """ Synthetic COMBINE/OMEX archives which were prepared for the evaluation of a test case
+
+    Attributes:
+        specifications (:obj:`dict`): specifications of the simulator which the archives were prepared for
+        working_dirname (:obj:`str`): directory for temporary files for evaluating the test case
+        synthetic_archives_dir (:obj:`str`): directory which the synthetic archives were saved to, or :obj:`None`
+        shared_archive_dir (:obj:`str`): directory with the contents of the curated archive
+        expected_results_of_synthetic_archives (:obj:`list` of :obj:`ExpectedResultOfSyntheticArchive`): synthetic archives and
+            their expected results
+        synthetic_archive_filenames (:obj:`list` of :obj:`str`): paths to the synthetic archives
+        exception (:obj:`Exception`): error which occurred while the archives were prepared, or :obj:`None`
+        log (:obj:`str`): standard output/error of the preparation of the archives
+        warnings (:obj:`list` of :obj:`warnings.WarningMessage`): warnings issued while the archives were prepared
+    """
+
+    def __init__(self, specifications, working_dirname, synthetic_archives_dir=None, shared_archive_dir=None,
+                 expected_results_of_synthetic_archives=None, synthetic_archive_filenames=None, exception=None,
+                 log='', warnings=None):
+        self.specifications = specifications
+        self.working_dirname = working_dirname
+        self.synthetic_archives_dir = synthetic_archives_dir
+        self.shared_archive_dir = shared_archive_dir
+        self.expected_results_of_synthetic_archives = expected_results_of_synthetic_archives or []
+        self.synthetic_archive_filenames = synthetic_archive_filenames or []
+        self.exception = exception
+        self.log = log
+        self.warnings = warnings or []
+
+
+def find_cases(specifications, dir_name=None, output_medium=OutputMedium.console, exec_cache=None, capabilities=None):
     """ Collect test cases
 
     Args:
         specifications (:obj:`dict`): specifications of the simulator to validate
         dir_name (:obj:`str`, optional): path to find example COMBINE/OMEX archives
         output_medium (:obj:`OutputMedium`, optional): medium the description should be formatted for
+        exec_cache (:obj:`ExecutionCache`, optional): cache of the outputs of the execution of COMBINE/OMEX archives by simulators
+        capabilities (:obj:`SimulatorCapabilities`, optional): index of the capabilities of the simulator to validate. If
+            :obj:`None`, the index is built from :obj:`specifications`.
 
     Returns:
         :obj:`list` of :obj:`SimulatorCanExecutePublishedProject`: test cases
@@ -915,12 +1538,21 @@ def find_cases(specifications, dir_name=None, output_medium=OutputMedium.console
     if not os.path.isdir(dir_name):
         warnings.warn('Directory of example COMBINE/OMEX archives is not available', IgnoredTestCaseWarning)
 
+    # the cases are read from the summaries of the examples in the index; their expected results are only read when they are used
+    if os.path.isdir(dir_name):
+        index_entries = ExamplesIndex(Config().examples_index_filename).get_entries(dir_name)
+    else:
+        index_entries = []
+
+    if capabilities is None:
+        capabilities = SimulatorCapabilities(specifications)
+
     all_cases = []
     compatible_cases = []
-    for example_filename in glob.glob(os.path.join(dir_name, '**/*.omex'), recursive=True):
-        md_filename = os.path.join(example_filename[0:-5], 'expected-results.json')
-        rel_filename = os.path.relpath(md_filename, dir_name)
-        case = SimulatorCanExecutePublishedProject(output_medium=output_medium).from_json(dir_name, rel_filename)
+    for index_entry in index_entries:
+        case = SimulatorCanExecutePublishedProject(output_medium=output_medium, exec_cache=exec_cache,
+                                                   capabilities=capabilities).from_json(
+            dir_name, index_entry['filename'], summary=index_entry['summary'])
         all_cases.append(case)
         if case.compatible_with_specifications(specifications):
             compatible_cases.append(case)
@@ -1223,10 +1855,12 @@ class UniformTimeCourseTestCase(SingleMasterSedDocumentCombineArchiveTestCase):
         sim = doc.simulations[0]
         report = doc.outputs[0]
 
-        data = ReportReader().run(report, outputs_dir, os.path.join(doc_id, report.id))
+        with phase('readReports'):
+            with OutputsReader(outputs_dir) as outputs_reader:
+                data = outputs_reader.run(report, os.path.join(doc_id, report.id))
 
         for data_set_data in data.values():
-            if numpy.any(simulation_results_isnan(data_set_data)):
+            if simulation_results_any_isnan(data_set_data):
                 warnings.warn('The results produced by the simulator include `NaN`.', InvalidOutputsWarning)
                 has_warnings = True
                 break
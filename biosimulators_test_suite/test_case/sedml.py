@@ -5,14 +5,18 @@
 :Copyright: 2020, Center for Reproducible Biomedical Modeling
 :License: MIT
 """
+from ..algorithm_substitution import get_algorithm_substitution_table
+from ..config import Config
 from ..exceptions import InvalidOutputsException, SkippedTestCaseException
-from ..utils import simulation_results_isnan
+from ..model_index import ModelAttribute, sample_model_attributes  # noqa: F401
+from ..outputs import OutputsReader
+from ..timing import phase
+from ..utils import simulation_results_any_isnan, SimulationResultsNanMask
 from ..warnings import InvalidOutputsWarning
 from .published_project import SingleMasterSedDocumentCombineArchiveTestCase, UniformTimeCourseTestCase, ExpectedResultOfSyntheticArchive
 from biosimulators_utils.combine.data_model import CombineArchive  # noqa: F401
 from biosimulators_utils.archive.io import ArchiveReader
 from biosimulators_utils.config import get_config
-from biosimulators_utils.report.io import ReportReader
 from biosimulators_utils.sedml.data_model import (SedDocument, Task, Output, Report, Plot2D, Plot3D,  DataGenerator,  # noqa: F401
                                                   Variable, UniformTimeCourseSimulation,
                                                   DataSet, Curve, Surface, AxisScale,
@@ -23,9 +27,7 @@ from biosimulators_utils.sedml.data_model import (SedDocument, Task, Output, Rep
                                                   SetValueComputeModelChange, SubTask)
 from biosimulators_utils.sedml.exec import get_report_for_plot2d, get_report_for_plot3d
 from biosimulators_utils.sedml.utils import get_xml_node_namespace_tag_target
-from kisao import Kisao
 from kisao.data_model import AlgorithmSubstitutionPolicy
-from kisao.utils import get_substitutable_algorithms_for_policy
 from lxml import etree
 import abc
 import copy
@@ -70,6 +72,33 @@ class SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(SingleMast
     individual variables, and reports
     """
 
+    def get_model_attributes(self, curated_archive_dir, model, numeric_only=False, max_attributes=None):
+        """ Get the attributes of the elements of a model of the curated archive for generating changes to the model
+
+        Args:
+            curated_archive_dir (:obj:`str`): directory with the contents of the curated COMBINE/OMEX archive
+            model (:obj:`Model`): model
+            numeric_only (:obj:`bool`, optional): whether to only get the attributes whose values are numeric
+            max_attributes (:obj:`int`, optional): maximum number of attributes to sample, stratified by their types (``0`` or
+                :obj:`None` for all attributes)
+
+        Returns:
+            :obj:`list` of :obj:`ModelAttribute`: attributes
+
+        Raises:
+            :obj:`SkippedTestCaseException`: if the model is not encoded in XML
+        """
+        model_attributes = self.curated_archive_cache.get_model_attributes(os.path.join(curated_archive_dir, model.source))
+        if model_attributes is None:
+            msg = ('This test is only implemented for XML-based model languages. '
+                   'Please contact the BioSimulators Team to discuss implementing tests for additional languages.')
+            raise SkippedTestCaseException(msg)
+
+        if numeric_only:
+            model_attributes = [attribute for attribute in model_attributes if attribute.numeric_value is not None]
+
+        return sample_model_attributes(model_attributes, max_attributes)
+
     def eval_outputs(self, specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
         """ Test that the expected outputs were created for the synthetic archive
 
@@ -85,45 +114,46 @@ class SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(SingleMast
         """
         has_warnings = False
 
-        # reports
-        try:
-            report_ids = ReportReader().get_ids(outputs_dir)
-        except Exception:
-            report_ids = []
-
-        expected_report_ids = set()
-        for doc_location, doc in synthetic_sed_docs.items():
-            doc_id = os.path.relpath(doc_location, './')
-            for output in doc.outputs:
-                if isinstance(output, Report):
-                    expected_report_ids.add(os.path.join(doc_id, output.id))
-
-        missing_report_ids = expected_report_ids.difference(set(report_ids))
-        extra_report_ids = set(report_ids).difference(expected_report_ids)
-
-        if missing_report_ids:
-            raise InvalidOutputsException('Simulator did not produce the following reports:\n  - {}'.format(
-                '\n  - '.join(sorted('`' + id + '`' for id in missing_report_ids))
-            ))
-
-        if extra_report_ids:
-            msg = 'Simulator produced extra reports:\n  - {}'.format(
-                '\n  - '.join(sorted('`' + id + '`' for id in extra_report_ids)))
-            warnings.warn(msg, InvalidOutputsWarning)
-            has_warnings = True
-
-        # data sets
-        expected_data_set_ids = set()
-        data_set_ids = set()
-        for doc_location, doc in synthetic_sed_docs.items():
-            doc_id = os.path.relpath(doc_location, './')
-            for output in doc.outputs:
-                if isinstance(output, Report):
-                    for data_set in output.data_sets:
-                        expected_data_set_ids.add(os.path.join(doc_id, output.id, data_set.id))
+        with OutputsReader(outputs_dir) as outputs_reader:
+            # reports
+            try:
+                report_ids = outputs_reader.get_ids()
+            except Exception:
+                report_ids = []
+
+            expected_report_ids = set()
+            for doc_location, doc in synthetic_sed_docs.items():
+                doc_id = os.path.relpath(doc_location, './')
+                for output in doc.outputs:
+                    if isinstance(output, Report):
+                        expected_report_ids.add(os.path.join(doc_id, output.id))
+
+            missing_report_ids = expected_report_ids.difference(set(report_ids))
+            extra_report_ids = set(report_ids).difference(expected_report_ids)
+
+            if missing_report_ids:
+                raise InvalidOutputsException('Simulator did not produce the following reports:\n  - {}'.format(
+                    '\n  - '.join(sorted('`' + id + '`' for id in missing_report_ids))
+                ))
 
-                    results = ReportReader().run(output, outputs_dir, os.path.join(doc_id, output.id))
-                    data_set_ids.update(set(os.path.join(doc_id, output.id, id) for id in results.keys()))
+            if extra_report_ids:
+                msg = 'Simulator produced extra reports:\n  - {}'.format(
+                    '\n  - '.join(sorted('`' + id + '`' for id in extra_report_ids)))
+                warnings.warn(msg, InvalidOutputsWarning)
+                has_warnings = True
+
+            # data sets
+            expected_data_set_ids = set()
+            data_set_ids = set()
+            for doc_location, doc in synthetic_sed_docs.items():
+                doc_id = os.path.relpath(doc_location, './')
+                for output in doc.outputs:
+                    if isinstance(output, Report):
+                        for data_set in output.data_sets:
+                            expected_data_set_ids.add(os.path.join(doc_id, output.id, data_set.id))
+
+                        results = outputs_reader.run(output, os.path.join(doc_id, output.id))
+                        data_set_ids.update(set(os.path.join(doc_id, output.id, id) for id in results.keys()))
 
         missing_data_set_ids = expected_data_set_ids.difference(set(data_set_ids))
         extra_data_set_ids = set(data_set_ids).difference(expected_data_set_ids)
@@ -251,78 +281,43 @@ class SimulatorSupportsModelAttributeChanges(SimulatorSupportsModelsSimulationsT
         doc = list(curated_sed_docs.values())[0]
         model = doc.models[0]
 
-        try:
-            model_etree = etree.parse(os.path.join(curated_archive_dir, model.source))
-        except etree.XMLSyntaxError:
-            msg = ('This test is only implemented for XML-based model languages. '
-                   'Please contact the BioSimulators Team to discuss implementing tests for additional languages.')
-            raise SkippedTestCaseException(msg)
+        model_attributes = self.get_model_attributes(curated_archive_dir, model, max_attributes=Config().model_change_budget)
 
         # add model changes
-        model_root = model_etree.getroot()
-
         sed_docs_1 = copy.deepcopy(curated_sed_docs)
         sed_docs_2 = copy.deepcopy(sed_docs_1)
         doc_1 = list(sed_docs_1.values())[0]
         doc_2 = list(sed_docs_2.values())[0]
         model_1 = doc_1.models[0]
         model_2 = doc_2.models[0]
-        nodes = [(model_root, 0, '', {})]
-        while nodes:
-            node, i_node, parent_target, parent_namespaces = nodes.pop()
-
-            _, _, _, node_target, target_namespaces = get_xml_node_namespace_tag_target(
-                node, target_namespaces=parent_namespaces)
-
-            node_target = (
-                parent_target
-                + '/'
-                + node_target
-                + '[{}]'.format(i_node + 1)
-            )
-
-            for key, value in node.attrib.items():
-                if key[0] == '{':
-                    ns, _, key = key[1:].rpartition('}')
-                    rev_namespaces = {v: k for k, v in node.nsmap.items()}
-                    key = rev_namespaces[ns] + ':' + key
+        for attribute in model_attributes:
+            target_namespaces = dict(attribute.target_namespaces)
 
-                model_1.changes.append(
-                    ModelAttributeChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        new_value='x',
-                    )
+            model_1.changes.append(
+                ModelAttributeChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    new_value='x',
                 )
+            )
 
-                model_2.changes.append(
-                    ModelAttributeChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        new_value='x',
-                    )
+            model_2.changes.append(
+                ModelAttributeChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    new_value='x',
                 )
-                model_2.changes.append(
-                    ModelAttributeChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        new_value=value,
-                    )
+            )
+            model_2.changes.append(
+                ModelAttributeChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    new_value=attribute.value,
                 )
-            for mod in [model_1, model_2]:
-                for change in mod.changes:
-                    change.model = mod.id
-            n_children = {}
-            for child in node.getchildren():
-                _, _, _, child_target, _ = get_xml_node_namespace_tag_target(
-                    child, target_namespaces=target_namespaces)
-
-                if child_target not in n_children:
-                    n_children[child_target] = 0
-
-                nodes.append((child, n_children[child_target], node_target, target_namespaces))
-
-                n_children[child_target] += 1
+            )
+        for mod in [model_1, model_2]:
+            for change in mod.changes:
+                change.model = mod.id
 
         return [
             ExpectedResultOfSyntheticArchive(curated_archive, sed_docs_1, False),
@@ -361,110 +356,70 @@ class SimulatorSupportsComputeModelChanges(SimulatorSupportsModelsSimulationsTas
         doc = list(curated_sed_docs.values())[0]
         model = doc.models[0]
 
-        try:
-            model_etree = etree.parse(os.path.join(curated_archive_dir, model.source))
-        except etree.XMLSyntaxError:
-            msg = ('This test is only implemented for XML-based model languages. '
-                   'Please contact the BioSimulators Team to discuss implementing tests for additional languages.')
-            raise SkippedTestCaseException(msg)
+        model_attributes = self.get_model_attributes(curated_archive_dir, model, numeric_only=True,
+                                                     max_attributes=Config().model_change_budget)
 
         # add model changes
-        model_root = model_etree.getroot()
-
         sed_docs_1 = copy.deepcopy(curated_sed_docs)
         sed_docs_2 = copy.deepcopy(sed_docs_1)
         doc_1 = list(sed_docs_1.values())[0]
         doc_2 = list(sed_docs_2.values())[0]
         model_1 = doc_1.models[0]
         model_2 = doc_2.models[0]
-        nodes = [(model_root, 0, '', {})]
         i_change = 0
-        while nodes:
-            node, i_node, parent_target, parent_namespaces = nodes.pop()
-
-            _, _, _, node_target, target_namespaces = get_xml_node_namespace_tag_target(
-                node, target_namespaces=parent_namespaces)
-
-            node_target = (
-                parent_target
-                + '/'
-                + node_target
-                + '[{}]'.format(i_node + 1)
-            )
+        for attribute in model_attributes:
+            target_namespaces = dict(attribute.target_namespaces)
 
-            for key, value in node.attrib.items():
-                if key[0] == '{':
-                    ns, _, key = key[1:].rpartition('}')
-                    rev_namespaces = {v: k for k, v in node.nsmap.items()}
-                    key = rev_namespaces[ns] + ':' + key
-
-                try:
-                    float(value)
-                except ValueError:
-                    continue
-
-                i_change += 1
-                param_id = '__p_{}'.format(i_change)
-                var_id = '__var_{}'.format(i_change)
-                model_1.changes.append(
-                    ComputeModelChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        parameters=[
-                            Parameter(id=param_id, value=-1)
-                        ],
-                        variables=[
-                            Variable(
-                                id=var_id,
-                                target=node_target + '/@' + key,
-                                target_namespaces=target_namespaces,
-                                model=model_1,
-                            )
-                        ],
-                        math='{} * {}'.format(param_id, var_id),
-                    )
+            i_change += 1
+            param_id = '__p_{}'.format(i_change)
+            var_id = '__var_{}'.format(i_change)
+            model_1.changes.append(
+                ComputeModelChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    parameters=[
+                        Parameter(id=param_id, value=-1)
+                    ],
+                    variables=[
+                        Variable(
+                            id=var_id,
+                            target=attribute.target,
+                            target_namespaces=target_namespaces,
+                            model=model_1,
+                        )
+                    ],
+                    math='{} * {}'.format(param_id, var_id),
                 )
+            )
 
-                model_2.changes.append(
-                    ComputeModelChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        parameters=[
-                            Parameter(id=param_id, value=-1)
-                        ],
-                        variables=[
-                            Variable(
-                                id=var_id,
-                                target=node_target + '/@' + key,
-                                target_namespaces=target_namespaces,
-                                model=model_2,
-                            )
-                        ],
-                        math='{} * {}'.format(param_id, var_id),
-                    )
+            model_2.changes.append(
+                ComputeModelChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    parameters=[
+                        Parameter(id=param_id, value=-1)
+                    ],
+                    variables=[
+                        Variable(
+                            id=var_id,
+                            target=attribute.target,
+                            target_namespaces=target_namespaces,
+                            model=model_2,
+                        )
+                    ],
+                    math='{} * {}'.format(param_id, var_id),
                 )
-                model_2.changes.append(
-                    ModelAttributeChange(
-                        target=node_target + '/@' + key,
-                        target_namespaces=target_namespaces,
-                        new_value=value,
-                    )
+            )
+            model_2.changes.append(
+                ModelAttributeChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    new_value=attribute.value,
                 )
-            for mod in [model_1, model_2]:
-                for change in mod.changes:
-                    change.model = mod.id
-
-            n_children = {}
-            for child in node.getchildren():
-                _, _, _, child_target, _ = get_xml_node_namespace_tag_target(
-                    child, target_namespaces=target_namespaces)
-
-                if child_target not in n_children:
-                    n_children[child_target] = 0
-
-                nodes.append((child, n_children[child_target], node_target, target_namespaces))
-
-                n_children[child_target] += 1
+            )
+        for mod in [model_1, model_2]:
+            for change in mod.changes:
+                change.model = mod.id
 
         return [
             ExpectedResultOfSyntheticArchive(curated_archive, sed_docs_1, False),
@@ -572,11 +527,10 @@ class SimulatorSupportsAlgorithmParameters(SimulatorSupportsModelsSimulationsTas
         Returns:
             :obj:`bool`: whether the algorithm is suitable for testing
         """
-        for alg_specs in specifications['algorithms']:
-            if alg_specs['kisaoId']['id'] == algorithm.kisao_id:
-                for param_spec in alg_specs['parameters']:
-                    if param_spec['value'] is not None:
-                        return True
+        capabilities = self.get_simulator_capabilities(specifications)
+        for param_spec in capabilities.get_algorithm_parameters(algorithm.kisao_id):
+            if param_spec['value'] is not None:
+                return True
 
         return False
 
@@ -602,13 +556,10 @@ class SimulatorSupportsAlgorithmParameters(SimulatorSupportsModelsSimulationsTas
 
         algorithm = doc.simulations[0].algorithm
 
-        for alg_specs in specifications['algorithms']:
-            if alg_specs['kisaoId']['id'] == algorithm.kisao_id:
-                if alg_specs['parameters']:
-                    break
+        capabilities = self.get_simulator_capabilities(specifications)
 
         algorithm.changes = []
-        for param_spec in alg_specs['parameters']:
+        for param_spec in capabilities.get_algorithm_parameters(algorithm.kisao_id):
             if param_spec['value'] is not None:
                 algorithm.changes.append(
                     AlgorithmParameterChange(
@@ -638,12 +589,8 @@ class SimulatorProducesReportsWithCuratedNumberOfDimensions(SimulatorSupportsMod
                 is_curated_sed_algorithm_suitable_for_building_synthetic_archive(specifications, algorithm)):
             return False
 
-        for alg_specs in specifications['algorithms']:
-            if alg_specs['kisaoId']['id'] == algorithm.kisao_id:
-                if alg_specs.get('dependentDimensions', None) is not None:
-                    return True
-
-        return False
+        alg_specs = self.get_simulator_capabilities(specifications).get_algorithm(algorithm.kisao_id)
+        return alg_specs is not None and alg_specs.get('dependentDimensions', None) is not None
 
     def eval_outputs(self, specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
         """ Test that the expected outputs were created for the synthetic archive
@@ -663,12 +610,10 @@ class SimulatorProducesReportsWithCuratedNumberOfDimensions(SimulatorSupportsMod
         doc_id = os.path.relpath(doc_location, './')
 
         report = doc.outputs[0]
-        data = ReportReader().run(report, outputs_dir, os.path.join(doc_id, report.id))
-
-        for alg_specs in specifications['algorithms']:
-            if alg_specs['kisaoId']['id'] == doc.simulations[0].algorithm.kisao_id:
-                break
+        with OutputsReader(outputs_dir) as outputs_reader:
+            data = outputs_reader.run(report, os.path.join(doc_id, report.id))
 
+        alg_specs = self.get_simulator_capabilities(specifications).get_algorithm(doc.simulations[0].algorithm.kisao_id)
         expected_dims = alg_specs['dependentDimensions']
 
         data_set_data = data[report.data_sets[0].id]
@@ -773,7 +718,8 @@ class SimulatorSupportsMultipleTasksPerSedDocument(SingleMasterSedDocumentCombin
             :obj:`bool`: whether there were no warnings about the outputs
         """
         try:
-            report_ids = ReportReader().get_ids(outputs_dir)
+            with OutputsReader(outputs_dir) as outputs_reader:
+                report_ids = outputs_reader.get_ids()
         except Exception:
             report_ids = []
 
@@ -850,7 +796,8 @@ class SimulatorSupportsMultipleReportsPerSedDocument(SingleMasterSedDocumentComb
         has_warnings = False
 
         try:
-            report_ids = ReportReader().get_ids(outputs_dir)
+            with OutputsReader(outputs_dir) as outputs_reader:
+                report_ids = outputs_reader.get_ids()
         except Exception:
             report_ids = []
 
@@ -935,58 +882,14 @@ class RepeatedTasksTestCase(SimulatorSupportsModelsSimulationsTasksDataGenerator
         """
 
         if self.FUNCTONAL_RANGE_USES_VARIABLES:
-            try:
-                model_etree = etree.parse(os.path.join(curated_archive_dir, model.source))
-            except etree.XMLSyntaxError:
-                msg = ('This test is only implemented for XML-based model languages. '
-                       'Please contact the BioSimulators Team to discuss implementing tests for additional languages.')
-                raise SkippedTestCaseException(msg)
-
-            model_root = model_etree.getroot()
-            nodes = [(model_root, 0, '', {})]
-            variables = []
-            while nodes:
-                node, i_node, parent_target, parent_namespaces = nodes.pop()
-
-                _, _, _, node_target, target_namespaces = get_xml_node_namespace_tag_target(
-                    node, target_namespaces=parent_namespaces)
-
-                node_target = (
-                    parent_target
-                    + '/'
-                    + node_target
-                    + '[{}]'.format(i_node + 1)
+            model_attributes = self.get_model_attributes(curated_archive_dir, model, numeric_only=True)
+            variables = [
+                Variable(
+                    target=attribute.target,
+                    target_namespaces=dict(attribute.target_namespaces),
                 )
-
-                for key, value in node.attrib.items():
-                    if key[0] == '{':
-                        ns, _, key = key[1:].rpartition('}')
-                        rev_namespaces = {v: k for k, v in node.nsmap.items()}
-                        key = rev_namespaces[ns] + ':' + key
-
-                    try:
-                        float(value)
-                    except ValueError:
-                        continue
-
-                    variables.append(
-                        Variable(
-                            target=node_target + '/@' + key,
-                            target_namespaces=target_namespaces,
-                        ),
-                    )
-
-                n_children = {}
-                for child in node.getchildren():
-                    _, _, _, child_target, _ = get_xml_node_namespace_tag_target(
-                        child, target_namespaces=target_namespaces)
-
-                    if child_target not in n_children:
-                        n_children[child_target] = 0
-
-                    nodes.append((child, n_children[child_target], node_target, target_namespaces))
-
-                    n_children[child_target] += 1
+                for attribute in model_attributes
+            ]
 
         if self.RANGE_TYPE is UniformRange:
             if self.UNIFORM_RANGE_TYPE == UniformRangeType.linear:
@@ -1060,96 +963,57 @@ class RepeatedTasksTestCase(SimulatorSupportsModelsSimulationsTasksDataGenerator
         if not self.HAS_CHANGES:
             return []
 
-        try:
-            model_etree = etree.parse(os.path.join(curated_archive_dir, model.source))
-        except etree.XMLSyntaxError:
-            msg = ('This test is only implemented for XML-based model languages. '
-                   'Please contact the BioSimulators Team to discuss implementing tests for additional languages.')
-            raise SkippedTestCaseException(msg)
+        model_attributes = self.get_model_attributes(curated_archive_dir, model, numeric_only=True,
+                                                     max_attributes=Config().model_change_budget)
 
-        model_root = model_etree.getroot()
-        nodes = [(model_root, 0, '', {})]
         changes = []
-        while nodes:
-            node, i_node, parent_target, parent_namespaces = nodes.pop()
-
-            _, _, _, node_target, target_namespaces = get_xml_node_namespace_tag_target(
-                node, target_namespaces=parent_namespaces)
+        for attribute in model_attributes:
+            target_namespaces = dict(attribute.target_namespaces)
 
-            node_target = (
-                parent_target
-                + '/'
-                + node_target
-                + '[{}]'.format(i_node + 1)
+            changes.append(
+                SetValueComputeModelChange(
+                    target=attribute.target,
+                    target_namespaces=target_namespaces,
+                    model=model,
+                    range=range,
+                    parameters=[
+                        Parameter(
+                            id='p_0_' + str(len(changes)) + '_' + str(i_repeated_task),
+                            value=1. if self.FUNCTONAL_RANGE_USES_VARIABLES else 0.,
+                        ),
+                        Parameter(
+                            id='p_1_' + str(len(changes)) + '_' + str(i_repeated_task),
+                            value=1. if self.FUNCTONAL_RANGE_USES_VARIABLES else -1,
+                        ),
+                    ],
+                    variables=[
+                        Variable(
+                            id='var_' + str(len(changes)) + '_' + str(i_repeated_task),
+                            model=model,
+                            target=attribute.target,
+                            target_namespaces=target_namespaces,
+                        )
+                    ],
+                    math='{} * {} + {} * {}'.format(
+                        'p_0_' + str(len(changes)) + '_' + str(i_repeated_task), range.id,
+                        'p_1_' + str(len(changes)) + '_' + str(i_repeated_task), 'var_' +
+                        str(len(changes)) + '_' + str(i_repeated_task),
+                    )
+                )
             )
-
-            for key, value in node.attrib.items():
-                if key[0] == '{':
-                    ns, _, key = key[1:].rpartition('}')
-                    rev_namespaces = {v: k for k, v in node.nsmap.items()}
-                    key = rev_namespaces[ns] + ':' + key
-
-                try:
-                    original_value = float(value)
-                except ValueError:
-                    continue
-
+            if not only_breaking_changes:
                 changes.append(
                     SetValueComputeModelChange(
-                        target=node_target + '/@' + key,
+                        target=attribute.target,
                         target_namespaces=target_namespaces,
                         model=model,
                         range=range,
                         parameters=[
-                            Parameter(
-                                id='p_0_' + str(len(changes)) + '_' + str(i_repeated_task),
-                                value=1. if self.FUNCTONAL_RANGE_USES_VARIABLES else 0.,
-                            ),
-                            Parameter(
-                                id='p_1_' + str(len(changes)) + '_' + str(i_repeated_task),
-                                value=1. if self.FUNCTONAL_RANGE_USES_VARIABLES else -1,
-                            ),
+                            Parameter(id='p_2_' + str(len(changes)) + '_' + str(i_repeated_task), value=attribute.numeric_value),
                         ],
-                        variables=[
-                            Variable(
-                                id='var_' + str(len(changes)) + '_' + str(i_repeated_task),
-                                model=model,
-                                target=node_target + '/@' + key,
-                                target_namespaces=target_namespaces,
-                            )
-                        ],
-                        math='{} * {} + {} * {}'.format(
-                            'p_0_' + str(len(changes)) + '_' + str(i_repeated_task), range.id,
-                            'p_1_' + str(len(changes)) + '_' + str(i_repeated_task), 'var_' +
-                            str(len(changes)) + '_' + str(i_repeated_task),
-                        )
+                        math='p_2_' + str(len(changes)) + '_' + str(i_repeated_task),
                     )
                 )
-                if not only_breaking_changes:
-                    changes.append(
-                        SetValueComputeModelChange(
-                            target=node_target + '/@' + key,
-                            target_namespaces=target_namespaces,
-                            model=model,
-                            range=range,
-                            parameters=[
-                                Parameter(id='p_2_' + str(len(changes)) + '_' + str(i_repeated_task), value=original_value),
-                            ],
-                            math='p_2_' + str(len(changes)) + '_' + str(i_repeated_task),
-                        )
-                    )
-
-            n_children = {}
-            for child in node.getchildren():
-                _, _, _, child_target, _ = get_xml_node_namespace_tag_target(
-                    child, target_namespaces=target_namespaces)
-
-                if child_target not in n_children:
-                    n_children[child_target] = 0
-
-                nodes.append((child, n_children[child_target], node_target, target_namespaces))
-
-                n_children[child_target] += 1
 
         return changes
 
@@ -1276,108 +1140,105 @@ class RepeatedTasksTestCase(SimulatorSupportsModelsSimulationsTasksDataGenerator
         doc = synthetic_sed_docs[doc_location]
         report = doc.outputs[0]
         repeated_report = doc.outputs[1]
-        results = ReportReader().run(report, outputs_dir, os.path.join(doc_id, report.id))
-        repeated_results = ReportReader().run(repeated_report, outputs_dir, os.path.join(doc_id, repeated_report.id))
-
-        for data_set, repeated_data_set in zip(report.data_sets, repeated_report.data_sets):
-            results_data_set = results[data_set.id]
-            repeated_results_data_set = repeated_results[repeated_data_set.id]
-
-            if results_data_set.ndim == 0:
-                results_data_set = results_data_set.reshape((1,))
+        # the data sets are read from the file in blocks, rather than into memory
+        with OutputsReader(outputs_dir) as outputs_reader:
+            results = outputs_reader.run(report, os.path.join(doc_id, report.id), lazy=True)
+            repeated_results = outputs_reader.run(repeated_report, os.path.join(doc_id, repeated_report.id), lazy=True)
 
-            if repeated_results_data_set.ndim - results_data_set.ndim != 2 * (self.NUM_NESTED_REPEATED_TASKS + 1):
-                raise InvalidOutputsException('Each level of repeated task should contribute two additional dimensions to reports')
+            for data_set, repeated_data_set in zip(report.data_sets, repeated_report.data_sets):
+                results_data_set = results[data_set.id]
+                repeated_results_data_set = repeated_results[repeated_data_set.id]
 
-            if not self.MIXED_SUB_TASK_TYPES:
-                if repeated_results_data_set.shape[0:2 * (self.NUM_NESTED_REPEATED_TASKS + 1):2] != self.RANGE_LENS:
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
-
-                if not set(repeated_results_data_set.shape[1:2 * (self.NUM_NESTED_REPEATED_TASKS + 1):2]) == set([self.NUM_SUB_TASKS]):
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
-
-                if (
-                    not numpy.any(simulation_results_isnan(results_data_set))
-                    and numpy.any(simulation_results_isnan(repeated_results_data_set))
-                ):
-                    raise InvalidOutputsException('The results of the repeated tasks have unexpected NaNs')
-            else:
-                shape = results_data_set.shape
+                shape = results_data_set.shape or (1,)
                 repeated_shape = repeated_results_data_set.shape
 
-                if repeated_shape[0] != self.RANGE_LENS[0]:
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
-
-                if repeated_shape[1] != self.NUM_SUB_TASKS:
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
-
-                if repeated_shape[2] != max(self.RANGE_LENS[1], shape[0]):
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
-
-                if (
-                    (len(shape) == 1 and repeated_shape[3] != self.NUM_SUB_TASKS)
-                    or (len(shape) > 1 and repeated_shape[3] != max(self.NUM_SUB_TASKS, shape[1]))
-                ):
-                    raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
-
-                if repeated_shape[2 * (self.NUM_NESTED_REPEATED_TASKS + 1):] != shape:
-                    msg = 'The results of the repeated tasks should have a slice for each dimension of output of the basic task'
-                    raise InvalidOutputsException(msg)
-
-                sub_tasks = sorted(doc.tasks[-1].sub_tasks, key=lambda sub_task: sub_task.order)
-                for i_sub_task, sub_task in enumerate(sub_tasks):
-                    if isinstance(sub_task.task, RepeatedTask):
-                        slices = tuple([
-                            slice(0, repeated_shape[0]),
-                            slice(i_sub_task, i_sub_task + 1),
-                            slice(0, self.RANGE_LENS[1]),
-                            slice(0, self.NUM_SUB_TASKS),
-                        ] + [slice(0, dim_len) for dim_len in repeated_shape[4:]])
-                        if (
-                            not numpy.any(simulation_results_isnan(results_data_set))
-                            and numpy.any(simulation_results_isnan(repeated_results_data_set[slices]))
-                        ):
-                            raise InvalidOutputsException('The results of repeated tasks have unexpected NaNs')
-
-                        slices = tuple([
-                            slice(0, repeated_shape[0]),
-                            slice(i_sub_task, i_sub_task + 1),
-                            slice(self.RANGE_LENS[1], repeated_shape[2]),
-                            slice(0, repeated_shape[3]),
-                        ] + [slice(0, dim_len) for dim_len in repeated_shape[4:]])
-                        if not numpy.all(simulation_results_isnan(repeated_results_data_set[slices])):
-                            raise InvalidOutputsException('The results of repeated tasks have unexpected non-NaNs')
+                if len(repeated_shape) - len(shape) != 2 * (self.NUM_NESTED_REPEATED_TASKS + 1):
+                    raise InvalidOutputsException('Each level of repeated task should contribute two additional dimensions to reports')
+
+                if not self.MIXED_SUB_TASK_TYPES:
+                    if repeated_shape[0:2 * (self.NUM_NESTED_REPEATED_TASKS + 1):2] != self.RANGE_LENS:
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
+
+                    if not set(repeated_shape[1:2 * (self.NUM_NESTED_REPEATED_TASKS + 1):2]) == set([self.NUM_SUB_TASKS]):
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
+
+                    if (
+                        not simulation_results_any_isnan(results_data_set)
+                        and simulation_results_any_isnan(repeated_results_data_set)
+                    ):
+                        raise InvalidOutputsException('The results of the repeated tasks have unexpected NaNs')
+                else:
+                    if repeated_shape[0] != self.RANGE_LENS[0]:
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
+
+                    if repeated_shape[1] != self.NUM_SUB_TASKS:
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
+
+                    if repeated_shape[2] != max(self.RANGE_LENS[1], shape[0]):
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each iteration')
+
+                    if (
+                        (len(shape) == 1 and repeated_shape[3] != self.NUM_SUB_TASKS)
+                        or (len(shape) > 1 and repeated_shape[3] != max(self.NUM_SUB_TASKS, shape[1]))
+                    ):
+                        raise InvalidOutputsException('The results of the repeated tasks should have a slice for each sub-task')
+
+                    if repeated_shape[2 * (self.NUM_NESTED_REPEATED_TASKS + 1):] != shape:
+                        msg = 'The results of the repeated tasks should have a slice for each dimension of output of the basic task'
+                        raise InvalidOutputsException(msg)
+
+                    # the NaNs of the results are determined once, rather than once for each slice of the results
+                    results_has_nans = simulation_results_any_isnan(results_data_set)
+                    repeated_results_nan_mask = SimulationResultsNanMask(repeated_results_data_set)
+
+                    sub_tasks = sorted(doc.tasks[-1].sub_tasks, key=lambda sub_task: sub_task.order)
+                    for i_sub_task, sub_task in enumerate(sub_tasks):
+                        if isinstance(sub_task.task, RepeatedTask):
+                            slices = tuple([
+                                slice(0, repeated_shape[0]),
+                                slice(i_sub_task, i_sub_task + 1),
+                                slice(0, self.RANGE_LENS[1]),
+                                slice(0, self.NUM_SUB_TASKS),
+                            ] + [slice(0, dim_len) for dim_len in repeated_shape[4:]])
+                            if not results_has_nans and repeated_results_nan_mask.any(slices):
+                                raise InvalidOutputsException('The results of repeated tasks have unexpected NaNs')
 
-                    else:
-                        slices = tuple([
-                            slice(0, repeated_shape[0]),
-                            slice(i_sub_task, i_sub_task + 1),
-                        ] + [
-                            slice(0, dim_len) for dim_len in shape
-                        ] + [
-                            slice(0, 1) for dim_len in repeated_shape[2 + len(shape):]
-                        ])
-                        if (
-                            not numpy.any(simulation_results_isnan(results_data_set))
-                            and numpy.any(simulation_results_isnan(repeated_results_data_set[slices]))
-                        ):
-                            raise InvalidOutputsException('The results of repeated tasks have unexpected NaNs')
-
-                        remaining_dims = repeated_shape[2 + len(shape):]
-                        for i_dim, dim_len in enumerate(remaining_dims):
-                            slices = [
+                            slices = tuple([
+                                slice(0, repeated_shape[0]),
+                                slice(i_sub_task, i_sub_task + 1),
+                                slice(self.RANGE_LENS[1], repeated_shape[2]),
+                                slice(0, repeated_shape[3]),
+                            ] + [slice(0, dim_len) for dim_len in repeated_shape[4:]])
+                            if not repeated_results_nan_mask.all(slices):
+                                raise InvalidOutputsException('The results of repeated tasks have unexpected non-NaNs')
+
+                        else:
+                            slices = tuple([
                                 slice(0, repeated_shape[0]),
                                 slice(i_sub_task, i_sub_task + 1),
                             ] + [
                                 slice(0, dim_len) for dim_len in shape
-                            ]
-                            slices.extend([slice(0, remaining_dims[ii_dim]) for ii_dim in range(i_dim)])
-                            slices.append(slice(1, remaining_dims[i_dim]))
-                            slices.extend([slice(0, remaining_dims[ii_dim]) for ii_dim in range(i_dim + 1, len(remaining_dims))])
-                            slices = tuple(slices)
-
-                            if not numpy.all(simulation_results_isnan(repeated_results_data_set[slices])):
-                                raise InvalidOutputsException('The results of repeated tasks have unexpected non-NaNs')
+                            ] + [
+                                slice(0, 1) for dim_len in repeated_shape[2 + len(shape):]
+                            ])
+                            if not results_has_nans and repeated_results_nan_mask.any(slices):
+                                raise InvalidOutputsException('The results of repeated tasks have unexpected NaNs')
+
+                            remaining_dims = repeated_shape[2 + len(shape):]
+                            for i_dim, dim_len in enumerate(remaining_dims):
+                                slices = [
+                                    slice(0, repeated_shape[0]),
+                                    slice(i_sub_task, i_sub_task + 1),
+                                ] + [
+                                    slice(0, dim_len) for dim_len in shape
+                                ]
+                                slices.extend([slice(0, remaining_dims[ii_dim]) for ii_dim in range(i_dim)])
+                                slices.append(slice(1, remaining_dims[i_dim]))
+                                slices.extend([slice(0, remaining_dims[ii_dim]) for ii_dim in range(i_dim + 1, len(remaining_dims))])
+                                slices = tuple(slices)
+
+                                if not repeated_results_nan_mask.all(slices):
+                                    raise InvalidOutputsException('The results of repeated tasks have unexpected non-NaNs')
 
         return True
 
@@ -1570,20 +1431,21 @@ class SimulatorProducesPlotsTestCase(SingleMasterSedDocumentCombineArchiveTestCa
         if not os.path.isfile(plots_path):
             raise SkippedTestCaseException('Simulator did not produce plots')
 
-        tempdir = tempfile.mkdtemp()
-        try:
-            archive = ArchiveReader().run(plots_path, tempdir)
-        except Exception:
-            shutil.rmtree(tempdir)
-            raise InvalidOutputsException('Simulator produced an invalid zip archive of plots')
+        with phase('validatePlots'):
+            tempdir = tempfile.mkdtemp()
+            try:
+                archive = ArchiveReader().run(plots_path, tempdir)
+            except Exception:
+                shutil.rmtree(tempdir)
+                raise InvalidOutputsException('Simulator produced an invalid zip archive of plots')
 
-        for file in archive.files:
-            with open(file.local_path, 'rb') as file:
-                try:
-                    PyPDF2.PdfReader(file)
-                except Exception:
-                    shutil.rmtree(tempdir)
-                    raise InvalidOutputsException('Simulator produced an invalid PDF plot')
+            for file in archive.files:
+                with open(file.local_path, 'rb') as file:
+                    try:
+                        PyPDF2.PdfReader(file)
+                    except Exception:
+                        shutil.rmtree(tempdir)
+                        raise InvalidOutputsException('Simulator produced an invalid PDF plot')
 
         doc = list(synthetic_sed_docs.values())[0]
         doc_location = list(synthetic_sed_docs.keys())[0]
@@ -1615,50 +1477,51 @@ class SimulatorProducesPlotsTestCase(SingleMasterSedDocumentCombineArchiveTestCa
                 if isinstance(output, (Plot2D, Plot3D)):
                     expected_plot_ids.add(os.path.join(doc_id, output.id))
 
-        try:
-            plot_ids = ReportReader().get_ids(outputs_dir)
-        except Exception:
-            plot_ids = []
+        with OutputsReader(outputs_dir) as outputs_reader:
+            try:
+                plot_ids = outputs_reader.get_ids()
+            except Exception:
+                plot_ids = []
 
-        missing_plot_ids = expected_plot_ids.difference(set(plot_ids))
+            missing_plot_ids = expected_plot_ids.difference(set(plot_ids))
 
-        if missing_plot_ids:
-            raise InvalidOutputsException('Simulator did not produce data for the following plots:\n  - {}'.format(
-                '\n  - '.join(sorted('`' + id + '`' for id in missing_plot_ids))
-            ))
+            if missing_plot_ids:
+                raise InvalidOutputsException('Simulator did not produce data for the following plots:\n  - {}'.format(
+                    '\n  - '.join(sorted('`' + id + '`' for id in missing_plot_ids))
+                ))
 
-        # check plot data saved in expected format
-        for doc_location, doc in synthetic_sed_docs.items():
-            doc_id = os.path.relpath(doc_location, './')
-            for output in plots:
-                if isinstance(output, Plot2D):
-                    report = get_report_for_plot2d(output)
-                elif isinstance(output, Plot3D):
-                    report = get_report_for_plot3d(output)
-
-                results = ReportReader().run(report, outputs_dir, os.path.join(doc_id, output.id))
-
-                data_gen_ids = set(results.keys())
-                expected_data_gen_ids = set(data_set.id for data_set in report.data_sets)
-                missing_data_gen_ids = expected_data_gen_ids.difference(data_gen_ids)
-                extra_data_gen_ids = data_gen_ids.difference(expected_data_gen_ids)
-                if missing_data_gen_ids:
-                    raise InvalidOutputsException('Simulator did not record the following data generators:\n  - {}'.format(
-                        '\n  - '.join(sorted('`' + id + '`' for id in missing_data_gen_ids))
-                    ))
-                if extra_data_gen_ids:
-                    msg = 'Simulator recorded extra data generators:\n  - {}'.format(
-                        '\n  - '.join(sorted('`' + id + '`' for id in extra_data_gen_ids)))
-                    warnings.warn(msg, InvalidOutputsWarning)
-
-                for value in results.values():
-                    sim = doc.simulations[0]
-
-                    if value.shape[-1] != sim.number_of_points + 1:
-                        raise InvalidOutputsException('Data set does not have the expected shape')
-
-                    if numpy.any(simulation_results_isnan(value)):
-                        raise InvalidOutputsException('Data set has unexpected non-NaN values')
+            # check plot data saved in expected format
+            for doc_location, doc in synthetic_sed_docs.items():
+                doc_id = os.path.relpath(doc_location, './')
+                for output in plots:
+                    if isinstance(output, Plot2D):
+                        report = get_report_for_plot2d(output)
+                    elif isinstance(output, Plot3D):
+                        report = get_report_for_plot3d(output)
+
+                    results = outputs_reader.run(report, os.path.join(doc_id, output.id), lazy=True)
+
+                    data_gen_ids = set(results.keys())
+                    expected_data_gen_ids = set(data_set.id for data_set in report.data_sets)
+                    missing_data_gen_ids = expected_data_gen_ids.difference(data_gen_ids)
+                    extra_data_gen_ids = data_gen_ids.difference(expected_data_gen_ids)
+                    if missing_data_gen_ids:
+                        raise InvalidOutputsException('Simulator did not record the following data generators:\n  - {}'.format(
+                            '\n  - '.join(sorted('`' + id + '`' for id in missing_data_gen_ids))
+                        ))
+                    if extra_data_gen_ids:
+                        msg = 'Simulator recorded extra data generators:\n  - {}'.format(
+                            '\n  - '.join(sorted('`' + id + '`' for id in extra_data_gen_ids)))
+                        warnings.warn(msg, InvalidOutputsWarning)
+
+                    for value in results.values():
+                        sim = doc.simulations[0]
+
+                        if value.shape[-1] != sim.number_of_points + 1:
+                            raise InvalidOutputsException('Data set does not have the expected shape')
+
+                        if simulation_results_any_isnan(value):
+                            raise InvalidOutputsException('Data set has unexpected non-NaN values')
 
         # remove temporary directory
         shutil.rmtree(tempdir)
@@ -1933,23 +1796,26 @@ class SimulatorSupportsDataGeneratorsWithDifferentShapes(UniformTimeCourseTestCa
         sim2 = doc.simulations[-1]
         report2 = doc.outputs[-1]
 
-        results2 = ReportReader().run(report2, outputs_dir, os.path.join(doc_id, report2.id))
-        for value in results2.values():
-            self._eval_data_set(value, sim2.number_of_points + 1, sim1.number_of_points + 1)
+        with OutputsReader(outputs_dir) as outputs_reader:
+            results2 = outputs_reader.run(report2, os.path.join(doc_id, report2.id), lazy=True)
+            for value in results2.values():
+                self._eval_data_set(value, sim2.number_of_points + 1, sim1.number_of_points + 1)
 
     def _eval_data_set(self, value, length, non_nan_points):
         if value.shape[-1] != length:
             raise InvalidOutputsException('Data set does not have the expected shape')
 
+        nan_mask = SimulationResultsNanMask(value)
+
         data_set_slice = tuple([slice(0, dim_len) for dim_len in value.shape[0:-1]] + [slice(0, non_nan_points)])
-        if numpy.any(simulation_results_isnan(value[data_set_slice])):
+        if nan_mask.any(data_set_slice):
             raise InvalidOutputsException('Data set has unexpected NaN values')
 
         data_set_slice = tuple(
             [slice(0, dim_len) for dim_len in value.shape[0:-1]]
             + [slice(non_nan_points, length)]
         )
-        if not numpy.all(simulation_results_isnan(value[data_set_slice])):
+        if not nan_mask.all(data_set_slice):
             raise InvalidOutputsException('Data set has unexpected non-NaN values')
 
 
@@ -2047,27 +1913,28 @@ class SimulatorSupportsDataSetsWithDifferentShapes(UniformTimeCourseTestCase):
         task1 = doc.tasks[0]
         report = doc.outputs[0]
 
-        results = ReportReader().run(report, outputs_dir, os.path.join(doc_id, report.id))
-
         values1 = {}
         values2 = {}
 
-        for data_set in report.data_sets:
-            value = results[data_set.id]
+        with OutputsReader(outputs_dir) as outputs_reader:
+            results = outputs_reader.run(report, os.path.join(doc_id, report.id), lazy=True)
 
-            if data_set.data_generator.variables[0].task == task1:
-                expected_length = sim1.number_of_points + 1
+            for data_set in report.data_sets:
+                value = results[data_set.id]
 
-                if data_set.data_generator.variables[0].symbol:
-                    values1[data_set.data_generator.id] = value
+                if data_set.data_generator.variables[0].task == task1:
+                    expected_length = sim1.number_of_points + 1
 
-            else:
-                expected_length = sim2.number_of_points + 1
+                    if data_set.data_generator.variables[0].symbol:
+                        values1[data_set.data_generator.id] = value.read()
+
+                else:
+                    expected_length = sim2.number_of_points + 1
 
-                if data_set.data_generator.variables[0].symbol:
-                    values2[data_set.data_generator.id.replace('__copy_2', '')] = value[0:sim1.number_of_points + 1]
+                    if data_set.data_generator.variables[0].symbol:
+                        values2[data_set.data_generator.id.replace('__copy_2', '')] = value[0:sim1.number_of_points + 1]
 
-            self._eval_data_set(data_set.id, value, expected_length)
+                self._eval_data_set(data_set.id, value, expected_length)
 
         for key in values1.keys():
             self._eval_time_data_sets(values1[key], values2[key])
@@ -2076,7 +1943,7 @@ class SimulatorSupportsDataSetsWithDifferentShapes(UniformTimeCourseTestCase):
         if value.shape[-1] != expected_length:
             raise InvalidOutputsException('Data set `{}` does not have the expected shape'.format(id))
 
-        if numpy.any(simulation_results_isnan(value)):
+        if simulation_results_any_isnan(value):
             raise InvalidOutputsException('Data set `{}` has unexpected NaN values'.format(id))
 
     def _eval_time_data_sets(self, value1, value2):
@@ -2106,27 +1973,32 @@ class SimulatorSupportsSubstitutingAlgorithms(SimulatorSupportsModelsSimulations
         Returns:
             :obj:`bool`: whether the algorithm is suitable for testing
         """
-        kisao = Kisao()
-        alg_term = kisao.get_term(algorithm.kisao_id)
-        sub_algs = get_substitutable_algorithms_for_policy(
-            alg_term,
+        return self.get_alternative_algorithm(specifications, algorithm) is not None
+
+    def get_alternative_algorithm(self, specifications, algorithm):
+        """ Get a similar algorithm which the simulator doesn't implement, to substitute for a SED algorithm
+
+        Args:
+            specifications (:obj:`dict`): specifications of the simulator to validate
+            algorithm (:obj:`Algorithm`): SED algorithm in curated archive
+
+        Returns:
+            :obj:`str`: KiSAO id of the alternative algorithm, or :obj:`None` if there is no such algorithm
+        """
+        sub_alg_ids = get_algorithm_substitution_table().get_substitutable_algorithm_ids(
+            algorithm.kisao_id,
             substitution_policy=AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES)
-        sub_alg_ids = kisao.get_term_ids(sub_algs)
 
-        for alg_specs in specifications['algorithms']:
-            if alg_specs['kisaoId']['id'] in sub_alg_ids:
-                sub_alg_ids.remove(alg_specs['kisaoId']['id'])
+        capabilities = self.get_simulator_capabilities(specifications)
+        sub_alg_ids = [sub_alg_id for sub_alg_id in sub_alg_ids if capabilities.get_algorithm(sub_alg_id) is None]
 
-        if sub_alg_ids:
-            if 'KISAO_0000019' in sub_alg_ids:
-                self._alt_alg = 'KISAO_0000019'
-            elif 'KISAO_0000088' in sub_alg_ids:
-                self._alt_alg = 'KISAO_0000088'
-            else:
-                self._alt_alg = sub_alg_ids[0]
-            return True
-        else:
-            return False
+        if not sub_alg_ids:
+            return None
+        if 'KISAO_0000019' in sub_alg_ids:
+            return 'KISAO_0000019'
+        if 'KISAO_0000088' in sub_alg_ids:
+            return 'KISAO_0000088'
+        return sub_alg_ids[0]
 
     def build_synthetic_archives(self, specifications, curated_archive, curated_archive_dir, curated_sed_docs):
         """ Generate a synthetic archive with master and non-master SED documents
@@ -2146,7 +2018,7 @@ class SimulatorSupportsSubstitutingAlgorithms(SimulatorSupportsModelsSimulations
 
         sed_docs_1 = copy.deepcopy(curated_sed_docs)
         doc = list(sed_docs_1.values())[0]
-        doc.simulations[0].algorithm.kisao_id = self._alt_alg
+        doc.simulations[0].algorithm.kisao_id = self.get_alternative_algorithm(specifications, doc.simulations[0].algorithm)
         doc.simulations[0].algorithm.changes = []
 
         sed_docs_2 = copy.deepcopy(curated_sed_docs)
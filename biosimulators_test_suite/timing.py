@@ -0,0 +1,102 @@
+""" Instrumentation for the durations of the phases of the evaluation of test cases
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-24
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+import collections
+import contextlib
+import contextvars
+import re
+import threading
+import time
+
+__all__ = [
+    'PhaseTimer',
+    'phase',
+    'get_phase_group',
+]
+
+_current_timer = contextvars.ContextVar('current_timer', default=None)
+_current_phase = contextvars.ContextVar('current_phase', default=None)
+
+
+class PhaseTimer(object):
+    """ Records the durations of the named phases (e.g., execution of an archive, reading of reports) of the evaluation of a
+    test case
+
+    While the timer is active (inside a ``with`` statement), :obj:`phase` records the durations of phases with the timer.
+    Nested phases are named with the names of their enclosing phases (e.g., ``syntheticArchive:1.execArchive``). The duration
+    of a phase which is entered multiple times is the sum of the durations of its entries.
+
+    Attributes:
+        timings (:obj:`collections.OrderedDict` of :obj:`str` to :obj:`float`): map from the names of phases to their durations
+            in seconds
+        _lock (:obj:`threading.Lock`): lock for the durations
+        _tokens (:obj:`list` of :obj:`contextvars.Token`): tokens for restoring the previously active timers
+    """
+
+    def __init__(self):
+        self.timings = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def __enter__(self):
+        """ Activate the timer """
+        self._tokens.append((_current_timer.set(self), _current_phase.set(None)))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Deactivate the timer """
+        timer_token, phase_token = self._tokens.pop()
+        _current_phase.reset(phase_token)
+        _current_timer.reset(timer_token)
+
+    def add(self, name, duration):
+        """ Add to the duration of a phase
+
+        Args:
+            name (:obj:`str`): name of the phase
+            duration (:obj:`float`): duration in seconds
+        """
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.) + duration
+
+
+@contextlib.contextmanager
+def phase(name):
+    """ Context manager which records the duration of a phase of the evaluation of a test case with the active
+    :obj:`PhaseTimer`. If no timer is active, the duration is not recorded.
+
+    Args:
+        name (:obj:`str`): name of the phase (e.g., ``execArchive``)
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    parent_name = _current_phase.get()
+    full_name = parent_name + '.' + name if parent_name else name
+    token = _current_phase.set(full_name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(full_name, time.perf_counter() - start)
+        _current_phase.reset(token)
+
+
+def get_phase_group(name):
+    """ Get the group of a phase for summarizing the durations of phases across test cases and synthetic archives by removing
+    the indices from its name (e.g., ``syntheticArchive:1.execArchive`` to ``syntheticArchive.execArchive``)
+
+    Args:
+        name (:obj:`str`): name of the phase
+
+    Returns:
+        :obj:`str`: group of the phase
+    """
+    return re.sub(r':\d+(?=\.|$)', '', name)
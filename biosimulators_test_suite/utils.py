@@ -7,10 +7,25 @@
 """
 
 from .config import Config
+import json
 import numpy
 import os
+import tempfile
+import traceback
 
-__all__ = ['get_singularity_image_filename', 'simulation_results_isnan']
+__all__ = [
+    'get_singularity_image_filename',
+    'simulation_results_isnan',
+    'simulation_results_any_isnan',
+    'SimulationResultsNanMask',
+    'iter_simulation_results_blocks',
+    'format_traceback',
+    'read_versioned_json',
+    'write_json_atomically',
+]
+
+# maximum number of elements of simulation results which are evaluated at once
+SIMULATION_RESULTS_BLOCK_SIZE = 2 ** 20
 
 
 def get_singularity_image_filename(docker_image):
@@ -50,3 +65,227 @@ def simulation_results_isnan(value):
             'Simulation results are {}.'
         ).format(value_type)
         raise TypeError(msg)
+
+
+def simulation_results_any_isnan(value, block_size=SIMULATION_RESULTS_BLOCK_SIZE):
+    """ Determine whether a scalar or any element of an array is NaN
+
+    Arrays are evaluated in blocks along their first dimension, until a block which contains NaN is found, so that the memory
+    used to evaluate large arrays is bounded. Arrays can also be objects which are read from files when they are sliced (e.g.,
+    HDF5 datasets, data sets of reports read lazily with :obj:`OutputsReader`).
+
+    Args:
+        value (:obj:`int`, :obj:`float`, :obj:`numpy.ndarray`, :obj:`h5py.Dataset`, or :obj:`OutputDataSet`): scalar or array
+        block_size (:obj:`int`, optional): maximum number of elements to evaluate at once
+
+    Returns:
+        :obj:`bool`: whether the value or any element of the value is NaN
+    """
+    for _, block in iter_simulation_results_blocks(value, block_size):
+        if numpy.any(simulation_results_isnan(block)):
+            return True
+    return False
+
+
+class SimulationResultsNanMask(object):
+    """ Summary of the NaN elements of simulation results, for checking whether several slices of the results contain NaN
+
+    The results are evaluated once, in blocks along their first dimension, and whether any and whether every element of each
+    block is NaN are recorded, rather than a mask of every element. A slice is then evaluated from these reductions for each
+    block which is either entirely NaN or free of NaN, and only the parts of the slice which intersect the other blocks are read
+    from the results (e.g., as hyperslabs of an HDF5 file). The memory used to evaluate large results is bounded.
+
+    Attributes:
+        value (:obj:`int`, :obj:`float`, :obj:`numpy.ndarray`, :obj:`h5py.Dataset`, or :obj:`OutputDataSet`): results
+        shape (:obj:`tuple` of :obj:`int`): shape of the results
+        block_slices (:obj:`list` of :obj:`slice`): slice of the first dimension of the results of each block
+        block_any (:obj:`list` of :obj:`bool`): whether any element of each block is NaN
+        block_all (:obj:`list` of :obj:`bool`): whether every element of each block is NaN
+    """
+
+    def __init__(self, value, block_size=SIMULATION_RESULTS_BLOCK_SIZE):
+        """
+        Args:
+            value (:obj:`int`, :obj:`float`, :obj:`numpy.ndarray`, :obj:`h5py.Dataset`, or :obj:`OutputDataSet`): scalar or
+                array
+            block_size (:obj:`int`, optional): maximum number of elements to evaluate at once
+        """
+        self.value = value
+        self.shape = tuple(getattr(value, 'shape', ()))
+        self.block_slices = []
+        self.block_any = []
+        self.block_all = []
+        for block_slice, block in iter_simulation_results_blocks(value, block_size):
+            block_isnan = simulation_results_isnan(block)
+            self.block_slices.append(block_slice)
+            self.block_any.append(bool(numpy.any(block_isnan)))
+            self.block_all.append(bool(numpy.all(block_isnan)))
+
+    def any(self, key=Ellipsis):
+        """ Determine whether any element of a slice of the results is NaN
+
+        Args:
+            key (:obj:`tuple` of :obj:`slice`, optional): slice of the results. Default: all of the results
+
+        Returns:
+            :obj:`bool`: whether any element of the slice is NaN
+        """
+        for block_any, block_all, block_key in self._get_block_keys(key):
+            if block_all:
+                return True
+            if block_any and numpy.any(simulation_results_isnan(self.value[block_key])):
+                return True
+        return False
+
+    def all(self, key=Ellipsis):
+        """ Determine whether every element of a slice of the results is NaN
+
+        Args:
+            key (:obj:`tuple` of :obj:`slice`, optional): slice of the results. Default: all of the results
+
+        Returns:
+            :obj:`bool`: whether every element of the slice is NaN
+        """
+        for block_any, block_all, block_key in self._get_block_keys(key):
+            if not block_any:
+                return False
+            if not block_all and not numpy.all(simulation_results_isnan(self.value[block_key])):
+                return False
+        return True
+
+    def _get_block_keys(self, key):
+        """ Get the intersections of a slice of the results with the blocks of the results
+
+        Args:
+            key (:obj:`tuple` of :obj:`slice`): slice of the results
+
+        Returns:
+            :obj:`types.GeneratorType`: generator of tuples of whether any and whether every element of each block which
+            intersects the slice is NaN, and the intersection of the slice with the block
+        """
+        if not self.shape:
+            yield self.block_any[0], self.block_all[0], Ellipsis
+            return
+
+        if not isinstance(key, tuple):
+            key = (key,)
+        if Ellipsis in key:
+            i_ellipsis = key.index(Ellipsis)
+            key = key[0:i_ellipsis] + (slice(None),) * (len(self.shape) - len(key) + 1) + key[i_ellipsis + 1:]
+        key = key + (slice(None),) * (len(self.shape) - len(key))
+
+        for dim_len, dim_key in zip(self.shape[1:], key[1:]):
+            if not range(*dim_key.indices(dim_len)):
+                return
+
+        # the rows of the slice are visited in increasing order, which doesn't change whether any or every element is NaN
+        rows = range(*key[0].indices(self.shape[0]))
+        if rows.step < 0:
+            rows = rows[::-1]
+
+        for block_slice, block_any, block_all in zip(self.block_slices, self.block_any, self.block_all):
+            block_rows = rows[
+                max(0, -(-(block_slice.start - rows.start) // rows.step)):
+                max(0, -(-(block_slice.stop - rows.start) // rows.step))
+            ]
+            if block_rows:
+                yield block_any, block_all, (slice(block_rows.start, block_rows.stop, block_rows.step),) + key[1:]
+
+
+def iter_simulation_results_blocks(value, block_size=SIMULATION_RESULTS_BLOCK_SIZE):
+    """ Iterate over blocks of the first dimension of simulation results
+
+    Args:
+        value (:obj:`int`, :obj:`float`, :obj:`numpy.ndarray`, :obj:`h5py.Dataset`, or :obj:`OutputDataSet`): scalar or array
+        block_size (:obj:`int`, optional): maximum number of elements of each block
+
+    Returns:
+        :obj:`types.GeneratorType`: generator of tuples of the slice of each block and the values of the block. Scalars are
+        returned as a single block.
+    """
+    shape = getattr(value, 'shape', ())
+    if not shape:
+        yield Ellipsis, (value[()] if hasattr(value, 'shape') else value)
+        return
+
+    row_size = 1
+    for dim_len in shape[1:]:
+        row_size *= dim_len
+    n_rows = max(1, block_size // max(1, row_size))
+
+    for i_row in range(0, shape[0], n_rows):
+        block_slice = slice(i_row, i_row + n_rows)
+        yield block_slice, value[block_slice]
+
+
+def format_traceback(exception_traceback):
+    """ Format a traceback, or a summary of the frames of a traceback, into a list of lines
+
+    Args:
+        exception_traceback (:obj:`types.TracebackType`, :obj:`traceback.StackSummary`, or :obj:`list` of :obj:`str`): traceback,
+            summary of its frames, or its already formatted lines (e.g., read from a report)
+
+    Returns:
+        :obj:`list` of :obj:`str`: formatted lines of the traceback
+    """
+    if isinstance(exception_traceback, traceback.StackSummary):
+        return exception_traceback.format()
+    if isinstance(exception_traceback, list):
+        return exception_traceback
+    return traceback.format_tb(exception_traceback)
+
+
+def read_versioned_json(filename, version):
+    """ Read a JSON file which was saved with :obj:`write_json_atomically` (e.g., an index or a table which is saved between runs)
+
+    Args:
+        filename (:obj:`str`): path to the file, or :obj:`None`
+        version (:obj:`object`): expected value of the ``version`` key of the file
+
+    Returns:
+        :obj:`dict`: contents of the file, or :obj:`None` if the path is :obj:`None`, or the file doesn't exist, can't be read, or
+        has another version
+    """
+    if not filename or not os.path.isfile(filename):
+        return None
+
+    try:
+        with open(filename, 'r') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('version', None) != version:
+        return None
+
+    return data
+
+
+def write_json_atomically(filename, data):
+    """ Save a JSON file which is only an optimization (e.g., an index or a table which is saved between runs)
+
+    The data is written to a temporary file which then replaces the file, so that concurrent readers never read a partially
+    written file. Failures to save the file (e.g., because its directory isn't writable) are ignored.
+
+    Args:
+        filename (:obj:`str`): path to the file, or :obj:`None` to not save the data
+        data (:obj:`dict`): data
+    """
+    if not filename:
+        return
+
+    try:
+        dirname = os.path.dirname(os.path.abspath(filename))
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        file_descriptor, temp_filename = tempfile.mkstemp(dir=dirname, suffix='.json')
+        try:
+            with os.fdopen(file_descriptor, 'w') as file:
+                json.dump(data, file)
+            os.replace(temp_filename, filename)
+        except Exception:
+            os.remove(temp_filename)
+            raise
+    except OSError:
+        pass
@@ -0,0 +1,362 @@
+""" Watchdog for enforcing time limits on the evaluation of test cases
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2021-06-21
+:Copyright: 2021, Center for Reproducible Biomedical Modeling
+:License: MIT
+"""
+
+from .exceptions import TimeoutException
+import contextvars
+import docker
+import os
+import signal
+import subprocess
+import threading
+import uuid
+
+__all__ = ['Watchdog']
+
+_current_watchdog = contextvars.ContextVar('current_watchdog', default=None)
+_popen_tracking_lock = threading.Lock()
+_popen_tracking_count = 0
+_original_popen = None
+
+
+class Watchdog(object):
+    """ Context manager which enforces a time limit on the evaluation of a test case
+
+    In contrast to :obj:`signal.alarm`, the watchdog can be used from any thread (e.g., inside worker threads and processes) and
+    supports fractional seconds. When the time limit expires, the watchdog
+
+    * stops the Docker containers which were started by the test case (e.g., containers started by
+      :obj:`biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator`) and the Docker
+      containers which bind mount directories inside the working directory of the test case,
+    * kills the subprocesses which were started by the test case (e.g., command-line interfaces started by
+      :obj:`biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli`, Singularity), and
+    * raises a :obj:`TimeoutException` in the thread which entered the context. In the main thread, the exception is raised
+      by a ``SIGALRM`` handler when the time limit expires, which also interrupts Python code. In other threads (and on
+      platforms without ``SIGALRM``), the exception is raised when the context exits (e.g., after the subprocess which the
+      thread was waiting for was killed).
+
+    The subprocesses of a test case are the subprocesses which are started with :obj:`subprocess.Popen` (e.g., by
+    :obj:`subprocess.run`) in the context which entered the watchdog, including in threads which run copies of this context
+    (e.g., threads which execute the synthetic archives of a test case concurrently), so that the subprocesses of other threads
+    (e.g., threads which prepare upcoming test cases) are not killed. To track them, :obj:`subprocess.Popen` is replaced with
+    a subclass while at least one watchdog is active, and restored when the last active watchdog exits. The subclass labels the
+    containers which the subprocesses start with ``docker run`` with the id of the watchdog, so that they can be identified
+    even if they bind mount directories outside the working directory (e.g., inside the directory mapped by
+    ``TEMP_DIR_HOST_PATH`` when the test suite runs inside Docker).
+
+    Attributes:
+        LABEL (:obj:`str`): label of the Docker containers started by the test case
+        id (:obj:`str`): unique id of the watchdog
+        seconds (:obj:`float`): time limit in seconds
+        working_dirname (:obj:`str`): working directory of the test case
+        expired (:obj:`bool`): whether the time limit expired
+        _processes (:obj:`list` of :obj:`subprocess.Popen`): subprocesses started by the test case
+        _use_alarm (:obj:`bool`): whether the time limit is enforced with ``SIGALRM``
+        _previous_alarm_handler (:obj:`object`): ``SIGALRM`` handler which was active when the context was entered
+        _timer (:obj:`threading.Timer`): timer
+        _lock (:obj:`threading.RLock`): lock which guards against the simultaneous expiration and exit of the context
+        _active (:obj:`bool`): whether the context is active
+        _token (:obj:`contextvars.Token`): token for restoring the previously active watchdog
+        _tracking_popen (:obj:`bool`): whether the watchdog holds a reference to the replacement of :obj:`subprocess.Popen`
+    """
+
+    LABEL = 'biosimulators-test-suite.watchdog'
+
+    def __init__(self, seconds, working_dirname=None):
+        """
+        Args:
+            seconds (:obj:`float`): time limit in seconds
+            working_dirname (:obj:`str`, optional): working directory of the test case
+        """
+        self.id = uuid.uuid4().hex
+        self.seconds = seconds
+        self.working_dirname = working_dirname
+        self.expired = False
+        self._processes = []
+        self._use_alarm = False
+        self._previous_alarm_handler = None
+        self._timer = None
+        self._lock = threading.RLock()
+        self._active = False
+        self._token = None
+        self._tracking_popen = False
+
+    def __enter__(self):
+        """ Start the watchdog """
+        _track_popen()
+        self._tracking_popen = True
+
+        self.expired = False
+        self._processes = []
+        self._token = _current_watchdog.set(self)
+        self._active = True
+
+        self._use_alarm = hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+        if self._use_alarm:
+            self._previous_alarm_handler = signal.signal(signal.SIGALRM, self._handle_alarm)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+        else:
+            self._timer = threading.Timer(self.seconds, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Stop the watchdog
+
+        Raises:
+            :obj:`TimeoutException`: if the time limit expired
+        """
+        with self._lock:
+            self._active = False
+        if self._use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_alarm_handler)
+        else:
+            self._timer.cancel()
+        _current_watchdog.reset(self._token)
+
+        try:
+            if self.expired:
+                # stop any processes which were started after the time limit expired
+                self.stop_processes()
+        finally:
+            if self._tracking_popen:
+                self._tracking_popen = False
+                _untrack_popen()
+
+        if self.expired:
+            raise TimeoutException("Operation did not complete within {} seconds".format(self.seconds))
+
+    def _expire(self):
+        """ Stop the processes started by the test case when the time limit expires
+
+        Returns:
+            :obj:`bool`: whether the watchdog was active
+        """
+        with self._lock:
+            if not self._active:
+                return False
+            self.expired = True
+            self.stop_processes()
+            return True
+
+    def _handle_alarm(self, signum, frame):
+        """ Stop the processes started by the test case and interrupt the main thread when the time limit expires
+
+        Args:
+            signum (:obj:`int`): signal number
+            frame (:obj:`types.FrameType`): current stack frame
+        """
+        if self._expire():
+            raise TimeoutException("Operation did not complete within {} seconds".format(self.seconds))
+
+    def add_process(self, process):
+        """ Track a subprocess started by the test case so that it can be killed when the time limit expires
+
+        Args:
+            process (:obj:`subprocess.Popen`): subprocess
+        """
+        with self._lock:
+            self._processes.append(process)
+            if self.expired:
+                kill_process_tree(process.pid)
+
+    def label_docker_run_args(self, args):
+        """ Label the Docker container started by a subprocess with the id of the watchdog so that it can be stopped when the
+        time limit expires. Detached containers (e.g., :obj:`PersistentSimulatorContainer`) are not labeled because they can
+        outlive the test case.
+
+        Args:
+            args (:obj:`list` of :obj:`str` or :obj:`str`): arguments of the subprocess
+
+        Returns:
+            :obj:`list` of :obj:`str` or :obj:`str`: arguments of the subprocess, with a label if the subprocess runs a container
+        """
+        if not isinstance(args, (list, tuple)):
+            return args
+
+        for i_arg, arg in enumerate(args[0:2]):
+            if isinstance(arg, str) and os.path.basename(arg) == 'docker':
+                if list(args[i_arg + 1:i_arg + 2]) != ['run'] or '--detach' in args or '-d' in args:
+                    return args
+                return (list(args[0:i_arg + 2])
+                        + ['--label', '{}={}'.format(self.LABEL, self.id)]
+                        + list(args[i_arg + 2:]))
+
+        return args
+
+    def stop_processes(self):
+        """ Stop the Docker containers and subprocesses started by the test case """
+        stop_docker_containers_with_label('{}={}'.format(self.LABEL, self.id))
+        if self.working_dirname:
+            stop_docker_containers_with_mounts_in_dir(self.working_dirname)
+
+        # subprocesses which were already waited for are skipped because their ids may have been reused by other processes
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            if process.returncode is None:
+                kill_process_tree(process.pid)
+
+
+class _TrackedPopen(subprocess.Popen):
+    """ :obj:`subprocess.Popen` which registers its process with the watchdog of the context which started it """
+
+    def __init__(self, *args, **kwargs):
+        watchdog = _current_watchdog.get()
+        if watchdog is not None:
+            if args:
+                args = (watchdog.label_docker_run_args(args[0]),) + args[1:]
+            elif 'args' in kwargs:
+                kwargs['args'] = watchdog.label_docker_run_args(kwargs['args'])
+
+        super(_TrackedPopen, self).__init__(*args, **kwargs)
+        if watchdog is not None:
+            watchdog.add_process(self)
+
+
+def _track_popen():
+    """ Replace :obj:`subprocess.Popen` with :obj:`_TrackedPopen` so that the subprocesses started by test cases are
+    registered with their watchdogs. Each call must be paired with a call to :obj:`_untrack_popen`.
+    """
+    global _popen_tracking_count, _original_popen
+    with _popen_tracking_lock:
+        if _popen_tracking_count == 0 and subprocess.Popen is not _TrackedPopen:
+            _original_popen = subprocess.Popen
+            subprocess.Popen = _TrackedPopen
+        _popen_tracking_count += 1
+
+
+def _untrack_popen():
+    """ Restore the original :obj:`subprocess.Popen` when the last active watchdog exits """
+    global _popen_tracking_count, _original_popen
+    with _popen_tracking_lock:
+        _popen_tracking_count -= 1
+        if _popen_tracking_count == 0:
+            # another replacement of :obj:`subprocess.Popen` (e.g., a mock) which was installed meanwhile is left in place
+            if subprocess.Popen is _TrackedPopen and _original_popen is not None:
+                subprocess.Popen = _original_popen
+            _original_popen = None
+
+
+def stop_docker_containers_with_label(label):
+    """ Stop the running Docker containers which have a label
+
+    Args:
+        label (:obj:`str`): label (``key=value``)
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the stopped containers
+    """
+    try:
+        docker_client = docker.from_env()
+        containers = docker_client.containers.list(filters={'label': label})
+    except Exception:
+        return []
+
+    stopped_container_ids = []
+    for container in containers:
+        try:
+            container.kill()
+            stopped_container_ids.append(container.id)
+        except Exception:
+            pass
+
+    return stopped_container_ids
+
+
+def stop_docker_containers_with_mounts_in_dir(dirname):
+    """ Stop the running Docker containers which bind mount a directory or a file inside a directory
+
+    Args:
+        dirname (:obj:`str`): directory
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the stopped containers
+    """
+    dirname = os.path.realpath(dirname)
+
+    try:
+        docker_client = docker.from_env()
+        containers = docker_client.containers.list()
+    except Exception:
+        return []
+
+    stopped_container_ids = []
+    for container in containers:
+        for mount in container.attrs.get('Mounts', []):
+            source = mount.get('Source', None)
+            if source and (source == dirname or source.startswith(dirname + os.sep)):
+                try:
+                    container.kill()
+                    stopped_container_ids.append(container.id)
+                except Exception:
+                    pass
+                break
+
+    return stopped_container_ids
+
+
+def get_child_process_ids(pid):
+    """ Get the ids of the child processes of a process
+
+    Args:
+        pid (:obj:`int`): id of the parent process
+
+    Returns:
+        :obj:`set` of :obj:`int`: ids of the child processes; empty if the process table is not available (e.g., on Windows)
+    """
+    return set(_get_process_children().get(pid, []))
+
+
+def kill_process_tree(pid):
+    """ Kill a process and its descendants
+
+    Args:
+        pid (:obj:`int`): id of the process
+    """
+    children = _get_process_children()
+
+    pids = []
+    pids_to_visit = [pid]
+    while pids_to_visit:
+        pid_to_visit = pids_to_visit.pop()
+        pids.append(pid_to_visit)
+        pids_to_visit.extend(children.get(pid_to_visit, []))
+
+    for pid_to_kill in reversed(pids):
+        try:
+            os.kill(pid_to_kill, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except OSError:
+            pass
+
+
+def _get_process_children():
+    """ Get a map from the id of each process to the ids of its child processes
+
+    Returns:
+        :obj:`dict` of :obj:`int` to :obj:`list` of :obj:`int`: map from the id of each process to the ids of its child processes
+    """
+    children = {}
+    if not os.path.isdir('/proc'):
+        return children
+
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(os.path.join('/proc', name, 'stat'), 'r') as file:
+                stat = file.read()
+        except OSError:
+            continue
+
+        # the name of the executable may contain spaces and parentheses; the parent id is the second field after it
+        ppid = int(stat.rpartition(')')[2].split()[1])
+        children.setdefault(ppid, []).append(int(name))
+
+    return children
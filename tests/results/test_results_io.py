@@ -1,7 +1,9 @@
 from biosimulators_test_suite import __version__
 from biosimulators_test_suite.data_model import TestCase
-from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType
-from biosimulators_test_suite.results.io import write_test_results
+from biosimulators_test_suite.exceptions import SkippedTestCaseException
+from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType, ReportedTestCase
+from biosimulators_test_suite.results.io import (write_test_results, read_test_results, TestResultsJsonLinesWriter,
+                                                 read_test_results_jsonl)
 from biosimulators_test_suite.warnings import TestCaseWarning
 import json
 import os
@@ -58,9 +60,13 @@ class ResultsIoTestCase(unittest.TestCase):
                 ],
                 'skipReason': None,
                 'log': 'Long log',
+                'timings': {},
+                'provenance': None,
             }],
             'ghIssue': None,
             'ghActionRun': None,
+            'specifications': None,
+            'imageDigest': None,
         }
 
         self.dirname = tempfile.mkdtemp()
@@ -79,3 +85,88 @@ class ResultsIoTestCase(unittest.TestCase):
             results = json.load(file)
 
         self.assertEqual(results, self.expected_results_report)
+
+    def test_write_read_test_results_with_specifications(self):
+        self.results[0].provenance = {'testSuiteVersion': __version__, 'ghIssue': 10, 'ghActionRun': 20}
+        specifications = {'id': 'tellurium', 'image': {'url': 'ghcr.io/biosimulators/tellurium:2.2.0'}}
+
+        filename = os.path.join(self.dirname, 'results.json')
+        write_test_results(self.results, filename, gh_issue=11, specifications=specifications, image_digest='sha256:1')
+        report = read_test_results(filename)
+        self.assertEqual(report.gh_issue, 11)
+        self.assertEqual(report.specifications, specifications)
+        self.assertEqual(report.image_digest, 'sha256:1')
+        self.assertEqual(report.results[0].provenance, self.results[0].provenance)
+        self.assertIsInstance(report.results[0].exception, NotImplementedError)
+
+        filename = os.path.join(self.dirname, 'results.jsonl')
+        with TestResultsJsonLinesWriter(filename, specifications=specifications, image_digest='sha256:1') as writer:
+            writer.write(self.results[0])
+        report = read_test_results_jsonl(filename)
+        self.assertEqual(report.specifications, specifications)
+        self.assertEqual(report.image_digest, 'sha256:1')
+        self.assertEqual(report.results[0].provenance, self.results[0].provenance)
+
+    def test_write_read_test_results_jsonl(self):
+        skipped_result = TestCaseResult(
+            case=self.results[0].case,
+            type=TestCaseResultType.skipped,
+            duration=0.5,
+            skip_reason=SkippedTestCaseException('Not applicable'),
+        )
+        expected_results_report = dict(self.expected_results_report)
+        expected_results_report['results'] = self.expected_results_report['results'] + [skipped_result.to_dict()]
+        expected_results_report['ghIssue'] = 10
+
+        filename = os.path.join(self.dirname, 'results.jsonl')
+        with TestResultsJsonLinesWriter(filename, gh_issue=10) as writer:
+            writer.write(self.results[0])
+
+            # results are readable before the writer is closed
+            self.assertEqual(len(read_test_results_jsonl(filename).results), 1)
+
+            writer.write(skipped_result)
+
+        with open(filename, 'r') as file:
+            self.assertEqual(len(file.readlines()), 3)
+
+        report = read_test_results_jsonl(filename)
+        self.assertEqual(report.to_dict(), expected_results_report)
+        self.assertIsInstance(report.results[0].case, ReportedTestCase)
+        self.assertIsInstance(report.results[0].exception, NotImplementedError)
+        self.assertTrue(issubclass(report.results[0].warnings[0].category, TestCaseWarning))
+        self.assertIsInstance(report.results[1].skip_reason, SkippedTestCaseException)
+
+    def test_read_test_results_jsonl_with_incomplete_line(self):
+        filename = os.path.join(self.dirname, 'results.jsonl')
+        with TestResultsJsonLinesWriter(filename) as writer:
+            writer.write(self.results[0])
+        with open(filename, 'a') as file:
+            file.write('{"case": {"id": "sedml.')
+
+        report = read_test_results_jsonl(filename)
+        self.assertEqual(report.to_dict(), self.expected_results_report)
+
+        with open(filename, 'a') as file:
+            file.write('\n{}\n'.format(json.dumps(self.results[0].to_dict())))
+        with self.assertRaisesRegex(ValueError, 'Line 3 .* is not valid JSON'):
+            read_test_results_jsonl(filename)
+
+    def test_TestCaseResult_from_dict_with_custom_classes(self):
+        class CustomException(Exception):
+            pass
+
+        result = TestCaseResult(
+            case=self.results[0].case,
+            type=TestCaseResultType.failed,
+            duration=1.,
+            exception=CustomException('Custom message'),
+            exception_traceback=['  File "x.py", line 1, in <module>\n'],
+        )
+        loaded_result = TestCaseResult().from_dict(result.to_dict())
+        self.assertEqual(loaded_result.to_dict(), result.to_dict())
+        self.assertEqual(loaded_result.exception.__class__.__name__, 'CustomException')
+
+        result.exception = KeyError('key')
+        loaded_result = TestCaseResult().from_dict(result.to_dict())
+        self.assertEqual(loaded_result.to_dict(), result.to_dict())
@@ -0,0 +1,81 @@
+from biosimulators_test_suite import algorithm_substitution
+from biosimulators_test_suite.algorithm_substitution import AlgorithmSubstitutionTable, get_algorithm_substitution_table
+from kisao import Kisao
+from kisao.data_model import AlgorithmSubstitutionPolicy
+from kisao.utils import get_substitutable_algorithms_for_policy
+from unittest import mock
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class AlgorithmSubstitutionTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'table', 'algorithm-substitution-table.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_substitutable_algorithm_ids(self):
+        table = AlgorithmSubstitutionTable(self.filename)
+
+        kisao = Kisao()
+        for policy in [AlgorithmSubstitutionPolicy.SAME_METHOD, AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES]:
+            for kisao_id in ['KISAO_0000019', 'KISAO_0000029']:
+                expected_ids = kisao.get_term_ids(get_substitutable_algorithms_for_policy(kisao.get_term(kisao_id), policy))
+                self.assertEqual(table.get_substitutable_algorithm_ids(kisao_id, policy), sorted(expected_ids))
+
+        # default policy
+        self.assertEqual(table.get_substitutable_algorithm_ids('KISAO_0000019'),
+                         table.get_substitutable_algorithm_ids('KISAO_0000019', AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES))
+
+        # callers can't modify the table
+        table.get_substitutable_algorithm_ids('KISAO_0000019').clear()
+        self.assertIn('KISAO_0000019', table.get_substitutable_algorithm_ids('KISAO_0000019'))
+
+        # errors
+        with self.assertRaisesRegex(ValueError, 'No KiSAO term'):
+            table.get_substitutable_algorithm_ids('KISAO_9999999')
+
+    def test_save_read(self):
+        table = AlgorithmSubstitutionTable(self.filename)
+        sub_alg_ids = table.get_substitutable_algorithm_ids('KISAO_0000019')
+        self.assertTrue(os.path.isfile(self.filename))
+
+        # the saved table is read rather than rebuilt
+        table = AlgorithmSubstitutionTable(self.filename)
+        with mock.patch.object(AlgorithmSubstitutionTable, 'build_policy_table', side_effect=Exception('rebuilt')):
+            self.assertEqual(table.get_substitutable_algorithm_ids('KISAO_0000019'), sub_alg_ids)
+
+        # the table is rebuilt for other versions of KiSAO
+        with open(self.filename, 'r') as file:
+            saved_table = json.load(file)
+        saved_table['version'][1] = 'other'
+        with open(self.filename, 'w') as file:
+            json.dump(saved_table, file)
+
+        table = AlgorithmSubstitutionTable(self.filename)
+        with mock.patch.object(AlgorithmSubstitutionTable, 'build_policy_table', return_value={}) as build_policy_table:
+            table.get_substitutable_algorithm_ids('KISAO_0000019')
+        build_policy_table.assert_called_once_with(AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES)
+
+        # invalid tables are ignored
+        with open(self.filename, 'w') as file:
+            file.write('{')
+        self.assertEqual(AlgorithmSubstitutionTable(self.filename).read(), {})
+
+        # the table isn't saved without a filename, and failures to save the table are ignored
+        self.assertEqual(AlgorithmSubstitutionTable().get_substitutable_algorithm_ids('KISAO_0000019'), sub_alg_ids)
+        with mock.patch('os.makedirs', side_effect=PermissionError('not writable')):
+            table = AlgorithmSubstitutionTable(os.path.join(self.dirname, 'other', 'table.json'))
+            self.assertEqual(table.get_substitutable_algorithm_ids('KISAO_0000019'), sub_alg_ids)
+
+    def test_get_algorithm_substitution_table(self):
+        with mock.patch.object(algorithm_substitution, '_algorithm_substitution_table', None):
+            with mock.patch.dict(os.environ, {'ALGORITHM_SUBSTITUTION_TABLE_FILENAME': self.filename}):
+                table = get_algorithm_substitution_table()
+            self.assertEqual(table.filename, self.filename)
+            self.assertIs(get_algorithm_substitution_table(), table)
@@ -0,0 +1,163 @@
+from biosimulators_test_suite import archive_assembler
+from biosimulators_test_suite.archive_assembler import CombineArchiveAssembler, SedmlSimulationStringWriter, is_member_unchanged
+from biosimulators_test_suite.test_case.published_project import CuratedArchiveCache, EXAMPLES_DIR
+from biosimulators_utils.combine.io import CombineArchiveReader
+from biosimulators_utils.sedml.io import SedmlSimulationReader
+from unittest import mock
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+
+class CombineArchiveAssemblerTestCase(unittest.TestCase):
+    CURATED_ARCHIVE_FILENAME = os.path.join(EXAMPLES_DIR, 'sbml-core', 'Tomida-EMBO-J-2003-NFAT-translocation.omex')
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.archive_dirname = os.path.join(self.dirname, 'archive')
+        self.archive, self.sed_docs = CuratedArchiveCache().extract(self.CURATED_ARCHIVE_FILENAME, self.archive_dirname)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_run(self):
+        sed_location = list(self.sed_docs.keys())[0]
+        sed_doc = self.sed_docs[sed_location]
+        sed_doc.simulations[0].id = 'synthetic_simulation'
+        for task in sed_doc.tasks:
+            task.simulation = sed_doc.simulations[0]
+
+        # modify a file of the curated archive
+        with open(os.path.join(self.archive_dirname, 'metadata.rdf'), 'a') as file:
+            file.write('\n')
+
+        filename = os.path.join(self.dirname, 'archive.omex')
+        CombineArchiveAssembler().run(self.archive, self.archive_dirname, filename, sed_docs=self.sed_docs,
+                                      source_filename=self.CURATED_ARCHIVE_FILENAME)
+
+        with zipfile.ZipFile(filename, 'r') as zip_file, zipfile.ZipFile(self.CURATED_ARCHIVE_FILENAME, 'r') as curated_zip_file:
+            self.assertIsNone(zip_file.testzip())
+            self.assertEqual(sorted(zip_file.namelist()), sorted(curated_zip_file.namelist()))
+
+            # unchanged files are copied without recompression
+            for name in ['BIOMD0000000678_url.xml', 'reports.h5', 'Figure3a.jpg']:
+                info = zip_file.getinfo(name)
+                curated_info = curated_zip_file.getinfo(name)
+                self.assertEqual(info.compress_size, curated_info.compress_size)
+                self.assertEqual(info.CRC, curated_info.CRC)
+                self.assertEqual(zip_file.read(name), curated_zip_file.read(name))
+
+            # changed files and SED documents are read from the directory and serialized
+            with open(os.path.join(self.archive_dirname, 'metadata.rdf'), 'rb') as file:
+                self.assertEqual(zip_file.read('metadata.rdf'), file.read())
+            self.assertIn(b'synthetic_simulation', zip_file.read(CombineArchiveAssembler.get_member_name(sed_location)))
+
+        archive_dirname = os.path.join(self.dirname, 'assembled')
+        archive = CombineArchiveReader().run(filename, archive_dirname)
+        self.assertEqual(
+            sorted(content.location for content in archive.contents if content.location not in CuratedArchiveCache.MANIFEST_LOCATIONS),
+            sorted(content.location for content in self.archive.contents))
+
+        doc = SedmlSimulationReader().run(os.path.join(archive_dirname, sed_location))
+        self.assertEqual(doc.simulations[0].id, 'synthetic_simulation')
+
+    def test_run_without_compression(self):
+        filename = os.path.join(self.dirname, 'archive.omex')
+        CombineArchiveAssembler(compression=zipfile.ZIP_STORED).run(self.archive, self.archive_dirname, filename)
+
+        with zipfile.ZipFile(filename, 'r') as zip_file:
+            self.assertIsNone(zip_file.testzip())
+            for info in zip_file.infolist():
+                self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+                self.assertEqual(info.compress_size, info.file_size)
+
+    def test_round_trip(self):
+        sed_location = list(self.sed_docs.keys())[0]
+        self.sed_docs[sed_location].simulations[0].id = 'synthetic_simulation'
+        for task in self.sed_docs[sed_location].tasks:
+            task.simulation = self.sed_docs[sed_location].simulations[0]
+
+        for compression in [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED]:
+            for can_copy_compressed_members in [True, False]:
+                filename = os.path.join(self.dirname, 'archive.omex')
+                with mock.patch.object(archive_assembler, 'can_copy_compressed_members', return_value=can_copy_compressed_members):
+                    CombineArchiveAssembler(compression=compression).run(self.archive, self.archive_dirname, filename,
+                                                                         sed_docs=self.sed_docs,
+                                                                         source_filename=self.CURATED_ARCHIVE_FILENAME)
+
+                with zipfile.ZipFile(filename, 'r') as zip_file:
+                    self.assertIsNone(zip_file.testzip())
+
+                archive_dirname = os.path.join(self.dirname, 'assembled')
+                archive = CombineArchiveReader().run(filename, archive_dirname)
+                self.assertEqual(
+                    sorted((content.location, content.format, content.master) for content in archive.contents
+                           if content.location not in CuratedArchiveCache.MANIFEST_LOCATIONS),
+                    sorted((content.location, content.format, content.master) for content in self.archive.contents))
+
+                for content in self.archive.contents:
+                    if content.location == sed_location:
+                        continue
+                    with open(os.path.join(self.archive_dirname, content.location), 'rb') as file:
+                        expected_data = file.read()
+                    with open(os.path.join(archive_dirname, content.location), 'rb') as file:
+                        self.assertEqual(file.read(), expected_data, content.location)
+
+                doc = SedmlSimulationReader().run(os.path.join(archive_dirname, sed_location))
+                self.assertEqual(doc.simulations[0].id, 'synthetic_simulation')
+
+                shutil.rmtree(archive_dirname)
+                os.remove(filename)
+
+    def test_copy_member_without_zipfile_internals(self):
+        filename = os.path.join(self.dirname, 'archive.omex')
+        with zipfile.ZipFile(self.CURATED_ARCHIVE_FILENAME, 'r') as curated_zip_file:
+            with zipfile.ZipFile(filename, 'w') as zip_file:
+                self.assertTrue(archive_assembler.can_copy_compressed_members(zip_file))
+                with mock.patch.object(archive_assembler, 'can_copy_compressed_members', return_value=False):
+                    archive_assembler.copy_member(curated_zip_file, 'reports.h5', zip_file)
+
+            with zipfile.ZipFile(filename, 'r') as zip_file:
+                self.assertIsNone(zip_file.testzip())
+                info = zip_file.getinfo('reports.h5')
+                curated_info = curated_zip_file.getinfo('reports.h5')
+                self.assertEqual(info.compress_type, curated_info.compress_type)
+                self.assertEqual(info.CRC, curated_info.CRC)
+                self.assertEqual(zip_file.read('reports.h5'), curated_zip_file.read('reports.h5'))
+
+        # versions of :obj:`zipfile` without the internals fall back to the public API
+        with zipfile.ZipFile(filename, 'w') as zip_file:
+            with mock.patch.dict(zipfile.__dict__):
+                del zipfile.__dict__['_FH_EXTRA_FIELD_LENGTH']
+                self.assertFalse(archive_assembler.can_copy_compressed_members(zip_file))
+
+    def test_get_member_name(self):
+        self.assertEqual(CombineArchiveAssembler.get_member_name('./model.xml'), 'model.xml')
+        self.assertEqual(CombineArchiveAssembler.get_member_name('dir/./model.xml'), 'dir/model.xml')
+        self.assertEqual(CombineArchiveAssembler.get_member_name('model.xml'), 'model.xml')
+
+    def test_is_member_unchanged(self):
+        filename = os.path.join(self.archive_dirname, 'metadata.rdf')
+        with zipfile.ZipFile(self.CURATED_ARCHIVE_FILENAME, 'r') as zip_file:
+            self.assertTrue(is_member_unchanged(zip_file, 'metadata.rdf', filename))
+            self.assertFalse(is_member_unchanged(zip_file, 'missing.rdf', filename))
+            self.assertFalse(is_member_unchanged(zip_file, 'metadata.rdf', os.path.join(self.archive_dirname, 'missing.rdf')))
+
+            with open(filename, 'rb') as file:
+                data = file.read()
+            with open(filename, 'wb') as file:
+                file.write(data[1:] + data[0:1])
+            self.assertFalse(is_member_unchanged(zip_file, 'metadata.rdf', filename))
+
+    def test_SedmlSimulationStringWriter(self):
+        sed_location = list(self.sed_docs.keys())[0]
+        filename = os.path.join(self.archive_dirname, sed_location)
+        sedml = SedmlSimulationStringWriter().run(self.sed_docs[sed_location], filename)
+        self.assertIn('<sedML', sedml)
+
+        with open(filename, 'w') as file:
+            file.write(sedml)
+        doc = SedmlSimulationReader().run(filename)
+        self.assertTrue(doc.is_equal(self.sed_docs[sed_location]))
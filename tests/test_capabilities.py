@@ -0,0 +1,77 @@
+from biosimulators_test_suite.capabilities import SimulatorCapabilities
+from biosimulators_test_suite.data_model import SedTaskRequirements
+from biosimulators_test_suite.test_case.published_project import SimulatorCanExecutePublishedProject
+import unittest
+
+
+class SimulatorCapabilitiesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.specifications = {
+            'id': 'tellurium',
+            'algorithms': [
+                {
+                    'kisaoId': {'id': 'KISAO_0000019'},
+                    'modelFormats': [{'id': 'format_2585', 'supportedFeatures': []}],
+                    'parameters': [],
+                    'dependentDimensions': [],
+                },
+                {
+                    'kisaoId': {'id': 'KISAO_0000019'},
+                    'modelFormats': [{'id': 'format_2585', 'supportedFeatures': ['fbc']}],
+                    'parameters': [{'kisaoId': {'id': 'KISAO_0000209'}, 'value': '1e-6'}],
+                },
+                {
+                    'kisaoId': {'id': 'KISAO_0000029'},
+                    'modelFormats': [{'id': 'format_2585', 'supportedFeatures': None}, {'id': 'format_3240'}],
+                    'parameters': [{'kisaoId': {'id': 'KISAO_0000488'}, 'value': None}],
+                },
+            ],
+        }
+
+    def test_supports_task(self):
+        capabilities = SimulatorCapabilities(self.specifications)
+
+        self.assertTrue(capabilities.supports_task('format_2585', set(), 'KISAO_0000019'))
+        self.assertTrue(capabilities.supports_task('format_2585', set(['fbc']), 'KISAO_0000019'))
+        self.assertTrue(capabilities.supports_task('format_2585', set(), 'KISAO_0000029'))
+        self.assertTrue(capabilities.supports_task('format_3240', set(), 'KISAO_0000029'))
+
+        self.assertFalse(capabilities.supports_task('format_2585', set(['fbc']), 'KISAO_0000029'))
+        self.assertFalse(capabilities.supports_task('format_3240', set(), 'KISAO_0000019'))
+        self.assertFalse(capabilities.supports_task('format_2585', set(), 'KISAO_0000088'))
+
+    def test_get_algorithm(self):
+        capabilities = SimulatorCapabilities(self.specifications)
+
+        self.assertIs(capabilities.get_algorithm('KISAO_0000019'), self.specifications['algorithms'][0])
+        self.assertIs(capabilities.get_algorithm('KISAO_0000029'), self.specifications['algorithms'][2])
+        self.assertEqual(capabilities.get_algorithm('KISAO_0000088'), None)
+
+    def test_get_algorithm_parameters(self):
+        capabilities = SimulatorCapabilities(self.specifications)
+
+        self.assertEqual(capabilities.get_algorithm_parameters('KISAO_0000019'), self.specifications['algorithms'][1]['parameters'])
+        self.assertEqual(capabilities.get_algorithm_parameters('KISAO_0000029'), self.specifications['algorithms'][2]['parameters'])
+        self.assertEqual(capabilities.get_algorithm_parameters('KISAO_0000088'), [])
+
+    def test_shared_by_test_cases(self):
+        capabilities = SimulatorCapabilities(self.specifications)
+
+        case = SimulatorCanExecutePublishedProject(
+            task_requirements=[
+                SedTaskRequirements(model_format='format_2585', model_format_features=set(), simulation_algorithm='KISAO_0000029'),
+                SedTaskRequirements(model_format='format_2585', model_format_features=set(['fbc']),
+                                    simulation_algorithm='KISAO_0000019'),
+            ],
+            capabilities=capabilities)
+        self.assertTrue(case.compatible_with_specifications(self.specifications))
+        self.assertIs(case.capabilities, capabilities)
+
+        # the index is rebuilt for other simulators
+        other_specifications = {'id': 'copasi', 'algorithms': []}
+        self.assertFalse(case.compatible_with_specifications(other_specifications))
+        self.assertIsNot(case.capabilities, capabilities)
+        self.assertIs(case.capabilities.specifications, other_specifications)
+
+        case.skipped_simulators = ['copasi']
+        self.assertFalse(case.compatible_with_specifications(other_specifications))
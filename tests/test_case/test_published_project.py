@@ -1,27 +1,39 @@
 from biosimulators_test_suite import data_model
+from biosimulators_test_suite import timing
+from biosimulators_test_suite import utils
+from biosimulators_test_suite.archive_assembler import CombineArchiveAssembler
+from biosimulators_test_suite.examples_index import ExamplesIndex
 from biosimulators_test_suite.exceptions import InvalidOutputsException, SkippedTestCaseException
+from biosimulators_test_suite.exec_cache import ExecutionCache
+from biosimulators_test_suite.model_index import get_model_attributes
+from biosimulators_test_suite.recording import route_thread_output
 from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType
 from biosimulators_test_suite.test_case.published_project import (
     SimulatorCanExecutePublishedProject, find_cases, SyntheticCombineArchiveTestCase,
-    ExpectedResultOfSyntheticArchive, UniformTimeCourseTestCase)
-from biosimulators_test_suite.warnings import IgnoredTestCaseWarning, SimulatorRuntimeErrorWarning, InvalidOutputsWarning
+    ExpectedResultOfSyntheticArchive, UniformTimeCourseTestCase, CuratedArchiveCache, EXAMPLES_DIR)
+from biosimulators_test_suite.warnings import (IgnoredTestCaseWarning, SimulatorRuntimeErrorWarning, InvalidOutputsWarning,
+                                               TestCaseWarning)
 from biosimulators_utils.archive.data_model import Archive, ArchiveFile
 from biosimulators_utils.archive.io import ArchiveWriter
 from biosimulators_utils.combine.data_model import CombineArchive
-from biosimulators_utils.combine.io import CombineArchiveReader, CombineArchiveWriter
+from biosimulators_utils.combine.io import CombineArchiveReader
+from biosimulators_utils.log.utils import StandardOutputErrorCapturer, StandardOutputErrorCapturerLevel
 from biosimulators_utils.report.data_model import DataSetResults
 from biosimulators_utils.report.io import ReportWriter, ReportFormat
 from biosimulators_utils.sedml.data_model import (SedDocument, Task, DataGenerator, Report,
                                                   DataSet, Plot2D, Symbol, Variable, Model, ModelLanguage)
 from unittest import mock
 import functools
+import h5py
 import json
 import os
 import numpy
 import numpy.testing
 import shutil
 import tempfile
+import threading
 import unittest
+import warnings
 
 
 class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
@@ -118,14 +130,14 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
         self.assertEqual(case.expected_reports[0].id, 'BIOMD0000000912_sim.sedml/report')
         self.assertEqual(set(data_set.label for data_set in case.expected_reports[0].data_sets), set(["time", "T", "E", "I"]))
         self.assertEqual(case.expected_reports[0].points, (5001,))
-        self.assertEqual(case.expected_reports[0].values, {
-            "data_set_time": {
-                (0,): 0.0,
-                (1,): 0.2,
-                (2,): 0.4,
-                (999,): 199.8,
-                (1000,): 200,
-            },
+        self.assertEqual(set(case.expected_reports[0].values.keys()), set(['data_set_time']))
+        self.assertEqual(case.expected_reports[0].values['data_set_time'].flat_indices.tolist(), [0, 1, 2, 999, 1000])
+        self.assertEqual(case.expected_reports[0].values['data_set_time'].to_dict(), {
+            (0,): 0.0,
+            (1,): 0.2,
+            (2,): 0.4,
+            (999,): 199.8,
+            (1000,): 200,
         })
         self.assertEqual(len(case.expected_plots), 1)
         self.assertEqual(case.expected_plots[0].id, 'BIOMD0000000912_sim.sedml/Figure_1_bottom_left')
@@ -137,6 +149,33 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
         self.assertEqual(case.r_tol, 1e-4)
         self.assertEqual(case.a_tol, 0.)
 
+    def test_SimulatorCanExecutePublishedProject_from_json_with_summary(self):
+        base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+        filename = os.path.join('sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations/expected-results.json')
+        expected_case = SimulatorCanExecutePublishedProject().from_json(base_path, filename)
+
+        entry = ExamplesIndex().get_entry(base_path, filename)
+        case = SimulatorCanExecutePublishedProject().from_json(base_path, filename, summary=entry['summary'])
+        self.assertEqual(case.id, expected_case.id)
+        self.assertEqual(case.name, expected_case.name)
+        self.assertEqual(case.filename, expected_case.filename)
+        self.assertEqual(case.description, expected_case.description)
+        self.assertEqual(case.skipped_simulators, expected_case.skipped_simulators)
+        self.assertEqual(case.r_tol, expected_case.r_tol)
+
+        # the expected results are read when they are first used
+        self.assertEqual(case._expected_results_filename, os.path.join(base_path, filename))
+        self.assertEqual([report.id for report in case.expected_reports], ['BIOMD0000000912_sim.sedml/report'])
+        self.assertEqual(case.expected_reports[0].values['data_set_time'].to_dict(),
+                         expected_case.expected_reports[0].values['data_set_time'].to_dict())
+        self.assertEqual([plot.id for plot in case.expected_plots], [plot.id for plot in expected_case.expected_plots])
+        self.assertEqual(case._expected_results_filename, None)
+
+        case = SimulatorCanExecutePublishedProject().from_json(base_path, filename, summary=entry['summary'])
+        case.expected_plots = []
+        self.assertEqual(case.expected_plots, [])
+        self.assertEqual(len(case.expected_reports), 1)
+
     def test_SimulatorCanExecutePublishedProject_eval(self):
         base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
         filename = os.path.join('sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations/expected-results.json')
@@ -410,6 +449,102 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
         if os.path.isdir(self.tmp_dirname):
             shutil.rmtree(self.tmp_dirname)
 
+    def test_SimulatorCanExecutePublishedProject_get_expected_value_mismatches_message(self):
+        case = SimulatorCanExecutePublishedProject()
+
+        msg = case.get_expected_value_mismatches_message('sim.sedml/report', 'x', [((3, 0), 1., 0.)], 1, 20)
+        self.assertEqual(msg, 'Data set x of report sim.sedml/report does not have expected values at 1 of 20 elements:\n  (3, 0): 1.0 != 0.0')
+
+        msg = case.get_expected_value_mismatches_message('sim.sedml/report', 'x', [((i_el, 0), 1., 0.) for i_el in range(20)], 20, 20)
+        self.assertIn('at 20 of 20 elements', msg)
+        self.assertIn('(9, 0): 1.0 != 0.0', msg)
+        self.assertNotIn('(10, 0)', msg)
+        self.assertIn('... and 10 more', msg)
+
+    def test_SimulatorCanExecutePublishedProject_from_dict_with_external_expected_values(self):
+        base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+        filename = os.path.join('sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations/expected-results.json')
+        with open(os.path.join(base_path, filename), 'r') as file:
+            data = json.load(file)
+        data['expectedReports'][0]['values'] = [
+            {'id': 'data_set_time', 'label': 'time', 'valueFile': {'filename': 'time.npy'}},
+            {'id': 'data_set_T', 'label': 'T', 'valueFile': {'filename': 'expected.h5', 'dataset': 'T'}},
+        ]
+        numpy.save(os.path.join(self.tmp_dirname, 'time.npy'), numpy.linspace(0., 1000., 5001))
+        with h5py.File(os.path.join(self.tmp_dirname, 'expected.h5'), 'w') as file:
+            file['T'] = numpy.zeros((5001,))
+
+        case = SimulatorCanExecutePublishedProject().from_dict(data, dirname=self.tmp_dirname)
+        values = case.expected_reports[0].values
+        self.assertIsInstance(values['data_set_time'], data_model.ExternalExpectedSedDataSetValues)
+        self.assertEqual(values['data_set_time'].filename, os.path.join(self.tmp_dirname, 'time.npy'))
+        self.assertEqual(values['data_set_time'].dataset, None)
+        self.assertEqual(values['data_set_T'].filename, os.path.join(self.tmp_dirname, 'expected.h5'))
+        self.assertEqual(values['data_set_T'].dataset, 'T')
+
+        data['expectedReports'][0]['values'][0]['valueFile']['filename'] = 'missing.npy'
+        id = ('published_project.SimulatorCanExecutePublishedProject:'
+              'sbml-core/Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations/expected-results.json')
+        with self.assertRaisesRegex(ValueError, 'does not exist'):
+            SimulatorCanExecutePublishedProject(id=id).from_dict(data, dirname=self.tmp_dirname)
+
+    def test_SimulatorCanExecutePublishedProject_compare_external_expected_values(self):
+        case = SimulatorCanExecutePublishedProject(r_tol=1e-6)
+        case.MAX_REPORTED_EXPECTED_VALUE_MISMATCHES = 2
+
+        value = numpy.arange(200.).reshape((100, 2))
+        numpy.save(os.path.join(self.tmp_dirname, 'expected.npy'), value)
+        with h5py.File(os.path.join(self.tmp_dirname, 'expected.h5'), 'w') as file:
+            file['value'] = value.reshape((100, 2, 1))
+
+        for expected_value in [
+            data_model.ExternalExpectedSedDataSetValues(os.path.join(self.tmp_dirname, 'expected.npy')),
+            data_model.ExternalExpectedSedDataSetValues(os.path.join(self.tmp_dirname, 'expected.h5'), 'value'),
+        ]:
+            with mock.patch('biosimulators_test_suite.test_case.published_project.iter_simulation_results_blocks',
+                            functools.partial(utils.iter_simulation_results_blocks, block_size=10)):
+                self.assertIsNone(case.compare_external_expected_values('report', 'x', value, expected_value))
+
+                actual_value = value.copy()
+                actual_value[10, 1] = -1.
+                actual_value[50, 0] = -1.
+                actual_value[99, 1] = -1.
+                msg = case.compare_external_expected_values('report', 'x', actual_value, expected_value)
+                self.assertIn('does not have expected values at 3 of 200 elements', msg)
+                self.assertIn('(10, 1): -1.0 != 21.0', msg)
+                self.assertIn('(50, 0): -1.0 != 100.0', msg)
+                self.assertIn('... and 1 more', msg)
+
+            msg = case.compare_external_expected_values('report', 'x', value[0:50], expected_value)
+            self.assertIn('does not have the expected shape', msg)
+
+        expected_value = data_model.ExternalExpectedSedDataSetValues(os.path.join(self.tmp_dirname, 'expected.h5'), 'missing')
+        msg = case.compare_external_expected_values('report', 'x', value, expected_value)
+        self.assertIn('could not be read', msg)
+
+    def test_SimulatorCanExecutePublishedProject_exec_sedml_docs_in_archive_with_exec_cache(self):
+        filename = os.path.join(EXAMPLES_DIR, 'sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations.omex')
+        cli = os.path.join(self.tmp_dirname, 'simulator')
+        with open(cli, 'w') as file:
+            file.write('#!/bin/sh\n')
+        os.chmod(cli, 0o755)
+
+        exec_cache = ExecutionCache(os.path.join(self.tmp_dirname, 'cache'))
+        case = SimulatorCanExecutePublishedProject(filename=filename, exec_cache=exec_cache)
+
+        def exec_sedml_docs_in_archive_with_simulator_cli(archive_filename, out_dir, cli, environment=None):
+            os.makedirs(out_dir)
+            with open(os.path.join(out_dir, 'reports.h5'), 'w') as file:
+                file.write('results')
+
+        with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli',
+                        side_effect=exec_sedml_docs_in_archive_with_simulator_cli) as exec_archive:
+            case.exec_sedml_docs_in_archive(None, os.path.join(self.tmp_dirname, 'outputs-1'), cli=cli)
+            case.exec_sedml_docs_in_archive(None, os.path.join(self.tmp_dirname, 'outputs-2'), cli=cli)
+        self.assertEqual(exec_archive.call_count, 1)
+        with open(os.path.join(self.tmp_dirname, 'outputs-2', 'reports.h5'), 'r') as file:
+            self.assertEqual(file.read(), 'results')
+
     def test_TestCaseResult(self):
         case = SimulatorCanExecutePublishedProject(id='case')
         exception = Exception('message')
@@ -438,6 +573,90 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
             with mock.patch.object(CombineArchiveReader, 'run', return_value=CombineArchive()):
                 case.eval(None, self.tmp_dirname)
 
+    def test_CuratedArchiveCache(self):
+        filename = os.path.join(EXAMPLES_DIR, 'sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations.omex')
+        cache = CuratedArchiveCache()
+
+        with mock.patch.object(CuratedArchiveCache, '_read', autospec=True, side_effect=CuratedArchiveCache._read) as read:
+            archive, sed_docs = cache.get(filename)
+            archive_2, sed_docs_2 = cache.get(filename)
+            archive_3, sed_docs_3 = cache.get(filename, read_only=True)
+            archive_4, sed_docs_4 = cache.extract(filename, self.tmp_dirname)
+        self.assertEqual(read.call_count, 1)
+
+        self.assertNotIn('manifest.xml', [os.path.relpath(content.location, '.') for content in archive.contents])
+        self.assertEqual(sorted(sed_docs.keys()), sorted(sed_docs_2.keys()))
+        self.assertGreater(len(sed_docs), 0)
+        location = list(sed_docs.keys())[0]
+        self.assertTrue(sed_docs[location].is_equal(sed_docs_2[location]))
+
+        self.assertIsNot(archive, archive_2)
+        self.assertIsNot(sed_docs[location], sed_docs_2[location])
+        self.assertIs(archive_3, cache.get(filename, read_only=True)[0])
+        self.assertIsNot(archive_4, archive_3)
+
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp_dirname, location)))
+        self.assertFalse(os.path.isfile(os.path.join(self.tmp_dirname, 'manifest.xml')))
+
+        cache.clear()
+        with mock.patch.object(CuratedArchiveCache, '_read', autospec=True, side_effect=CuratedArchiveCache._read) as read:
+            cache.get(filename)
+        self.assertEqual(read.call_count, 1)
+
+    def test_CuratedArchiveCache_get_model_attributes(self):
+        filename = os.path.join(EXAMPLES_DIR, 'sbml-core', 'Caravagna-J-Theor-Biol-2010-tumor-suppressive-oscillations.omex')
+        cache = CuratedArchiveCache()
+
+        dirname_1 = os.path.join(self.tmp_dirname, '1')
+        dirname_2 = os.path.join(self.tmp_dirname, '2')
+        _, sed_docs = cache.extract(filename, dirname_1)
+        cache.extract(filename, dirname_2)
+        model_source = list(sed_docs.values())[0].models[0].source
+
+        with mock.patch('biosimulators_test_suite.test_case.published_project.get_model_attributes',
+                        side_effect=get_model_attributes) as get_attributes:
+            attributes = cache.get_model_attributes(os.path.join(dirname_1, model_source))
+            self.assertIs(cache.get_model_attributes(os.path.join(dirname_2, model_source)), attributes)
+        self.assertEqual(get_attributes.call_count, 1)
+        self.assertEqual(attributes[0].target, '/sbml:sbml[1]/@level')
+        self.assertGreater(len([attribute for attribute in attributes if attribute.numeric_value is not None]), 0)
+
+        non_xml_filename = os.path.join(self.tmp_dirname, 'model.bngl')
+        with open(non_xml_filename, 'w') as file:
+            file.write('begin model\nend model\n')
+        self.assertEqual(cache.get_model_attributes(non_xml_filename), None)
+
+        cache.clear()
+        self.assertEqual(cache._model_attributes, {})
+
+    def test_SyntheticCombineArchiveTestCase_get_suitable_curated_archive(self):
+        class TestCase(SyntheticCombineArchiveTestCase):
+            def is_curated_archive_suitable_for_building_synthetic_archive(self, specifications, archive, sed_docs):
+                return specifications['suitable'] == self._published_projects_test_case.id
+
+            def eval_outputs(self):
+                pass
+
+        curated_case_1 = SimulatorCanExecutePublishedProject(id='1', filename='1.omex')
+        curated_case_2 = SimulatorCanExecutePublishedProject(id='2', filename='2.omex')
+        cache = CuratedArchiveCache()
+        case = TestCase(published_projects_test_cases=[curated_case_1, curated_case_2], curated_archive_cache=cache)
+
+        with mock.patch.object(CuratedArchiveCache, '_read', return_value=(CombineArchive(), {})) as read:
+            with mock.patch.object(TestCase, 'is_curated_archive_suitable_for_building_synthetic_archive', autospec=True,
+                                   side_effect=TestCase.is_curated_archive_suitable_for_building_synthetic_archive) as is_suitable:
+                self.assertEqual(case.get_suitable_curated_archive({'suitable': '2'}), curated_case_2)
+                self.assertEqual(is_suitable.call_count, 2)
+                self.assertEqual(case.get_suitable_curated_archive({'suitable': '2'}), curated_case_2)
+                self.assertEqual(is_suitable.call_count, 2)
+
+                self.assertEqual(case.get_suitable_curated_archive({'suitable': '1'}), curated_case_1)
+                self.assertEqual(case.get_suitable_curated_archive({'suitable': '3'}), None)
+                self.assertEqual(case.get_suitable_curated_archive({'suitable': '3'}), None)
+                self.assertEqual(is_suitable.call_count, 5)
+
+        self.assertEqual(read.call_count, 2)
+
     def test_SyntheticCombineArchiveTestCase_build_synthetic_archives(self):
         class ConcreteSyntheticCombineArchiveTestCase(SyntheticCombineArchiveTestCase):
             def eval_outputs():
@@ -495,20 +714,20 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
         shared_archive_dir = self.tmp_dirname
 
         with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator', return_value=None):
-            with mock.patch.object(CombineArchiveWriter, 'run', return_value=None):
+            with mock.patch.object(CombineArchiveAssembler, 'run', return_value=None):
                 with mock.patch.object(Concrete, 'eval_outputs', return_value=True):
                     self.assertFalse(Concrete()._eval_synthetic_archive(
                         specifications, expected_results_of_synthetic_archive, shared_archive_dir, None, self.tmp_dirname))
 
         with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator', return_value=None):
-            with mock.patch.object(CombineArchiveWriter, 'run', return_value=None):
+            with mock.patch.object(CombineArchiveAssembler, 'run', return_value=None):
                 with mock.patch.object(Concrete, 'eval_outputs', return_value=False):
                     self.assertTrue(Concrete()._eval_synthetic_archive(
                         specifications, expected_results_of_synthetic_archive, shared_archive_dir, None, self.tmp_dirname))
 
         with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator',
                         side_effect=RuntimeError):
-            with mock.patch.object(CombineArchiveWriter, 'run', return_value=None):
+            with mock.patch.object(CombineArchiveAssembler, 'run', return_value=None):
                 with mock.patch.object(Concrete, 'eval_outputs', return_value=False):
                     with self.assertRaises(RuntimeError):
                         Concrete()._eval_synthetic_archive(
@@ -517,18 +736,175 @@ class TestSimulatorCanExecutePublishedProject(unittest.TestCase):
         expected_results_of_synthetic_archive.is_success_expected = False
         with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator',
                         side_effect=RuntimeError):
-            with mock.patch.object(CombineArchiveWriter, 'run', return_value=None):
+            with mock.patch.object(CombineArchiveAssembler, 'run', return_value=None):
                 with mock.patch.object(Concrete, 'eval_outputs', return_value=False):
                     self.assertFalse(Concrete()._eval_synthetic_archive(
                         specifications, expected_results_of_synthetic_archive, shared_archive_dir, None, self.tmp_dirname))
 
         with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_containerized_simulator', return_value=None):
-            with mock.patch.object(CombineArchiveWriter, 'run', return_value=None):
+            with mock.patch.object(CombineArchiveAssembler, 'run', return_value=None):
                 with mock.patch.object(Concrete, 'eval_outputs', return_value=False):
                     with self.assertRaisesRegex(ValueError, 'did not fail as expected'):
                         Concrete()._eval_synthetic_archive(
                             specifications, expected_results_of_synthetic_archive, shared_archive_dir, None, self.tmp_dirname)
 
+    def test_SyntheticCombineArchiveTestCase__eval_concurrent_synthetic_archives(self):
+        class Concrete(SyntheticCombineArchiveTestCase):
+            def build_synthetic_archives(self, specifications, curated_archive, curated_archive_dir, curated_sed_docs):
+                return [ExpectedResultOfSyntheticArchive(None, {}, True) for i_archive in range(3)]
+
+            def eval_outputs(self, specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
+                pass
+
+        barrier = threading.Barrier(3, timeout=10.)
+        executed_archives = []
+
+        def eval_synthetic_archive(specifications, expected_results_of_synthetic_archive, shared_archive_dir,
+                                   i_synthetic_archive, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None,
+                                   synthetic_archive_filename=None, results=None, concurrent=True):
+            self.assertEqual(working_dirname, os.path.join(self.tmp_dirname, str(i_synthetic_archive + 1)))
+            self.assertEqual(synthetic_archive_filename, os.path.join(working_dirname, 'archive.omex'))
+            if concurrent:
+                barrier.wait()
+            executed_archives.append(i_synthetic_archive)
+            with timing.phase('execArchive'):
+                result = results[i_synthetic_archive]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        case = Concrete()
+        curated_case = SimulatorCanExecutePublishedProject(filename='curated.omex')
+
+        # by default, the archives are executed one after another
+        with mock.patch.dict(os.environ):
+            os.environ.pop('SYNTHETIC_ARCHIVE_CONCURRENCY', None)
+            self.assertEqual(case.get_synthetic_archive_concurrency(), 1)
+
+        with mock.patch.object(Concrete, 'get_suitable_curated_archive', return_value=curated_case), \
+                mock.patch.dict(os.environ, {'SYNTHETIC_ARCHIVE_CONCURRENCY': '3'}):
+            with mock.patch.object(CuratedArchiveCache, 'extract', return_value=(None, {})), \
+                    mock.patch.object(Concrete, '_write_synthetic_archive',
+                                      side_effect=lambda expected, shared_archive_dir, i_archive, working_dirname, **kwargs:
+                                      os.path.join(working_dirname, 'archive.omex')):
+                # if enabled, the archives are executed concurrently, the durations of their phases are recorded, and their
+                # warnings are aggregated
+                with mock.patch.object(Concrete, '_eval_synthetic_archive',
+                                       side_effect=functools.partial(eval_synthetic_archive, results=[False, True, False])):
+                    with timing.PhaseTimer() as timer:
+                        self.assertFalse(case._eval({}, self.tmp_dirname))
+                self.assertEqual(sorted(executed_archives), [0, 1, 2])
+                for i_archive in range(3):
+                    self.assertIn('syntheticArchive:{}.execArchive'.format(i_archive + 1), timer.timings)
+
+                with mock.patch.object(Concrete, '_eval_synthetic_archive',
+                                       side_effect=functools.partial(eval_synthetic_archive, results=[False, False, False])):
+                    self.assertTrue(case._eval({}, self.tmp_dirname))
+
+                # the failure of the first archive which fails is reported
+                barrier.reset()
+                with mock.patch.object(Concrete, '_eval_synthetic_archive',
+                                       side_effect=functools.partial(eval_synthetic_archive,
+                                                                     results=[False, ValueError('2'), ValueError('3')])):
+                    with self.assertRaisesRegex(ValueError, '^2$'):
+                        case._eval({}, self.tmp_dirname)
+
+                # the archives of test cases which aren't thread-safe are executed one after another, and they stop at the
+                # first failure
+                executed_archives.clear()
+                with mock.patch.object(Concrete, 'MAX_CONCURRENT_SYNTHETIC_ARCHIVES', 1):
+                    with mock.patch.object(Concrete, '_eval_synthetic_archive',
+                                           side_effect=functools.partial(eval_synthetic_archive, concurrent=False,
+                                                                         results=[False, ValueError('2'), False])):
+                        with self.assertRaisesRegex(ValueError, '^2$'):
+                            case._eval({}, self.tmp_dirname)
+                self.assertEqual(executed_archives, [0, 1])
+
+                executed_archives.clear()
+                with mock.patch.dict(os.environ, {'SYNTHETIC_ARCHIVE_CONCURRENCY': '1'}):
+                    with mock.patch.object(Concrete, '_eval_synthetic_archive',
+                                           side_effect=functools.partial(eval_synthetic_archive, concurrent=False,
+                                                                         results=[False, True, False])):
+                        self.assertFalse(case._eval({}, self.tmp_dirname))
+                self.assertEqual(executed_archives, [0, 1, 2])
+
+    def test_SyntheticCombineArchiveTestCase_prepare(self):
+        class Concrete(SyntheticCombineArchiveTestCase):
+            def build_synthetic_archives(self, specifications, curated_archive, curated_archive_dir, curated_sed_docs):
+                return [ExpectedResultOfSyntheticArchive(None, {}, True) for i_archive in range(2)]
+
+            def eval_outputs(self, specifications, synthetic_archive, synthetic_sed_docs, outputs_dir):
+                pass
+
+        def write_synthetic_archive(expected, shared_archive_dir, i_archive, working_dirname, synthetic_archives_dir=None):
+            return os.path.join(working_dirname, 'archive.omex')
+
+        specifications = {}
+        case = Concrete()
+        curated_case = SimulatorCanExecutePublishedProject(filename='curated.omex')
+        with mock.patch.object(Concrete, 'get_suitable_curated_archive', return_value=curated_case), \
+                mock.patch.object(CuratedArchiveCache, 'extract', return_value=(None, {})) as extract, \
+                mock.patch.object(Concrete, '_write_synthetic_archive', side_effect=write_synthetic_archive) as write, \
+                mock.patch.object(Concrete, '_eval_synthetic_archive', return_value=False) as eval_synthetic_archive:
+            # the archives are prepared before the test case is evaluated, and the evaluation only executes them
+            with timing.PhaseTimer() as timer:
+                case.prepare(specifications, self.tmp_dirname)
+            self.assertEqual(write.call_count, 2)
+            self.assertIn('findCuratedArchive', timer.timings)
+            self.assertIn('buildSyntheticArchives', timer.timings)
+            self.assertIsNot(case._prepared_synthetic_archives, None)
+
+            self.assertTrue(case._eval(specifications, self.tmp_dirname))
+            self.assertEqual(extract.call_count, 1)
+            self.assertEqual(write.call_count, 2)
+            self.assertEqual([call[1]['synthetic_archive_filename'] for call in eval_synthetic_archive.call_args_list],
+                             [os.path.join(self.tmp_dirname, str(i_archive + 1), 'archive.omex') for i_archive in range(2)])
+            self.assertEqual(case._prepared_synthetic_archives, None)
+
+            # the archives are prepared again for subsequent evaluations
+            self.assertTrue(case._eval(specifications, self.tmp_dirname))
+            self.assertEqual(extract.call_count, 2)
+
+            # archives prepared for other directories aren't used
+            case.prepare(specifications, os.path.join(self.tmp_dirname, 'other'))
+            self.assertTrue(case._eval(specifications, self.tmp_dirname))
+            self.assertEqual(extract.call_count, 4)
+
+        # errors which occur while the archives are prepared are raised by the evaluation
+        with mock.patch.object(Concrete, 'get_suitable_curated_archive', return_value=None):
+            case.prepare(specifications, self.tmp_dirname)
+        with mock.patch.object(Concrete, 'get_suitable_curated_archive', return_value=curated_case):
+            with self.assertRaisesRegex(SkippedTestCaseException, 'No curated'):
+                case._eval(specifications, self.tmp_dirname)
+
+        # the output and warnings of preparations in other threads are replayed by the evaluation of the test case
+        def build_synthetic_archives(specifications, curated_archive, curated_archive_dir, curated_sed_docs):
+            print('Output of preparation')
+            warnings.warn('Warning of preparation', TestCaseWarning)
+            return [ExpectedResultOfSyntheticArchive(None, {}, True)]
+
+        with mock.patch.object(Concrete, 'get_suitable_curated_archive', return_value=curated_case), \
+                mock.patch.object(CuratedArchiveCache, 'extract', return_value=(None, {})), \
+                mock.patch.object(Concrete, 'build_synthetic_archives', side_effect=build_synthetic_archives), \
+                mock.patch.object(Concrete, '_write_synthetic_archive', side_effect=write_synthetic_archive), \
+                mock.patch.object(Concrete, '_eval_synthetic_archive', return_value=False):
+            with warnings.catch_warnings(record=True) as caught_warnings:
+                warnings.simplefilter("ignore")
+                warnings.simplefilter("always", TestCaseWarning)
+                with StandardOutputErrorCapturer(level=StandardOutputErrorCapturerLevel.python) as captured:
+                    with route_thread_output():
+                        preparer = threading.Thread(target=case.prepare, args=(specifications, self.tmp_dirname))
+                        preparer.start()
+                        preparer.join()
+                self.assertEqual(captured.get_text(), '')
+                self.assertEqual(caught_warnings, [])
+
+                with StandardOutputErrorCapturer(level=StandardOutputErrorCapturerLevel.python) as captured:
+                    with route_thread_output():
+                        self.assertTrue(case._eval(specifications, self.tmp_dirname))
+                self.assertEqual(captured.get_text(), 'Output of preparation\n')
+                self.assertEqual([str(warning.message) for warning in caught_warnings], ['Warning of preparation'])
+
     def test_UniformTimeCourseTestCase_add_time_data_set(self):
         class Concrete(UniformTimeCourseTestCase):
             def modify_simulation(self, simulation):
@@ -1,4 +1,5 @@
 from biosimulators_test_suite.exceptions import InvalidOutputsException, SkippedTestCaseException
+from biosimulators_test_suite.outputs import OutputsReader
 from biosimulators_test_suite.test_case import sedml
 from biosimulators_test_suite.test_case.published_project import SimulatorCanExecutePublishedProject, SyntheticCombineArchiveTestCase
 from biosimulators_test_suite.warnings import InvalidOutputsWarning
@@ -7,7 +8,7 @@ from biosimulators_utils.archive.io import ArchiveWriter
 from biosimulators_utils.config import get_config
 from biosimulators_utils.combine.data_model import CombineArchive, CombineArchiveContent, CombineArchiveContentFormat
 from biosimulators_utils.report.data_model import DataSetResults
-from biosimulators_utils.report.io import ReportWriter, ReportReader
+from biosimulators_utils.report.io import ReportWriter
 from biosimulators_utils.sedml.data_model import (SedDocument, Task, Report, DataSet,
                                                   DataGenerator, Variable, UniformTimeCourseSimulation,
                                                   Algorithm, Symbol, Model, ModelLanguage,
@@ -77,14 +78,14 @@ class SedmlTestCaseTest(unittest.TestCase):
             self.assertFalse(case.eval_outputs(None, None, {'./a.sedml': doc}, self.dirname))
 
         with self.assertWarnsRegex(InvalidOutputsWarning, 'extra data sets'):
-            _report_reader_run = ReportReader().run
+            _outputs_reader_run = OutputsReader.run
 
-            def report_reader_run(output, outputs_dir, report_id):
-                report = _report_reader_run(output, outputs_dir, report_id)
+            def outputs_reader_run(self, output, report_id):
+                report = _outputs_reader_run(self, output, report_id)
                 report['z'] = numpy.array([7, 8, 9])
                 return report
 
-            with mock.patch.object(ReportReader, 'run', side_effect=report_reader_run):
+            with mock.patch.object(OutputsReader, 'run', outputs_reader_run):
                 self.assertFalse(case.eval_outputs(None, None, {'./a.sedml': doc}, self.dirname))
 
     def test_SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(self):
@@ -999,6 +1000,26 @@ class SedmlTestCaseTest(unittest.TestCase):
         if os.path.isdir(self.dirname):
             shutil.rmtree(self.dirname)
 
+    def test_SimulatorSupportsModelAttributeChanges_change_budget(self):
+        specs = read_simulator_specs(os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'COPASI.specs.json'), validate=False)
+        curated_case = SimulatorCanExecutePublishedProject(filename=self.CURATED_ARCHIVE_FILENAME)
+
+        for case_cls in [sedml.SimulatorSupportsModelAttributeChanges, sedml.SimulatorSupportsComputeModelChanges]:
+            case = case_cls(published_projects_test_cases=[curated_case])
+            case._published_projects_test_case = curated_case
+            curated_archive_dir = os.path.join(self.dirname, case_cls.__name__)
+            curated_archive, curated_sed_docs = case.curated_archive_cache.extract(curated_case.filename, curated_archive_dir)
+            model = list(curated_sed_docs.values())[0].models[0]
+            n_attributes = len(case.get_model_attributes(curated_archive_dir, model,
+                                                         numeric_only=case_cls is sedml.SimulatorSupportsComputeModelChanges))
+            self.assertGreater(n_attributes, 10)
+
+            for budget, n_expected_attributes in [(0, n_attributes), (10, 10)]:
+                with mock.patch.dict(os.environ, {'MODEL_CHANGE_BUDGET': str(budget)}):
+                    expected_results = case.build_synthetic_archives(specs, curated_archive, curated_archive_dir, curated_sed_docs)
+                changes = list(expected_results[0].sed_documents.values())[0].models[0].changes
+                self.assertEqual(len(set(change.target for change in changes)), n_expected_attributes)
+
     def test_SimulatorSupportsComputeModelChanges(self):
         specs = {'image': {'url': self.IMAGE}}
         curated_case = SimulatorCanExecutePublishedProject(filename=self.CURATED_ARCHIVE_FILENAME)
@@ -1222,6 +1243,7 @@ class SedmlTestCaseTest(unittest.TestCase):
         for alt_alg_id in kisao.get_term_ids(alt_algs):
             specs['algorithms'].append({'kisaoId': {'id': alt_alg_id}})
         self.assertFalse(case.is_curated_sed_algorithm_suitable_for_building_synthetic_archive(specs, alg))
+        self.assertEqual(case.get_alternative_algorithm(specs, alg), None)
 
         specs = {
             'image': {'url': self.IMAGE},
@@ -1230,3 +1252,26 @@ class SedmlTestCaseTest(unittest.TestCase):
             ]
         }
         case.eval(specs, self.dirname)
+
+    def test_SimulatorSupportsSubstitutingAlgorithms_build_synthetic_archives(self):
+        # the alternative algorithm doesn't depend on which specifications were last checked for suitability (e.g., when the
+        # suitability of the curated archive is cached)
+        curated_case = SimulatorCanExecutePublishedProject(filename=self.CURATED_ARCHIVE_FILENAME)
+        case = sedml.SimulatorSupportsSubstitutingAlgorithms(published_projects_test_cases=[curated_case])
+        case._published_projects_test_case = curated_case
+        curated_archive_dir = os.path.join(self.dirname, 'curated')
+        curated_archive, curated_sed_docs = case.curated_archive_cache.extract(curated_case.filename, curated_archive_dir)
+        alg = list(curated_sed_docs.values())[0].simulations[0].algorithm
+        self.assertEqual(alg.kisao_id, 'KISAO_0000560')
+
+        specs_1 = {'algorithms': [{'kisaoId': {'id': 'KISAO_0000560'}}]}
+        specs_2 = {'algorithms': [{'kisaoId': {'id': 'KISAO_0000019'}}, {'kisaoId': {'id': 'KISAO_0000560'}}]}
+        self.assertTrue(case.is_curated_sed_algorithm_suitable_for_building_synthetic_archive(specs_1, alg))
+        self.assertTrue(case.is_curated_sed_algorithm_suitable_for_building_synthetic_archive(specs_2, alg))
+        self.assertEqual(case.get_alternative_algorithm(specs_1, alg), 'KISAO_0000019')
+        self.assertNotIn(case.get_alternative_algorithm(specs_2, alg), [None, 'KISAO_0000019', 'KISAO_0000560'])
+
+        for specs in [specs_1, specs_2]:
+            expected_results = case.build_synthetic_archives(specs, curated_archive, curated_archive_dir, curated_sed_docs)
+            sim = list(expected_results[0].sed_documents.values())[0].simulations[0]
+            self.assertEqual(sim.algorithm.kisao_id, case.get_alternative_algorithm(specs, alg))
@@ -38,6 +38,91 @@ class ConfigTestCase(unittest.TestCase):
             config = Config()
         self.assertEqual(config.biosimulators_docker_registry_username, 'user2')
 
+        with mock.patch.dict(os.environ, {
+            'EXEC_CACHE_DIRNAME': '/tmp/exec-cache',
+            'EXEC_CACHE_MAX_SIZE': '1000',
+        }):
+            config = Config()
+        self.assertEqual(config.exec_cache_dirname, '/tmp/exec-cache')
+        self.assertEqual(config.exec_cache_max_size, 1000)
+
+        with mock.patch.dict(os.environ, {
+            'MODEL_CHANGE_BUDGET': '100',
+        }):
+            config = Config()
+        self.assertEqual(config.model_change_budget, 100)
+
+        with mock.patch.dict(os.environ, {
+            'COMPRESS_SYNTHETIC_ARCHIVES': '0',
+        }):
+            config = Config()
+        self.assertEqual(config.compress_synthetic_archives, False)
+
+        # the index of the examples, the table of substitutable algorithms, and the durations of test cases are only saved when
+        # their paths are configured
+        with mock.patch.dict(os.environ):
+            for name in ['EXAMPLES_INDEX_FILENAME', 'ALGORITHM_SUBSTITUTION_TABLE_FILENAME', 'CASE_DURATIONS_FILENAME']:
+                os.environ.pop(name, None)
+            config = Config()
+        self.assertEqual(config.examples_index_filename, None)
+        self.assertEqual(config.algorithm_substitution_table_filename, None)
+        self.assertEqual(config.case_durations_filename, None)
+
+        with mock.patch.dict(os.environ, {
+            'EXAMPLES_INDEX_FILENAME': '/tmp/examples-index.json',
+        }):
+            config = Config()
+        self.assertEqual(config.examples_index_filename, '/tmp/examples-index.json')
+
+        with mock.patch.dict(os.environ, {
+            'EXAMPLES_INDEX_FILENAME': '',
+        }):
+            config = Config()
+        self.assertEqual(config.examples_index_filename, None)
+
+        with mock.patch.dict(os.environ, {
+            'ALGORITHM_SUBSTITUTION_TABLE_FILENAME': '/tmp/algorithm-substitution-table.json',
+        }):
+            config = Config()
+        self.assertEqual(config.algorithm_substitution_table_filename, '/tmp/algorithm-substitution-table.json')
+
+        with mock.patch.dict(os.environ, {
+            'ALGORITHM_SUBSTITUTION_TABLE_FILENAME': '',
+        }):
+            config = Config()
+        self.assertEqual(config.algorithm_substitution_table_filename, None)
+
+        with mock.patch.dict(os.environ, {
+            'SYNTHETIC_ARCHIVE_CONCURRENCY': '2',
+        }):
+            config = Config()
+        self.assertEqual(config.synthetic_archive_concurrency, 2)
+
+        with mock.patch.dict(os.environ, {
+            'PIPELINE_DEPTH': '0',
+        }):
+            config = Config()
+        self.assertEqual(config.pipeline_depth, 0)
+
+        with mock.patch.dict(os.environ, {
+            'CASE_DURATIONS_FILENAME': '/tmp/case-durations.json',
+        }):
+            config = Config()
+        self.assertEqual(config.case_durations_filename, '/tmp/case-durations.json')
+
+        with mock.patch.dict(os.environ, {
+            'CASE_DURATIONS_FILENAME': '',
+        }):
+            config = Config()
+        self.assertEqual(config.case_durations_filename, None)
+        self.assertEqual(config.previous_test_results_filename, None)
+
+        with mock.patch.dict(os.environ, {
+            'PREVIOUS_TEST_RESULTS_FILENAME': 'previous-results.json',
+        }):
+            config = Config()
+        self.assertEqual(config.previous_test_results_filename, 'previous-results.json')
+
     def test_arguments(self):
         config = Config(
             pull_docker_image=True, docker_hub_username='user', docker_hub_token='token',
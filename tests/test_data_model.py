@@ -1,4 +1,9 @@
 from biosimulators_test_suite import data_model
+import h5py
+import numpy
+import os
+import shutil
+import tempfile
 import unittest
 
 
@@ -35,3 +40,45 @@ class DataModelTestCase(unittest.TestCase):
     def test_ExpectedSedReport_2(self):
         plot = data_model.ExpectedSedPlot(id='plot-1')
         self.assertEqual(plot.id, 'plot-1')
+
+    def test_SparseExpectedSedDataSetValues(self):
+        values = data_model.SparseExpectedSedDataSetValues([(0, 1), (2, 0)], [10., 12.], (3, 2))
+        self.assertEqual(values.indices.tolist(), [[0, 1], [2, 0]])
+        self.assertEqual(values.flat_indices.tolist(), [1, 4])
+        self.assertEqual(values.values.tolist(), [10., 12.])
+        self.assertEqual(values.to_dict(), {(0, 1): 10., (2, 0): 12.})
+
+        values = data_model.SparseExpectedSedDataSetValues([], [], (3,))
+        self.assertEqual(values.flat_indices.tolist(), [])
+        self.assertEqual(values.to_dict(), {})
+
+        with self.assertRaises(ValueError):
+            data_model.SparseExpectedSedDataSetValues([(3,)], [10.], (3,))
+        with self.assertRaises(ValueError):
+            data_model.SparseExpectedSedDataSetValues([(0, 1)], [10.], (3,))
+
+    def test_ExternalExpectedSedDataSetValues(self):
+        dirname = tempfile.mkdtemp()
+        value = numpy.arange(6.).reshape((3, 2))
+        numpy.save(os.path.join(dirname, 'value.npy'), value)
+        with h5py.File(os.path.join(dirname, 'values.h5'), 'w') as file:
+            file['group/value'] = value
+
+        expected_value = data_model.ExternalExpectedSedDataSetValues(os.path.join(dirname, 'value.npy'))
+        with expected_value.open() as expected_values:
+            self.assertIsInstance(expected_values, numpy.memmap)
+            self.assertEqual(expected_values.shape, (3, 2))
+            numpy.testing.assert_equal(expected_values[1:], value[1:])
+
+        expected_value = data_model.ExternalExpectedSedDataSetValues(os.path.join(dirname, 'values.h5'), 'group/value')
+        with expected_value.open() as expected_values:
+            self.assertIsInstance(expected_values, h5py.Dataset)
+            self.assertEqual(expected_values.shape, (3, 2))
+            numpy.testing.assert_equal(expected_values[1:], value[1:])
+
+        expected_value = data_model.ExternalExpectedSedDataSetValues(os.path.join(dirname, 'values.h5'), 'missing')
+        with self.assertRaises(KeyError):
+            with expected_value.open():
+                pass
+
+        shutil.rmtree(dirname)
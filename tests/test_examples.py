@@ -1,3 +1,4 @@
+from biosimulators_test_suite.data_model import ExternalExpectedSedDataSetValues
 from biosimulators_utils.combine.io import CombineArchiveReader
 from biosimulators_utils.combine.data_model import CombineArchiveContentFormat
 from biosimulators_utils.combine.utils import get_sedml_contents
@@ -117,8 +118,16 @@ class ExamplesTestCase(unittest.TestCase):
 
             for expected_data_set_value in expected_report['values']:
                 self.assertEqual(expected_data_set_value['label'], expected_data_set_id_labels[expected_data_set_value['id']])
-                expected_value = expected_data_set_value['value']
                 value = report_results[expected_data_set_value['id']]
+                if 'valueFile' in expected_data_set_value:
+                    expected_value = ExternalExpectedSedDataSetValues(
+                        os.path.join(os.path.dirname(example_specs_filename), expected_data_set_value['valueFile']['filename']),
+                        expected_data_set_value['valueFile'].get('dataset', None))
+                    with expected_value.open() as file_expected_value:
+                        numpy.testing.assert_allclose(value, file_expected_value[()])
+                    continue
+
+                expected_value = expected_data_set_value['value']
                 if isinstance(expected_value, dict):
                     for idx in expected_value.keys():
                         numpy.testing.assert_allclose(value[int(idx)], expected_value[idx])
@@ -0,0 +1,107 @@
+from biosimulators_test_suite.examples_index import ExamplesIndex
+from unittest import mock
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ExamplesIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.examples_dirname = os.path.join(self.dirname, 'examples')
+        self.index_filename = os.path.join(self.dirname, 'index', 'examples-index.json')
+
+        self.add_example('sbml-core/example-1', 'Example 1')
+        self.add_example('sbml-core/example-2', 'Example 2')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def add_example(self, name, title):
+        filename = os.path.join(self.examples_dirname, name + '.omex')
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        with open(filename, 'wb'):
+            pass
+
+        os.makedirs(os.path.join(self.examples_dirname, name))
+        with open(os.path.join(self.examples_dirname, name, 'expected-results.json'), 'w') as file:
+            json.dump({
+                'name': title,
+                'filename': os.path.basename(filename),
+                'taskRequirements': [{'modelFormat': 'format_2585', 'simulationAlgorithm': 'KISAO_0000019'}],
+                'skippedSimulators': [],
+                'expectedReports': [{'id': 'sim.sedml/report', 'points': [2], 'values': [{'id': 'x', 'value': [1, 2]}]}],
+                'expectedPlots': [],
+            }, file)
+
+    def test_get_entries(self):
+        index = ExamplesIndex(self.index_filename)
+        entries = index.get_entries(self.examples_dirname)
+        self.assertEqual([entry['filename'] for entry in entries], [
+            os.path.join('sbml-core', 'example-1', 'expected-results.json'),
+            os.path.join('sbml-core', 'example-2', 'expected-results.json'),
+        ])
+        self.assertEqual(entries[0]['summary'], {
+            'name': 'Example 1',
+            'filename': 'example-1.omex',
+            'taskRequirements': [{'modelFormat': 'format_2585', 'simulationAlgorithm': 'KISAO_0000019'}],
+            'skippedSimulators': [],
+        })
+        self.assertTrue(os.path.isfile(self.index_filename))
+
+        # the index is used rather than the files of the examples
+        with mock.patch('hashlib.sha256', side_effect=Exception('files should not be read')):
+            self.assertEqual(index.get_entries(self.examples_dirname), entries)
+
+        # files which are touched without being changed are not re-indexed
+        os.utime(os.path.join(self.examples_dirname, entries[0]['filename']), ns=(0, 0))
+        with mock.patch.object(ExamplesIndex, 'SUMMARY_EXCLUDED_KEYS', ('name',)):
+            touched_entries = index.get_entries(self.examples_dirname)
+        self.assertEqual(touched_entries[0]['summary'], entries[0]['summary'])
+        self.assertEqual(touched_entries[0]['mtime'], 0)
+        self.assertEqual(ExamplesIndex(self.index_filename).read()['entries'][entries[0]['filename']]['mtime'], 0)
+
+        # changed, added, and removed examples are re-indexed
+        filename = os.path.join(self.examples_dirname, entries[1]['filename'])
+        with open(filename, 'r') as file:
+            data = json.load(file)
+        data['name'] = 'Example 2 (revised)'
+        with open(filename, 'w') as file:
+            json.dump(data, file)
+
+        self.add_example('sbml-core/example-3', 'Example 3')
+        os.remove(os.path.join(self.examples_dirname, 'sbml-core', 'example-1.omex'))
+
+        entries = index.get_entries(self.examples_dirname)
+        self.assertEqual([entry['summary']['name'] for entry in entries], ['Example 2 (revised)', 'Example 3'])
+        self.assertEqual(ExamplesIndex(self.index_filename).read()['entries'].keys(), set(entry['filename'] for entry in entries))
+
+    def test_read_invalid_index(self):
+        index = ExamplesIndex(self.index_filename)
+        self.assertEqual(index.read(), {})
+
+        index.get_entries(self.examples_dirname)
+        self.assertNotEqual(index.read(), {})
+
+        # the index is rebuilt for other versions
+        with open(self.index_filename, 'r') as file:
+            data = json.load(file)
+        data['version'] = [ExamplesIndex.VERSION - 1, data['version'][1]]
+        with open(self.index_filename, 'w') as file:
+            json.dump(data, file)
+        self.assertEqual(index.read(), {})
+
+        with open(self.index_filename, 'w') as file:
+            file.write('{')
+        self.assertEqual(index.read(), {})
+
+        self.assertEqual(len(index.get_entries(self.examples_dirname)), 2)
+        self.assertNotEqual(index.read(), {})
+
+    def test_without_filename(self):
+        index = ExamplesIndex()
+        self.assertEqual(len(index.get_entries(self.examples_dirname)), 2)
+        self.assertEqual(index.read(), {})
@@ -0,0 +1,156 @@
+from biosimulators_test_suite.exec_cache import (ExecutionCache, get_archive_digest, get_cli_identity, get_docker_image_identity,
+                                                 get_dir_size)
+from unittest import mock
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+
+
+class ExecutionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.cache_dirname = os.path.join(self.dirname, 'cache')
+
+        self.cli = os.path.join(self.dirname, 'simulator')
+        with open(self.cli, 'w') as file:
+            file.write('#!/bin/sh\n')
+        os.chmod(self.cli, 0o755)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def _write_archive(self, filename, contents):
+        with zipfile.ZipFile(filename, 'w') as zip_file:
+            for name, content in contents:
+                zip_file.writestr(name, content)
+
+    def _write_outputs(self, dirname, content):
+        os.makedirs(dirname)
+        with open(os.path.join(dirname, 'reports.h5'), 'w') as file:
+            file.write(content)
+        with open(os.path.join(dirname, 'log.yml'), 'w') as file:
+            file.write('status: SUCCEEDED')
+
+    def test_get_archive_digest(self):
+        filename_1 = os.path.join(self.dirname, 'archive-1.omex')
+        filename_2 = os.path.join(self.dirname, 'archive-2.omex')
+        filename_3 = os.path.join(self.dirname, 'archive-3.omex')
+        self._write_archive(filename_1, [('a.sedml', 'A'), ('b.xml', 'B')])
+        time.sleep(2.)
+        self._write_archive(filename_2, [('b.xml', 'B'), ('a.sedml', 'A')])
+        self._write_archive(filename_3, [('a.sedml', 'A'), ('b.xml', 'C')])
+
+        self.assertEqual(get_archive_digest(filename_1), get_archive_digest(filename_2))
+        self.assertNotEqual(get_archive_digest(filename_1), get_archive_digest(filename_3))
+
+    def test_get_cli_identity(self):
+        identity = get_cli_identity(self.cli)
+        self.assertTrue(identity.startswith('cli:'))
+        self.assertEqual(get_cli_identity(self.cli), identity)
+
+        with open(self.cli, 'a') as file:
+            file.write('echo\n')
+        self.assertNotEqual(get_cli_identity(self.cli), identity)
+
+        self.assertEqual(get_cli_identity(os.path.join(self.dirname, 'does-not-exist')), None)
+
+    def test_get_docker_image_identity(self):
+        with mock.patch('biosimulators_test_suite.exec_cache.get_docker_image', return_value=mock.Mock(id='sha256:abc')):
+            with mock.patch('docker.from_env'):
+                self.assertEqual(get_docker_image_identity('ghcr.io/biosimulators/copasi:latest'), 'image:sha256:abc')
+
+        with mock.patch('docker.from_env', side_effect=Exception('Docker is not available')):
+            self.assertEqual(get_docker_image_identity('ghcr.io/biosimulators/copasi:latest'), None)
+
+    def test_get_key(self):
+        archive_filename = os.path.join(self.dirname, 'archive.omex')
+        self._write_archive(archive_filename, [('a.sedml', 'A')])
+        cache = ExecutionCache(self.cache_dirname)
+        specs = {'image': {'url': 'ghcr.io/biosimulators/copasi:latest'}}
+
+        key = cache.get_key(archive_filename, specs, cli=self.cli)
+        self.assertEqual(len(key), 64)
+        self.assertEqual(cache.get_key(archive_filename, specs, cli=self.cli, environment={}), key)
+        self.assertNotEqual(cache.get_key(archive_filename, specs, cli=self.cli, environment={'A': '1'}), key)
+        with mock.patch('biosimulators_test_suite.exec_cache.__version__', '0.0.0'):
+            self.assertNotEqual(cache.get_key(archive_filename, specs, cli=self.cli), key)
+
+        with mock.patch('biosimulators_test_suite.exec_cache.get_docker_image_identity', return_value='image:sha256:abc') as get_identity:
+            key_2 = cache.get_key(archive_filename, specs)
+            key_3 = cache.get_key(archive_filename, specs, singularity=True)
+            self.assertEqual(get_identity.call_count, 1)
+        self.assertNotIn(key_2, [key, key_3])
+
+        with mock.patch('biosimulators_test_suite.exec_cache.get_docker_image_identity', return_value=None):
+            specs = {'image': {'url': 'ghcr.io/biosimulators/tellurium:latest'}}
+            self.assertEqual(cache.get_key(archive_filename, specs), None)
+
+    def test_save_restore(self):
+        cache = ExecutionCache(self.cache_dirname)
+        key = 'a' * 64
+
+        outputs_dirname = os.path.join(self.dirname, 'outputs')
+        self.assertFalse(cache.restore(key, outputs_dirname))
+        self.assertFalse(os.path.isdir(outputs_dirname))
+
+        self._write_outputs(outputs_dirname, 'results')
+        cache.save(key, outputs_dirname)
+        self.assertTrue(os.path.isdir(cache.get_entry_dirname(key)))
+
+        restored_outputs_dirname = os.path.join(self.dirname, 'restored-outputs')
+        self.assertTrue(cache.restore(key, restored_outputs_dirname))
+        self.assertEqual(sorted(os.listdir(restored_outputs_dirname)), ['log.yml', 'reports.h5'])
+        with open(os.path.join(restored_outputs_dirname, 'reports.h5'), 'r') as file:
+            self.assertEqual(file.read(), 'results')
+
+        cache.clear()
+        self.assertFalse(cache.restore(key, os.path.join(self.dirname, 'restored-outputs-2')))
+
+    def test_evict_least_recently_used(self):
+        key_1 = 'a' * 64
+        key_2 = 'b' * 64
+        key_3 = 'c' * 64
+
+        outputs_dirname = os.path.join(self.dirname, 'outputs')
+        self._write_outputs(outputs_dirname, 'x' * 1000)
+        entry_size = get_dir_size(outputs_dirname)
+
+        cache = ExecutionCache(self.cache_dirname, max_size=int(2.5 * entry_size))
+        cache.save(key_1, outputs_dirname)
+        time.sleep(0.05)
+        cache.save(key_2, outputs_dirname)
+        time.sleep(0.05)
+        self.assertTrue(cache.restore(key_1, os.path.join(self.dirname, 'restored-outputs')))
+        time.sleep(0.05)
+        cache.save(key_3, outputs_dirname)
+
+        self.assertTrue(os.path.isdir(cache.get_entry_dirname(key_1)))
+        self.assertFalse(os.path.isdir(cache.get_entry_dirname(key_2)))
+        self.assertTrue(os.path.isdir(cache.get_entry_dirname(key_3)))
+
+    def test_lock(self):
+        cache = ExecutionCache(self.cache_dirname)
+        key = 'a' * 64
+        events = []
+
+        def target(i_thread):
+            with cache.lock(key):
+                events.append(('start', i_thread))
+                time.sleep(0.05)
+                events.append(('end', i_thread))
+
+        threads = [threading.Thread(target=target, args=(i_thread,)) for i_thread in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(events), 6)
+        for i_event in range(0, 6, 2):
+            self.assertEqual(events[i_event][0], 'start')
+            self.assertEqual(events[i_event + 1], ('end', events[i_event][1]))
+        self.assertEqual(cache._get_entry_dirnames(), [])
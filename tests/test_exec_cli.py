@@ -73,10 +73,14 @@ class MainTestCase(unittest.TestCase):
                     'warnings': [],
                     'skipReason': None,
                     'log': None,
+                    'timings': {},
+                    'provenance': None,
                 },
             ],
             'ghIssue': None,
             'ghActionRun': None,
+            'specifications': None,
+            'imageDigest': None,
         })
 
     def test_warnings(self):
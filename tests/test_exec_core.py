@@ -1,16 +1,26 @@
 from biosimulators_test_suite.exec_core import SimulatorValidator
 from biosimulators_test_suite.data_model import TestCase, SedTaskRequirements
-from biosimulators_test_suite.exceptions import SkippedTestCaseException
-from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType
+from biosimulators_test_suite.exceptions import SkippedTestCaseException, TimeoutException
+from biosimulators_test_suite.profiling import CaseProfiler, get_profile_summary
+from biosimulators_test_suite import __version__
+from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType, TestResultsReport
+from biosimulators_test_suite.results.io import read_test_results_jsonl, write_test_results
+from biosimulators_test_suite.scheduling import CaseDurationStore
 from biosimulators_test_suite.test_case import published_project
 from biosimulators_test_suite.test_case.docker_image import HasBioContainersLabels
 from biosimulators_test_suite.warnings import TestCaseWarning, IgnoredTestCaseWarning
 from unittest import mock
+import collections
+import concurrent.futures
+import gc
+import os
 import sys
 import shutil
 import tempfile
+import traceback
 import unittest
 import warnings
+import weakref
 
 
 class ValidateSimulatorTestCase(unittest.TestCase):
@@ -68,6 +78,7 @@ class ValidateSimulatorTestCase(unittest.TestCase):
         self.assertRegex(summary, 'Passed 3 test cases')
         self.assertRegex(summary, 'Failed 2 test cases')
         self.assertRegex(summary, 'Skipped 3 test cases')
+        self.assertNotIn('Duration by phase', summary)
         self.assertEqual(len(failure_details), 2)
         self.assertEqual(len(warning_details), 2)
         self.assertEqual(len(skipped_details), 3)
@@ -306,3 +317,468 @@ class ValidateSimulatorTestCase(unittest.TestCase):
         self.assertEqual(len(results), 3)
         for result in results:
             self.assertEqual(result.type, TestCaseResultType.skipped)
+
+    def test_run_in_parallel(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Vilar-PNAS-2002-minimal-circardian-clock-continuous',
+        ]
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, working_dirname=self.dirname, jobs=3)
+        cases = validator.cases['published_project']
+        self.assertEqual(len(cases), 3)
+
+        def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+            print('Output of ' + self.id)
+            warnings.warn('Warning of ' + self.id, TestCaseWarning)
+            if 'Varusai' in self.id:
+                raise RuntimeError('Failure of ' + self.id)
+            if 'Vilar' in self.id:
+                raise SkippedTestCaseException('Skip of ' + self.id)
+
+        with mock.patch.object(published_project.SimulatorCanExecutePublishedProject, 'eval', new=eval):
+            results = validator.run()
+
+        self.assertEqual([result.case for result in results], cases)
+        self.assertEqual([result.type for result in results],
+                         [TestCaseResultType.passed, TestCaseResultType.failed, TestCaseResultType.skipped])
+        for case, result in zip(cases, results):
+            self.assertEqual(result.log.replace('\r', '').strip(), 'Output of ' + case.id)
+            self.assertEqual([str(warning.message) for warning in result.warnings], ['Warning of ' + case.id])
+        self.assertIsInstance(results[1].exception, RuntimeError)
+        self.assertEqual(str(results[1].exception), 'Failure of ' + cases[1].id)
+        self.assertEqual(results[1].to_dict()['exception']['category'], 'RuntimeError')
+        self.assertIn('raise RuntimeError', ''.join(results[1].to_dict()['exception']['traceback']))
+        self.assertEqual(str(results[2].skip_reason), 'Skip of ' + cases[2].id)
+
+        summary, failure_details, _, _ = SimulatorValidator.summarize_results(results, debug=True)
+        self.assertIn('raise RuntimeError', failure_details[0])
+
+    def test_run_in_parallel_longest_first(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Vilar-PNAS-2002-minimal-circardian-clock-continuous',
+        ]
+        report_filename = os.path.join(self.dirname, 'report.json')
+        durations_filename = os.path.join(self.dirname, 'case-durations.json')
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, working_dirname=self.dirname,
+                                       jobs=2, case_durations_filename=durations_filename,
+                                       case_duration_report_filenames=[report_filename])
+        self.assertEqual(validator.case_duration_store.filename, durations_filename)
+        cases = validator.cases['published_project']
+        write_test_results([
+            TestCaseResult(case=case, type=TestCaseResultType.passed, duration=duration)
+            for case, duration in zip(cases, [1., 3., 2.])
+        ], report_filename)
+
+        submitted_cases = []
+
+        def submit(func, suite_name, i_case, working_dirname):
+            submitted_cases.append(i_case)
+            future = concurrent.futures.Future()
+            future.set_result(TestCaseResult(type=TestCaseResultType.passed, duration=4.))
+            return future
+
+        # the test cases are started longest-first, and their results are reported in their original order
+        with mock.patch('biosimulators_test_suite.exec_core.concurrent.futures.ProcessPoolExecutor') as ProcessPoolExecutor:
+            ProcessPoolExecutor.return_value.submit.side_effect = submit
+            results = validator.run()
+        self.assertEqual(submitted_cases, [1, 2, 0])
+        self.assertEqual([result.case for result in results], cases)
+
+        # the durations of the test cases are recorded for subsequent runs
+        self.assertEqual(CaseDurationStore(durations_filename).get_durations(validator.specifications['id']),
+                         {case.id: 4. for case in cases})
+        self.assertEqual(validator.get_case_scheduler().durations, {case.id: duration for case, duration in zip(cases, [1., 3., 2.])})
+
+        validator.case_duration_report_filenames = []
+        self.assertEqual(validator.get_case_scheduler().durations, {case.id: 4. for case in cases})
+
+    def test_time_budget(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+            'sedml.SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports',
+        ]
+        report_filename = os.path.join(self.dirname, 'report.json')
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            cases = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False).cases
+        tomida_case, varusai_case = cases['published_project']
+        sedml_case = cases['sedml'][0]
+        write_test_results([
+            TestCaseResult(case=tomida_case, type=TestCaseResultType.passed, duration=10.),
+            TestCaseResult(case=varusai_case, type=TestCaseResultType.failed, duration=20.),
+            TestCaseResult(case=sedml_case, type=TestCaseResultType.passed, duration=5.),
+        ], report_filename)
+
+        # the most valuable test cases which fit within the budget are selected, and the other cases are deferred
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                           case_duration_report_filenames=[report_filename], time_budget=25.)
+        self.assertEqual([case.id for case in validator.cases['published_project']], [varusai_case.id])
+        self.assertEqual([case.id for case in validator.cases['sedml']], [sedml_case.id])
+        self.assertEqual([case.id for case in validator.deferred_cases], [tomida_case.id])
+
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                           case_duration_report_filenames=[report_filename])
+        self.assertEqual(len(validator.cases['published_project']), 2)
+        self.assertEqual(validator.deferred_cases, [])
+
+        with self.assertRaisesRegex(ValueError, 'positive number'):
+            SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, time_budget=0.)
+
+    def test_run_with_previous_report(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+            'sedml.SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports',
+        ]
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False)
+        tomida_case, varusai_case = validator.cases['published_project']
+        sedml_case = validator.cases['sedml'][0]
+        case_order = [case.id for suite_cases in validator.cases.values() for case in suite_cases]
+        previous_report = TestResultsReport(
+            test_suite_version=__version__,
+            results=[
+                TestCaseResult(case=tomida_case, type=TestCaseResultType.passed, duration=10.),
+                TestCaseResult(case=sedml_case, type=TestCaseResultType.failed, exception=Exception('Big error'), duration=5.),
+            ],
+            gh_issue=10,
+            gh_action_run=20,
+            specifications=validator.specifications,
+            image_digest='sha256:1',
+        )
+
+        # only the test case without a previous result is evaluated
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, pipeline_depth=0,
+                                           previous_report=previous_report, image_digest='sha256:1')
+        self.assertEqual([case.id for case in validator.cases['published_project']], [varusai_case.id])
+        self.assertEqual(validator.cases['sedml'], [])
+
+        def eval_case(case, working_dirname, preparation=None):
+            return TestCaseResult(case=case, type=TestCaseResultType.passed, duration=1.)
+
+        with mock.patch.object(validator, 'eval_case', side_effect=eval_case):
+            results = validator.run()
+
+        # the reused results are merged with the new results in the order of the test cases
+        self.assertEqual([result.case.id for result in results], case_order)
+        results = {result.case.id: result for result in results}
+        self.assertEqual(results[tomida_case.id].type, TestCaseResultType.passed)
+        self.assertEqual(results[varusai_case.id].type, TestCaseResultType.passed)
+        self.assertEqual(results[sedml_case.id].type, TestCaseResultType.failed)
+        self.assertEqual(results[tomida_case.id].provenance, {'testSuiteVersion': __version__, 'ghIssue': 10, 'ghActionRun': 20})
+        self.assertEqual(results[varusai_case.id].provenance, None)
+
+        # all of the test cases are evaluated when the image changes
+        with mock.patch.dict(os.environ, {'CASE_DURATIONS_FILENAME': ''}):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                           previous_report=previous_report, image_digest='sha256:2')
+        self.assertEqual(len(validator.cases['published_project']), 2)
+        self.assertEqual(validator.reused_results, [])
+
+    def test_run_deduplicates_execs(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'results_report.SimulatorGeneratesReportsOfSimulationResults',
+            'sedml.SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports',
+        ]
+        cli = os.path.join(self.dirname, 'simulator')
+        with open(cli, 'w') as file:
+            file.write('#!/bin/sh\n')
+        os.chmod(cli, 0o755)
+
+        def exec_archive(archive_filename, outputs_dirname, cli, environment=None):
+            os.makedirs(outputs_dirname, exist_ok=True)
+            with open(os.path.join(outputs_dirname, 'log.yml'), 'w') as file:
+                file.write('status: SUCCEEDED\n')
+
+        working_dirname = os.path.join(self.dirname, 'dedup')
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, cli=cli,
+                                       working_dirname=working_dirname, pipeline_depth=0)
+        with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli',
+                        side_effect=exec_archive) as exec_method:
+            results = validator.run()
+        self.assertEqual(len(results), 2)
+        self.assertEqual(exec_method.call_count, 1)
+        for result in results:
+            self.assertIn('eval', result.timings)
+            self.assertIn('eval.buildSyntheticArchives', result.timings)
+            self.assertIn('eval.syntheticArchive:1.writeArchive', result.timings)
+            self.assertIn('eval.syntheticArchive:1.evalOutputs', result.timings)
+            self.assertIn('timings', result.to_dict())
+        self.assertEqual(sum('eval.syntheticArchive:1.execArchive' in result.timings for result in results), 1)
+        self.assertEqual(sum('eval.syntheticArchive:1.restoreOutputs' in result.timings for result in results), 2)
+
+        summary, _, _, _ = SimulatorValidator.summarize_results(results)
+        self.assertIn('* Duration by phase:', summary)
+        self.assertRegex(summary, r'  \* `eval\.syntheticArchive\.writeArchive`: \d+\.\d s \(2 test cases\)')
+        self.assertFalse(os.path.isdir(os.path.join(working_dirname, '.execs')))
+        for case in validator.cases['sedml'] + validator.cases['results_report']:
+            self.assertEqual(case.exec_cache, None)
+
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, cli=cli,
+                                       working_dirname=os.path.join(self.dirname, 'no-dedup'), deduplicate_execs=False)
+        with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli',
+                        side_effect=exec_archive) as exec_method:
+            validator.run()
+        self.assertEqual(exec_method.call_count, 2)
+
+    def test_run_pipelined(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'results_report.SimulatorGeneratesReportsOfSimulationResults',
+            'sedml.SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports',
+        ]
+        cli = os.path.join(self.dirname, 'simulator')
+        with open(cli, 'w') as file:
+            file.write('#!/bin/sh\n')
+        os.chmod(cli, 0o755)
+
+        def exec_archive(archive_filename, outputs_dirname, cli, environment=None):
+            self.assertTrue(os.path.isfile(archive_filename))
+            os.makedirs(outputs_dirname, exist_ok=True)
+            with open(os.path.join(outputs_dirname, 'log.yml'), 'w') as file:
+                file.write('status: SUCCEEDED\n')
+
+        all_results = []
+        for pipeline_depth in [0, 1]:
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, cli=cli,
+                                           working_dirname=os.path.join(self.dirname, str(pipeline_depth)),
+                                           pipeline_depth=pipeline_depth)
+            with mock.patch('biosimulators_utils.simulator.exec.exec_sedml_docs_in_archive_with_simulator_cli',
+                            side_effect=exec_archive):
+                all_results.append(validator.run())
+        unpipelined_results, results = all_results
+
+        # the results are the same as those of test cases which prepare their archives when they are evaluated
+        self.assertEqual([(result.type, str(result.exception)) for result in results],
+                         [(result.type, str(result.exception)) for result in unpipelined_results])
+
+        # the archives are prepared ahead of the evaluation of the test cases, and the durations of their preparation are
+        # recorded with the results of the test cases
+        for result in results:
+            self.assertIn('prepare.buildSyntheticArchives', result.timings)
+            self.assertIn('prepare.syntheticArchive:1.writeArchive', result.timings)
+            self.assertIn('eval.awaitPreparation', result.timings)
+            self.assertIn('eval.syntheticArchive:1.evalOutputs', result.timings)
+            self.assertNotIn('eval.buildSyntheticArchives', result.timings)
+            self.assertNotIn('eval.syntheticArchive:1.writeArchive', result.timings)
+        for case in validator.cases['sedml'] + validator.cases['results_report']:
+            self.assertEqual(case._prepared_synthetic_archives, None)
+
+        with self.assertRaisesRegex(ValueError, 'non-negative integer'):
+            SimulatorValidator(specifications, case_ids=[], validate_specs=False, pipeline_depth=-1)
+
+    def test_prepare_upcoming_cases(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        validator = SimulatorValidator(specifications, case_ids=[], validate_specs=False, pipeline_depth=2)
+        cases = ['case-{}'.format(i_case) for i_case in range(5)]
+        cases_to_prepare = collections.deque((case, os.path.join(self.dirname, case)) for case in cases)
+        preparations = {}
+        preparer = mock.Mock()
+
+        # the current test case and at most two upcoming test cases are prepared
+        validator.prepare_upcoming_cases(preparer, cases_to_prepare, preparations, current_case=cases[0])
+        self.assertEqual(list(preparations.keys()), cases[0:3])
+        self.assertEqual([call[0][1] for call in preparer.submit.call_args_list], cases[0:3])
+
+        preparations.pop(cases[0])
+        validator.prepare_upcoming_cases(preparer, cases_to_prepare, preparations, current_case=cases[1])
+        self.assertEqual(list(preparations.keys()), cases[1:4])
+
+        # test cases which are not prepared don't count toward the depth of the pipeline
+        validator.prepare_upcoming_cases(preparer, cases_to_prepare, preparations, current_case='other-case')
+        self.assertEqual(list(preparations.keys()), cases[1:4])
+
+        preparations.pop(cases[1])
+        preparations.pop(cases[2])
+        validator.prepare_upcoming_cases(preparer, cases_to_prepare, preparations, current_case=cases[3])
+        self.assertEqual(list(preparations.keys()), cases[3:5])
+        self.assertEqual(len(cases_to_prepare), 0)
+
+    def test_run_with_persistent_container(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+        ]
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False, use_persistent_container=True)
+        case = validator.cases['published_project'][0]
+
+        persistent_containers = []
+
+        def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+            persistent_containers.append(self.persistent_container)
+
+        with mock.patch('biosimulators_test_suite.exec_core.PersistentSimulatorContainer') as PersistentSimulatorContainer:
+            with mock.patch.object(published_project.SimulatorCanExecutePublishedProject, 'eval', new=eval):
+                results = validator.run()
+
+        self.assertEqual(results[0].type, TestCaseResultType.passed)
+        PersistentSimulatorContainer.assert_called_once()
+        self.assertEqual(PersistentSimulatorContainer.call_args[0][0], validator.specifications['image']['url'])
+        self.assertEqual(persistent_containers, [PersistentSimulatorContainer.return_value])
+        PersistentSimulatorContainer.return_value.stop.assert_called_once_with()
+        self.assertEqual(case.persistent_container, None)
+
+    def test_run_with_report_jsonl(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+        ]
+        report_filename = os.path.join(self.dirname, 'results.jsonl')
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                       report_jsonl_filename=report_filename, retain_logs=False)
+
+        def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+            print('Output of ' + self.id)
+            if 'Varusai' in self.id:
+                raise RuntimeError('Failure of ' + self.id)
+
+        with mock.patch.object(published_project.SimulatorCanExecutePublishedProject, 'eval', new=eval):
+            results = validator.run()
+
+        report = read_test_results_jsonl(report_filename)
+        self.assertEqual([result.case.id for result in report.results], case_ids)
+        self.assertEqual([result.type for result in report.results], [TestCaseResultType.passed, TestCaseResultType.failed])
+        self.assertEqual(report.results[0].log.strip(), 'Output of ' + case_ids[0])
+        self.assertEqual(report.results[1].exception.__class__, RuntimeError)
+
+        # the logs of the passed test cases were not retained
+        self.assertEqual(results[0].log, None)
+        self.assertEqual(results[1].log.strip(), 'Output of ' + case_ids[1])
+
+    def test_revalidate_from_report_jsonl(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+        ]
+        report_filename = os.path.join(self.dirname, 'results.jsonl')
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                       report_jsonl_filename=report_filename, image_digest='sha256:1',
+                                       gh_issue=10, gh_action_run=20)
+
+        def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+            if 'Varusai' in self.id:
+                raise RuntimeError('Failure of ' + self.id)
+
+        with mock.patch.object(published_project.SimulatorCanExecutePublishedProject, 'eval', new=eval):
+            validator.run()
+
+        # the report records the specifications and image of the simulator
+        report = read_test_results_jsonl(report_filename)
+        self.assertEqual(report.specifications, validator.specifications)
+        self.assertEqual(report.image_digest, 'sha256:1')
+        self.assertEqual(report.gh_issue, 10)
+        self.assertEqual(report.gh_action_run, 20)
+
+        # the results of the report are reused for the same image
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                       previous_report=report, image_digest='sha256:1')
+        self.assertEqual([case for suite_cases in validator.cases.values() for case in suite_cases], [])
+        self.assertEqual([result.case.id for result in validator.reused_results], case_ids)
+        self.assertEqual([result.type for result in validator.reused_results],
+                         [TestCaseResultType.passed, TestCaseResultType.failed])
+        self.assertEqual([result.provenance['ghIssue'] for result in validator.reused_results], [10, 10])
+
+        # the test cases are evaluated again for a different image
+        validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                       previous_report=report, image_digest='sha256:2')
+        self.assertEqual([case.id for suite_cases in validator.cases.values() for case in suite_cases], case_ids)
+        self.assertEqual(validator.reused_results, [])
+
+    def test_run_with_profile_dir(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        case_ids = [
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation',
+            'published_project.SimulatorCanExecutePublishedProject:sbml-core/Varusai-Sci-Rep-2018-mTOR-signaling-LSODA-LSODAR-SBML',
+        ]
+        profile_dirname = os.path.join(self.dirname, 'profiles')
+
+        def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+            if 'Varusai' in self.id:
+                raise RuntimeError('Failure of ' + self.id)
+
+        with mock.patch.object(published_project.SimulatorCanExecutePublishedProject, 'eval', new=eval):
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False)
+            self.assertEqual(validator.profiler, None)
+            validator.run()
+            self.assertFalse(os.path.isdir(profile_dirname))
+
+            validator = SimulatorValidator(specifications, case_ids=case_ids, validate_specs=False,
+                                           profile_dirname=profile_dirname, profile_collapsed_stacks=True)
+            results = validator.run()
+
+        self.assertEqual(sorted(os.listdir(profile_dirname)), sorted(
+            CaseProfiler.get_basename(case_id) + extension
+            for case_id in case_ids
+            for extension in ['.pstats', '.collapsed.txt']
+        ))
+        self.assertEqual([result.type for result in results], [TestCaseResultType.passed, TestCaseResultType.failed])
+        self.assertTrue(get_profile_summary(profile_dirname, case_ids=case_ids).startswith('Profiles of 2 test cases'))
+
+    def test_eval_case_releases_frames(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        validator = SimulatorValidator(specifications, case_ids=[], validate_specs=False)
+
+        class SimulationResults(object):
+            pass
+
+        results_refs = []
+
+        class Case(TestCase):
+            def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+                results = SimulationResults()
+                results_refs.append(weakref.ref(results))
+                try:
+                    raise KeyError('report')
+                except KeyError as exception:
+                    raise ValueError('Simulation results are invalid') from exception
+
+        case = Case(id='case')
+        result = validator.eval_case(case, self.dirname)
+        gc.collect()
+
+        self.assertEqual(results_refs[0](), None)
+        self.assertEqual(result.type, TestCaseResultType.failed)
+        self.assertIsInstance(result.exception, ValueError)
+        self.assertEqual(result.exception.__traceback__, None)
+        self.assertEqual(result.exception.__cause__.__traceback__, None)
+        self.assertIsInstance(result.exception_traceback, traceback.StackSummary)
+        self.assertEqual(result.exception_traceback[-1].name, 'eval')
+        self.assertIn("raise ValueError('Simulation results are invalid') from exception",
+                      ''.join(result.to_dict()['exception']['traceback']))
+
+        _, failure_details, _, _ = SimulatorValidator.summarize_results([result], debug=True)
+        self.assertIn("raise ValueError('Simulation results are invalid') from exception", failure_details[0])
+
+    def test_invalid_jobs(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        with self.assertRaisesRegex(ValueError, 'positive integer'):
+            SimulatorValidator(specifications, case_ids=[], validate_specs=False, jobs=0)
+
+    def test_eval_case_timeout(self):
+        specifications = os.path.join(os.path.dirname(__file__), 'fixtures', 'COPASI.specs.json')
+        validator = SimulatorValidator(specifications, case_ids=[], validate_specs=False)
+        validator.test_case_timeout = 0.2
+
+        class Case(TestCase):
+            def eval(self, specifications, working_dirname, synthetic_archives_dir=None, dry_run=False, cli=None):
+                while True:
+                    pass
+
+        case = Case()
+        result = validator.eval_case(case, self.dirname)
+        self.assertEqual(result.type, TestCaseResultType.failed)
+        self.assertIsInstance(result.exception, TimeoutException)
+        self.assertLess(result.duration, 5.)
@@ -2,6 +2,7 @@ from biosimulators_test_suite import exec_gh_action
 from biosimulators_test_suite import exec_core
 from biosimulators_test_suite.config import Config
 from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType
+from biosimulators_test_suite.results.io import write_test_results
 from biosimulators_test_suite.test_case.published_project import SimulatorCanExecutePublishedProject
 from biosimulators_test_suite.warnings import TestCaseWarning
 from biosimulators_utils.gh_action.data_model import GitHubActionCaughtError
@@ -10,6 +11,8 @@ from unittest import mock
 import docker
 import os
 import requests
+import shutil
+import tempfile
 import unittest
 
 
@@ -40,6 +43,16 @@ class ValidateCommitWorkflowTestCase(unittest.TestCase):
 
         self.submitter = 'jonrkarr'
 
+        # the action and the utilities it uses save files (e.g., the specifications of simulators, reports of results) to the
+        # current directory
+        self.cwd = os.getcwd()
+        self.working_dirname = tempfile.mkdtemp()
+        os.chdir(self.working_dirname)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.working_dirname)
+
     def test_get_uncaught_exception_msg(self):
         msg = 'My custom message'
         exception = Exception(msg)
@@ -149,6 +162,26 @@ class ValidateCommitWorkflowTestCase(unittest.TestCase):
                                 with mock.patch.dict(os.environ, self.env):
                                     action.validate_image(specs)
 
+    def test_read_previous_test_results(self):
+        with mock.patch.dict(os.environ, self.env):
+            action = exec_gh_action.ValidateCommitSimulatorGitHubAction()
+        self.assertEqual(action.read_previous_test_results(), None)
+
+        dirname = tempfile.mkdtemp()
+        filename = os.path.join(dirname, 'results.json')
+        action.config.previous_test_results_filename = filename
+        self.assertEqual(action.read_previous_test_results(), None)
+
+        write_test_results([
+            TestCaseResult(case=SimulatorCanExecutePublishedProject(id='sedml.case-1'), type=TestCaseResultType.passed, duration=1.)
+        ], filename, gh_issue=10, gh_action_run=20, specifications={'id': 'tellurium'}, image_digest='sha256:1')
+        report = action.read_previous_test_results()
+        self.assertEqual(report.results[0].case.id, 'sedml.case-1')
+        self.assertEqual(report.specifications, {'id': 'tellurium'})
+        self.assertEqual(report.image_digest, 'sha256:1')
+
+        shutil.rmtree(dirname)
+
     def test_exec_core(self):
         with mock.patch.dict(os.environ, self.env):
             action = exec_gh_action.ValidateCommitSimulatorGitHubAction()
@@ -0,0 +1,171 @@
+from biosimulators_test_suite import __version__
+from biosimulators_test_suite.data_model import SedTaskRequirements
+from biosimulators_test_suite.exceptions import SkippedTestCaseException
+from biosimulators_test_suite.incremental import get_changed_specifications_keys, get_cases_to_revalidate, is_case_affected_by_algorithms
+from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType, TestResultsReport
+from biosimulators_test_suite.test_case.docker_image import HasBioContainersLabels
+from biosimulators_test_suite.test_case.published_project import SimulatorCanExecutePublishedProject
+from biosimulators_test_suite.test_case.sedml import SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports
+import collections
+import copy
+import unittest
+
+
+class IncrementalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.specifications = {
+            'id': 'tellurium',
+            'name': 'tellurium',
+            'image': {'url': 'ghcr.io/biosimulators/tellurium:2.2.0'},
+            'algorithms': [{'kisaoId': {'namespace': 'KISAO', 'id': 'KISAO_0000019'}}],
+        }
+
+        self.docker_image_case = HasBioContainersLabels(id='docker_image.HasBioContainersLabels')
+        self.sedml_case = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(
+            id='sedml.SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports')
+        self.project_1 = SimulatorCanExecutePublishedProject(id='published_project.SimulatorCanExecutePublishedProject:project-1')
+        self.project_2 = SimulatorCanExecutePublishedProject(id='published_project.SimulatorCanExecutePublishedProject:project-2')
+        self.cases = collections.OrderedDict([
+            ('docker_image', [self.docker_image_case]),
+            ('published_project', [self.project_1, self.project_2]),
+            ('sedml', [self.sedml_case]),
+        ])
+
+        self.previous_report = TestResultsReport(
+            test_suite_version=__version__,
+            results=[
+                TestCaseResult(case=self.docker_image_case, type=TestCaseResultType.passed, duration=1.),
+                TestCaseResult(case=self.project_1, type=TestCaseResultType.failed, exception=Exception('Big error'),
+                               duration=2.),
+                TestCaseResult(case=self.sedml_case, type=TestCaseResultType.passed, duration=3.),
+            ],
+            gh_issue=10,
+            gh_action_run=20,
+            specifications=copy.deepcopy(self.specifications),
+            image_digest='sha256:1',
+        )
+
+    def test_get_changed_specifications_keys(self):
+        self.assertEqual(get_changed_specifications_keys({'a': 1, 'b': 2}, {'a': 1, 'b': 3, 'c': 4}), set(['b', 'c']))
+        self.assertEqual(get_changed_specifications_keys({'a': 1}, {'a': 1}), set())
+
+    def test_reuse_results(self):
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, 'sha256:1', self.previous_report)
+
+        # only the test cases without previous results are evaluated
+        self.assertEqual(cases_to_evaluate, collections.OrderedDict([
+            ('docker_image', []),
+            ('published_project', [self.project_2]),
+            ('sedml', []),
+        ]))
+        self.assertEqual([result.case for result in reused_results], [self.docker_image_case, self.project_1, self.sedml_case])
+        self.assertEqual(reused_results[1].type, TestCaseResultType.failed)
+        self.assertEqual(str(reused_results[1].exception), 'Big error')
+        self.assertEqual(reused_results[1].duration, 2.)
+        self.assertEqual(reused_results[1].provenance, {
+            'testSuiteVersion': __version__,
+            'ghIssue': 10,
+            'ghActionRun': 20,
+        })
+
+        # changes to metadata don't affect the outcomes of test cases
+        specifications = copy.deepcopy(self.specifications)
+        specifications['name'] = 'Tellurium'
+        specifications['urls'] = [{'type': 'Home page', 'url': 'https://tellurium.analogmachine.org'}]
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, specifications, 'sha256:1', self.previous_report)
+        self.assertEqual(len(reused_results), 3)
+
+        # the provenance of results which were reused in the previous report is preserved
+        self.previous_report.results[0].provenance = {'testSuiteVersion': __version__, 'ghIssue': 5, 'ghActionRun': 6}
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, 'sha256:1', self.previous_report)
+        self.assertEqual(reused_results[0].provenance['ghIssue'], 5)
+
+    def test_revalidate_all_cases(self):
+        # image changed
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, 'sha256:2', self.previous_report)
+        self.assertEqual(cases_to_evaluate, self.cases)
+        self.assertEqual(reused_results, [])
+
+        # digest of image is unknown
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, None, self.previous_report)
+        self.assertEqual(reused_results, [])
+
+        # image URL changed
+        specifications = copy.deepcopy(self.specifications)
+        specifications['image']['url'] = 'ghcr.io/biosimulators/tellurium:2.2.1'
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, specifications, 'sha256:1', self.previous_report)
+        self.assertEqual(reused_results, [])
+
+        # version of test suite changed
+        self.previous_report.test_suite_version = '0.0.1'
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, 'sha256:1', self.previous_report)
+        self.assertEqual(reused_results, [])
+
+        # previous report doesn't record the specifications of the simulator
+        self.previous_report.test_suite_version = __version__
+        self.previous_report.specifications = None
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, self.specifications, 'sha256:1', self.previous_report)
+        self.assertEqual(reused_results, [])
+
+    def test_revalidate_cases_affected_by_algorithms(self):
+        def get_algorithm_specs(kisao_id):
+            return {'kisaoId': {'namespace': 'KISAO', 'id': kisao_id}, 'modelFormats': [{'namespace': 'EDAM', 'id': 'format_2585'}]}
+
+        def get_task_requirements(kisao_id):
+            return [SedTaskRequirements(model_format='format_2585', simulation_algorithm=kisao_id)]
+
+        self.project_1.task_requirements = get_task_requirements('KISAO_0000019')
+        self.project_2.task_requirements = get_task_requirements('KISAO_0000029')
+        project_3 = SimulatorCanExecutePublishedProject(id='published_project.SimulatorCanExecutePublishedProject:project-3',
+                                                        task_requirements=get_task_requirements('KISAO_0000088'))
+        self.cases['published_project'].append(project_3)
+
+        # every published project has a previous result; incompatible projects were skipped
+        self.previous_report.specifications['algorithms'] = [
+            get_algorithm_specs('KISAO_0000019'),
+            get_algorithm_specs('KISAO_0000088'),
+        ]
+        self.previous_report.results.extend([
+            TestCaseResult(case=self.project_2, type=TestCaseResultType.skipped, skip_reason=SkippedTestCaseException(
+                'Case requires model formats `format_2585` and simulation algorithms `KISAO_0000029`'), duration=0.),
+            TestCaseResult(case=project_3, type=TestCaseResultType.passed, duration=4.),
+        ])
+
+        specifications = copy.deepcopy(self.previous_report.specifications)
+        specifications['algorithms'] = [
+            get_algorithm_specs('KISAO_0000019'),
+            get_algorithm_specs('KISAO_0000029'),
+        ]
+        cases_to_evaluate, reused_results = get_cases_to_revalidate(
+            self.cases, specifications, 'sha256:1', self.previous_report)
+
+        # synthetic archives, newly compatible published projects, and published projects which are no longer compatible are
+        # evaluated
+        self.assertEqual(cases_to_evaluate, collections.OrderedDict([
+            ('docker_image', []),
+            ('published_project', [self.project_2, project_3]),
+            ('sedml', [self.sedml_case]),
+        ]))
+        self.assertEqual([result.case for result in reused_results], [self.docker_image_case, self.project_1])
+        self.assertEqual(reused_results[1].type, TestCaseResultType.failed)
+
+    def test_is_case_affected_by_algorithms(self):
+        old_specifications = {'algorithms': []}
+        new_specifications = {'algorithms': [{'kisaoId': {'namespace': 'KISAO', 'id': 'KISAO_0000019'},
+                                              'modelFormats': [{'namespace': 'EDAM', 'id': 'format_2585'}]}]}
+        self.project_1.task_requirements = [SedTaskRequirements(model_format='format_2585', simulation_algorithm='KISAO_0000019')]
+        self.project_2.task_requirements = [SedTaskRequirements(model_format='format_2585', simulation_algorithm='KISAO_0000029')]
+
+        self.assertFalse(is_case_affected_by_algorithms('docker_image', self.docker_image_case, old_specifications, new_specifications))
+        self.assertTrue(is_case_affected_by_algorithms('sedml', self.sedml_case, old_specifications, new_specifications))
+        self.assertTrue(is_case_affected_by_algorithms('published_project', self.project_1, old_specifications, new_specifications))
+        self.assertTrue(is_case_affected_by_algorithms('published_project', self.project_1, new_specifications, old_specifications))
+        self.assertFalse(is_case_affected_by_algorithms('published_project', self.project_2, old_specifications, new_specifications))
@@ -0,0 +1,92 @@
+from biosimulators_test_suite.model_index import (ModelAttribute, get_model_attributes, get_model_attribute_type,
+                                                  sample_model_attributes)
+from lxml import etree
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ModelIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_model_attributes(self):
+        filename = os.path.join(self.dirname, 'model.xml')
+        with open(filename, 'w') as file:
+            file.write(
+                '<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"'
+                ' xmlns:fbc="http://www.sbml.org/sbml/level3/version1/fbc/version2" level="3">'
+                '  <!-- comment -->'
+                '  <model id="model">'
+                '    <listOfParameters>'
+                '      <parameter id="k1" value="1.5"/>'
+                '      <parameter id="k2" value="2e-3"/>'
+                '    </listOfParameters>'
+                '    <fbc:listOfObjectives fbc:activeObjective="obj"/>'
+                '  </model>'
+                '</sbml>'
+            )
+
+        attributes = get_model_attributes(filename)
+        self.assertEqual(
+            [(attribute.target, attribute.name, attribute.value, attribute.numeric_value) for attribute in attributes],
+            [
+                ('/sbml:sbml[1]/@level', 'level', '3', 3.),
+                ('/sbml:sbml[1]/sbml:model[1]/@id', 'id', 'model', None),
+                ('/sbml:sbml[1]/sbml:model[1]/fbc:listOfObjectives[1]/@fbc:activeObjective', 'fbc:activeObjective', 'obj', None),
+                ('/sbml:sbml[1]/sbml:model[1]/sbml:listOfParameters[1]/sbml:parameter[2]/@id', 'id', 'k2', None),
+                ('/sbml:sbml[1]/sbml:model[1]/sbml:listOfParameters[1]/sbml:parameter[2]/@value', 'value', '2e-3', 2e-3),
+                ('/sbml:sbml[1]/sbml:model[1]/sbml:listOfParameters[1]/sbml:parameter[1]/@id', 'id', 'k1', None),
+                ('/sbml:sbml[1]/sbml:model[1]/sbml:listOfParameters[1]/sbml:parameter[1]/@value', 'value', '1.5', 1.5),
+            ])
+        self.assertEqual(attributes[2].target_namespaces, {
+            'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+            'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+        })
+
+        # the targets resolve to the attributes
+        root = etree.parse(filename).getroot()
+        for attribute in attributes:
+            self.assertEqual(root.xpath(attribute.target, namespaces=attribute.target_namespaces), [attribute.value])
+
+    def test_get_model_attributes_non_xml(self):
+        filename = os.path.join(self.dirname, 'model.bngl')
+        with open(filename, 'w') as file:
+            file.write('begin model\nend model\n')
+
+        with self.assertRaises(etree.XMLSyntaxError):
+            get_model_attributes(filename)
+
+    def test_get_model_attribute_type(self):
+        attribute = ModelAttribute('/sbml:sbml[1]/sbml:model[1]/sbml:listOfParameters[1]/sbml:parameter[12]/@value', {}, 'value', '1')
+        self.assertEqual(get_model_attribute_type(attribute), '/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter/@value')
+
+    def test_sample_model_attributes(self):
+        attributes = (
+            [ModelAttribute('/model[1]/@id', {}, 'id', 'model')]
+            + [ModelAttribute('/model[1]/species[{}]/@value'.format(i + 1), {}, 'value', str(i)) for i in range(60)]
+            + [ModelAttribute('/model[1]/parameter[{}]/@value'.format(i + 1), {}, 'value', str(i)) for i in range(30)]
+        )
+
+        self.assertEqual(sample_model_attributes(attributes, None), attributes)
+        self.assertEqual(sample_model_attributes(attributes, 0), attributes)
+        self.assertEqual(sample_model_attributes(attributes, 100), attributes)
+
+        sample = sample_model_attributes(attributes, 10)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual([get_model_attribute_type(attribute) for attribute in sample].count('/model/@id'), 1)
+        self.assertEqual([get_model_attribute_type(attribute) for attribute in sample].count('/model/species/@value'), 6)
+        self.assertEqual([get_model_attribute_type(attribute) for attribute in sample].count('/model/parameter/@value'), 3)
+        self.assertEqual(sample, sorted(sample, key=attributes.index))
+        self.assertEqual(sample, sample_model_attributes(attributes, 10))
+
+        # evenly spaced within each type
+        self.assertEqual([attribute.value for attribute in sample if 'species' in attribute.target], ['5', '15', '25', '35', '45', '55'])
+
+        # more types than the budget
+        sample = sample_model_attributes(attributes, 2)
+        self.assertEqual([get_model_attribute_type(attribute) for attribute in sample], ['/model/@id', '/model/species/@value'])
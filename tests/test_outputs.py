@@ -0,0 +1,135 @@
+from biosimulators_test_suite.outputs import OutputDataSet, OutputsReader
+from biosimulators_test_suite.utils import simulation_results_any_isnan, SimulationResultsNanMask
+from biosimulators_utils.report.data_model import DataSetResults
+from biosimulators_utils.report.io import ReportWriter, ReportReader
+from biosimulators_utils.report.warnings import MissingDataWarning, ExtraDataWarning
+from biosimulators_utils.sedml.data_model import Report, Plot2D, DataSet
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class OutputsReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+        self.report = Report(id='report', data_sets=[
+            DataSet(id='x', label='x'),
+            DataSet(id='y', label='y'),
+        ])
+        self.results = DataSetResults({
+            'x': numpy.array([1., 2., 3.]),
+            'y': numpy.array([[4., 5.], [6., 7.]]),
+        })
+        ReportWriter().run(self.report, self.results, self.dirname, 'sim.sedml/report', type=Report)
+
+        self.plot = Report(id='plot', data_sets=[
+            DataSet(id='z', label='z'),
+        ])
+        ReportWriter().run(self.plot, DataSetResults({'z': numpy.array([8., 9.])}), self.dirname, 'dir/sim.sedml/plot', type=Plot2D)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_ids(self):
+        with OutputsReader(self.dirname) as reader:
+            self.assertEqual(reader.get_ids(), ReportReader().get_ids(self.dirname))
+            self.assertEqual(sorted(reader.get_ids()), ['dir/sim.sedml/plot', 'sim.sedml/report'])
+            self.assertEqual(reader.get_ids(type=Report), ['sim.sedml/report'])
+            self.assertEqual(reader.get_ids(type=Plot2D), ['dir/sim.sedml/plot'])
+
+    def test_get_metadata(self):
+        with OutputsReader(self.dirname) as reader:
+            metadata = reader.get_metadata('./sim.sedml/report')
+            self.assertTrue(metadata.is_dataset)
+            self.assertEqual(metadata.uri, 'sim.sedml/report')
+            self.assertEqual(metadata.type, 'SedReport')
+            self.assertEqual(metadata.data_set_ids, ['x', 'y'])
+            self.assertEqual(metadata.data_set_shapes, [[3], [2, 2]])
+            self.assertEqual(metadata.shape, (2, 3, 2))
+
+            metadata = reader.get_metadata('dir/sim.sedml')
+            self.assertFalse(metadata.is_dataset)
+            self.assertEqual(metadata.uri, 'dir/sim.sedml')
+            self.assertEqual(metadata.combine_archive_location, 'dir/sim.sedml')
+            self.assertIsNone(metadata.shape)
+
+            with self.assertRaises(KeyError):
+                reader.get_metadata('sim.sedml/missing')
+
+    def test_run(self):
+        with OutputsReader(self.dirname) as reader:
+            results = reader.run(self.report, 'sim.sedml/report')
+            expected_results = ReportReader().run(self.report, self.dirname, 'sim.sedml/report')
+            self.assertEqual(set(results.keys()), set(expected_results.keys()))
+            for id, value in results.items():
+                numpy.testing.assert_equal(value, expected_results[id])
+                numpy.testing.assert_equal(value, self.results[id])
+
+            report = Report(id='report', data_sets=[
+                DataSet(id='x', label='x'),
+                DataSet(id='w', label='w'),
+            ])
+            with self.assertWarnsRegex(MissingDataWarning, '`w`'):
+                results = reader.run(report, 'sim.sedml/report')
+            self.assertEqual(set(results.keys()), set(['x']))
+            with self.assertWarnsRegex(ExtraDataWarning, '`y`'):
+                reader.run(report, 'sim.sedml/report')
+
+            with self.assertRaises(KeyError):
+                reader.run(self.report, 'sim.sedml')
+
+            with self.assertRaises(KeyError):
+                reader.run(self.report, 'sim.sedml/missing')
+
+    def test_run_lazily(self):
+        with OutputsReader(self.dirname) as reader:
+            results = reader.run(self.report, 'sim.sedml/report', lazy=True)
+            self.assertEqual(set(results.keys()), set(['x', 'y']))
+
+            value = results['y']
+            self.assertIsInstance(value, OutputDataSet)
+            self.assertEqual(value.shape, (2, 2))
+            self.assertEqual(value.ndim, 2)
+            self.assertEqual(value.size, 4)
+            self.assertEqual(len(value), 2)
+            self.assertEqual(value.dtype, numpy.dtype('float64'))
+
+            # the hyperslabs of the data set exclude the padding of the dataset of the report
+            expected_value = self.results['y']
+            for key in [(), Ellipsis, 0, -1, slice(0, 1), slice(None, None, -1), (Ellipsis, 1), (slice(1, 2), slice(0, 0)),
+                        (slice(None, None, -1), slice(None, None, -1))]:
+                numpy.testing.assert_equal(value[key], expected_value[key])
+                self.assertEqual(value[key].shape, expected_value[key].shape)
+            numpy.testing.assert_equal(value.read(), expected_value)
+            numpy.testing.assert_equal(numpy.asarray(value), expected_value)
+            numpy.testing.assert_equal(results['x'].read(), self.results['x'])
+
+            with self.assertRaises(IndexError):
+                value[2]
+            with self.assertRaises(IndexError):
+                value[0, 0, 0]
+
+            # data sets can be evaluated in blocks which are read from the file
+            self.assertFalse(simulation_results_any_isnan(value, block_size=1))
+            self.assertFalse(SimulationResultsNanMask(value, block_size=1).any((slice(0, 1), slice(1, 2))))
+
+    def test_missing_file(self):
+        reader = OutputsReader(os.path.join(self.dirname, 'missing'))
+        with self.assertRaises(OSError):
+            reader.get_ids()
+        reader.close()
+
+    def test_close(self):
+        reader = OutputsReader(self.dirname)
+        reader.open()
+        reader.open()
+        reader.close()
+        reader.close()
+
+        # the file can be reopened after it has been closed
+        self.assertEqual(len(reader.get_ids()), 2)
+        reader.close()
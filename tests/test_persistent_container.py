@@ -0,0 +1,176 @@
+from biosimulators_test_suite.exceptions import TimeoutException
+from biosimulators_test_suite.persistent_container import PersistentSimulatorContainer
+from unittest import mock
+import concurrent.futures
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+
+class PersistentSimulatorContainerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.archive_filename = os.path.join(self.dirname, 'archive.omex')
+        with open(self.archive_filename, 'w') as file:
+            file.write('archive')
+
+        self.container = PersistentSimulatorContainer('ghcr.io/biosimulators/tellurium:latest')
+        self.docker_commands = []
+        self.container_running = True
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+        shutil.rmtree(self.container.exchange_dirname, ignore_errors=True)
+
+    def _run(self, args, **kwargs):
+        if args[1] == 'exec' and '-o' in args:
+            return self.exec_archive(args)
+
+        self.docker_commands.append(args)
+        stdout = b''
+        if args[1] == 'inspect':
+            stdout = b'true\n' if self.container_running else b'false\n'
+        elif args[1] == 'ps':
+            stdout = b'abc\ndef\n'
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b'')
+
+    def _get_host_path(self, container_path):
+        return os.path.join(self.container.exchange_dirname,
+                            os.path.relpath(container_path, self.container.CONTAINER_EXCHANGE_DIRNAME))
+
+    def _exec(self, args, returncode=0, stderr=b''):
+        self.docker_commands.append(args)
+        with open(self._get_host_path(args[args.index('-c') + 2]), 'w') as file:
+            file.write('123\n')
+        with open(os.path.join(self._get_host_path(args[args.index('-o') + 1]), 'log.yml'), 'w') as file:
+            file.write('status: SUCCEEDED')
+        return subprocess.CompletedProcess(args, returncode, stdout=None, stderr=stderr)
+
+    def _patch(self):
+        image = mock.Mock(attrs={'Config': {'Entrypoint': ['tellurium']}})
+        return [
+            mock.patch('docker.from_env'),
+            mock.patch('biosimulators_test_suite.persistent_container.get_docker_image', return_value=image),
+            mock.patch('subprocess.run', side_effect=self._run),
+        ]
+
+    def _start_patches(self, exec_archive=None):
+        self.exec_archive = exec_archive or self._exec
+        for patch in self._patch():
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_exec_sedml_docs_in_archive(self):
+        self._start_patches()
+
+        out_dirname = os.path.join(self.dirname, 'out-1')
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, out_dirname, environment={'ALGORITHM_SUBSTITUTION_POLICY': 'NONE'})
+        self.assertEqual(os.listdir(out_dirname), ['log.yml'])
+
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out-2'))
+
+        run_commands = [args for args in self.docker_commands if args[1] == 'run']
+        exec_commands = [args for args in self.docker_commands if args[1] == 'exec']
+        self.assertEqual(len(run_commands), 1)
+        self.assertIn('--detach', run_commands[0])
+        self.assertEqual(run_commands[0][-3:], ['ghcr.io/biosimulators/tellurium:latest', '-f', '/dev/null'])
+        self.assertEqual(run_commands[0][run_commands[0].index('--user') + 1], str(os.getuid()))
+
+        self.assertEqual(len(exec_commands), 2)
+        container_name = run_commands[0][run_commands[0].index('--name') + 1]
+        self.assertEqual(exec_commands[0][2:5], ['--env', 'ALGORITHM_SUBSTITUTION_POLICY=NONE', container_name])
+        self.assertEqual(exec_commands[0][5:7], ['sh', '-c'])
+        self.assertEqual(exec_commands[0][9], 'tellurium')
+        self.assertEqual(exec_commands[1][2:4], [container_name, 'sh'])
+        self.assertEqual(exec_commands[1][7], 'tellurium')
+
+        # the files exchanged with the container are removed
+        self.assertEqual(os.listdir(self.container.exchange_dirname), [])
+
+    def test_recreate_stopped_container(self):
+        self._start_patches()
+
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out-1'))
+        self.container_running = False
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out-2'))
+
+        commands = [args[1] for args in self.docker_commands]
+        self.assertEqual(commands, ['run', 'exec', 'inspect', 'rm', 'run', 'exec'])
+
+    def test_failed_execution(self):
+        self._start_patches(exec_archive=lambda args: self._exec(args, returncode=1, stderr=b'Simulation failed\n'))
+
+        # the standard error of the execution is relayed and reported
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with self.assertRaisesRegex(RuntimeError, 'could not execute the archive:\n\n  Simulation failed$'):
+                self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+        self.assertEqual(stderr.getvalue(), 'Simulation failed\n')
+        self.assertEqual([args[1] for args in self.docker_commands], ['run', 'exec'])
+
+        self.docker_commands.clear()
+        self.exec_archive = lambda args: self._exec(args, returncode=1)
+        with self.assertRaisesRegex(RuntimeError, 'Unknown error'):
+            self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+
+    def test_exec_sedml_docs_in_archive_concurrently(self):
+        self._start_patches()
+
+        # the threads of a process share a single container
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(
+                lambda i_archive: self.container.exec_sedml_docs_in_archive(
+                    self.archive_filename, os.path.join(self.dirname, 'out-{}'.format(i_archive))),
+                range(4)))
+
+        self.assertEqual(len([args for args in self.docker_commands if args[1] == 'run']), 1)
+        self.assertEqual(len([args for args in self.docker_commands if args[1] == 'exec']), 4)
+
+    def test_interrupted_execution(self):
+        self._start_patches(exec_archive=lambda args: self._exec(args, returncode=-9))
+
+        # only the process of the interrupted execution is killed, and the container is kept for the other executions
+        with self.assertRaisesRegex(RuntimeError, 'could not execute the archive'):
+            self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+        self.assertEqual([args[1] for args in self.docker_commands], ['run', 'exec', 'exec'])
+        container_name = self.docker_commands[0][self.docker_commands[0].index('--name') + 1]
+        self.assertEqual(self.docker_commands[-1][1:], ['exec', container_name, 'sh', '-c', 'kill -KILL "$0"', '123'])
+        self.assertEqual(list(self.container._container_names.values()), [container_name])
+
+        # executions which are interrupted by exceptions (e.g., the time limit of a test case) are also killed
+        def exec_archive(args):
+            self._exec(args)
+            raise TimeoutException('Time limit exceeded')
+        self.docker_commands.clear()
+        self.exec_archive = exec_archive
+        with self.assertRaises(TimeoutException):
+            self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+        self.assertEqual([args[1] for args in self.docker_commands], ['inspect', 'exec', 'exec'])
+        self.assertEqual(self.docker_commands[-1][-1], '123')
+        self.assertEqual(os.listdir(self.container.exchange_dirname), [])
+
+        # the container is used by subsequent executions
+        self.docker_commands.clear()
+        self.exec_archive = self._exec
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+        self.assertEqual([args[1] for args in self.docker_commands], ['inspect', 'exec'])
+
+    def test_stop(self):
+        self._start_patches()
+
+        self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
+        self.container.stop()
+
+        self.assertEqual(self.docker_commands[-2][1:4], ['ps', '--all', '--quiet'])
+        self.assertIn('label={}={}'.format(PersistentSimulatorContainer.LABEL, self.container.run_id), self.docker_commands[-2])
+        self.assertEqual(self.docker_commands[-1][1:], ['rm', '--force', 'abc', 'def'])
+        self.assertFalse(os.path.isdir(self.container.exchange_dirname))
+
+    def test_image_without_entrypoint(self):
+        self._start_patches()
+        with mock.patch('biosimulators_test_suite.persistent_container.get_docker_image',
+                        return_value=mock.Mock(attrs={'Config': {'Entrypoint': None}})):
+            with self.assertRaisesRegex(ValueError, 'does not have an entrypoint'):
+                self.container.exec_sedml_docs_in_archive(self.archive_filename, os.path.join(self.dirname, 'out'))
@@ -0,0 +1,70 @@
+from biosimulators_test_suite.profiling import CaseProfiler, get_profile_summary
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+
+def slow_function():
+    return sum(i * i for i in range(100000))
+
+
+def fast_function():
+    return slow_function()
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_CaseProfiler(self):
+        profiler = CaseProfiler(os.path.join(self.dirname, 'profiles'), collapsed_stacks=True)
+        case_id = 'published_project.SimulatorCanExecutePublishedProject:sbml-core/Tomida-EMBO-J-2003-NFAT-translocation'
+        with profiler.profile(case_id):
+            fast_function()
+
+        basename = 'published_project.SimulatorCanExecutePublishedProject_sbml-core_Tomida-EMBO-J-2003-NFAT-translocation'
+        self.assertEqual(CaseProfiler.get_basename(case_id), basename)
+        self.assertEqual(sorted(os.listdir(profiler.dirname)), [basename + '.collapsed.txt', basename + '.pstats'])
+
+        stats = pstats.Stats(os.path.join(profiler.dirname, basename + '.pstats'))
+        self.assertIn('slow_function', [name for _, _, name in stats.stats.keys()])
+
+        with open(os.path.join(profiler.dirname, basename + '.collapsed.txt'), 'r') as file:
+            lines = file.read().strip().split('\n')
+        stacks = [line.rpartition(' ')[0].split(';') for line in lines]
+        self.assertTrue(all(int(line.rpartition(' ')[2]) > 0 for line in lines))
+        self.assertTrue(any(
+            'fast_function' in stack[-2] and 'slow_function' in stack[-1]
+            for stack in stacks if len(stack) >= 2
+        ))
+
+    def test_CaseProfiler_exception(self):
+        profiler = CaseProfiler(self.dirname)
+        with self.assertRaises(ValueError):
+            with profiler.profile('case'):
+                raise ValueError('Simulation failed')
+        self.assertEqual(os.listdir(self.dirname), ['case.pstats'])
+
+    def test_get_profile_summary(self):
+        self.assertEqual(get_profile_summary(self.dirname), None)
+
+        profiler = CaseProfiler(self.dirname)
+        with profiler.profile('case-1'):
+            slow_function()
+        with profiler.profile('case-2'):
+            fast_function()
+
+        summary = get_profile_summary(self.dirname, n=5)
+        self.assertIn('slow_function', summary)
+        self.assertTrue(summary.startswith('Profiles of 2 test cases'))
+        self.assertNotIn(self.dirname, summary)
+
+        summary = get_profile_summary(self.dirname, n=20, case_ids=['case-2', 'case-3'])
+        self.assertTrue(summary.startswith('Profiles of 1 test cases'))
+        self.assertIn('fast_function', summary)
+        self.assertEqual(get_profile_summary(self.dirname, case_ids=['case-3']), None)
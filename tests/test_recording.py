@@ -0,0 +1,50 @@
+from biosimulators_test_suite.recording import ThreadOutputRecorder, route_thread_output
+from biosimulators_test_suite.warnings import TestCaseWarning
+from biosimulators_utils.log.utils import StandardOutputErrorCapturer, StandardOutputErrorCapturerLevel
+import sys
+import threading
+import unittest
+import warnings
+
+
+class RecordingTestCase(unittest.TestCase):
+    def test_ThreadOutputRecorder(self):
+        recorders = []
+
+        def run():
+            with ThreadOutputRecorder() as recorder:
+                print('Output of thread')
+                sys.stderr.write('Error of thread\n')
+                warnings.warn('Warning of thread', TestCaseWarning)
+            recorders.append(recorder)
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always", TestCaseWarning)
+            with StandardOutputErrorCapturer(level=StandardOutputErrorCapturerLevel.python) as captured:
+                with route_thread_output():
+                    print('Output of main thread')
+                    thread = threading.Thread(target=run)
+                    thread.start()
+                    thread.join()
+                    warnings.warn('Warning of main thread', TestCaseWarning)
+
+        # the output and warnings of the thread are recorded by its recorder, and the output and warnings of the other threads
+        # are passed through
+        self.assertEqual(captured.get_text(), 'Output of main thread\n')
+        self.assertEqual([str(warning.message) for warning in caught_warnings], ['Warning of main thread'])
+
+        recorder = recorders[0]
+        self.assertEqual(recorder.get_text(), 'Output of thread\nError of thread\n')
+        self.assertEqual([str(warning.message) for warning in recorder.warnings], ['Warning of thread'])
+        self.assertEqual(recorder.warnings[0].category, TestCaseWarning)
+
+        # the streams and warnings are restored
+        self.assertNotIn('_RoutedStream', type(sys.stdout).__name__)
+        self.assertIsNot(warnings.showwarning.__name__, 'route_warning')
+
+    def test_ThreadOutputRecorder_without_routing(self):
+        with ThreadOutputRecorder() as recorder:
+            with StandardOutputErrorCapturer(level=StandardOutputErrorCapturerLevel.python) as captured:
+                print('Output')
+        self.assertEqual(recorder.get_text(), '')
+        self.assertEqual(captured.get_text(), 'Output\n')
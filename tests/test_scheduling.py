@@ -0,0 +1,164 @@
+from biosimulators_test_suite.data_model import SedTaskRequirements
+from biosimulators_test_suite.results.data_model import TestCaseResult, TestCaseResultType
+from biosimulators_test_suite.results.io import TestResultsJsonLinesWriter, write_test_results
+from biosimulators_test_suite.scheduling import (CaseDurationStore, CaseScheduler, read_case_durations_from_report,
+                                                 read_case_result_types_from_report)
+from biosimulators_test_suite.test_case.published_project import SimulatorCanExecutePublishedProject
+from biosimulators_test_suite.test_case.sedml import SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports
+import collections
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class SchedulingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_CaseDurationStore(self):
+        filename = os.path.join(self.dirname, 'store', 'case-durations.json')
+        store = CaseDurationStore(filename)
+        self.assertEqual(store.get_durations('tellurium'), {})
+
+        case_1 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-1')
+        case_2 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-2')
+        store.update('tellurium', [
+            TestCaseResult(case=case_1, type=TestCaseResultType.passed, duration=2.),
+            TestCaseResult(case=case_2, type=TestCaseResultType.failed, duration=0.),
+        ])
+        self.assertEqual(store.get_durations('tellurium'), {'case-1': 2.})
+        self.assertEqual(store.get_result_types('tellurium'), {'case-1': TestCaseResultType.passed,
+                                                               'case-2': TestCaseResultType.failed})
+        self.assertEqual(store.get_durations('copasi'), {})
+
+        # durations are blended with the durations of previous runs
+        store.update('tellurium', [
+            TestCaseResult(case=case_1, type=TestCaseResultType.passed, duration=4.),
+            TestCaseResult(case=case_2, type=TestCaseResultType.passed, duration=1.),
+        ])
+        self.assertEqual(CaseDurationStore(filename).get_durations('tellurium'), {'case-1': 3., 'case-2': 1.})
+        self.assertEqual(store.get_result_types('tellurium')['case-2'], TestCaseResultType.passed)
+
+        # stores with other versions and invalid stores are ignored
+        with open(filename, 'r') as file:
+            saved_store = json.load(file)
+        saved_store['version'] = CaseDurationStore.VERSION + 1
+        with open(filename, 'w') as file:
+            json.dump(saved_store, file)
+        self.assertEqual(store.get_durations('tellurium'), {})
+
+        with open(filename, 'w') as file:
+            file.write('{')
+        self.assertEqual(store.get_durations('tellurium'), {})
+
+        # durations aren't saved without a filename
+        store = CaseDurationStore()
+        store.update('tellurium', [TestCaseResult(case=case_1, type=TestCaseResultType.passed, duration=4.)])
+        self.assertEqual(store.get_durations('tellurium'), {})
+
+    def test_read_case_durations_from_report(self):
+        case_1 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-1')
+        case_2 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-2')
+        results = [
+            TestCaseResult(case=case_1, type=TestCaseResultType.passed, duration=2.),
+            TestCaseResult(case=case_2, type=TestCaseResultType.skipped, duration=0.5),
+        ]
+
+        filename = os.path.join(self.dirname, 'report.json')
+        write_test_results(results, filename)
+        self.assertEqual(read_case_durations_from_report(filename), {'case-1': 2., 'case-2': 0.5})
+        self.assertEqual(read_case_result_types_from_report(filename), {'case-1': TestCaseResultType.passed,
+                                                                        'case-2': TestCaseResultType.skipped})
+
+        filename = os.path.join(self.dirname, 'report.jsonl')
+        with TestResultsJsonLinesWriter(filename) as writer:
+            for result in results:
+                writer.write(result)
+        self.assertEqual(read_case_durations_from_report(filename), {'case-1': 2., 'case-2': 0.5})
+        self.assertEqual(read_case_result_types_from_report(filename), {'case-1': TestCaseResultType.passed,
+                                                                        'case-2': TestCaseResultType.skipped})
+
+    def test_CaseScheduler(self):
+        archive_filenames = []
+        for i_archive, size in enumerate([100, 400, 200]):
+            archive_filenames.append(os.path.join(self.dirname, '{}.omex'.format(i_archive)))
+            with open(archive_filenames[-1], 'wb') as file:
+                file.write(b'0' * size)
+
+        project_1 = SimulatorCanExecutePublishedProject(id='project-1', filename=archive_filenames[0])
+        project_2 = SimulatorCanExecutePublishedProject(id='project-2', filename=archive_filenames[1])
+        project_3 = SimulatorCanExecutePublishedProject(id='project-3', filename=archive_filenames[2])
+        project_4 = SimulatorCanExecutePublishedProject(id='project-4', filename=os.path.join(self.dirname, 'missing.omex'))
+        case_1 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-1')
+        case_2 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-2')
+        cases = [case_1, case_2, project_1, project_2, project_3, project_4]
+
+        # without previous durations
+        scheduler = CaseScheduler()
+        estimated_durations = scheduler.estimate_durations(cases)
+        self.assertEqual(estimated_durations[case_1], CaseScheduler.DEFAULT_DURATION)
+        self.assertEqual(estimated_durations[project_4], CaseScheduler.DEFAULT_DURATION)
+        self.assertAlmostEqual(estimated_durations[project_2], 400 * CaseScheduler.DEFAULT_PUBLISHED_PROJECT_SECONDS_PER_BYTE)
+
+        # with previous durations
+        scheduler = CaseScheduler({'case-1': 30., 'case-2': 10., 'project-1': 5.})
+        estimated_durations = scheduler.estimate_durations(cases)
+        self.assertEqual(estimated_durations, {
+            case_1: 30.,
+            case_2: 10.,
+            project_1: 5.,
+            project_2: 20.,
+            project_3: 10.,
+            project_4: 10.,
+        })
+
+        self.assertEqual(scheduler.order(cases), [case_1, project_2, case_2, project_3, project_4, project_1])
+
+        self.assertEqual(scheduler.predict_makespan(cases, 1), 85.)
+        self.assertEqual(scheduler.predict_makespan(cases, 2), 45.)
+        self.assertEqual(scheduler.predict_makespan(cases, 6), 30.)
+        self.assertEqual(scheduler.predict_makespan([], 2), 0.)
+
+    def test_CaseScheduler_select(self):
+        case_1 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-1')
+        case_2 = SimulatorSupportsModelsSimulationsTasksDataGeneratorsAndReports(id='case-2')
+        project_1 = SimulatorCanExecutePublishedProject(id='project-1', task_requirements=[
+            SedTaskRequirements(model_format='format_2585', simulation_algorithm='KISAO_0000019')])
+        project_2 = SimulatorCanExecutePublishedProject(id='project-2', task_requirements=[
+            SedTaskRequirements(model_format='format_2585', simulation_algorithm='KISAO_0000019')])
+        project_3 = SimulatorCanExecutePublishedProject(id='project-3', task_requirements=[
+            SedTaskRequirements(model_format='format_2585', simulation_algorithm='KISAO_0000029')])
+        cases = collections.OrderedDict([
+            ('sedml', [case_1, case_2]),
+            ('published_project', [project_1, project_2, project_3]),
+        ])
+
+        scheduler = CaseScheduler(
+            {'case-1': 30., 'case-2': 10., 'project-1': 5., 'project-2': 20., 'project-3': 10.},
+            result_types={'case-2': TestCaseResultType.failed})
+
+        # failed test cases, the first test case of each suite, and published projects which cover additional algorithms are
+        # selected first
+        selected_cases, deferred_cases = scheduler.select(cases, 40.)
+        self.assertEqual(selected_cases, collections.OrderedDict([
+            ('sedml', [case_2]),
+            ('published_project', [project_1, project_3]),
+        ]))
+        self.assertEqual(deferred_cases, [case_1, project_2])
+
+        # more test cases fit within the budget when test cases are evaluated concurrently
+        selected_cases, deferred_cases = scheduler.select(cases, 40., jobs=2)
+        self.assertEqual(selected_cases, collections.OrderedDict([
+            ('sedml', [case_1, case_2]),
+            ('published_project', [project_1, project_2, project_3]),
+        ]))
+        self.assertEqual(deferred_cases, [])
+
+        selected_cases, deferred_cases = scheduler.select(cases, 1.)
+        self.assertEqual(selected_cases, collections.OrderedDict([('sedml', []), ('published_project', [])]))
+        self.assertEqual(deferred_cases, [case_1, case_2, project_1, project_2, project_3])
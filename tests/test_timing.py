@@ -0,0 +1,68 @@
+from biosimulators_test_suite.timing import PhaseTimer, phase, get_phase_group
+import threading
+import time
+import unittest
+
+
+class TimingTestCase(unittest.TestCase):
+    def test_PhaseTimer(self):
+        with PhaseTimer() as timer:
+            with phase('buildSyntheticArchives'):
+                time.sleep(0.01)
+            for i_archive in range(2):
+                with phase('syntheticArchive:{}'.format(i_archive + 1)):
+                    with phase('execArchive'):
+                        time.sleep(0.01)
+                    with phase('readReports'):
+                        pass
+                    with phase('readReports'):
+                        pass
+
+        self.assertEqual(list(timer.timings.keys()), [
+            'buildSyntheticArchives',
+            'syntheticArchive:1.execArchive',
+            'syntheticArchive:1.readReports',
+            'syntheticArchive:1',
+            'syntheticArchive:2.execArchive',
+            'syntheticArchive:2.readReports',
+            'syntheticArchive:2',
+        ])
+        self.assertGreaterEqual(timer.timings['buildSyntheticArchives'], 0.01)
+        self.assertGreaterEqual(timer.timings['syntheticArchive:1'], timer.timings['syntheticArchive:1.execArchive'])
+
+        # phases outside of a timer are not recorded
+        with phase('execArchive'):
+            pass
+        self.assertNotIn('execArchive', timer.timings)
+
+    def test_PhaseTimer_records_phases_which_raise_exceptions(self):
+        with PhaseTimer() as timer:
+            with self.assertRaises(ValueError):
+                with phase('execArchive'):
+                    raise ValueError('Simulation failed')
+            with phase('evalOutputs'):
+                pass
+        self.assertEqual(list(timer.timings.keys()), ['execArchive', 'evalOutputs'])
+
+    def test_PhaseTimer_is_independent_across_threads(self):
+        timers = {}
+
+        def target(name):
+            with PhaseTimer() as timer:
+                with phase(name):
+                    time.sleep(0.01)
+            timers[name] = timer
+
+        threads = [threading.Thread(target=target, args=(name,)) for name in ['a', 'b']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(list(timers['a'].timings.keys()), ['a'])
+        self.assertEqual(list(timers['b'].timings.keys()), ['b'])
+
+    def test_get_phase_group(self):
+        self.assertEqual(get_phase_group('eval'), 'eval')
+        self.assertEqual(get_phase_group('eval.syntheticArchive:12.execArchive'), 'eval.syntheticArchive.execArchive')
+        self.assertEqual(get_phase_group('eval.syntheticArchive:2'), 'eval.syntheticArchive')
@@ -1,8 +1,11 @@
 from biosimulators_test_suite import utils
 from biosimulators_test_suite.config import Config
+from unittest import mock
 import math
 import numpy
 import os
+import shutil
+import tempfile
 import unittest
 
 
@@ -27,3 +30,107 @@ class UtilsTestCase(unittest.TestCase):
             utils.simulation_results_isnan('a')
         with self.assertRaises(TypeError):
             utils.simulation_results_isnan(numpy.array(['a']))
+
+    def test_simulation_results_any_isnan(self):
+        self.assertTrue(utils.simulation_results_any_isnan(math.nan))
+        self.assertFalse(utils.simulation_results_any_isnan(3.))
+        self.assertTrue(utils.simulation_results_any_isnan(numpy.array(math.nan)))
+
+        value = numpy.zeros((10, 3, 2))
+        self.assertFalse(utils.simulation_results_any_isnan(value, block_size=6))
+        value[9, 2, 1] = math.nan
+        self.assertTrue(utils.simulation_results_any_isnan(value, block_size=6))
+        self.assertTrue(utils.simulation_results_any_isnan(value, block_size=1))
+        self.assertFalse(utils.simulation_results_any_isnan(value[0:9], block_size=6))
+        self.assertFalse(utils.simulation_results_any_isnan(numpy.zeros((0, 3))))
+
+        with self.assertRaises(TypeError):
+            utils.simulation_results_any_isnan(numpy.array(['a', 'b']), block_size=1)
+
+    def test_SimulationResultsNanMask(self):
+        value = numpy.zeros((10, 3, 2))
+        value[5:, 1, :] = math.nan
+
+        read_keys = []
+
+        class Value(object):
+            shape = value.shape
+
+            def __getitem__(self, key):
+                read_keys.append(key)
+                return value[key]
+
+        mask = utils.SimulationResultsNanMask(Value(), block_size=6)
+        self.assertEqual(mask.block_slices, [slice(i_row, i_row + 1) for i_row in range(10)])
+        self.assertEqual(mask.block_any, [False] * 5 + [True] * 5)
+        self.assertEqual(mask.block_all, [False] * 10)
+        self.assertTrue(mask.any())
+        self.assertFalse(mask.all())
+        self.assertFalse(mask.any((slice(0, 5),)))
+        self.assertTrue(mask.all((slice(5, 10), slice(1, 2))))
+        self.assertFalse(mask.all((slice(4, 10), slice(1, 2))))
+        self.assertTrue(mask.all((slice(9, 4, -2), slice(1, 2))))
+        self.assertFalse(mask.any((slice(5, 10), slice(0, 1))))
+        self.assertTrue(mask.all((Ellipsis, slice(0, 0))))
+        self.assertFalse(mask.any((Ellipsis, slice(0, 0))))
+
+        # only the blocks which are partially NaN are read again, and only their intersections with the slices
+        read_keys.clear()
+        self.assertFalse(mask.any((slice(0, 5),)))
+        self.assertEqual(read_keys, [])
+        self.assertTrue(mask.all((slice(5, 7), slice(1, 2))))
+        self.assertEqual(read_keys, [
+            (slice(5, 6, 1), slice(1, 2), slice(None)),
+            (slice(6, 7, 1), slice(1, 2), slice(None)),
+        ])
+
+        value[5:, :, :] = math.nan
+        mask = utils.SimulationResultsNanMask(value, block_size=12)
+        self.assertEqual(mask.block_any, [False, False, True, True, True])
+        self.assertEqual(mask.block_all, [False, False, False, True, True])
+        self.assertTrue(mask.any((slice(3, 7),)))
+        self.assertFalse(mask.all((slice(3, 7),)))
+        self.assertTrue(mask.all((slice(6, 10),)))
+
+        mask = utils.SimulationResultsNanMask(numpy.zeros((0, 3)))
+        self.assertFalse(mask.any())
+        self.assertTrue(mask.all())
+
+        mask = utils.SimulationResultsNanMask(math.nan)
+        self.assertTrue(mask.any())
+        self.assertTrue(mask.all())
+
+        mask = utils.SimulationResultsNanMask(2)
+        self.assertFalse(mask.any())
+
+    def test_read_write_versioned_json(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(dirname, 'dir', 'data.json')
+            self.assertIsNone(utils.read_versioned_json(filename, 1))
+            self.assertIsNone(utils.read_versioned_json(None, 1))
+
+            utils.write_json_atomically(filename, {'version': 1, 'value': 2})
+            self.assertEqual(utils.read_versioned_json(filename, 1), {'version': 1, 'value': 2})
+            self.assertIsNone(utils.read_versioned_json(filename, 2))
+            self.assertEqual(os.listdir(os.path.dirname(filename)), ['data.json'])
+
+            with open(filename, 'w') as file:
+                file.write('[')
+            self.assertIsNone(utils.read_versioned_json(filename, 1))
+
+            with open(filename, 'w') as file:
+                file.write('[1]')
+            self.assertIsNone(utils.read_versioned_json(filename, 1))
+
+            # failures to save the data are ignored, and temporary files are removed
+            with mock.patch('os.replace', side_effect=PermissionError('not writable')):
+                utils.write_json_atomically(filename, {'version': 1})
+            self.assertEqual(os.listdir(os.path.dirname(filename)), ['data.json'])
+
+            with mock.patch('os.makedirs', side_effect=PermissionError('not writable')):
+                utils.write_json_atomically(os.path.join(dirname, 'dir2', 'data.json'), {'version': 1})
+
+            utils.write_json_atomically(None, {'version': 1})
+        finally:
+            shutil.rmtree(dirname)
@@ -0,0 +1,233 @@
+from biosimulators_test_suite.exceptions import TimeoutException
+from biosimulators_test_suite.watchdog import (Watchdog, get_child_process_ids, stop_docker_containers_with_label,
+                                               stop_docker_containers_with_mounts_in_dir)
+from biosimulators_utils.simulator.exec import exec_sedml_docs_in_archive_with_containerized_simulator
+from unittest import mock
+import contextvars
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+
+class WatchdogTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_not_expired(self):
+        with Watchdog(5.) as watchdog:
+            pass
+        self.assertFalse(watchdog.expired)
+
+    def test_interrupt_python(self):
+        start = time.time()
+        with self.assertRaisesRegex(TimeoutException, 'did not complete within 0.2 seconds'):
+            with Watchdog(0.2):
+                while True:
+                    pass
+        self.assertLess(time.time() - start, 5.)
+
+    def test_interrupt_subprocess_in_thread(self):
+        exceptions = []
+
+        def target():
+            try:
+                with Watchdog(0.2):
+                    subprocess.call(['sleep', '30'])
+            except Exception as exception:
+                exceptions.append(exception)
+
+        start = time.time()
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join(10.)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.time() - start, 10.)
+        self.assertEqual(len(exceptions), 1)
+        self.assertIsInstance(exceptions[0], TimeoutException)
+
+    def test_only_kill_subprocesses_of_test_case(self):
+        # subprocesses started by other threads (e.g., threads which prepare upcoming test cases) are not killed
+        other_processes = []
+
+        def start_other_process():
+            other_processes.append(subprocess.Popen(['sleep', '30']))
+
+        # subprocesses started by threads which run copies of the context of the test case are killed
+        case_processes = []
+
+        def start_case_process():
+            case_processes.append(subprocess.Popen(['sleep', '30']))
+
+        try:
+            with self.assertRaises(TimeoutException):
+                with Watchdog(0.2):
+                    thread = threading.Thread(target=start_other_process)
+                    thread.start()
+                    thread.join()
+                    thread = threading.Thread(target=contextvars.copy_context().run, args=(start_case_process,))
+                    thread.start()
+                    thread.join()
+                    case_processes[0].wait()
+            self.assertIsNone(other_processes[0].poll())
+            self.assertLess(case_processes[0].wait(10.), 0)
+        finally:
+            for process in other_processes + case_processes:
+                process.kill()
+                process.wait()
+
+    def test_restore_popen(self):
+        original_popen = subprocess.Popen
+
+        with Watchdog(5.):
+            self.assertIsNot(subprocess.Popen, original_popen)
+            with Watchdog(5.):
+                self.assertIsNot(subprocess.Popen, original_popen)
+
+            # the replacement is kept while a watchdog is active
+            self.assertIsNot(subprocess.Popen, original_popen)
+        self.assertIs(subprocess.Popen, original_popen)
+
+        with self.assertRaises(TimeoutException):
+            with Watchdog(0.2):
+                subprocess.call(['sleep', '30'])
+        self.assertIs(subprocess.Popen, original_popen)
+
+        # watchdogs in other threads
+        entered = threading.Event()
+        release = threading.Event()
+
+        def target():
+            with Watchdog(5.):
+                entered.set()
+                release.wait(10.)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        entered.wait(10.)
+        with Watchdog(5.):
+            pass
+        self.assertIsNot(subprocess.Popen, original_popen)
+        release.set()
+        thread.join(10.)
+        self.assertIs(subprocess.Popen, original_popen)
+
+    def test_kill_subprocess(self):
+        start = time.time()
+        with self.assertRaises(TimeoutException):
+            with Watchdog(0.2):
+                subprocess.check_call(['sleep', '30'])
+        self.assertLess(time.time() - start, 10.)
+        self.assertEqual(get_child_process_ids(os.getpid()), set())
+
+    def test_interpreter_not_signaled_after_expiration(self):
+        # profile a function after the watchdog expired while the thread was blocked in a subprocess
+        script = (
+            "from biosimulators_test_suite.exceptions import TimeoutException\n"
+            "from biosimulators_test_suite.watchdog import Watchdog\n"
+            "import cProfile\n"
+            "import subprocess\n"
+            "try:\n"
+            "    with Watchdog(0.2):\n"
+            "        subprocess.call(['sleep', '30'])\n"
+            "except TimeoutException:\n"
+            "    pass\n"
+            "cProfile.run('sum(range(10))')\n"
+        )
+        subprocess.run([sys.executable, '-c', script], check=True, timeout=30., stdout=subprocess.DEVNULL,
+                       env=dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(__file__))))
+
+    def test_failure_suppressed_by_test_case(self):
+        with self.assertRaises(TimeoutException):
+            with Watchdog(0.2):
+                try:
+                    subprocess.check_call(['sleep', '30'])
+                except subprocess.CalledProcessError:
+                    pass
+
+    def test_stop_docker_containers_with_mounts_in_dir(self):
+        container_1 = mock.Mock(id='1', attrs={'Mounts': [{'Source': os.path.join(self.dirname, 'outputs')}]})
+        container_2 = mock.Mock(id='2', attrs={'Mounts': [{'Source': self.dirname + '-other'}]})
+        container_3 = mock.Mock(id='3', attrs={})
+        docker_client = mock.Mock(containers=mock.Mock(list=lambda: [container_1, container_2, container_3]))
+        with mock.patch('docker.from_env', return_value=docker_client):
+            self.assertEqual(stop_docker_containers_with_mounts_in_dir(self.dirname), ['1'])
+        container_1.kill.assert_called_once_with()
+        container_2.kill.assert_not_called()
+        container_3.kill.assert_not_called()
+
+        with mock.patch('docker.from_env', side_effect=Exception('Docker is not available')):
+            self.assertEqual(stop_docker_containers_with_mounts_in_dir(self.dirname), [])
+
+    def test_stop_docker_containers_with_label(self):
+        container = mock.Mock(id='1')
+        docker_client = mock.Mock(containers=mock.Mock(list=mock.Mock(return_value=[container])))
+        with mock.patch('docker.from_env', return_value=docker_client):
+            self.assertEqual(stop_docker_containers_with_label('biosimulators-test-suite.watchdog=abc'), ['1'])
+        docker_client.containers.list.assert_called_once_with(filters={'label': 'biosimulators-test-suite.watchdog=abc'})
+        container.kill.assert_called_once_with()
+
+        with mock.patch('docker.from_env', side_effect=Exception('Docker is not available')):
+            self.assertEqual(stop_docker_containers_with_label('biosimulators-test-suite.watchdog=abc'), [])
+
+    def test_label_docker_run_args(self):
+        watchdog = Watchdog(5.)
+        label = 'biosimulators-test-suite.watchdog=' + watchdog.id
+        self.assertEqual(watchdog.label_docker_run_args(['docker', 'run', '--rm', 'image']),
+                         ['docker', 'run', '--label', label, '--rm', 'image'])
+        self.assertEqual(watchdog.label_docker_run_args(('sudo', 'docker', 'run', 'image')),
+                         ['sudo', 'docker', 'run', '--label', label, 'image'])
+        self.assertEqual(watchdog.label_docker_run_args(['/usr/bin/docker', 'run', 'image']),
+                         ['/usr/bin/docker', 'run', '--label', label, 'image'])
+
+        # other commands and detached containers are not labeled
+        self.assertEqual(watchdog.label_docker_run_args(['docker', 'exec', 'container', 'ls']), ['docker', 'exec', 'container', 'ls'])
+        self.assertEqual(watchdog.label_docker_run_args(['docker', 'run', '--detach', 'image']), ['docker', 'run', '--detach', 'image'])
+        self.assertEqual(watchdog.label_docker_run_args(['sleep', '30']), ['sleep', '30'])
+        self.assertEqual(watchdog.label_docker_run_args('docker run image'), 'docker run image')
+
+    def test_stop_docker_containers_with_temp_dir_host_path(self):
+        # the test suite runs inside Docker and mounts directories of the host into the containers of simulators, rather than
+        # directories inside the working directory of the test case
+        bin_dirname = os.path.join(self.dirname, 'bin')
+        os.mkdir(bin_dirname)
+        args_filename = os.path.join(self.dirname, 'args.txt')
+        with open(os.path.join(bin_dirname, 'docker'), 'w') as file:
+            file.write('#!/bin/sh\necho "$@" > {}\nexec sleep 30\n'.format(args_filename))
+        os.chmod(os.path.join(bin_dirname, 'docker'), 0o755)
+
+        working_dirname = os.path.join(self.dirname, 'case')
+        os.mkdir(working_dirname)
+        archive_filename = os.path.join(working_dirname, 'archive.omex')
+        with open(archive_filename, 'w'):
+            pass
+
+        container = mock.Mock(id='1', attrs={'Mounts': [{'Source': '/host/tmp/tmpabcdef'}]})
+        docker_client = mock.Mock()
+        docker_client.containers.list.side_effect = lambda filters=None: [container] if filters else []
+
+        env = {
+            'PATH': bin_dirname + os.pathsep + os.environ['PATH'],
+            'TEMP_DIR_HOST_PATH': '/host/tmp',
+        }
+        with mock.patch.dict(os.environ, env):
+            with mock.patch('docker.from_env', return_value=docker_client):
+                with self.assertRaises(TimeoutException):
+                    with Watchdog(0.5, working_dirname=working_dirname) as watchdog:
+                        exec_sedml_docs_in_archive_with_containerized_simulator(
+                            archive_filename, os.path.join(working_dirname, 'outputs'), 'ghcr.io/biosimulators/tellurium',
+                            pull_docker_image=False, allocate_tty=False)
+
+        with open(args_filename, 'r') as file:
+            args = file.read().split()
+        self.assertEqual(args[0:3], ['run', '--label', 'biosimulators-test-suite.watchdog=' + watchdog.id])
+        self.assertIn('type=bind,source=/host/tmp/', ' '.join(args))
+        docker_client.containers.list.assert_any_call(filters={'label': 'biosimulators-test-suite.watchdog=' + watchdog.id})
+        container.kill.assert_called_with()